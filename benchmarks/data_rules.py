@@ -0,0 +1,58 @@
+"""
+Reports the time taken to check the data rules of a submission with the given
+number of results, ten per activity, with every rule and without the biological
+ones, and the rules which took the most time.
+
+    python -m benchmarks.data_rules [count]
+"""
+import sys
+from datetime import datetime
+from time import perf_counter
+
+from wqxlib import RuleSet, WQXSubmission
+
+
+def build(count):
+    submission = WQXSubmission()
+    submission.id = "72420"
+    submission.organizationIdentifier = "WQXTEST"
+    submission.organizationFormalName = "WQX Test Organization"
+    for i in range(0, count, 10):
+        with submission.activity() as activity:
+            activity.activityIdentifier = f"A{i}"
+            activity.monitoringLocationIdentifier = "GREENUP"
+            activity.activityTypeCode = "Field Msr/Obs"
+            activity.activityMediaName = "Water"
+            activity.activityStartDate = datetime(2021, 2, 2)
+            activity.projectIdentifier = "TEST"
+            for j in range(min(10, count - i)):
+                with activity.result() as result:
+                    result.characteristicName = "Temperature, water"
+                    result.resultStatusIdentifier = "Final"
+                    result.resultMeasureUnitCode = "deg C"
+                    result.resultMeasureValue = str(i + j)
+    submission.normalize()
+    return submission
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    submission = build(count)
+    start = perf_counter()
+    violations = submission.list_data_rule_violations()
+    seconds = perf_counter() - start
+    print(f"{len(violations)} violations of {count} results in {seconds:.2f} s")
+    start = perf_counter()
+    submission.list_data_rule_violations(RuleSet().disable("biological"))
+    print(f"Without the biological rules in {perf_counter() - start:.2f} s")
+    statistics = submission.profileDataRules()
+    statistics.sort(key=lambda x: x.seconds, reverse=True)
+    for x in statistics[:5]:
+        print(
+            f"Rule {x.rule.number}: {x.evaluations} evaluations in {x.seconds:.2f} s, "
+            f"{x.violations} violations"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Reports the time taken to import wqxlib in a fresh interpreter for a few common
+statements, less the time taken to start the interpreter, as the best of several
+runs. Classes are loaded the first time they are used, so the statements which need
+fewer classes should take less time.
+
+    python -m benchmarks.import_time [runs]
+"""
+import subprocess
+import sys
+from time import perf_counter
+
+STATEMENTS = (
+    "import wqxlib",
+    "from wqxlib import XMLWriter",
+    "from wqxlib.wqx_v3_0 import CharacteristicName",
+    "from wqxlib.wqx_v3_0 import Measure",
+    "from wqxlib.wqx_v3_0 import Result",
+    "from wqxlib import WQXSubmission",
+    "from wqxlib.wqx_v3_0 import *",
+)
+
+
+def run(statement: str) -> float:
+    start = perf_counter()
+    subprocess.run([sys.executable, "-c", statement], check=True)
+    return perf_counter() - start
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    startup = min(run("pass") for _ in range(runs))
+    for statement in STATEMENTS:
+        seconds = min(run(statement) for _ in range(runs)) - startup
+        print(f"{statement}: {seconds * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
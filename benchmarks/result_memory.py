@@ -0,0 +1,44 @@
+"""
+Reports the memory taken per Result, built from a ResultDescription with a Measure
+and a ResultLabInformation with a WQXTime, including the values it holds.
+
+    python -m benchmarks.result_memory [count]
+"""
+import sys
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from wqxlib.wqx_v3_0 import (
+    Measure,
+    Result,
+    ResultDescription,
+    ResultLabInformation,
+    WQXTime,
+)
+
+TIME = datetime(2021, 2, 2, 12, 30, tzinfo=timezone(timedelta(hours=-6)))
+
+
+def build(i):
+    return Result(
+        resultDescription=ResultDescription(
+            characteristicName="Temperature, water",
+            resultMeasure=Measure(resultMeasureValue=str(i), measureUnitCode="deg C"),
+            resultStatusIdentifier="Final",
+        ),
+        resultLabInformation=ResultLabInformation(analysisStartTime=WQXTime(TIME)),
+    )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    build(0)
+    tracemalloc.start()
+    results = [build(i) for i in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{size / len(results):.0f} bytes per Result")
+
+
+if __name__ == "__main__":
+    main()
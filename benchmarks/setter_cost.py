@@ -0,0 +1,33 @@
+"""
+Reports the time taken to set a simple content property of a ResultDescription from
+a plain string, from a value already of the property's class, and the time taken to
+store that value without the setter.
+
+    python -m benchmarks.setter_cost [count]
+"""
+import sys
+from timeit import timeit
+
+from wqxlib.wqx_v3_0 import CharacteristicName, ResultDescription
+
+TEXT = "Temperature, water"
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    description = ResultDescription()
+    name = CharacteristicName(TEXT)
+    cases = {
+        "str": lambda: setattr(description, "characteristicName", TEXT),
+        "CharacteristicName": lambda: setattr(description, "characteristicName", name),
+        "no setter": lambda: setattr(
+            description, "_ResultDescription__characteristicName", name
+        ),
+    }
+    for case, statement in cases.items():
+        seconds = timeit(statement, number=count)
+        print(f"{case}: {seconds / count * 1e9:.0f} ns per set")
+
+
+if __name__ == "__main__":
+    main()
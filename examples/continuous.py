@@ -6,6 +6,9 @@ from dateutil import tz
 # wqxlib has one import for what we are doing
 from wqxlib import WQXSubmission
 
+# Every activity has the same sample description
+from wqxlib.wqx_v3_0 import ReferenceMethod, SampleDescription
+
 # Load data from a CSV file using Pandas.
 # Data could be gathered from any method you choose.
 csv = pd.read_csv(
@@ -122,60 +125,49 @@ with WQXSubmission(fileName="continuous.xml") as submission:
         "mg/L.1": "mg/l",
     }
 
-    # Iterate each day
-    for date, day_data in median.iterrows():
-        # Group by the site name, which is level 0 of the index
-        row = day_data.groupby(level=0)
-
-        # Iterate each site
-        for name, site_data in row:
-            # Use lookup table to translate monitoring location name
-            site = monitoring_locations.get(name)
-
-            # The group index is a tuple representing the date
-            # We can create the activity_date by joining it.
-            activity_date = "".join(map(str, date))
-
-            # The activity identifier will default to something similar,
-            # but it is good practice to explicity set it.
-            # If an activity identifier is repeated, the newer one will
-            # replace the older one.
-            activity_id = f"{site}:{activity_date}:FM:PRS"
-
-            # Create a new activity in the submission
-            with submission.activity() as activity:
-                activity.activityIdentifier = activity_id
-                activity.monitoringLocationIdentifier = site
-                activity.activityTypeCode = "Field Msr/Obs"
-                activity.activityMediaName = "Water"
-                # This timestamp will be reused later, so define a variable
-                timestamp = datetime(*date, tzinfo=tzlocal)
-                activity.activityStartDate = timestamp
-                activity.projectIdentifier = "TEST"
-
-                # Create a new sample in the activity
-                with activity.sample() as sample:
-                    sample.methodIdentifier = "QAPP"
-                    sample.methodIdentifierContext = "WQXTEST"
-                    sample.methodName = "Quality Assurance Project Plan for WQX test"
-                    sample.methodQualifierTypeName = "WQXTEST"
-                    sample.sampleCollectionEquipmentName = "Probe/Sensor"
-
-                # Iterate each fact in the day's data
-                for key, fact in site_data.items():
-                    # Translate characteristic name to approved value
-                    characteristic = characteristics.get(key[1])
-                    # We skipped a few values which need to be ignored
-                    if characteristic is not None:
-                        # Create a new result in the activity for each fact
-                        with activity.result() as result:
-                            # The characteristic name must be an approved value
-                            result.characteristicName = characteristic
-                            # The user-supplied name can be anything for your reference
-                            result.characteristicNameUserSupplied = key[1]
-                            # Measurement Unit must be an approved value
-                            result.resultMeasureUnitCode = unit_codes.get(key[2], "None")
-                            # Measure value must be a string (so you can control precision)
-                            result.resultMeasureValue = str(fact)
-                            # Analysis start time should be a datetime object with timezone
-                            result.analysisStartTime = timestamp
+    # One row per result, with the site, the name of the fact and its unit, which
+    # are the levels of the columns, and the median in a column of its own
+    results = median.melt(ignore_index=False, var_name=["site", "fact", "unit"])
+    # The group index is a tuple representing the date
+    results["date"] = [datetime(*date, tzinfo=tzlocal) for date in results.index]
+    # Use the lookup tables to translate the names and units
+    results["site"] = results["site"].map(monitoring_locations)
+    results["characteristic"] = results["fact"].map(characteristics)
+    results["unitCode"] = results["unit"].map(unit_codes).fillna("None")
+    # Measure value must be a string (so you can control precision)
+    results["value"] = results["value"].astype(str)
+    # We skipped a few values which need to be ignored
+    results = results.dropna(subset=["characteristic"])
+
+    # The rows are grouped into an activity per site and day, and the results of each
+    # activity are added at once. The activity identifier defaults to the monitoring
+    # location, the date and the activity type.
+    submission.addDataFrame(
+        results,
+        {
+            # Properties of the activities
+            "monitoringLocationIdentifier": "site",
+            "activityStartDate": "date",
+            # Properties of the results. The characteristic name must be an
+            # approved value, while the user-supplied name can be anything for your
+            # reference.
+            "characteristicName": "characteristic",
+            "characteristicNameUserSupplied": "fact",
+            "resultMeasureUnitCode": "unitCode",
+            "resultMeasureValue": "value",
+            "analysisStartTime": "date",
+        },
+        # Values which every activity has
+        activityTypeCode="Field Msr/Obs",
+        activityMediaName="Water",
+        projectIdentifier="TEST",
+        sampleDescription=SampleDescription(
+            sampleCollectionMethod=ReferenceMethod(
+                methodIdentifier="QAPP",
+                methodIdentifierContext="WQXTEST",
+                methodName="Quality Assurance Project Plan for WQX test",
+                methodQualifierTypeName="WQXTEST",
+            ),
+            sampleCollectionEquipmentName="Probe/Sensor",
+        ),
+    )
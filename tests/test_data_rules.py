@@ -0,0 +1,59 @@
+import unittest
+from datetime import datetime
+
+from wqxlib import RuleSet
+
+from .test_wqx_submission import create_submission
+
+
+class TestDataRules(unittest.TestCase):
+    def test_status(self):
+        # The results of the test submission have no ResultStatusIdentifier
+        submission = create_submission(locations=2)
+        submission.normalize()
+        self.assertEqual(
+            submission.list_data_rule_violations(),
+            ["CharacteristicName and ResultStatusIdentifier must be reported."] * 4,
+        )
+
+    def test_violations(self):
+        submission = create_tissue_submission()
+        violations = submission.list_data_rule_violations()
+        # Rules are listed in the order of their numbers
+        self.assertEqual(len(violations), 5)
+        self.assertTrue(violations[2].startswith("If a numeric value is reported"))
+        self.assertTrue(violations[3].startswith("Biological Intent Name"))
+        self.assertEqual(
+            violations[4], "Measure Unit is required when Measure Value is supplied."
+        )
+
+    def test_rule_set(self):
+        submission = create_tissue_submission()
+        rules = RuleSet().disable("biological", 13)
+        self.assertNotIn(32, [x.number for x in rules.rules])
+        violations = submission.list_data_rule_violations(rules)
+        self.assertEqual(len(violations), 2)
+        self.assertEqual(len(submission.list_data_rule_violations(rules.enable(32))), 3)
+        with self.assertRaises(ValueError):
+            rules.disable("chemistry")
+        statistics = submission.profileDataRules(RuleSet(RuleSet.select(13, 22)))
+        self.assertEqual([x.rule.number for x in statistics], [13, 22])
+        self.assertEqual([x.evaluations for x in statistics], [3, 3])
+        self.assertEqual([x.violations for x in statistics], [2, 1])
+
+
+def create_tissue_submission():
+    submission = create_submission()
+    with submission.activity() as activity:
+        activity.activityIdentifier = "GREENUP:20210202:T"
+        activity.monitoringLocationIdentifier = "GREENUP"
+        activity.activityTypeCode = "Sample-Routine"
+        activity.activityMediaName = "Tissue"
+        activity.activityStartDate = datetime(2021, 2, 2)
+        activity.projectIdentifier = "TEST"
+        with activity.result() as result:
+            result.characteristicName = "Mercury"
+            result.resultStatusIdentifier = "Final"
+            result.resultMeasureValue = "1"
+    submission.normalize()
+    return submission
@@ -0,0 +1,344 @@
+import pickle
+import unittest
+from array import array
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict
+from zoneinfo import ZoneInfo
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+try:
+    import pandas
+except ImportError:
+    pandas = None
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+from wqxlib.ResultTable import Column, NumberColumn, ResultTable, TextColumn, TimeColumn
+from wqxlib.ResultTemplate import ResultTemplate
+from wqxlib.wqx_v3_0 import (
+    Measure,
+    ReferenceMethod,
+    Result,
+    ResultDescription,
+    SampleDescription,
+)
+from wqxlib.XMLWriter import XMLWriter
+
+from .test_wqx_submission import create_submission
+
+LOCATIONS = ["GREENUP", "GREENUP1"]
+
+TZ = timezone(timedelta(hours=-6))
+TIMES = [
+    datetime(2021, 2, 2, 12, 0, tzinfo=TZ) + timedelta(minutes=15 * i) for i in range(4)
+]
+VALUES = [12.5, 12.75, float("nan"), 1e-05]
+NAMES = ["Temperature, water", "Temperature, water", "pH", "pH"]
+
+
+class TestResultTable(unittest.TestCase):
+    def setUp(self):
+        self.template = ResultTemplate(
+            Result(
+                resultDescription=ResultDescription(
+                    resultMeasure=Measure(measureUnitCode="deg C"),
+                    resultStatusIdentifier="Final",
+                )
+            ),
+            [
+                "resultDescription.characteristicName",
+                "resultDescription.resultMeasure.resultMeasureValue",
+                "resultLabInformation.analysisStartTime",
+            ],
+        )
+        self.table = ResultTable(self.template, [NAMES, array("d", VALUES), TIMES])
+
+    def expected(self) -> list:
+        values = ["12.5", "12.75", None, "0.00001"]
+        return [
+            self.template.result(*row) for row in zip(NAMES, values, TIMES)  # noqa: B905
+        ]
+
+    def test_columns(self):
+        columns = [self.table._ResultTable__columns[i] for i in range(3)]
+        self.assertEqual(
+            [type(x) for x in columns], [TextColumn, NumberColumn, TimeColumn]
+        )
+        self.assertEqual(len(columns[0].values), 2)
+        self.assertEqual(len(self.table), 4)
+        self.assertEqual(
+            self.table[3].resultDescription.resultMeasure.resultMeasureValue, "0.00001"
+        )
+        self.assertEqual(
+            self.table[-1].resultLabInformation.analysisStartTime.time, TIMES[3].time()
+        )
+
+        class Incomplete(Column):
+            def __len__(self):
+                return 0
+
+        # Columns missing a method cannot be made at all
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_generate_xml(self):
+        for indentation in (None, "  "):
+            with self.subTest(indentation=indentation):
+                writer = XMLWriter(indentation=indentation)
+                writer.elements(self.table, "Result")
+                expected = XMLWriter(indentation=indentation)
+                for x in self.expected():
+                    x.generateXML("Result", expected)
+                self.assertEqual(writer.getvalue(), expected.getvalue())
+
+    def test_slice(self):
+        part = self.table[1:3]
+        self.assertEqual(len(part), 2)
+        self.assertEqual(part[0].generateXML(), self.expected()[1].generateXML())
+        copy = pickle.loads(pickle.dumps(part))
+        self.assertEqual(copy.generateXML(), part.generateXML())
+        self.assertEqual(len(copy._ResultTable__columns[1].numbers), 2)
+
+    def test_submission(self):
+        expected = create_submission()
+        submission = create_submission()
+        for s in (submission, expected):
+            with s.activity() as activity:
+                activity.activityIdentifier = "GREENUP:20210202:FM:PRS"
+                activity.monitoringLocationIdentifier = "GREENUP"
+                activity.activityTypeCode = "Field Msr/Obs"
+                activity.activityMediaName = "Water"
+                activity.activityStartDate = datetime(2021, 2, 2)
+                activity.projectIdentifier = "TEST"
+                with activity.sample() as sample:
+                    sample.methodIdentifier = "QAPP"
+                    sample.methodIdentifierContext = "WQXTEST"
+                    sample.methodName = "Quality Assurance Project Plan"
+                    sample.sampleCollectionEquipmentName = "Probe/Sensor"
+                if s is submission:
+                    activity.resultTable(self.table)
+                else:
+                    for result in self.expected():
+                        activity.templateResult(
+                            self.template, *result._TemplateResult__values
+                        )
+        for compact in (False, True):
+            with self.subTest(compact=compact):
+                self.assertEqual(
+                    submission.export(compact=compact), expected.export(compact=compact)
+                )
+
+    def test_bulk(self):
+        values = [12.5, 12.75, 7.5, 7.25]
+        expected = create_submission(0)
+        for location in LOCATIONS:
+            with expected.activity() as activity:
+                activity.monitoringLocationIdentifier = location
+                activity.activityTypeCode = "Field Msr/Obs"
+                activity.activityMediaName = "Water"
+                activity.activityStartDate = datetime(2021, 2, 2)
+                activity.projectIdentifier = "TEST"
+                for name, value, time in zip(NAMES, values, TIMES):  # noqa: B905
+                    with activity.result() as result:
+                        result.characteristicName = name
+                        result.resultMeasureValue = str(value)
+                        result.resultMeasureUnitCode = "deg C"
+                        result.analysisStartTime = time
+        submission = create_submission(0)
+        activities = submission.addActivities(
+            monitoringLocationIdentifier=LOCATIONS,
+            activityTypeCode="Field Msr/Obs",
+            activityMediaName="Water",
+            activityStartDate=datetime(2021, 2, 2),
+            projectIdentifier="TEST",
+        )
+        for activity in activities:
+            activity.addResults(
+                characteristicName=NAMES,
+                resultMeasureValue=array("d", values),
+                resultMeasureUnitCode="deg C",
+                analysisStartTime=TIMES,
+            )
+        self.assertEqual(submission.export(), expected.export())
+        with self.assertRaises(ValueError):
+            submission.addActivities(
+                activityTypeCode=["Field Msr/Obs"], activityMediaName=[]
+            )
+        with self.assertRaises(TypeError):
+            activities[0].addResults(unknown=[1])
+        # Lists and elements are not shared between the activities
+        activities = submission.addActivities(
+            activityIdentifier=["A", "B"],
+            activityConductingOrganizationText="WQX Test Organization",
+            sampleDescription=SampleDescription(
+                sampleCollectionMethod=ReferenceMethod(
+                    methodIdentifier="QAPP",
+                    methodIdentifierContext="WQXTEST",
+                    methodName="Quality Assurance Project Plan",
+                ),
+                sampleCollectionEquipmentName="Probe/Sensor",
+            ),
+        )
+        first, second = activities
+        first.activityConductingOrganizationText.append("Other Organization")
+        self.assertEqual(
+            second.activityConductingOrganizationText, ["WQX Test Organization"]
+        )
+        self.assertIsNot(first.sampleDescription, second.sampleDescription)
+        self.assertIsNot(
+            first.sampleDescription.sampleCollectionMethod,
+            second.sampleDescription.sampleCollectionMethod,
+        )
+
+    def test_data_frame(self):
+        self.assertDataFrame(lambda frame: frame)
+
+    @unittest.skipIf(pandas is None, "pandas is not installed")
+    def test_pandas(self):
+        self.assertDataFrame(pandas.DataFrame)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_arrow(self):
+        self.assertDataFrame(pyarrow.table)
+
+    @unittest.skipIf(
+        pandas is None or pyarrow is None, "pandas or pyarrow is not installed"
+    )
+    def test_time_zones(self):
+        zone = ZoneInfo("America/New_York")
+        columns = {
+            "site": LOCATIONS,
+            "name": NAMES[:2],
+            "value": [12.5, 12.75],
+            "time": [datetime(2021, 2, 2, 10, tzinfo=zone)] * 2,
+        }
+        mapping = {
+            "monitoringLocationIdentifier": "site",
+            "characteristicName": "name",
+            "resultMeasureValue": "value",
+            "analysisStartTime": "time",
+        }
+        exports = []
+        for make in (pandas.DataFrame, pyarrow.table):
+            submission = create_submission(0)
+            submission.addDataFrame(
+                make(columns),
+                mapping,
+                activityTypeCode="Field Msr/Obs",
+                activityMediaName="Water",
+                activityStartDate=datetime(2021, 2, 2),
+                projectIdentifier="TEST",
+                resultMeasureUnitCode="deg C",
+            )
+            exports.append(submission.export(compact=True))
+        # The zone of the column is kept, rather than the times given in UTC
+        self.assertIn(
+            "<AnalysisStartTime><Time>10:00:00</Time>"
+            "<TimeZoneCode>EST</TimeZoneCode></AnalysisStartTime>",
+            exports[0],
+        )
+        self.assertEqual(exports[1], exports[0])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        times = numpy.array(
+            [x.replace(tzinfo=None) - x.utcoffset() for x in TIMES],
+            dtype="datetime64[ns]",
+        )
+        table = ResultTable(self.template, [NAMES, numpy.array(VALUES), times])
+        columns = table._ResultTable__columns
+        self.assertEqual([type(x) for x in columns[1:]], [NumberColumn, TimeColumn])
+        # NaN is a missing value
+        self.assertEqual(
+            [x.resultDescription.resultMeasure.resultMeasureValue for x in table],
+            ["12.5", "12.75", None, "0.00001"],
+        )
+        # Times without a zone are read as UTC
+        self.assertIn(
+            "<AnalysisStartTime><Time>18:00:00</Time>"
+            "<TimeZoneCode>UTC</TimeZoneCode></AnalysisStartTime>",
+            table[0].generateXML(),
+        )
+        submission = create_submission(0)
+        activities = submission.addActivities(
+            monitoringLocationIdentifier=numpy.array(LOCATIONS),
+            activityStartDate=numpy.array(["2021-02-02"] * 2, dtype="datetime64[D]"),
+            activityTypeCode="Field Msr/Obs",
+            activityMediaName="Water",
+        )
+        self.assertEqual(
+            [x.activityStartDate for x in activities], [date(2021, 2, 2)] * 2
+        )
+        activities[0].addResults(
+            characteristicName=NAMES,
+            resultMeasureValue=numpy.array(VALUES),
+            resultMeasureUnitCode="deg C",
+        )
+        results = activities[0]._Activity__results
+        self.assertEqual(
+            [x.resultDescription.resultMeasure.resultMeasureValue for x in results],
+            ["12.5", "12.75", None, "0.00001"],
+        )
+
+    def assertDataFrame(self, make: Callable[[Dict[str, list]], Any]) -> None:
+        """
+        Check that addDataFrame adds the activities and results of a table made from
+        a dictionary of lists.
+        """
+        values = [12.5, 12.75, 7.5, 7.25]
+        expected = create_submission(0)
+        for location in LOCATIONS:
+            with expected.activity() as activity:
+                activity.monitoringLocationIdentifier = location
+                activity.activityTypeCode = "Field Msr/Obs"
+                activity.activityMediaName = "Water"
+                activity.activityStartDate = datetime(2021, 2, 2)
+                activity.projectIdentifier = "TEST"
+                with activity.sample() as sample:
+                    sample.methodIdentifier = "QAPP"
+                    sample.methodIdentifierContext = "WQXTEST"
+                    sample.methodName = "Quality Assurance Project Plan"
+                    sample.sampleCollectionEquipmentName = "Probe/Sensor"
+                for name, value in zip(NAMES, values):  # noqa: B905
+                    with activity.result() as result:
+                        result.characteristicName = name
+                        result.resultMeasureValue = str(value)
+                        result.resultMeasureUnitCode = "deg C"
+        # A row per result, with the results of the activities interleaved
+        frame = make(
+            {
+                "site": [x for _ in NAMES for x in LOCATIONS],
+                "day": [datetime(2021, 2, 2)] * 8,
+                "name": [x for x in NAMES for _ in LOCATIONS],
+                "value": [x for x in values for _ in LOCATIONS],
+            }
+        )
+        submission = create_submission(0)
+        activities = submission.addDataFrame(
+            frame,
+            {
+                "monitoringLocationIdentifier": "site",
+                "activityStartDate": "day",
+                "characteristicName": "name",
+                "resultMeasureValue": "value",
+            },
+            activityTypeCode="Field Msr/Obs",
+            activityMediaName="Water",
+            projectIdentifier="TEST",
+            sampleDescription=SampleDescription(
+                sampleCollectionMethod=ReferenceMethod(
+                    methodIdentifier="QAPP",
+                    methodIdentifierContext="WQXTEST",
+                    methodName="Quality Assurance Project Plan",
+                ),
+                sampleCollectionEquipmentName="Probe/Sensor",
+            ),
+            resultMeasureUnitCode="deg C",
+        )
+        self.assertEqual(len(activities), 2)
+        self.assertEqual(submission.export(), expected.export())
@@ -0,0 +1,100 @@
+import pickle
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from wqxlib.ResultTemplate import ResultTemplate
+from wqxlib.wqx_v3_0 import Measure, Result, ResultDescription, ResultLabInformation
+
+from .test_wqx_submission import create_submission
+
+TIME = datetime(2021, 2, 2, 12, 30, tzinfo=timezone(timedelta(hours=-6)))
+
+
+class TestResultTemplate(unittest.TestCase):
+    def setUp(self):
+        self.template = ResultTemplate(
+            Result(
+                resultDescription=ResultDescription(
+                    characteristicNameUserSupplied="Sonde <1> & logger",
+                    resultMeasure=Measure(measureUnitCode="deg C"),
+                    resultStatusIdentifier="Final",
+                )
+            ),
+            [
+                "resultDescription.characteristicName",
+                "resultDescription.resultMeasure.resultMeasureValue",
+                "resultLabInformation.analysisStartTime",
+            ],
+        )
+
+    def expected(self, value: str) -> Result:
+        return Result(
+            resultDescription=ResultDescription(
+                characteristicName="Temperature, water",
+                characteristicNameUserSupplied="Sonde <1> & logger",
+                resultMeasure=Measure(resultMeasureValue=value, measureUnitCode="deg C"),
+                resultStatusIdentifier="Final",
+            ),
+            resultLabInformation=ResultLabInformation(analysisStartTime=TIME),
+        )
+
+    def test_generate_xml(self):
+        result = self.template.result("Temperature, water", "12.5", TIME)
+        self.assertEqual(result.generateXML(), self.expected("12.5").generateXML())
+
+    def test_submission(self):
+        expected = create_submission()
+        submission = create_submission()
+        for s in (submission, expected):
+            with s.activity() as activity:
+                activity.activityIdentifier = "GREENUP:20210202:FM:PRS"
+                activity.monitoringLocationIdentifier = "GREENUP"
+                activity.activityTypeCode = "Field Msr/Obs"
+                activity.activityMediaName = "Water"
+                activity.activityStartDate = datetime(2021, 2, 2)
+                activity.projectIdentifier = "TEST"
+                with activity.sample() as sample:
+                    sample.methodIdentifier = "QAPP"
+                    sample.methodIdentifierContext = "WQXTEST"
+                    sample.methodName = "Quality Assurance Project Plan"
+                    sample.sampleCollectionEquipmentName = "Probe/Sensor"
+                for value in ("12.5", "13 & <14>"):
+                    if s is submission:
+                        activity.templateResult(
+                            self.template, "Temperature, water", value, TIME
+                        )
+                        continue
+                    with activity.result() as result:
+                        result.characteristicName = "Temperature, water"
+                        result.characteristicNameUserSupplied = "Sonde <1> & logger"
+                        result.resultMeasureValue = value
+                        result.resultMeasureUnitCode = "deg C"
+                        result.resultStatusIdentifier = "Final"
+                        result.analysisStartTime = TIME
+        for compact in (False, True):
+            with self.subTest(compact=compact):
+                self.assertEqual(
+                    submission.export(compact=compact), expected.export(compact=compact)
+                )
+
+    def test_missing_value(self):
+        result = self.template.result("Temperature, water", "12.5", None)
+        expected = self.expected("12.5")
+        expected.resultLabInformation = None
+        self.assertEqual(result.generateXML(), expected.generateXML())
+
+    def test_materialize(self):
+        result = self.template.result("Temperature, water", "12.5", TIME)
+        copy = pickle.loads(pickle.dumps(result))
+        self.assertEqual(
+            result.resultDescription.resultMeasure.resultMeasureValue, "12.5"
+        )
+        result.resultDescription.resultMeasure.resultMeasureValue = "14"
+        self.assertEqual(result.generateXML(), self.expected("14").generateXML())
+        self.assertEqual(copy.generateXML(), self.expected("12.5").generateXML())
+
+    def test_invalid_slot(self):
+        with self.assertRaises(ValueError):
+            ResultTemplate(Result(), ["resultDescription.characteristic"])
+        with self.assertRaises(ValueError):
+            ResultTemplate(Result(), ["attachedBinaryObject"])
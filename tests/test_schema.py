@@ -0,0 +1,191 @@
+import json
+import pickle
+import unittest
+from copy import deepcopy
+from datetime import date
+from xml.etree.ElementTree import fromstring
+
+from wqxlib import XMLWriter
+from wqxlib.exceptions import WQXException
+from wqxlib.Schema import decode, validate
+from wqxlib.wqx_v3_0 import (
+    WQX,
+    BibliographicReference,
+    CharacteristicName,
+    Measure,
+    MeasureCompact,
+    Organization,
+    OrganizationAddress,
+    ResultDescription,
+    TribalLandIndicator,
+)
+from wqxlib.WQXResult import WQXResult
+
+from .test_wqx_submission import create_submission
+
+
+class TestSchema(unittest.TestCase):
+    def test_generate_xml(self):
+        measure = Measure(
+            resultMeasureValue="<0.5",
+            measureUnitCode="mg/L",
+            measureQualifierCode=["J", "U"],
+        )
+        expected = (
+            "<ResultMeasure><ResultMeasureValue>&lt;0.5</ResultMeasureValue>"
+            "<MeasureUnitCode>mg/L</MeasureUnitCode>"
+            "<MeasureQualifierCode>J</MeasureQualifierCode>"
+            "<MeasureQualifierCode>U</MeasureQualifierCode></ResultMeasure>"
+        )
+        self.assertEqual(measure.generateXML("ResultMeasure"), expected)
+        writer = XMLWriter(indentation="  ")
+        measure.generateXML("ResultMeasure", writer)
+        self.assertEqual(
+            writer.getvalue(),
+            "<ResultMeasure>\n"
+            "  <ResultMeasureValue>&lt;0.5</ResultMeasureValue>\n"
+            "  <MeasureUnitCode>mg/L</MeasureUnitCode>\n"
+            "  <MeasureQualifierCode>J</MeasureQualifierCode>\n"
+            "  <MeasureQualifierCode>U</MeasureQualifierCode>\n"
+            "</ResultMeasure>",
+        )
+
+    def test_required(self):
+        measure = MeasureCompact(measureValue="1")
+        with self.assertRaisesRegex(WQXException, "'measureUnitCode' is required"):
+            measure.generateXML()
+
+    def test_occurrences(self):
+        measure = Measure(measureQualifierCode=["J"] * 7)
+        with self.assertRaisesRegex(WQXException, "list of 0 to 6 MeasureQualifierCode"):
+            measure.generateXML()
+
+    def test_validate(self):
+        organization = Organization(organizationAddress=[OrganizationAddress()] * 4)
+        self.assertEqual(
+            validate(organization),
+            [
+                "Organization: Attribute 'organizationDescription' is required.",
+                "Organization: Attribute 'organizationAddress' must be a list of 0 to 3 "
+                "OrganizationAddress objects.",
+            ],
+        )
+
+    def test_compact(self):
+        measure = Measure(resultMeasureValue="1", measureUnitCode="mg/L")
+        self.assertIsInstance(measure, Measure)
+        self.assertFalse(hasattr(measure, "__dict__"))
+        for copy in (deepcopy(measure), pickle.loads(pickle.dumps(measure))):
+            self.assertIs(type(copy), Measure.Compact)
+            self.assertEqual(copy.generateXML(), measure.generateXML())
+        # Facades combine several classes, so they cannot be compact
+        result = WQXResult()
+        result.resultMeasureValue = "1"
+        owned = result.resultMeasure
+        result.resultMeasureUnitCode = "mg/L"
+        # The properties of facades change the measure they hold in place
+        self.assertIs(result.resultMeasure, owned)
+        self.assertEqual(result.resultMeasure.generateXML(), measure.generateXML())
+
+    def test_adopt(self):
+        codes = ["J"]
+        measure = Measure.adopt(resultMeasureValue="<0.5", measureQualifierCode=codes)
+        self.assertIs(measure.measureQualifierCode, codes)
+        self.assertIsNone(measure.measureUnitCode)
+        self.assertEqual(Measure.adopt(measure).generateXML(), measure.generateXML())
+        # Values are taken as they are, without the checks of the setters
+        self.assertEqual(
+            Measure.adopt(measureQualifierCode=None).measureQualifierCode, []
+        )
+        result = WQXResult()
+        result.resultMeasureValue = "1"
+        description = ResultDescription.adopt(result)
+        self.assertIs(type(description), ResultDescription.Compact)
+        self.assertIs(description.resultMeasure, result.resultMeasure)
+        with self.assertRaises(TypeError):
+            Measure.adopt(unknown=1)
+
+    def test_interned(self):
+        name = CharacteristicName("Temperature, water")
+        self.assertIs(CharacteristicName("Temperature, water"), name)
+        self.assertIs(
+            Measure(measureUnitCode="deg C").measureUnitCode,
+            Measure(measureUnitCode="deg C").measureUnitCode,
+        )
+        with self.assertRaises(ValueError):
+            CharacteristicName("x" * 256)
+        # Keywords are passed on to the class
+        self.assertEqual(TribalLandIndicator(o=True), "true")
+        self.assertIs(type(TribalLandIndicator(o="Y")), TribalLandIndicator)
+
+    def test_validate_values(self):
+        measure = Measure.adopt(resultMeasureValue="1", measureUnitCode="x" * 13)
+        self.assertEqual(validate(measure), [])
+        self.assertEqual(
+            validate(measure, values=True),
+            [
+                "Measure: Attribute 'measureUnitCode' is invalid: MeasureUnitCode "
+                "must be between 0 and 12 characters."
+            ],
+        )
+        measure.measureUnitCode = "mg/L"
+        description = ResultDescription.adopt(
+            characteristicName="pH", resultMeasure=measure
+        )
+        self.assertEqual(validate(description, values=True), [])
+        # Checked values are turned into the types of their fields
+        self.assertIs(type(description.characteristicName), CharacteristicName)
+        # Elements of the wrong type are reported rather than looked into
+        result = WQXResult.adopt(
+            resultDescription={"characteristicName": "pH"},
+            attachedBinaryObject=["x"],
+        )
+        self.assertEqual(
+            validate(result),
+            [
+                "Result: Attribute 'resultDescription' is invalid: Expected "
+                "ResultDescription, not dict.",
+                "Result: Attribute 'attachedBinaryObject' is invalid: Expected "
+                "AttachedBinaryObject, not str.",
+            ],
+        )
+
+    def test_dict(self):
+        submission = create_submission(locations=2)
+        submission.normalize()
+        wqx = submission.payload[0].wqx
+        d = json.loads(json.dumps(wqx.toDict()))
+        self.assertEqual(WQX.fromDict(d).generateXML(), wqx.generateXML())
+        measure = Measure.fromDict({"resultMeasureValue": 1.5})
+        self.assertEqual(measure.toDict(), {"resultMeasureValue": "1.5"})
+        self.assertEqual(measure.measureQualifierCode, [])
+        # Values read from dictionaries and XML are checked like adopted ones
+        message = (
+            "Measure: Attribute 'measureUnitCode' is invalid: MeasureUnitCode must be "
+            "between 0 and 12 characters."
+        )
+        measure = Measure.fromDict(
+            {"resultMeasureValue": "1", "measureUnitCode": "x" * 13}
+        )
+        self.assertEqual(validate(measure, values=True), [message])
+        element = fromstring(
+            "<ResultMeasure><ResultMeasureValue>1</ResultMeasureValue>"
+            f"<MeasureUnitCode>{'x' * 13}</MeasureUnitCode></ResultMeasure>"
+        )
+        self.assertEqual(validate(decode(element, Measure), values=True), [message])
+
+    def test_bibliographic_reference(self):
+        reference = BibliographicReference(
+            resourceTitleName="Field Guide",
+            resourceDate=date(2021, 1, 1),
+            resourceIdentifier="FG-1",
+        )
+        self.assertEqual(
+            reference.generateXML(),
+            "<BibliographicReference><ResourceTitleName>Field Guide</ResourceTitleName>"
+            "<ResourceDate>2021-01-01</ResourceDate>"
+            "<ResourceIdentifier>FG-1</ResourceIdentifier></BibliographicReference>",
+        )
+        self.assertEqual(validate(reference, values=True), [])
+        copy = BibliographicReference(reference)
+        self.assertEqual(copy.generateXML(), reference.generateXML())
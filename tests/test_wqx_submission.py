@@ -0,0 +1,279 @@
+import os
+import tempfile
+import unittest
+import xml.etree.cElementTree as ET
+from datetime import datetime, timedelta, timezone
+from typing import List
+from zipfile import ZIP_DEFLATED, ZIP_LZMA, ZIP_STORED, ZipFile
+
+from wqxlib import WQXSubmission
+from wqxlib.exceptions import WQXLibException
+from wqxlib.wqx_v3_0 import ActivityGroup
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+
+def create_submission(locations: int = 1) -> WQXSubmission:
+    submission = WQXSubmission()
+    submission.id = "72420"
+    submission.author = "John Doe"
+    submission.organization = "Test Organization"
+    submission.creationTime = datetime(
+        2021, 3, 4, 13, 22, 37, tzinfo=timezone(timedelta(hours=-6))
+    )
+    submission.organizationIdentifier = "WQXTEST"
+    submission.organizationFormalName = "WQX Test Organization"
+    for i in range(locations):
+        add_activity(submission, "GREENUP" if i == 0 else f"GREENUP{i}")
+    return submission
+
+
+def add_activity(submission: WQXSubmission, location: str) -> None:
+    with submission.activity() as activity:
+        activity.activityIdentifier = f"{location}:20210202:FM"
+        activity.monitoringLocationIdentifier = location
+        activity.activityTypeCode = "Field Msr/Obs"
+        activity.activityMediaName = "Water"
+        activity.activityStartDate = datetime(2021, 2, 2)
+        activity.projectIdentifier = "TEST"
+        with activity.sample() as sample:
+            sample.methodIdentifier = "QAPP"
+            sample.methodIdentifierContext = "WQXTEST"
+            sample.methodName = "Quality Assurance Project Plan"
+            sample.sampleCollectionEquipmentName = "Probe/Sensor"
+        for characteristic, unit, value in [
+            ("Temperature, water", "deg C", "3.56"),
+            ("pH", "None", "7.77"),
+        ]:
+            with activity.result() as result:
+                result.characteristicName = characteristic
+                result.resultMeasureUnitCode = unit
+                result.resultMeasureValue = value
+
+
+def canonical(xml: str) -> bytes:
+    element = ET.fromstring(xml)
+    for node in element.iter():
+        if node.text is not None and not node.text.strip():
+            node.text = None
+        node.tail = None
+    return ET.tostring(element)
+
+
+class TestWQXSubmissionExport(unittest.TestCase):
+    def setUp(self):
+        self.submission = create_submission()
+        self.expected = canonical(self.submission.export())
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_stream_xml(self):
+        filename = os.path.join(self.tmp.name, "submission.xml")
+        self.assertIsNone(self.submission.export(filename, stream=True))
+        with open(filename, encoding="utf-8") as f:
+            self.assertEqual(canonical(f.read()), self.expected)
+
+    def test_stream_unknown_suffix(self):
+        filename = os.path.join(self.tmp.name, "submission.txt")
+        with self.assertRaises(ValueError):
+            self.submission.export(filename, stream=True)
+        self.assertFalse(os.path.exists(filename))
+
+    def test_stream_zip(self):
+        filename = os.path.join(self.tmp.name, "submission.zip")
+        self.assertIsNone(self.submission.export(filename, stream=True))
+        with ZipFile(filename) as zip:
+            self.assertEqual(zip.namelist(), ["submission.xml"])
+            xml = zip.read("submission.xml").decode("utf-8")
+        self.assertEqual(canonical(xml), self.expected)
+
+    def test_workers(self):
+        submission = create_submission(3)
+        for compact in [False, True]:
+            self.assertEqual(
+                submission.export(compact=compact, workers=2),
+                submission.export(compact=compact),
+            )
+        filename = os.path.join(self.tmp.name, "submission.zip")
+        submission.export(filename, stream=True, workers=2)
+        with ZipFile(filename) as zip:
+            xml = zip.read("submission.xml").decode("utf-8")
+        self.assertEqual(xml, submission.export())
+
+    def test_cache(self):
+        submission = create_submission(3)
+        xml = submission.export(cache=True)
+        self.assertEqual(xml, submission.export())
+        self.assertEqual(submission.export(cache=True), xml)
+        submission.normalize()
+        organization = submission.payload[0].wqx.organization
+        result = organization.activity[1].results[0]
+        result.resultDescription.resultMeasure.resultMeasureValue = "4.25"
+        xml = submission.export(cache=True)
+        self.assertIn("<ResultMeasureValue>4.25</ResultMeasureValue>", xml)
+        self.assertEqual(xml, submission.export())
+        self.assertEqual(
+            submission.export(compact=True, cache=True), submission.export(compact=True)
+        )
+
+    def test_cache_reuse(self):
+        submission = create_submission(5)
+
+        def fragments():
+            organization = submission.payload[0].wqx.organization
+            return [x._XMLFragment__snapshot.fragment for x in organization.activity]
+
+        submission.export(cache=True)
+        before = fragments()
+        submission.export(cache=True)
+        after = fragments()
+        # Nothing changed, so the XML of every activity is reused
+        reused = [x is y for x, y in zip(before, after)]  # noqa: B905
+        self.assertEqual(reused, [True] * 5)
+        organization = submission.payload[0].wqx.organization
+        result = organization.activity[1].results[0]
+        result.resultDescription.resultMeasure.resultMeasureValue = "4.25"
+        submission.export(cache=True)
+        reused = [x is y for x, y in zip(after, fragments())]  # noqa: B905
+        self.assertEqual(reused, [True, False, True, True, True])
+
+    @unittest.skipIf(pandas is None, "pandas is not installed")
+    def test_data_frame_missing_text(self):
+        # pandas gives missing text as NaN, which leaves the result without it
+        frame = pandas.DataFrame(
+            {
+                "site": ["GREENUP"] * 3,
+                "name": ["pH"] * 3,
+                "value": [7.5, 7.25, 7.0],
+                "comment": ["Calibrated", None, "Windy"],
+            }
+        )
+        submission = create_submission(0)
+        submission.addDataFrame(
+            frame,
+            {
+                "monitoringLocationIdentifier": "site",
+                "characteristicName": "name",
+                "resultMeasureValue": "value",
+                "resultCommentText": "comment",
+            },
+            activityTypeCode="Field Msr/Obs",
+            activityMediaName="Water",
+            activityStartDate=datetime(2021, 2, 2),
+            projectIdentifier="TEST",
+            resultMeasureUnitCode="None",
+        )
+        results = ET.fromstring(submission.export()).iter(
+            "{http://www.exchangenetwork.net/schema/wqx/3}Result"
+        )
+        self.assertEqual(
+            [x.findtext(".//{*}ResultCommentText") for x in results],
+            ["Calibrated", None, "Windy"],
+        )
+
+    def test_zip_compression(self):
+        for stream in [False, True]:
+            for compression in [ZIP_STORED, ZIP_DEFLATED, ZIP_LZMA]:
+                filename = os.path.join(self.tmp.name, f"{stream}{compression}.zip")
+                self.submission.export(
+                    filename, stream=stream, compression=compression, compresslevel=1
+                )
+                with ZipFile(filename) as zip:
+                    info = zip.getinfo("submission.xml")
+                    self.assertEqual(info.compress_type, compression)
+                    xml = zip.read(info).decode("utf-8")
+                self.assertEqual(canonical(xml), self.expected)
+
+
+class TestWQXSubmissionSplit(unittest.TestCase):
+    def setUp(self):
+        self.submission = create_submission(3)
+        self.submission.normalize()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def activities(self, part) -> List[str]:
+        organization = part.payload[0].wqx.organization
+        return [a.activityDescription.activityIdentifier for a in organization.activity]
+
+    def test_split_max_results(self):
+        parts = self.submission.split(maxResults=4)
+        self.assertEqual([part.id for part in parts], ["72420-1", "72420-2"])
+        self.assertEqual(
+            [self.activities(part) for part in parts],
+            [
+                ["GREENUP:20210202:FM", "GREENUP1:20210202:FM"],
+                ["GREENUP2:20210202:FM"],
+            ],
+        )
+        for part in parts:
+            self.assertEqual(part.header.author, "John Doe")
+            ET.fromstring(part.generateXML())
+
+    def test_split_activity_groups(self):
+        organization = self.submission.payload[0].wqx.organization
+        organization.activityGroup = [
+            ActivityGroup.adopt(
+                activityGroupIdentifier=identifier,
+                activityGroupTypeCode="Replicate",
+                activityIdentifier=activities,
+            )
+            for identifier, activities in [
+                ("FIRST", ["GREENUP:20210202:FM", "GREENUP1:20210202:FM"]),
+                ("SECOND", ["GREENUP2:20210202:FM", "GREENUP:20201201:FM"]),
+            ]
+        ]
+        parts = self.submission.split(maxResults=4)
+        self.assertEqual(
+            [
+                [
+                    x.activityGroupIdentifier
+                    for x in part.payload[0].wqx.organization.activityGroup
+                ]
+                for part in parts
+            ],
+            [["FIRST"], ["SECOND"]],
+        )
+        # A group cannot be split across parts
+        with self.assertRaises(WQXLibException):
+            self.submission.split(maxResults=2)
+
+    def test_split_max_bytes(self):
+        size = len(self.submission.split()[0].generateXML(compact=True))
+        self.assertEqual(len(self.submission.split(maxBytes=size)), 1)
+        self.assertEqual(len(self.submission.split(maxBytes=1)), 3)
+
+    def test_export_parts(self):
+        filename = os.path.join(self.tmp.name, "submission.zip")
+        names = self.submission.exportParts(filename, maxResults=2)
+        self.assertEqual(names, [f"submission_{i}.xml" for i in range(1, 4)])
+        with ZipFile(filename) as archive:
+            self.assertEqual(archive.namelist(), names)
+        filename = os.path.join(self.tmp.name, "submission.xml")
+        names = self.submission.exportParts(filename, byMonitoringLocation=True)
+        self.assertEqual(len(names), 3)
+        parts = []
+        for name in names:
+            with open(name, encoding="utf-8") as f:
+                parts.append(f.read())
+            ET.fromstring(parts[-1])
+        # Parts written at once by a pool of processes are the same
+        names = self.submission.exportParts(
+            filename, byMonitoringLocation=True, workers=2
+        )
+        for name, xml in zip(names, parts):  # noqa: B905
+            with open(name, encoding="utf-8") as f:
+                self.assertEqual(f.read(), xml)
+        filename = os.path.join(self.tmp.name, "submission.zip")
+        self.submission.exportParts(filename, byMonitoringLocation=True, workers=2)
+        with ZipFile(filename) as archive:
+            self.assertEqual(
+                [archive.read(x).decode("utf-8") for x in archive.namelist()], parts
+            )
@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+
+from wqxlib.XMLIndex import ActivityIndex
+from wqxlib.XMLReader import readActivities
+
+from .test_wqx_submission import create_submission
+
+
+class TestActivityIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, "submission.xml")
+        with open(self.filename, "w", encoding="utf-8") as f:
+            f.write(create_submission(locations=3).export())
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_lookup(self):
+        index = ActivityIndex(self.filename)
+        activities = list(readActivities(self.filename))
+        self.assertEqual(len(index), 3)
+        for activity in activities:
+            description = activity.activityDescription
+            found = index.activity(description.activityIdentifier)
+            self.assertEqual(found.generateXML(), activity.generateXML())
+            found = index.byMonitoringLocation(description.monitoringLocationIdentifier)
+            self.assertEqual([x.generateXML() for x in found], [activity.generateXML()])
+        self.assertEqual(len(index.byProject("TEST")), 3)
+        with self.assertRaises(KeyError):
+            index.activity("MISSING")
+
+    def test_save(self):
+        index = ActivityIndex.load(self.filename)
+        self.assertTrue(os.path.exists(ActivityIndex.indexFilename(self.filename)))
+        loaded = ActivityIndex.load(self.filename)
+        self.assertEqual(loaded.identifiers(), index.identifiers())
+        identifier = index.identifiers()[1]
+        self.assertEqual(
+            loaded.activity(identifier).generateXML(),
+            index.activity(identifier).generateXML(),
+        )
@@ -0,0 +1,38 @@
+import io
+import os
+import tempfile
+import unittest
+
+from wqxlib.XMLReader import readActivities, readDocument
+
+from .test_wqx_submission import create_submission
+
+
+class TestXMLReader(unittest.TestCase):
+    def setUp(self):
+        self.submission = create_submission(locations=3)
+
+    def test_round_trip(self):
+        for compact in (False, True):
+            with self.subTest(compact=compact):
+                xml = self.submission.export(compact=compact)
+                document = readDocument(io.BytesIO(xml.encode("utf-8")))
+                self.assertEqual(document.generateXML(compact=compact), xml)
+
+    def test_zip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "submission.zip")
+            xml = self.submission.export(filename)
+            self.assertEqual(readDocument(filename).generateXML(), xml)
+
+    def test_read_activities(self):
+        xml = self.submission.export().encode("utf-8")
+        activities = list(readActivities(io.BytesIO(xml)))
+        self.assertEqual(
+            [x.activityDescription.monitoringLocationIdentifier for x in activities],
+            ["GREENUP", "GREENUP1", "GREENUP2"],
+        )
+        self.assertEqual(
+            activities[0].results[0].resultDescription.characteristicName,
+            "Temperature, water",
+        )
@@ -0,0 +1,143 @@
+import unittest
+from io import StringIO
+
+from wqxlib import Document, XMLWriter
+from wqxlib.wqx_v3_0 import Measure, Result, ResultDescription
+from wqxlib.XMLWriter import getWriter
+
+from .test_wqx_submission import create_submission
+
+try:
+    import lxml  # noqa F401
+except ImportError:
+    lxml = None
+
+
+class TestXMLWriter(unittest.TestCase):
+    def setUp(self):
+        self.result = Result(
+            resultDescription=ResultDescription(
+                characteristicName="Temperature, water",
+                characteristicNameUserSupplied="Temp <probe> & logger",
+                resultMeasure=Measure(resultMeasureValue="12.5", measureUnitCode="deg C"),
+            )
+        )
+
+    def test_generate_xml_matches_shared_writer(self):
+        writer = XMLWriter()
+        self.assertEqual(self.result.generateXML("Result", writer), "")
+        self.result.generateXML("Result", writer)
+        self.assertEqual(writer.getvalue(), self.result.generateXML() * 2)
+
+    def test_stream_writer(self):
+        stream = StringIO()
+        writer = XMLWriter(stream)
+        self.result.generateXML("Result", writer)
+        self.assertEqual(writer.getvalue(), "")
+        self.assertEqual(
+            stream.getvalue(),
+            "<Result><ResultDescription>"
+            "<CharacteristicName>Temperature, water</CharacteristicName>"
+            "<CharacteristicNameUserSupplied>Temp &lt;probe&gt; &amp; logger"
+            "</CharacteristicNameUserSupplied>"
+            "<ResultMeasure><ResultMeasureValue>12.5</ResultMeasureValue>"
+            "<MeasureUnitCode>deg C</MeasureUnitCode></ResultMeasure>"
+            "</ResultDescription></Result>",
+        )
+
+    def test_attribute_escaping(self):
+        writer = XMLWriter()
+        with writer.tag("Payload", ("Operation", 'A "quoted" & <value>\n')):
+            writer.line("Name", 3)
+            writer.line("Text", "Line\r\n")
+        self.assertEqual(
+            writer.getvalue(),
+            '<Payload Operation="A &quot;quoted&quot; &amp; &lt;value&gt;&#10;">'
+            "<Name>3</Name><Text>Line&#13;\n</Text></Payload>",
+        )
+
+    def test_indentation(self):
+        writer = XMLWriter(indentation="  ")
+        writer.asis('<?xml version="1.0" encoding="UTF-8"?>')
+        with writer.tag("Activity"):
+            with writer.tag("Empty"):
+                pass
+            self.result.generateXML("Result", writer)
+        self.assertEqual(
+            writer.getvalue(),
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            "<Activity>\n"
+            "  <Empty></Empty>\n"
+            "  <Result>\n"
+            "    <ResultDescription>\n"
+            "      <CharacteristicName>Temperature, water</CharacteristicName>\n"
+            "      <CharacteristicNameUserSupplied>Temp &lt;probe&gt; &amp; logger"
+            "</CharacteristicNameUserSupplied>\n"
+            "      <ResultMeasure>\n"
+            "        <ResultMeasureValue>12.5</ResultMeasureValue>\n"
+            "        <MeasureUnitCode>deg C</MeasureUnitCode>\n"
+            "      </ResultMeasure>\n"
+            "    </ResultDescription>\n"
+            "  </Result>\n"
+            "</Activity>",
+        )
+
+
+@unittest.skipIf(lxml is None, "lxml is not installed")
+class TestLxmlWriter(unittest.TestCase):
+    """
+    Every backend must write exactly the same bytes as XMLWriter.
+    """
+
+    def assertSameOutput(self, write, **kwargs):
+        expected = XMLWriter(**kwargs)
+        write(expected)
+        actual = getWriter("lxml")(**kwargs)
+        write(actual)
+        self.assertEqual(actual.getvalue(), expected.getvalue())
+
+    def test_escaping(self):
+        def write(writer):
+            with writer.tag("Payload", ("Operation", '"A"\t& <b>\r\n'), ("Count", 2)):
+                writer.line("Name", 'Temp <probe> & "logger"\r\n')
+                writer.line("Value", 12.5)
+                writer.line("Count", 3, ("Unit", "#"))
+
+        self.assertSameOutput(write)
+        self.assertSameOutput(write, indentation="  ")
+
+    def test_namespaces(self):
+        def write(writer):
+            writer.asis('<?xml version="1.0" encoding="UTF-8"?>')
+            with writer.tag(
+                "WQX",
+                ("xmlns", "http://www.exchangenetwork.net/schema/wqx/3"),
+                ("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance"),
+                ("xsi:schemaLocation", "http://www.exchangenetwork.net/schema/wqx/3"),
+            ):
+                with writer.tag("Empty"):
+                    pass
+
+        self.assertSameOutput(write, indentation="  ")
+
+    def test_submission(self):
+        submission = create_submission(locations=3)
+        submission.normalize()
+        for compact in (False, True):
+            with self.subTest(compact=compact):
+                self.assertEqual(
+                    submission.export(compact=compact, backend="lxml"),
+                    submission.export(compact=compact),
+                )
+
+    def test_stream(self):
+        submission = create_submission()
+        expected = submission.export()
+        # The second pass writes the XML cached by the first one
+        for _ in range(2):
+            stream = StringIO()
+            writer = getWriter("lxml")(stream, "  ", cache=True)
+            Document.generateXML(submission, writer=writer)
+            self.assertEqual(stream.getvalue(), expected)
+            # The document is finished, so lxml let go of its output
+            self.assertIsNone(writer._LxmlWriter__file)
@@ -0,0 +1,1352 @@
+from collections import Counter
+from inspect import cleandoc
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .Payload import Payload
+
+Check = Callable[[Any, "Context"], bool]
+Condition = Callable[[Any], bool]
+
+
+class Rule:
+    """
+    A data rule of WQX, as opposed to the rules of its XSD. Its checks are registered
+    for the kinds of elements they apply to (see KINDS), and each returns True when
+    the element it is given violates the rule.
+
+    A check of the elements inside activities may only apply to some activities, such
+    as those of biological samples. It is then given a condition, which is called
+    once per activity rather than once per element.
+
+    :param number: Number of the rule in the WQX documentation, which identifies it
+    :param text: Text of the rule, which is reported for every violation
+    :param categories: Categories of the rule, by which rules are enabled or disabled
+        together (see RuleSet)
+    """
+
+    def __init__(self, number: int, text: str, categories: Tuple[str, ...] = ()):
+        self.number = number
+        self.text = cleandoc(text)
+        self.categories = categories
+        self.checks: Dict[str, List[Tuple[Check, Optional[Condition]]]] = {}
+        RULES.append(self)
+
+    def __repr__(self) -> str:
+        return f"Rule({self.number})"
+
+    def check(self, *kinds: str, when: Condition = None) -> Callable[[Check], Check]:
+        """
+        Register the decorated function as a check of elements of the given kinds,
+        which only applies inside the activities for which when returns True, if
+        given.
+        """
+
+        def register(check: Check) -> Check:
+            for kind in kinds:
+                if kind not in KINDS:
+                    raise ValueError(f"Unknown kind of element {kind!r}.")
+                if when is not None and kind not in INSIDE_ACTIVITY:
+                    raise ValueError(f"{kind} is not inside an activity.")
+                self.checks.setdefault(kind, []).append((check, when))
+            return check
+
+        return register
+
+
+# Every rule, in order of their numbers
+RULES: List[Rule] = []
+
+
+class Context:
+    """
+    What the checks of an element may need besides the element: the organization,
+    activity and result it belongs to, and the identifiers collected for rule 19.
+    """
+
+    def __init__(self, organization: Any):
+        self.organization = organization
+        self.activity = None
+        self.result = None
+        self.identifiers: List[str] = []
+
+
+# Kinds of elements checked, in the order they are visited within an organization.
+# The elements inside another one are visited before it.
+KINDS = (
+    "ElectronicAddress",
+    "Telephonic",
+    "OrganizationAddress",
+    "ProjectMonitoringLocationWeighting",
+    "Project",
+    "MonitoringLocation",
+    "BiologicalHabitatIndex",
+    "ActivityMetric",
+    "DetectionQuantitationLimit",
+    "FrequencyClassInformation",
+    "BiologicalResultDescription",
+    "Result",
+    "Activity",
+    "ActivityGroup",
+    "Organization",
+)
+INSIDE_ACTIVITY = (
+    "ActivityMetric",
+    "DetectionQuantitationLimit",
+    "FrequencyClassInformation",
+    "BiologicalResultDescription",
+    "Result",
+)
+
+# Domain lists the rules depend on, which are not filled in yet
+MONITORING_LOCATION_REQUIRED: List[str] = []
+ANALYTICAL_METHOD_REQUIRED: List[str] = []  # TODO: Add domain values
+SAMPLE_FRACTION_REQUIRED: List[str] = []  # TODO: Add domain values
+ANALYTICAL_METHOD_CONTEXTS: List[str] = []
+PICK_LIST_CHARACTERISTICS: List[str] = []
+PICK_LIST_VALUES: List[str] = []
+METRIC_TYPE_CONTEXTS: List[str] = []
+METRIC_TYPES: List[str] = []
+UNIT_REQUIRED: List[str] = []
+BOUNDS_REQUIRED: List[str] = []
+
+DETECTION_CONDITIONS = (
+    "Not Detected",
+    "Present Above Quantification Limit",
+    "Present Below Quantification Limit",
+)
+# Biological intents for which ResultAnalyticalMethod is never required
+UNANALYZED_INTENTS = (
+    "Individual",
+    "Population Census",
+    "Frequency Class",
+    "Group Summary",
+)
+BENTHIC = "Benthic Macroinvertebrates"
+
+
+def missingUnit(value: Any, unit: Any) -> bool:
+    return value is not None and unit is None
+
+
+def missingValue(value: Any, unit: Any) -> bool:
+    return value is None and unit is not None
+
+
+def activityMeasures(activity: Any) -> Iterable[Any]:
+    """
+    Measures of an activity outside of its results and metrics.
+    """
+    description = activity.activityDescription
+    if description is not None:
+        yield description.activityDepthHeightMeasure
+        yield description.activityTopDepthHeightMeasure
+        yield description.activityBottomDepthHeightMeasure
+    if activity.activityLocation is not None:
+        yield activity.activityLocation.horizontalAccuracyMeasure
+    biological = activity.biologicalActivityDescription
+    if biological is None:
+        return
+    habitat = biological.biologicalHabitatCollectionInformation
+    if habitat is None:
+        return
+    yield habitat.collectionDuration
+    yield habitat.collectionArea
+    yield habitat.reachLengthMeasure
+    yield habitat.reachWidthMeasure
+    net = habitat.netInformation
+    if net is not None:
+        yield net.netSurfaceAreaMeasure
+        yield net.netMeshSizeMeasure
+        yield net.boatSpeedMeasure
+        yield net.currentSpeedMeasure
+
+
+def monitoringLocationMeasures(location: Any) -> Iterable[Any]:
+    geospatial = location.monitoringLocationGeospatial
+    if geospatial is not None:
+        yield geospatial.horizontalAccuracyMeasure
+        yield geospatial.verticalAccuracyMeasure
+        yield geospatial.verticalMeasure
+    identity = location.monitoringLocationIdentity
+    if identity is not None:
+        yield identity.drainageAreaMeasure
+        yield identity.contributingDrainageAreaMeasure
+    well = location.wellInformation
+    if well is not None:
+        yield well.wellHoleDepthMeasure
+        yield well.wellDepthMeasure
+
+
+def mediaName(activity: Any) -> Any:
+    description = activity.activityDescription
+    return None if description is None else description.activityMediaName
+
+
+def isLogger(activity: Any) -> bool:
+    description = activity.activityDescription
+    return (
+        description is not None
+        and description.activityTypeCode is not None
+        and "Logger" in description.activityTypeCode
+    )
+
+
+def isTissue(activity: Any) -> bool:
+    return mediaName(activity) == "Tissue"
+
+
+def assemblage(activity: Any) -> Any:
+    description = activity.biologicalActivityDescription
+    return None if description is None else description.assemblageSampledName
+
+
+def isBenthic(activity: Any) -> bool:
+    return assemblage(activity) == BENTHIC
+
+
+def habitatNet(activity: Any) -> Any:
+    description = activity.biologicalActivityDescription
+    if description is None:
+        return None
+    habitat = description.biologicalHabitatCollectionInformation
+    return None if habitat is None else habitat.netInformation
+
+
+rule1 = Rule(
+    1,
+    """
+    Data Rule #1: When ElectronicAddressText or ElectronicAddressTypeName is
+    reported, both must be reported.
+    """,
+    categories=("contact",),
+)
+
+
+@rule1.check("ElectronicAddress")
+def addressTextAndType(address: Any, context: Context) -> bool:
+    return (address.electronicAddressText is None) != (
+        address.electronicAddressTypeName is None
+    )
+
+
+rule2 = Rule(
+    2,
+    """
+    Data Rule #2: When TelephoneNumberText or TelephoneNumberTypeName is
+    reported, both must be reported.
+    """,
+    categories=("contact",),
+)
+
+
+@rule2.check("Telephonic")
+def telephoneTextAndType(telephonic: Any, context: Context) -> bool:
+    return (telephonic.telephoneNumberText is None) != (
+        telephonic.telephoneNumberTypeName is None
+    )
+
+
+rule3 = Rule(
+    3,
+    """
+    Data Rule #3: When AddressText or AddressTypeName is reported, both must be
+    reported.
+    """,
+    categories=("contact",),
+)
+
+
+@rule3.check("OrganizationAddress")
+def addressAndType(address: Any, context: Context) -> bool:
+    return (address.addressText is None) != (address.addressTypeName is None)
+
+
+rule4 = Rule(
+    4,
+    """
+    When HorizonitalCollectionMethodName is “Interpolation-Map”,
+    SourceMapScaleNumeric must be reported.
+    """,
+    categories=("location",),
+)
+
+
+@rule4.check("Activity")
+def activityMapScale(activity: Any, context: Context) -> bool:
+    location = activity.activityLocation
+    return (
+        location is not None
+        and location.sourceMapScale is None
+        and location.horizontalCollectionMethodName == "Interpolation-Map"
+    )
+
+
+@rule4.check("MonitoringLocation")
+def monitoringLocationMapScale(location: Any, context: Context) -> bool:
+    geospatial = location.monitoringLocationGeospatial
+    return (
+        geospatial is not None
+        and geospatial.sourceMapScale is None
+        and geospatial.horizontalCollectionMethodName == "Interpolation-Map"
+    )
+
+
+rule5 = Rule(
+    5,
+    """
+    When VerticalMeasure's MeasureValue is reported, the following also must be
+    reported:
+      VerticalMeasure's MeasureUnitCode,
+      VerticalCollectionMethodName,
+      VerticalCoordinateReferenceSystemDatumName.
+    """,
+    categories=("location",),
+)
+
+
+@rule5.check("MonitoringLocation")
+def verticalMeasure(location: Any, context: Context) -> bool:
+    geospatial = location.monitoringLocationGeospatial
+    if geospatial is None:
+        return False
+    measure = geospatial.verticalMeasure
+    return (
+        measure is not None
+        and measure.measureValue is not None
+        and (
+            measure.measureUnitCode is None
+            or geospatial.verticalCollectionMethodName is None
+            or geospatial.verticalCoordinateReferenceSystemDatumName is None
+        )
+    )
+
+
+rule6 = Rule(
+    6,
+    """
+    Either ProjectDescriptionText or Project's AttachedBinaryObject must be
+    reported.
+    """,
+    categories=("project",),
+)
+
+
+@rule6.check("Project")
+def projectDescription(project: Any, context: Context) -> bool:
+    return project.projectDescriptionText is None and not project.attachedBinaryObject
+
+
+rule7 = Rule(
+    7,
+    """
+    Activity Depth/Height can be reported in only one of the following two ways
+    (but not both):
+      a. Specific depth using ActivityDepthHeightMeasure's MeasureValue.
+      b. Depth Range using ActivityTopDepthHeightMeasure's MeasureValue and
+      ActivityBottomDepthHeightMeasure's MeasureValue.
+        i. This method must be used when ActivityTypeCode is “Sample-Integrated
+        Vertical Profile”.
+    """,
+    categories=("activity",),
+)
+
+
+@rule7.check("Activity")
+def depthOrRange(activity: Any, context: Context) -> bool:
+    description = activity.activityDescription
+    if description is None:
+        return False
+    depth = description.activityDepthHeightMeasure
+    top = description.activityTopDepthHeightMeasure
+    bottom = description.activityBottomDepthHeightMeasure
+    return (
+        depth is not None
+        and depth.measureValue is not None
+        and (
+            description.activityTypeCode == "Sample-Integrated Vertical Profile"
+            or (top is not None and top.measureValue is not None)
+            or (bottom is not None and bottom.measureValue is not None)
+        )
+    )
+
+
+rule8 = Rule(
+    8,
+    """
+    When ActivityTypeCode contains the word 'Logger', DataLoggerLineName must be
+    reported.
+    """,
+    categories=("activity",),
+)
+
+
+@rule8.check("Result", when=isLogger)
+def loggerLine(result: Any, context: Context) -> bool:
+    return result.resultDescription.dataLoggerLineName is None
+
+
+rule9 = Rule(
+    9,
+    """
+    When ActivityMediaName is "Tissue" then BiologicalIntentName must also be
+    "Tissue" (and visa-versa)
+    """,
+    categories=("biological",),
+)
+
+
+@rule9.check("BiologicalResultDescription", when=mediaName)
+def tissueIntent(description: Any, context: Context) -> bool:
+    intent = description.biologicalIntentName
+    return intent is not None and isTissue(context.activity) != (intent == "Tissue")
+
+
+rule10 = Rule(
+    10,
+    """
+    When ActivityMediaName (or BiologicalIntentName) is "Tissue", then
+    SampleTissueAnatomyName must be reported.
+    """,
+    categories=("biological",),
+)
+
+
+@rule10.check("BiologicalResultDescription", when=isTissue)
+def tissueAnatomy(description: Any, context: Context) -> bool:
+    return (
+        description.biologicalIntentName == "Tissue"
+        and description.sampleTissueAnatomyName is None
+    )
+
+
+rule11 = Rule(
+    11,
+    """
+    When ActivityMediaName is "Biological" then AssemblageSampledName must be
+    reported.
+    """,
+    categories=("biological",),
+)
+
+
+@rule11.check("Activity")
+def biologicalAssemblage(activity: Any, context: Context) -> bool:
+    description = activity.activityDescription
+    return (
+        description is not None
+        and description.activityMediaName == "Biological"
+        and assemblage(activity) is None
+    )
+
+
+rule12 = Rule(
+    12,
+    """
+    When ResultDetectionConditionText is 'Not Detected', 'Present Above
+    Quantification Limit' or 'Present Below Quantification Limit', then
+    DetectionQuantitationLimitTypeName and DetectionQuantitationLimitMeasure must
+    be reported.
+    """,
+    categories=("result",),
+)
+
+
+@rule12.check("Result")
+def detectionLimit(result: Any, context: Context) -> bool:
+    description = result.resultDescription
+    return (
+        description is not None
+        and description.resultDetectionConditionText in DETECTION_CONDITIONS
+        and not any(
+            x.detectionQuantitationLimitTypeName is not None
+            and x.detectionQuantitationLimitMeasure is not None
+            for x in result.resultLabInformation.resultDetectionQuantitationLimit
+        )
+    )
+
+
+rule13 = Rule(
+    13,
+    """
+    CharacteristicName and ResultStatusIdentifier must be reported.
+    """,
+    categories=("result",),
+)
+
+
+@rule13.check("Result")
+def characteristicAndStatus(result: Any, context: Context) -> bool:
+    description = result.resultDescription
+    return (
+        description.characteristicName is None
+        or description.resultStatusIdentifier is None
+    )
+
+
+rule14 = Rule(
+    14,
+    """
+    When DetectionQuantitationLimit's MeasureValue is reported,
+    DetectionQuantitationLimit's MeasureUnitCode must be reported.
+    """,
+    categories=("measure",),
+)
+
+
+@rule14.check("DetectionQuantitationLimit")
+def detectionLimitUnit(limit: Any, context: Context) -> bool:
+    measure = limit.detectionQuantitationLimitMeasure
+    return measure is not None and missingUnit(
+        measure.measureValue, measure.measureUnitCode
+    )
+
+
+rule15 = Rule(
+    15,
+    """
+    ActivityDescription’s MonitoringLocationIdentifier may be required depending
+    on the value provided for ActivityTypeCode. See the domain value list for
+    ActivityTypeCode for more information.
+    """,
+    categories=(
+        "activity",
+        "domain",
+    ),
+)
+
+
+@rule15.check("Activity")
+def monitoringLocationIdentifier(activity: Any, context: Context) -> bool:
+    description = activity.activityDescription
+    return (
+        description is not None
+        and description.monitoringLocationIdentifier is None
+        and description.activityTypeCode in MONITORING_LOCATION_REQUIRED
+    )
+
+
+rule16 = Rule(
+    16,
+    """
+    ResultAnalyticalMethod may be required depending on the value provided for
+    ActivityTypeCode. See the domain value list for ActivityTypeCode for more
+    information.
+      a. However, ResultAnalyticalMethod is never required if BiologicalIntentName
+      is "Individual", "Population Census", "Frequency Class", or "Group Summary"
+    """,
+    categories=(
+        "result",
+        "domain",
+    ),
+)
+
+
+def analyticalMethodRequired(activity: Any) -> bool:
+    description = activity.activityDescription
+    return (
+        description is not None
+        and description.activityTypeCode is not None
+        and description.activityTypeCode in ANALYTICAL_METHOD_REQUIRED
+    )
+
+
+@rule16.check("BiologicalResultDescription", when=analyticalMethodRequired)
+def analyticalMethod(description: Any, context: Context) -> bool:
+    intent = description.biologicalIntentName
+    return (
+        intent is not None
+        and intent not in UNANALYZED_INTENTS
+        and context.result.resultAnalyticalMethod is None
+    )
+
+
+rule17 = Rule(
+    17,
+    """
+    ResultSampleFractionText may be required depending on the value provided for
+    CharacteristicName. See the domain value list for CharacteristicName for more
+    information.
+    """,
+    categories=(
+        "result",
+        "domain",
+    ),
+)
+
+
+@rule17.check("Result")
+def sampleFraction(result: Any, context: Context) -> bool:
+    description = result.resultDescription
+    return (
+        description is not None
+        and description.resultSampleFractionText is None
+        and description.characteristicName is not None
+        and description.characteristicName in SAMPLE_FRACTION_REQUIRED
+    )
+
+
+rule18 = Rule(
+    18,
+    """
+    ResultAnalyticalMethod’s MethodIdentifierContext must either match a value
+    from the AnalyticalMethodContext domain list or it must be the same as the
+    value for the OrganizationIdentifier provided in the submission file.
+      a. If the MethodIdentifierContext matches a value from the domain list,
+      then the MethodIdentifier must also match a value from the AnalyticalMethod
+      domain list (for that Context). Furthermore, MethodName,
+      MethodQualifierTypeName, and MethodDescriptionText are not required and
+      will be ignored (since only the Identifier and IdentifierContext are needed
+      to uniquely identify the Analytical Method).
+      b. If the MethodIdentifierContext matches your OrganizationIdentifier
+      (indicating your own method), then MethodIdentifier and MethodName are both
+      required, but do not need to match a value from the domain list (since they
+      are your own). Additionally, MethodQualifierTypeName and
+      MethodDescriptionText can be provided, but are optional, to further
+      describe the Analytical Method used.
+    """,
+    categories=(
+        "result",
+        "domain",
+    ),
+)
+
+
+@rule18.check("Result")
+def analyticalMethodContext(result: Any, context: Context) -> bool:
+    method = result.resultAnalyticalMethod
+    description = context.organization.organizationDescription
+    return (
+        method is not None
+        and description is not None
+        and method.methodIdentifierContext != description.organizationIdentifier
+        and method.methodIdentifierContext not in ANALYTICAL_METHOD_CONTEXTS
+    )
+
+
+rule19 = Rule(
+    19,
+    """
+    ProjectIdentifier, MonitoringLocationIdentifier, ActivityIdentifier,
+    IndexIdentifier and ActivityGroupIdentifier must be unique within an
+    Organization. The value for each of these identifiers may occur only once in
+    a submission file.
+      a. Unique identifiers are treated as case-insensitive by WQX. For example,
+      the following three identifiers would be treated as identical: “Mx571”,
+      “mx571”, “MX571”.
+    """,
+    categories=("identifier",),
+)
+
+# The identifiers of the elements of an organization are collected as they are
+# visited, and compared once the organization is
+IDENTIFIERS = {
+    "Project": lambda x: x.projectIdentifier,
+    "MonitoringLocation": lambda x: (
+        None
+        if x.monitoringLocationIdentity is None
+        else x.monitoringLocationIdentity.monitoringLocationIdentifier
+    ),
+    "BiologicalHabitatIndex": lambda x: x.indexIdentifier,
+    "Activity": lambda x: (
+        None
+        if x.activityDescription is None
+        else x.activityDescription.activityIdentifier
+    ),
+    "ActivityMetric": lambda x: x.indexIdentifier,
+    "ActivityGroup": lambda x: x.activityGroupIdentifier,
+}
+
+
+def collect(kind: str) -> None:
+    identifier = IDENTIFIERS[kind]
+
+    @rule19.check(kind)
+    def collectIdentifier(element: Any, context: Context) -> bool:
+        value = identifier(element)
+        if value is not None:
+            context.identifiers.append(value.lower())
+        return False
+
+
+for kind in IDENTIFIERS:
+    collect(kind)
+
+
+@rule19.check("Organization")
+def uniqueIdentifiers(organization: Any, context: Context) -> bool:
+    duplicates = [x for x, n in Counter(context.identifiers).items() if n > 1]
+    return len(duplicates) > 1
+
+
+# Rule 20 has no text.
+
+rule21 = Rule(
+    21,
+    """
+    ResultMeasure's ResultMeasureValue may be constrained to a list of domain
+    values depending on the value provided for CharacteristicName. See the domain
+    value list for CharacteristicName for more information.
+    """,
+    categories=(
+        "result",
+        "domain",
+    ),
+)
+
+
+@rule21.check("Result")
+def pickListValue(result: Any, context: Context) -> bool:
+    description = result.resultDescription
+    return (
+        description is not None
+        and description.characteristicName in PICK_LIST_CHARACTERISTICS
+        and description.resultMeasure.resultMeasureValue not in PICK_LIST_VALUES
+    )
+
+
+rule22 = Rule(
+    22,
+    """
+    If a numeric value is reported for ResultMeasureValue, then ResultMeasure's
+    MeasureUnitCode and ResultValueTypeName are required.
+      a. The exception to this is when the ResultMeasureValue is a Characteristic
+      Pick List Value. These do not have units.
+    """,
+    categories=(
+        "result",
+        "measure",
+    ),
+)
+
+
+@rule22.check("Result")
+def numericValue(result: Any, context: Context) -> bool:
+    description = result.resultDescription
+    if description is None or description.resultMeasure is None:
+        return False
+    measure = description.resultMeasure
+    value = measure.resultMeasureValue
+    return (
+        value is not None
+        and value not in PICK_LIST_VALUES
+        and value.isnumeric()
+        and (measure.measureUnitCode is None or description.resultValueTypeName is None)
+    )
+
+
+rule23 = Rule(
+    23,
+    """
+    If a CountyCode is reported then a StateCode must also be reported.
+    """,
+    categories=("location",),
+)
+
+
+@rule23.check("MonitoringLocation")
+def monitoringLocationState(location: Any, context: Context) -> bool:
+    geospatial = location.monitoringLocationGeospatial
+    return (
+        geospatial is not None
+        and geospatial.countyCode is not None
+        and geospatial.stateCode is None
+    )
+
+
+@rule23.check("OrganizationAddress")
+def addressState(address: Any, context: Context) -> bool:
+    return address.countyCode is not None and address.stateCode is None
+
+
+rule24 = Rule(
+    24,
+    """
+    If NetTypeName = "Net/Horizontal Tow" then BoatSpeedMeasure is required.
+    """,
+    categories=("biological",),
+)
+
+
+@rule24.check("Activity")
+def boatSpeed(activity: Any, context: Context) -> bool:
+    net = habitatNet(activity)
+    return (
+        net is not None
+        and net.netTypeName == "Net/Horizontal Tow"
+        and net.boatSpeedMeasure is None
+    )
+
+
+# Rule 25 is not checked: If NetTypeName is reported then the
+# SampleCollectionEquipmentName must be one that relates to that type of equipment.
+# TODO: Figure out how to report violations of this rule
+
+rule26 = Rule(
+    26,
+    """
+    ActivityMetric's MetricTypeIdentifierContext must either match a value from
+    the MetricTypeContext domain list or it must be the same as the value for the
+    OrganizationIdentifier provided in the submission file.
+      a. If the MetricTypeIdentifierContext matches a value from the domain list,
+      then the MetricTypeIdentifier must also match a value from the MetricType
+      domain list (for that Context). Furthermore, MetricTypeName,
+      MetricTypeCitation, MetricTypeScaleText, and FormulaDescriptionText are not
+      required and will be ignored (since only the Identifier and
+      IdentifierContext are needed to uniquely identify the MetricType).
+      b. If the MetricTypeIdentifierContext matches your OrganizationIdentifier
+      (indicating your own metric), then MetricTypeIdentifier and MetricTypeName
+      are both required, but do not need to match a value from the domain list
+      (since they are your own). Additionally, MetricTypeCitation,
+      MetricTypeScaleText, and FormulaDescriptionText can be provided, but are
+      optional, to further describe the Metric Type used.
+    """,
+    categories=(
+        "biological",
+        "domain",
+    ),
+)
+
+
+@rule26.check("ActivityMetric")
+def metricTypeContext(metric: Any, context: Context) -> bool:
+    type = metric.activityMetricType
+    if type is None:
+        return False
+    organization = context.organization.organizationDescription.organizationIdentifier
+    if type.metricTypeIdentifierContext == organization:
+        return type.metricTypeIdentifier is None or type.metricTypeName is None
+    if type.metricTypeIdentifierContext in METRIC_TYPE_CONTEXTS:
+        return type.metricTypeIdentifier not in METRIC_TYPES
+    return True
+
+
+rule27 = Rule(
+    27,
+    """
+    If BiologicalIntentName is "Group Summary" then GroupSummaryCount or
+    GroupSummaryWeight must be reported.
+    """,
+    categories=("biological",),
+)
+
+
+@rule27.check("BiologicalResultDescription")
+def groupSummary(description: Any, context: Context) -> bool:
+    return description.biologicalIntentName == "Group Summary" and (
+        description.groupSummaryCount is None
+        or description.groupSummaryWeightMeasure is None
+    )
+
+
+rule28 = Rule(
+    28,
+    """
+    If BiologicalIntentName is "Frequency Class" then Result's CharacteristicName
+    must be "Count"
+    """,
+    categories=("biological",),
+)
+
+
+@rule28.check("BiologicalResultDescription")
+def frequencyClassCount(description: Any, context: Context) -> bool:
+    return (
+        description.biologicalIntentName == "Frequency Class"
+        and context.result.resultDescription.characteristicName != "Count"
+    )
+
+
+rule29 = Rule(
+    29,
+    """
+    If BiologicalIntentName is "Population Census" then Result's
+    CharacteristicName must be "Count" or "Total Sample Weight"
+    """,
+    categories=("biological",),
+)
+
+
+@rule29.check("BiologicalResultDescription")
+def populationCensusCount(description: Any, context: Context) -> bool:
+    result = context.result.resultDescription
+    return description.biologicalIntentName == "Population Census" and (
+        result is None
+        or result.characteristicName not in ("Count", "Total Sample Weight")
+    )
+
+
+rule30 = Rule(
+    30,
+    """
+    FrequencyClassDescriptorUnitCode may be required depending on the value
+    provided for FrequencyClassDescriptorCode. See the domain value list for
+    FrequencyClassType for more information.
+    """,
+    categories=(
+        "biological",
+        "domain",
+    ),
+)
+
+
+@rule30.check("FrequencyClassInformation")
+def frequencyClassUnit(information: Any, context: Context) -> bool:
+    return (
+        information.frequencyClassDescriptorUnitCode is None
+        and information.frequencyClassDescriptorCode is not None
+        and information.frequencyClassDescriptorCode in UNIT_REQUIRED
+    )
+
+
+rule31 = Rule(
+    31,
+    """
+    FrequencyClassInformation's LowerClassBoundValue and UpperClassBoundValue may
+    be required depending on the value provided for FrequencyClassDescriptorCode.
+    See the domain value list for FrequencyClassType for more information.
+    """,
+    categories=(
+        "biological",
+        "domain",
+    ),
+)
+
+
+@rule31.check("FrequencyClassInformation")
+def frequencyClassBounds(information: Any, context: Context) -> bool:
+    return (
+        (
+            information.lowerClassBoundValue is None
+            or information.upperClassBoundValue is None
+        )
+        and information.frequencyClassDescriptorCode is not None
+        and information.frequencyClassDescriptorCode in BOUNDS_REQUIRED
+    )
+
+
+rule32 = Rule(
+    32,
+    """
+    Biological Intent Name and Subject Taxonomic Name must be reported when
+    Activity Media Name is "Biological" or "Tissue"
+    """,
+    categories=("biological",),
+)
+
+
+@rule32.check("Result", when=lambda x: mediaName(x) in ("Biological", "Tissue"))
+def taxonomicName(result: Any, context: Context) -> bool:
+    description = result.biologicalResultDescription
+    return (
+        description is None
+        or description.biologicalIntentName is None
+        or description.subjectTaxonomicName is None
+    )
+
+
+rule33 = Rule(
+    33,
+    """
+    Either Result Measure Value and/or Result Detection Condition Text must be
+    reported.
+    """,
+    categories=("result",),
+)
+
+
+@rule33.check("Result")
+def valueOrCondition(result: Any, context: Context) -> bool:
+    description = result.resultDescription
+    return (
+        description is None
+        or description.resultMeasure is None
+        or (
+            description.resultMeasure.resultMeasureValue is None
+            and description.resultDetectionConditionText is None
+        )
+    )
+
+
+rule34 = Rule(
+    34,
+    """
+    Habitat Selection Method is required when Activity Assemblage is
+    "Benthic Macroinvertebrates"
+    """,
+    categories=("biological",),
+)
+
+
+@rule34.check("Activity")
+def habitatSelection(activity: Any, context: Context) -> bool:
+    return (
+        isBenthic(activity)
+        and activity.biologicalActivityDescription.habitatSelectionMethod is None
+    )
+
+
+rule35 = Rule(
+    35,
+    """
+    Measure Unit is required when Measure Value is supplied.
+    """,
+    categories=("measure",),
+)
+rule36 = Rule(
+    36,
+    """
+    Measure Value is required when Measurement Unit is supplied.
+    """,
+    categories=("measure",),
+)
+
+
+def measures(rule: Rule, missing: Callable[[Any, Any], bool]) -> None:
+    """
+    Register the checks of rule 35 or 36, which only differ by what is missing from
+    a measure.
+    """
+
+    def incomplete(measure: Any) -> bool:
+        return measure is not None and missing(
+            measure.measureValue, measure.measureUnitCode
+        )
+
+    @rule.check("Result")
+    def resultMeasures(result: Any, context: Context) -> bool:
+        description = result.resultDescription
+        if description is None:
+            return False
+        measure = description.resultMeasure
+        return (
+            measure is not None
+            and missing(measure.resultMeasureValue, measure.measureUnitCode)
+        ) or incomplete(description.resultDepthHeightMeasure)
+
+    @rule.check("BiologicalResultDescription")
+    def groupSummaryWeight(description: Any, context: Context) -> bool:
+        return incomplete(description.groupSummaryWeightMeasure)
+
+    @rule.check("Activity")
+    def activity(activity: Any, context: Context) -> bool:
+        return any(incomplete(x) for x in activityMeasures(activity))
+
+    @rule.check("ActivityMetric")
+    def metricValue(metric: Any, context: Context) -> bool:
+        return incomplete(metric.metricValueMeasure)
+
+    @rule.check("DetectionQuantitationLimit")
+    def detectionLimit(limit: Any, context: Context) -> bool:
+        return incomplete(limit.detectionQuantitationLimitMeasure)
+
+    @rule.check("MonitoringLocation")
+    def monitoringLocation(location: Any, context: Context) -> bool:
+        return any(incomplete(x) for x in monitoringLocationMeasures(location))
+
+    @rule.check("ProjectMonitoringLocationWeighting")
+    def weightingFactor(weighting: Any, context: Context) -> bool:
+        return incomplete(weighting.locationWeightingFactorMeasure)
+
+
+measures(rule35, missingUnit)
+measures(rule36, missingValue)
+
+rule37 = Rule(
+    37,
+    """
+    Target Count is required when the Activity Assemblage is
+    "Benthic Macroinvertebrates"
+    """,
+    categories=("biological",),
+)
+
+
+@rule37.check("Result", when=isBenthic)
+def targetCount(result: Any, context: Context) -> bool:
+    return (
+        result.resultDescription is None or result.resultDescription.targetCount is None
+    )
+
+
+rule38 = Rule(
+    38,
+    """
+    Percent Sample Processed Numeric is required when the Activity Assemblage is
+    "Benthic Macroinvertebrates"
+    """,
+    categories=("biological",),
+)
+
+
+@rule38.check("Result", when=isBenthic)
+def proportionProcessed(result: Any, context: Context) -> bool:
+    return (
+        result.resultDescription is None
+        or result.resultDescription.proportionSampleProcessedNumeric is None
+    )
+
+
+rule39 = Rule(
+    39,
+    """
+    Percent Sample Processed Numeric must be a positive number between 0 and 1"
+    """,
+    categories=("biological",),
+)
+
+
+@rule39.check("Result")
+def proportionRange(result: Any, context: Context) -> bool:
+    description = result.resultDescription
+    if description is None:
+        return False
+    proportion = description.proportionSampleProcessedNumeric
+    return proportion is not None and (proportion < 0 or proportion > 1)
+
+
+# Rule 40 was removed in version 3.0: Sample Collection Method is required when
+# Activity Type Code contains the word "Sample"
+
+rule41 = Rule(
+    41,
+    """
+    Statistical N-Value Numeric must be a positive whole number.
+    """,
+    categories=("result",),
+)
+
+
+@rule41.check("Result")
+def statisticalN(result: Any, context: Context) -> bool:
+    description = result.resultDescription
+    return (
+        description is not None
+        and description.statisticalNValueNumeric is not None
+        and description.statisticalNValueNumeric < 0
+    )
+
+
+class RuleStatistics:
+    """
+    What checking a rule cost: how many times its checks and their conditions were
+    called, the wall time they took in seconds, and the violations they found.
+    """
+
+    __slots__ = ("rule", "evaluations", "seconds", "violations")
+
+    def __init__(self, rule: Rule):
+        self.rule = rule
+        self.evaluations = 0
+        self.seconds = 0.0
+        self.violations = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"RuleStatistics(rule={self.rule.number}, "
+            f"evaluations={self.evaluations}, seconds={self.seconds:.6f}, "
+            f"violations={self.violations})"
+        )
+
+
+def timed(function: Callable[..., bool], statistics: RuleStatistics) -> Callable:
+    """
+    Wrap a check or condition to add its calls and their time to the statistics of
+    its rule.
+    """
+
+    def timedFunction(*args: Any) -> bool:
+        start = perf_counter()
+        try:
+            return function(*args)
+        finally:
+            statistics.seconds += perf_counter() - start
+            statistics.evaluations += 1
+
+    return timedFunction
+
+
+class RuleSet:
+    """
+    The data rules to check, which are every rule of RULES unless some are disabled.
+    Rules are enabled or disabled by their number or by a category, such as
+    "biological" for the rules of biological samples:
+
+        rules = RuleSet().disable("biological", 19)
+        violations = rules.listViolations(document.payload)
+
+    The categories are "activity", "biological", "contact", "domain", "identifier",
+    "location", "measure", "project" and "result".
+
+    :param rules: Rules enabled at first, every rule by default
+    """
+
+    def __init__(self, rules: Iterable[Rule] = None):
+        self.__enabled = set(RULES if rules is None else rules)
+
+    @property
+    def rules(self) -> List[Rule]:
+        """
+        The enabled rules, in order of their numbers.
+        """
+        return [x for x in RULES if x in self.__enabled]
+
+    @staticmethod
+    def select(*selectors: Union[int, str]) -> List[Rule]:
+        """
+        Rules with the given numbers or in the given categories.
+
+        :raises ValueError: If no rule has one of the numbers or categories
+        """
+        rules = []
+        for selector in selectors:
+            if isinstance(selector, int):
+                found = [x for x in RULES if x.number == selector]
+            else:
+                found = [x for x in RULES if selector in x.categories]
+            if not found:
+                raise ValueError(f"There is no data rule {selector!r}.")
+            rules.extend(found)
+        return rules
+
+    def enable(self, *selectors: Union[int, str]) -> "RuleSet":
+        """
+        Enable the rules with the given numbers or in the given categories.
+        """
+        self.__enabled.update(self.select(*selectors))
+        return self
+
+    def disable(self, *selectors: Union[int, str]) -> "RuleSet":
+        """
+        Disable the rules with the given numbers or in the given categories.
+        """
+        self.__enabled.difference_update(self.select(*selectors))
+        return self
+
+    def __checks(self, statistics: Dict[Rule, RuleStatistics] = None) -> dict:
+        # Rule, check and condition of each check, by kind of element
+        checks: Dict[str, list] = {}
+        for rule in self.rules:
+            for kind, functions in rule.checks.items():
+                for check, when in functions:
+                    if statistics is not None:
+                        check = timed(check, statistics[rule])
+                        when = when and timed(when, statistics[rule])
+                    checks.setdefault(kind, []).append((rule, check, when))
+        return checks
+
+    @staticmethod
+    def __visit(payloads: Iterable[Payload], checks: dict) -> Iterator[Counter]:
+        for payload in payloads:
+            if payload.operation != payload.UPDATE_INSERT:
+                # Data rules only apply for Update-Insert operations
+                continue
+            if payload.wqx is None or payload.wqx.organization is None:
+                continue
+            visitor = Visitor(payload.wqx.organization, checks)
+            visitor.visit()
+            yield visitor.counts
+
+    def listViolations(self, payloads: Iterable[Payload]) -> List[str]:
+        """
+        Check the enabled rules on every Update-Insert payload, in a single pass over
+        the elements of its organization. Each element is given to the checks
+        registered for its kind. The text of a rule is listed once per violation,
+        and the rules are listed in order of their numbers.
+        """
+        rules = self.rules
+        violations: List[str] = []
+        for counts in self.__visit(payloads, self.__checks()):
+            for rule in rules:
+                violations.extend([rule.text] * counts[rule])
+        return violations
+
+    def profile(self, payloads: Iterable[Payload]) -> List[RuleStatistics]:
+        """
+        Check the enabled rules like listViolations, timing every call of their
+        checks, and give the statistics of each rule in order of their numbers.
+        Timing adds to the time taken, so the total is larger than without it.
+        """
+        statistics = {x: RuleStatistics(x) for x in self.rules}
+        for counts in self.__visit(payloads, self.__checks(statistics)):
+            for rule, count in counts.items():
+                statistics[rule].violations += count
+        return list(statistics.values())
+
+
+class Visitor:
+    """
+    Gives every element of an organization to the checks of its kind, once, and
+    counts the violations of each rule.
+
+    :param checks: Rule, check and condition of each check, by kind of element
+    """
+
+    def __init__(self, organization: Any, checks: Dict[str, list]):
+        self.context = Context(organization)
+        self.counts: Counter = Counter()
+        self.checks = {
+            kind: [(rule, check) for rule, check, _ in x] for kind, x in checks.items()
+        }
+        # Checks with conditions are chosen again for every activity
+        self.conditional = {
+            kind: x for kind, x in checks.items() if any(when for _, _, when in x)
+        }
+
+    def run(self, kind: str, elements: Iterable[Any]) -> None:
+        functions = self.checks.get(kind)
+        if not functions:
+            return
+        context = self.context
+        counts = self.counts
+        for element in elements:
+            for rule, check in functions:
+                if check(element, context):
+                    counts[rule] += 1
+
+    def visit(self) -> None:
+        organization = self.context.organization
+        run = self.run
+        run("ElectronicAddress", organization.electronicAddress)
+        run("Telephonic", organization.telephonic)
+        run("OrganizationAddress", organization.organizationAddress)
+        for project in organization.project:
+            run(
+                "ProjectMonitoringLocationWeighting",
+                project.projectMonitoringLocationWeighting,
+            )
+            run("Project", (project,))
+        run("MonitoringLocation", organization.monitoringLocation)
+        run("BiologicalHabitatIndex", organization.biologicalHabitatIndex)
+        for activity in organization.activity:
+            self.visitActivity(activity)
+        self.context.activity = None
+        run("ActivityGroup", organization.activityGroup)
+        run("Organization", (organization,))
+
+    def visitActivity(self, activity: Any) -> None:
+        context = self.context
+        context.activity = activity
+        for kind, x in self.conditional.items():
+            self.checks[kind] = [
+                (rule, check) for rule, check, when in x if when is None or when(activity)
+            ]
+        run = self.run
+        run("ActivityMetric", activity.activityMetric)
+        # Results are the most numerous, so their checks are run here directly
+        checks = self.checks.get("Result", ())
+        counts = self.counts
+        for result in activity.results:
+            context.result = result
+            lab = result.resultLabInformation
+            if lab is not None:
+                run("DetectionQuantitationLimit", lab.resultDetectionQuantitationLimit)
+            biological = result.biologicalResultDescription
+            if biological is not None:
+                run("FrequencyClassInformation", biological.frequencyClassInformation)
+                run("BiologicalResultDescription", (biological,))
+            for rule, check in checks:
+                if check(result, context):
+                    counts[rule] += 1
+        context.result = None
+        run("Activity", (activity,))
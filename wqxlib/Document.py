@@ -1,12 +1,17 @@
 import re
-from collections import Counter
-from typing import List, Union
+from io import TextIOWrapper
+from typing import BinaryIO, Dict, List, Union
+from zipfile import ZIP_DEFLATED, ZipFile
 
-from yattag import Doc, indent
-
-from .exceptions import WQXException
+from .DataRules import RuleSet, RuleStatistics
+from .exceptions import WQXException, WQXLibException
 from .Header import Header
 from .Payload import Payload
+from .wqx_v3_0.Activity import Activity
+from .wqx_v3_0.ActivityGroup import ActivityGroup
+from .wqx_v3_0.Organization import Organization
+from .wqx_v3_0.WQX import WQX
+from .XMLWriter import XMLWriter, getWriter
 
 
 class ID(str):
@@ -91,2075 +96,28 @@ class Document:
         else:
             self.__payload = [Payload(val)]
 
-    def list_data_rule_violations(self) -> List[str]:  # noqa: C901
+    def list_data_rule_violations(self, rules: RuleSet = None) -> List[str]:
         """
         List all data rule (not XSD rules) violations of the enclosed Document.
         This function returns an empty list if none of the tests fail, but that does
         not guarantee the data will be accepted by WQX.
-        """
-        violations: List[str] = []
-
-        for payload in self.__payload:
-            if payload.operation != payload.UPDATE_INSERT:
-                # Data rules only apply for Update-Insert operations
-                continue
-
-            data_rule_1 = """
-            Data Rule #1: When ElectronicAddressText or ElectronicAddressTypeName is
-            reported, both must be reported.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.electronicAddress is not None)
-            ):
-                for electronic_address in payload.wqx.organization.electronicAddress:
-                    if (
-                        electronic_address.electronicAddressText is not None
-                        and electronic_address.electronicAddressTypeName is None
-                    ) or (
-                        electronic_address.electronicAddressText is None
-                        and electronic_address.electronicAddressTypeName is not None
-                    ):
-                        violations.append(data_rule_1.strip())
-
-            data_rule_2 = """
-            Data Rule #2: When TelephoneNumberText or TelephoneNumberTypeName is
-            reported, both must be reported.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.telephonic is not None)
-            ):
-                for telephonic in payload.wqx.organization.telephonic:
-                    if (
-                        telephonic.telephoneNumberText is not None
-                        and telephonic.telephoneNumberTypeName is None
-                    ) or (
-                        telephonic.telephoneNumberText is None
-                        and telephonic.telephoneNumberTypeName is not None
-                    ):
-                        violations.append(data_rule_2.strip())
-
-            data_rule_3 = """
-            Data Rule #3: When AddressText or AddressTypeName is reported, both must be
-            reported.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.organizationAddress is not None)
-            ):
-                for organization_address in payload.wqx.organization.organizationAddress:
-                    if (
-                        organization_address.addressText is not None
-                        and organization_address.addressTypeName is None
-                    ) or (
-                        organization_address.addressText is None
-                        and organization_address.addressTypeName is not None
-                    ):
-                        violations.append(data_rule_3.strip())
-
-            data_rule_4 = """
-            When HorizonitalCollectionMethodName is “Interpolation-Map”,
-            SourceMapScaleNumeric must be reported.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                if payload.wqx.organization.activity is not None:
-                    for activity in payload.wqx.organization.activity:
-                        if (
-                            (activity.activityLocation is not None)
-                            and (activity.activityLocation.sourceMapScale is None)
-                            and (
-                                activity.activityLocation.horizontalCollectionMethodName
-                                == "Interpolation-Map"
-                            )
-                        ):
-                            violations.append(data_rule_4.strip())
-                if payload.wqx.organization.monitoringLocation is not None:
-                    for (
-                        monitoring_location
-                    ) in payload.wqx.organization.monitoringLocation:
-                        if (
-                            (monitoring_location.monitoringLocationGeospatial is not None)
-                            and (
-                                monitoring_location.monitoringLocationGeospatial.sourceMapScale
-                                is None
-                            )
-                            and (
-                                monitoring_location.monitoringLocationGeospatial.horizontalCollectionMethodName  # noqa: B950
-                                == "Interpolation-Map"
-                            )
-                        ):
-                            violations.append(data_rule_4.strip())
-
-            data_rule_5 = """
-            When VerticalMeasure's MeasureValue is reported, the following also must be
-            reported:
-              VerticalMeasure's MeasureUnitCode,
-              VerticalCollectionMethodName,
-              VerticalCoordinateReferenceSystemDatumName.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.monitoringLocation is not None)
-            ):
-                for monitoring_location in payload.wqx.organization.monitoringLocation:
-                    if (
-                        (monitoring_location.monitoringLocationGeospatial is not None)
-                        and (
-                            monitoring_location.monitoringLocationGeospatial.verticalMeasure
-                            is not None
-                        )
-                        and (
-                            monitoring_location.monitoringLocationGeospatial.verticalMeasure.measureValue  # noqa: B950
-                            is not None
-                        )
-                        and (
-                            (
-                                monitoring_location.monitoringLocationGeospatial.verticalMeasure.measureUnitCode  # noqa: B950
-                                is None
-                            )
-                            or (
-                                monitoring_location.monitoringLocationGeospatial.verticalCollectionMethodName  # noqa: B950
-                                is None
-                            )
-                            or (
-                                monitoring_location.monitoringLocationGeospatial.verticalCoordinateReferenceSystemDatumName  # noqa: B950
-                                is None
-                            )
-                        )
-                    ):
-                        violations.append(data_rule_5.strip())
-
-            data_rule_6 = """
-            Either ProjectDescriptionText or Project's AttachedBinaryObject must be
-            reported.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.project is not None)
-            ):
-                for project in payload.wqx.organization.project:
-                    if (project.projectDescriptionText is None) and (
-                        len(project.attachedBinaryObject) < 1
-                    ):
-                        violations.append(data_rule_6.strip())
-
-            data_rule_7 = """
-            Activity Depth/Height can be reported in only one of the following two ways
-            (but not both):
-              a. Specific depth using ActivityDepthHeightMeasure's MeasureValue.
-              b. Depth Range using ActivityTopDepthHeightMeasure's MeasureValue and
-              ActivityBottomDepthHeightMeasure's MeasureValue.
-                i. This method must be used when ActivityTypeCode is “Sample-Integrated
-                Vertical Profile”.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if (
-                        (activity.activityDescription is not None)
-                        and (
-                            activity.activityDescription.activityDepthHeightMeasure
-                            is not None
-                        )
-                        and (
-                            activity.activityDescription.activityDepthHeightMeasure.measureValue
-                            is not None
-                        )
-                        and (
-                            (
-                                activity.activityDescription.activityTypeCode
-                                == "Sample-Integrated Vertical Profile"
-                            )
-                            or (
-                                (
-                                    activity.activityDescription.activityTopDepthHeightMeasure
-                                    is not None
-                                )
-                                and (
-                                    activity.activityDescription.activityTopDepthHeightMeasure.measureValue  # noqa: B950
-                                    is not None
-                                )
-                            )
-                            or (
-                                (
-                                    activity.activityDescription.activityBottomDepthHeightMeasure
-                                    is not None
-                                )
-                                and (
-                                    activity.activityDescription.activityBottomDepthHeightMeasure.measureValue  # noqa: B950
-                                    is not None
-                                )
-                            )
-                        )
-                    ):
-                        violations.append(data_rule_7.strip())
-
-            data_rule_8 = """
-            When ActivityTypeCode contains the word 'Logger', DataLoggerLineName must be
-            reported.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if (
-                        (activity.activityDescription is not None)
-                        and (activity.activityDescription.activityTypeCode is not None)
-                        and ("Logger" in activity.activityDescription.activityTypeCode)
-                    ):
-                        for result in activity.results:
-                            if result.resultDescription.dataLoggerLineName is None:
-                                violations.append(data_rule_8.strip())
-
-            data_rule_9 = """
-            When ActivityMediaName is "Tissue" then BiologicalIntentName must also be
-            "Tissue" (and visa-versa)
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    for result in activity.results:
-                        if (
-                            (activity.activityDescription is not None)
-                            and (activity.activityDescription.activityMediaName)
-                            and (
-                                "Tissue" != activity.activityDescription.activityMediaName
-                            )
-                            and (result.biologicalResultDescription is not None)
-                            and (
-                                result.biologicalResultDescription.biologicalIntentName
-                                is not None
-                            )
-                            and (
-                                "Tissue"
-                                == result.biologicalResultDescription.biologicalIntentName
-                            )
-                        ) or (
-                            (activity.activityDescription is not None)
-                            and (activity.activityDescription.activityMediaName)
-                            and (
-                                "Tissue" == activity.activityDescription.activityMediaName
-                            )
-                            and (result.biologicalResultDescription is not None)
-                            and (
-                                result.biologicalResultDescription.biologicalIntentName
-                                is not None
-                            )
-                            and (
-                                "Tissue"
-                                != result.biologicalResultDescription.biologicalIntentName
-                            )
-                        ):
-                            violations.append(data_rule_9.strip())
-
-            data_rule_10 = """
-            When ActivityMediaName (or BiologicalIntentName) is "Tissue", then
-            SampleTissueAnatomyName must be reported.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    for result in activity.results:
-                        if (
-                            (activity.activityDescription is not None)
-                            and (
-                                activity.activityDescription.activityMediaName is not None
-                            )
-                            and (
-                                "Tissue" == activity.activityDescription.activityMediaName
-                            )
-                            and (result.biologicalResultDescription is not None)
-                            and (
-                                result.biologicalResultDescription.biologicalIntentName
-                                is not None
-                            )
-                            and (
-                                "Tissue"
-                                == result.biologicalResultDescription.biologicalIntentName
-                            )
-                        ):
-                            if (
-                                result.biologicalResultDescription.sampleTissueAnatomyName
-                                is None
-                            ):
-                                violations.append(data_rule_10.strip())
-
-            data_rule_11 = """
-            When ActivityMediaName is "Biological" then AssemblageSampledName must be
-            reported.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if (
-                        (activity.activityDescription is not None)
-                        and (activity.activityDescription.activityMediaName is not None)
-                        and (
-                            "Biological" == activity.activityDescription.activityMediaName
-                        )
-                        and (
-                            (activity.biologicalActivityDescription is None)
-                            or (
-                                activity.biologicalActivityDescription.assemblageSampledName
-                                is None
-                            )
-                        )
-                    ):
-                        violations.append(data_rule_11.strip())
 
-            data_rule_12 = """
-            When ResultDetectionConditionText is 'Not Detected', 'Present Above
-            Quantification Limit' or 'Present Below Quantification Limit', then
-            DetectionQuantitationLimitTypeName and DetectionQuantitationLimitMeasure must
-            be reported.
-            """
-            data_rule_12_pattern_1 = [
-                "Not Detected",
-                "Present Above Quantification Limit",
-                "Present Below Quantification Limit",
-            ]
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    for result in activity.results:
-                        if (
-                            (result.resultDescription is not None)
-                            and (
-                                result.resultDescription.resultDetectionConditionText
-                                in data_rule_12_pattern_1
-                            )
-                            and (
-                                not any(
-                                    i.detectionQuantitationLimitTypeName is not None
-                                    and i.detectionQuantitationLimitMeasure is not None
-                                    for i in result.resultLabInformation.resultDetectionQuantitationLimit  # noqa: B950
-                                )
-                            )
-                        ):
-                            violations.append(data_rule_12.strip())
+        The rules are checked in a single pass over the elements of each payload (see
+        DataRules).
 
-            data_rule_13 = """
-        CharacteristicName and ResultStatusIdentifier must be reported.
+        :param rules: Rules to check, every rule by default
         """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    for result in activity.results:
-                        if (result.resultDescription.characteristicName is None) or (
-                            result.resultDescription.resultStatusIdentifier is None
-                        ):
-                            violations.append(data_rule_13.strip())
-
-            data_rule_14 = """
-            When DetectionQuantitationLimit's MeasureValue is reported,
-            DetectionQuantitationLimit's MeasureUnitCode must be reported.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if activity.results is not None:
-                        for result in activity.results:
-                            if (result.resultLabInformation is not None) and (
-                                result.resultLabInformation.resultDetectionQuantitationLimit
-                                is not None
-                            ):
-                                for (
-                                    result_detection_quantitation_limit
-                                ) in (
-                                    result.resultLabInformation.resultDetectionQuantitationLimit
-                                ):
-                                    if (
-                                        (
-                                            result_detection_quantitation_limit.detectionQuantitationLimitMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            result_detection_quantitation_limit.detectionQuantitationLimitMeasure.measureValue  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            result_detection_quantitation_limit.detectionQuantitationLimitMeasure.measureUnitCode  # noqa: B950
-                                            is None
-                                        )
-                                    ):
-                                        violations.append(data_rule_14.strip())
-
-            data_rule_15 = """
-            ActivityDescription’s MonitoringLocationIdentifier may be required depending
-            on the value provided for ActivityTypeCode. See the domain value list for
-            ActivityTypeCode for more information.
-            """
-            data_rule_15_domain = []
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if (
-                        (activity.activityDescription is not None)
-                        and (
-                            activity.activityDescription.monitoringLocationIdentifier
-                            is None
-                        )
-                        and (
-                            activity.activityDescription.activityTypeCode
-                            in data_rule_15_domain
-                        )
-                    ):
-                        violations.append(data_rule_15.strip())
-
-            data_rule_16 = """
-            ResultAnalyticalMethod may be required depending on the value provided for
-            ActivityTypeCode. See the domain value list for ActivityTypeCode for more
-            information.
-              a. However, ResultAnalyticalMethod is never required if BiologicalIntentName
-              is "Individual", "Population Census", "Frequency Class", or "Group Summary"
-            """
-            data_rule_16_pattern = [
-                "Individual",
-                "Population Census",
-                "Frequency Class",
-                "Group Summary",
-            ]
-            data_rule_16_domain = []  # TODO: Add domain values
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if activity.results is not None:
-                        for result in activity.results:
-                            if (
-                                (result.biologicalResultDescription is not None)
-                                and (
-                                    result.biologicalResultDescription.biologicalIntentName
-                                    is not None
-                                )
-                                and (
-                                    result.biologicalResultDescription.biologicalIntentName
-                                    not in data_rule_16_pattern
-                                )
-                                and (result.resultAnalyticalMethod is None)
-                                and (activity.activityDescription is not None)
-                                and (
-                                    activity.activityDescription.activityTypeCode
-                                    is not None
-                                )
-                                and (
-                                    activity.activityDescription.activityTypeCode
-                                    in data_rule_16_domain
-                                )
-                            ):
-                                violations.append(data_rule_16.strip())
-
-            data_rule_17 = """
-            ResultSampleFractionText may be required depending on the value provided for
-            CharacteristicName. See the domain value list for CharacteristicName for more
-            information.
-            """
-            data_rule_17_domain = []  # TODO: Add domain values
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if activity.results is not None:
-                        for result in activity.results:
-                            if (
-                                (result.resultDescription is not None)
-                                and (
-                                    result.resultDescription.resultSampleFractionText
-                                    is None
-                                )
-                                and (
-                                    result.resultDescription.characteristicName
-                                    is not None
-                                )
-                                and (
-                                    result.resultDescription.characteristicName
-                                    in data_rule_17_domain
-                                )
-                            ):
-                                violations.append(data_rule_17.strip())
-
-            data_rule_18 = """
-            ResultAnalyticalMethod’s MethodIdentifierContext must either match a value
-            from the AnalyticalMethodContext domain list or it must be the same as the
-            value for the OrganizationIdentifier provided in the submission file.
-              a. If the MethodIdentifierContext matches a value from the domain list,
-              then the MethodIdentifier must also match a value from the AnalyticalMethod
-              domain list (for that Context). Furthermore, MethodName,
-              MethodQualifierTypeName, and MethodDescriptionText are not required and
-              will be ignored (since only the Identifier and IdentifierContext are needed
-              to uniquely identify the Analytical Method).
-              b. If the MethodIdentifierContext matches your OrganizationIdentifier
-              (indicating your own method), then MethodIdentifier and MethodName are both
-              required, but do not need to match a value from the domain list (since they
-              are your own). Additionally, MethodQualifierTypeName and
-              MethodDescriptionText can be provided, but are optional, to further
-              describe the Analytical Method used.
-            """
-            data_rule_18_domain = []
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if activity.results is not None:
-                        for result in activity.results:
-                            if (
-                                (result.resultAnalyticalMethod is not None)
-                                and (
-                                    payload.wqx.organization.organizationDescription
-                                    is not None
-                                )
-                                and (
-                                    result.resultAnalyticalMethod.methodIdentifierContext
-                                    != payload.wqx.organization.organizationDescription.organizationIdentifier  # noqa: B950
-                                )
-                                and (
-                                    result.resultAnalyticalMethod.methodIdentifierContext
-                                    not in data_rule_18_domain
-                                )
-                            ):
-                                violations.append(data_rule_18.strip())
-
-            data_rule_19 = """
-            ProjectIdentifier, MonitoringLocationIdentifier, ActivityIdentifier,
-            IndexIdentifier and ActivityGroupIdentifier must be unique within an
-            Organization. The value for each of these identifiers may occur only once in
-            a submission file.
-              a. Unique identifiers are treated as case-insensitive by WQX. For example,
-              the following three identifiers would be treated as identical: “Mx571”,
-              “mx571”, “MX571”.
-            """
-            identifiers: List[str] = []
-            if (payload.wqx is not None) and (payload.wqx.organization is not None):
-                if payload.wqx.organization.project is not None:
-                    for project in payload.wqx.organization.project:
-                        if project.projectIdentifier is not None:
-                            identifiers.append(project.projectIdentifier.lower())
-                if payload.wqx.organization.monitoringLocation is not None:
-                    for (
-                        monitoring_location
-                    ) in payload.wqx.organization.monitoringLocation:
-                        if (
-                            monitoring_location.monitoringLocationIdentity is not None
-                        ) and (
-                            monitoring_location.monitoringLocationIdentity.monitoringLocationIdentifier  # noqa: B950
-                            is not None
-                        ):
-                            identifiers.append(
-                                monitoring_location.monitoringLocationIdentity.monitoringLocationIdentifier.lower()  # noqa: B950
-                            )
-                if payload.wqx.organization.biologicalHabitatIndex is not None:
-                    for (
-                        biological_habitat_index
-                    ) in payload.wqx.organization.biologicalHabitatIndex:
-                        if biological_habitat_index.indexIdentifier is not None:
-                            identifiers.append(
-                                biological_habitat_index.indexIdentifier.lower()
-                            )
-                if payload.wqx.organization.activity is not None:
-                    for activity in payload.wqx.organization.activity:
-                        if (activity.activityDescription is not None) and (
-                            activity.activityDescription.activityIdentifier is not None
-                        ):
-                            identifiers.append(
-                                activity.activityDescription.activityIdentifier.lower()
-                            )
-                        if activity.activityMetric is not None:
-                            for activity_metric in activity.activityMetric:
-                                if activity_metric.indexIdentifier is not None:
-                                    identifiers.append(
-                                        activity_metric.indexIdentifier.lower()
-                                    )
-                if payload.wqx.organization.activityGroup is not None:
-                    for activity_group in payload.wqx.organization.activityGroup:
-                        if activity_group.activityGroupIdentifier is not None:
-                            identifiers.append(
-                                activity_group.activityGroupIdentifier.lower()
-                            )
-            duplicates: List[str] = [
-                i for i, cnt, in Counter(identifiers).items() if cnt > 1
-            ]
-            if len(duplicates) > 1:
-                violations.append(data_rule_19.strip())
-
-            # pylint: disable=unused-variable
-            data_rule_20 = """
-            """  # noqa: F841
-
-            data_rule_21 = """
-            ResultMeasure's ResultMeasureValue may be constrained to a list of domain
-            values depending on the value provided for CharacteristicName. See the domain
-            value list for CharacteristicName for more information.
-            """
-            data_rule_21_trigger = []
-            data_rule_21_domain = []
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if activity.results is not None:
-                        for result in activity.results:
-                            if (
-                                (result.resultDescription is not None)
-                                and (
-                                    result.resultDescription.characteristicName
-                                    in data_rule_21_trigger
-                                )
-                                and (
-                                    result.resultDescription.resultMeasure.resultMeasureValue
-                                    not in data_rule_21_domain
-                                )
-                            ):
-                                violations.append(data_rule_21.strip())
-
-            data_rule_22 = """
-            If a numeric value is reported for ResultMeasureValue, then ResultMeasure's
-            MeasureUnitCode and ResultValueTypeName are required.
-              a. The exception to this is when the ResultMeasureValue is a Characteristic
-              Pick List Value. These do not have units.
-            """
-            data_rule_22_exceptions = []
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if activity.results is not None:
-                        for result in activity.results:
-                            if (
-                                (result.resultDescription is not None)
-                                and (result.resultDescription.resultMeasure is not None)
-                                and (
-                                    result.resultDescription.resultMeasure.resultMeasureValue
-                                    is not None
-                                )
-                                and (
-                                    result.resultDescription.resultMeasure.resultMeasureValue
-                                    not in data_rule_22_exceptions
-                                )
-                                and (
-                                    result.resultDescription.resultMeasure.resultMeasureValue.isnumeric()  # noqa: B950
-                                )
-                                and (
-                                    (
-                                        result.resultDescription.resultMeasure.measureUnitCode
-                                        is None
-                                    )
-                                    or (
-                                        result.resultDescription.resultValueTypeName
-                                        is None
-                                    )
-                                )
-                            ):
-                                violations.append(data_rule_22.strip())
-
-            data_rule_23 = """
-            If a CountyCode is reported then a StateCode must also be reported.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.monitoringLocation is not None)
-            ):
-                if payload.wqx.organization.monitoringLocation is not None:
-                    for (
-                        monitoring_location
-                    ) in payload.wqx.organization.monitoringLocation:
-                        if (
-                            (monitoring_location.monitoringLocationGeospatial is not None)
-                            and (
-                                monitoring_location.monitoringLocationGeospatial.countyCode
-                                is not None
-                            )
-                            and (
-                                monitoring_location.monitoringLocationGeospatial.stateCode
-                                is None
-                            )
-                        ):
-                            violations.append(data_rule_23.strip())
-                if payload.wqx.organization.organizationAddress is not None:
-                    for (
-                        organization_address
-                    ) in payload.wqx.organization.organizationAddress:
-                        if (organization_address.countyCode is not None) and (
-                            organization_address.stateCode is None
-                        ):
-                            violations.append(data_rule_23.strip())
-
-            data_rule_24 = """
-            If NetTypeName = "Net/Horizontal Tow" then BoatSpeedMeasure is required.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if (
-                        (activity.biologicalActivityDescription is not None)
-                        and (
-                            activity.biologicalActivityDescription.biologicalHabitatCollectionInformation  # noqa: B950
-                            is not None
-                        )
-                        and (
-                            activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation  # noqa: B950
-                            is not None
-                        )
-                        and (
-                            "Net/Horizontal Tow"
-                            == activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.netTypeName  # noqa: B950
-                        )
-                        and (
-                            activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.boatSpeedMeasure  # noqa: B950
-                            is None
-                        )
-                    ):
-                        violations.append(data_rule_24.strip())
-
-            # pylint: disable=unused-variable
-            data_rule_25 = """
-            If NetTypeName is reported then the SampleCollectionEquipmentName must be
-            one that relates to that type of equipment.
-            """  # noqa: F841
-            # TODO: Figure out how to report violations of this rule
-
-            data_rule_26 = """
-            ActivityMetric's MetricTypeIdentifierContext must either match a value from
-            the MetricTypeContext domain list or it must be the same as the value for the
-            OrganizationIdentifier provided in the submission file.
-              a. If the MetricTypeIdentifierContext matches a value from the domain list,
-              then the MetricTypeIdentifier must also match a value from the MetricType
-              domain list (for that Context). Furthermore, MetricTypeName,
-              MetricTypeCitation, MetricTypeScaleText, and FormulaDescriptionText are not
-              required and will be ignored (since only the Identifier and
-              IdentifierContext are needed to uniquely identify the MetricType).
-              b. If the MetricTypeIdentifierContext matches your OrganizationIdentifier
-              (indicating your own metric), then MetricTypeIdentifier and MetricTypeName
-              are both required, but do not need to match a value from the domain list
-              (since they are your own). Additionally, MetricTypeCitation,
-              MetricTypeScaleText, and FormulaDescriptionText can be provided, but are
-              optional, to further describe the Metric Type used.
-            """
-            data_rule_26_metric_type_context_domain = []
-            data_rule_26_metric_type_domain = []
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if activity.activityMetric is not None:
-                        for activity_metric in activity.activityMetric:
-                            if activity_metric.activityMetricType is not None:
-                                if (
-                                    activity_metric.activityMetricType.metricTypeIdentifierContext
-                                    == payload.wqx.organization.organizationDescription.organizationIdentifier  # noqa: B950
-                                ):
-                                    if (
-                                        activity_metric.activityMetricType.metricTypeIdentifier
-                                        is None
-                                    ) or (
-                                        activity_metric.activityMetricType.metricTypeName
-                                        is None
-                                    ):
-                                        violations.append(data_rule_26.strip())
-                                elif (
-                                    activity_metric.activityMetricType.metricTypeIdentifierContext
-                                    in data_rule_26_metric_type_context_domain
-                                ):
-                                    if (
-                                        activity_metric.activityMetricType.metricTypeIdentifier
-                                        not in data_rule_26_metric_type_domain
-                                    ):
-                                        violations.append(data_rule_26.strip())
-                                else:
-                                    violations.append(data_rule_26.strip())
-
-            data_rule_27 = """
-            If BiologicalIntentName is "Group Summary" then GroupSummaryCount or
-            GroupSummaryWeight must be reported.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if activity.results is not None:
-                        for result in activity.results:
-                            if (
-                                (result.biologicalResultDescription is not None)
-                                and (
-                                    "Group Summary"
-                                    == result.biologicalResultDescription.biologicalIntentName
-                                )
-                                and (
-                                    (
-                                        result.biologicalResultDescription.groupSummaryCount
-                                        is None
-                                    )
-                                    or (
-                                        result.biologicalResultDescription.groupSummaryWeightMeasure  # noqa: B950
-                                        is None
-                                    )
-                                )
-                            ):
-                                violations.append(data_rule_27.strip())
-
-            data_rule_28 = """
-            If BiologicalIntentName is "Frequency Class" then Result's CharacteristicName
-            must be "Count"
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if activity.results is not None:
-                        for result in activity.results:
-                            if (
-                                (result.biologicalResultDescription is not None)
-                                and (
-                                    "Frequency Class"
-                                    == result.biologicalResultDescription.biologicalIntentName
-                                )
-                                and (
-                                    "Count" != result.resultDescription.characteristicName
-                                )
-                            ):
-                                violations.append(data_rule_28.strip())
-
-            data_rule_29 = """
-            If BiologicalIntentName is "Population Census" then Result's
-            CharacteristicName must be "Count" or "Total Sample Weight"
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if activity.results is not None:
-                        for result in activity.results:
-                            if (
-                                (result.biologicalResultDescription is not None)
-                                and (
-                                    "Population Census"
-                                    == result.biologicalResultDescription.biologicalIntentName
-                                )
-                                and (
-                                    (result.resultDescription is None)
-                                    or (
-                                        result.resultDescription.characteristicName
-                                        is None
-                                    )
-                                    or (
-                                        result.resultDescription.characteristicName
-                                        not in ["Count", "Total Sample Weight"]
-                                    )
-                                )
-                            ):
-                                violations.append(data_rule_29.strip())
-
-            data_rule_30 = """
-            FrequencyClassDescriptorUnitCode may be required depending on the value
-            provided for FrequencyClassDescriptorCode. See the domain value list for
-            FrequencyClassType for more information.
-            """
-            data_rule_30_domain = []
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if activity.results is not None:
-                        for result in activity.results:
-                            if (result.biologicalResultDescription is not None) and (
-                                result.biologicalResultDescription.frequencyClassInformation
-                                is not None
-                            ):
-                                for (
-                                    frequency_class_information
-                                ) in (
-                                    result.biologicalResultDescription.frequencyClassInformation
-                                ):
-                                    if (
-                                        (
-                                            frequency_class_information.frequencyClassDescriptorUnitCode  # noqa: B950
-                                            is None
-                                        )
-                                        and (
-                                            frequency_class_information.frequencyClassDescriptorCode  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            frequency_class_information.frequencyClassDescriptorCode  # noqa: B950
-                                            in data_rule_30_domain
-                                        )
-                                    ):
-                                        violations.append(data_rule_30.strip())
-
-            data_rule_31 = """
-            FrequencyClassInformation's LowerClassBoundValue and UpperClassBoundValue may
-            be required depending on the value provided for FrequencyClassDescriptorCode.
-            See the domain value list for FrequencyClassType for more information.
-            """
-            data_rule_31_domain = []
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if activity.results is not None:
-                        for result in activity.results:
-                            if (result.biologicalResultDescription is not None) and (
-                                result.biologicalResultDescription.frequencyClassInformation
-                                is not None
-                            ):
-                                for (
-                                    frequency_class_information
-                                ) in (
-                                    result.biologicalResultDescription.frequencyClassInformation
-                                ):
-                                    if (
-                                        (
-                                            (
-                                                frequency_class_information.lowerClassBoundValue
-                                                is None
-                                            )
-                                            or (
-                                                frequency_class_information.upperClassBoundValue
-                                                is None
-                                            )
-                                        )
-                                        and (
-                                            frequency_class_information.frequencyClassDescriptorCode  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            frequency_class_information.frequencyClassDescriptorCode  # noqa: B950
-                                            in data_rule_31_domain
-                                        )
-                                    ):
-                                        violations.append(data_rule_31.strip())
-
-            data_rule_32 = """
-            Biological Intent Name and Subject Taxonomic Name must be reported when
-            Activity Media Name is "Biological" or "Tissue"
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if (
-                        (activity.activityDescription is not None)
-                        and (activity.activityDescription.activityMediaName is not None)
-                        and (
-                            activity.activityDescription.activityMediaName
-                            in ["Biological", "Tissue"]
-                        )
-                    ):
-                        for result in activity.results:
-                            if (
-                                (result.biologicalResultDescription is None)
-                                or (
-                                    result.biologicalResultDescription.biologicalIntentName
-                                    is None
-                                )
-                                or (
-                                    result.biologicalResultDescription.subjectTaxonomicName
-                                    is None
-                                )
-                            ):
-                                violations.append(data_rule_32.strip())
-
-            data_rule_33 = """
-            Either Result Measure Value and/or Result Detection Condition Text must be
-            reported.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if activity.results is not None:
-                        for result in activity.results:
-                            if (
-                                (result.resultDescription is None)
-                                or (result.resultDescription.resultMeasure is None)
-                                or (
-                                    (
-                                        result.resultDescription.resultMeasure.resultMeasureValue
-                                        is None
-                                    )
-                                    and (
-                                        result.resultDescription.resultDetectionConditionText
-                                        is None
-                                    )
-                                )
-                            ):
-                                violations.append(data_rule_33.strip())
-
-            data_rule_34 = """
-            Habitat Selection Method is required when Activity Assemblage is
-            "Benthic Macroinvertebrates"
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if (
-                        (activity.biologicalActivityDescription is not None)
-                        and (
-                            activity.biologicalActivityDescription.assemblageSampledName
-                            is not None
-                        )
-                        and (
-                            "Benthic Macroinvertebrates"
-                            == activity.biologicalActivityDescription.assemblageSampledName
-                        )
-                        and (
-                            (activity.biologicalActivityDescription is None)
-                            or (
-                                activity.biologicalActivityDescription.habitatSelectionMethod
-                                is None
-                            )
-                        )
-                    ):
-                        violations.append(data_rule_34.strip())
-
-            data_rule_35 = """
-            Measure Unit is required when Measure Value is supplied.
-            """
-            if (payload.wqx is not None) and (payload.wqx.organization is not None):
-                if payload.wqx.organization.activity is not None:
-                    for activity in payload.wqx.organization.activity:
-                        if activity.results is not None:
-                            for result in activity.results:
-                                if (
-                                    (result.resultDescription is not None)
-                                    and (
-                                        result.resultDescription.resultMeasure is not None
-                                    )
-                                    and (
-                                        result.resultDescription.resultMeasure.resultMeasureValue
-                                        is not None
-                                    )
-                                    and (
-                                        result.resultDescription.resultMeasure.measureUnitCode
-                                        is None
-                                    )
-                                ) or (
-                                    (result.resultDescription is not None)
-                                    and (
-                                        result.resultDescription.resultDepthHeightMeasure
-                                        is not None
-                                    )
-                                    and (
-                                        result.resultDescription.resultDepthHeightMeasure.measureValue  # noqa: B950
-                                        is not None
-                                    )
-                                    and (
-                                        result.resultDescription.resultDepthHeightMeasure.measureUnitCode  # noqa: B950
-                                        is None
-                                    )
-                                ):
-                                    violations.append(data_rule_35.strip())
-                        if (
-                            (
-                                (activity.activityDescription is not None)
-                                and (
-                                    (
-                                        (
-                                            activity.activityDescription.activityDepthHeightMeasure
-                                            is not None
-                                        )
-                                        and (
-                                            activity.activityDescription.activityDepthHeightMeasure.measureValue  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            activity.activityDescription.activityDepthHeightMeasure.measureUnitCode  # noqa: B950
-                                            is None
-                                        )
-                                    )
-                                    or (
-                                        (
-                                            activity.activityDescription.activityTopDepthHeightMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            activity.activityDescription.activityTopDepthHeightMeasure.measureValue  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            activity.activityDescription.activityTopDepthHeightMeasure.measureUnitCode  # noqa: B950
-                                            is None
-                                        )
-                                    )
-                                    or (
-                                        (
-                                            activity.activityDescription.activityBottomDepthHeightMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            activity.activityDescription.activityBottomDepthHeightMeasure.measureValue  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            activity.activityDescription.activityBottomDepthHeightMeasure.measureUnitCode  # noqa: B950
-                                            is None
-                                        )
-                                    )
-                                )
-                            )
-                            or (
-                                (activity.activityLocation is not None)
-                                and (
-                                    activity.activityLocation.horizontalAccuracyMeasure
-                                    is not None
-                                )
-                                and (
-                                    activity.activityLocation.horizontalAccuracyMeasure.measureValue  # noqa: B950
-                                    is not None
-                                )
-                                and (
-                                    activity.activityLocation.horizontalAccuracyMeasure.measureUnitCode  # noqa: B950
-                                    is None
-                                )
-                            )
-                            or (
-                                (activity.biologicalActivityDescription is not None)
-                                and (
-                                    activity.biologicalActivityDescription.biologicalHabitatCollectionInformation  # noqa: B950
-                                    is not None
-                                )
-                                and (
-                                    (
-                                        (
-                                            activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.collectionDuration  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.collectionDuration.measureValue  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.collectionDuration.measureUnitCode  # noqa: B950
-                                            is None
-                                        )
-                                    )
-                                    or (
-                                        (
-                                            activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.collectionArea  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.collectionArea.measureValue  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.collectionArea.measureUnitCode  # noqa: B950
-                                            is None
-                                        )
-                                    )
-                                    or (
-                                        (
-                                            activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.reachLengthMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.reachLengthMeasure.measureValue  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.reachLengthMeasure.measureUnitCode  # noqa: B950
-                                            is None
-                                        )
-                                    )
-                                    or (
-                                        (
-                                            activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.reachWidthMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.reachWidthMeasure.measureValue  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.reachWidthMeasure.measureUnitCode  # noqa: B950
-                                            is None
-                                        )
-                                    )
-                                    or (
-                                        (
-                                            activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            (
-                                                (
-                                                    activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.netSurfaceAreaMeasure  # noqa: B950
-                                                    is not None
-                                                )
-                                                and (
-                                                    activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.netSurfaceAreaMeasure.measureValue  # noqa: B950
-                                                    is not None
-                                                )
-                                                and (
-                                                    activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.netSurfaceAreaMeasure.measureUnitCode  # noqa: B950
-                                                    is None
-                                                )
-                                            )
-                                            or (
-                                                (
-                                                    activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.netMeshSizeMeasure  # noqa: B950
-                                                    is not None
-                                                )
-                                                and (
-                                                    activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.netMeshSizeMeasure.measureValue  # noqa: B950
-                                                    is not None
-                                                )
-                                                and (
-                                                    activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.netMeshSizeMeasure.measureUnitCode  # noqa: B950
-                                                    is None
-                                                )
-                                            )
-                                            or (
-                                                (
-                                                    activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.boatSpeedMeasure  # noqa: B950
-                                                    is not None
-                                                )
-                                                and (
-                                                    activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.boatSpeedMeasure.measureValue  # noqa: B950
-                                                    is not None
-                                                )
-                                                and (
-                                                    activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.boatSpeedMeasure.measureUnitCode  # noqa: B950
-                                                    is None
-                                                )
-                                            )
-                                            or (
-                                                (
-                                                    activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.currentSpeedMeasure  # noqa: B950
-                                                    is not None
-                                                )
-                                                and (
-                                                    activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.currentSpeedMeasure.measureValue  # noqa: B950
-                                                    is not None
-                                                )
-                                                and (
-                                                    activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.currentSpeedMeasure.measureUnitCode  # noqa: B950
-                                                    is None
-                                                )
-                                            )
-                                        )
-                                    )
-                                )
-                            )
-                        ):
-                            violations.append(data_rule_35.strip())
-                        if activity.activityMetric is not None:
-                            for activity_metric in activity.activityMetric:
-                                if (
-                                    (activity_metric.metricValueMeasure is not None)
-                                    and (
-                                        activity_metric.metricValueMeasure.measureValue
-                                        is not None
-                                    )
-                                    and (
-                                        activity_metric.metricValueMeasure.measureUnitCode
-                                        is None
-                                    )
-                                ):
-                                    violations.append(data_rule_35.strip())
-                        if activity.results is not None:
-                            for result in activity.results:
-                                if (result.resultLabInformation is not None) and (
-                                    result.resultLabInformation.resultDetectionQuantitationLimit
-                                    is not None
-                                ):
-                                    for (
-                                        detection_quantitation_limit
-                                    ) in (
-                                        result.resultLabInformation.resultDetectionQuantitationLimit  # noqa: B950
-                                    ):
-                                        if (
-                                            (
-                                                detection_quantitation_limit.detectionQuantitationLimitMeasure  # noqa: B950
-                                                is not None
-                                            )
-                                            and (
-                                                detection_quantitation_limit.detectionQuantitationLimitMeasure.measureValue  # noqa: B950
-                                                is not None
-                                            )
-                                            and (
-                                                detection_quantitation_limit.detectionQuantitationLimitMeasure.measureUnitCode  # noqa: B950
-                                                is None
-                                            )
-                                        ):
-                                            violations.append(data_rule_35.strip())
-                                if (
-                                    (result.biologicalResultDescription is not None)
-                                    and (
-                                        result.biologicalResultDescription.groupSummaryWeightMeasure  # noqa: B950
-                                        is not None
-                                    )
-                                    and (
-                                        result.biologicalResultDescription.groupSummaryWeightMeasure.measureValue  # noqa: B950
-                                        is not None
-                                    )
-                                    and (
-                                        result.biologicalResultDescription.groupSummaryWeightMeasure.measureUnitCode  # noqa: B950
-                                        is None
-                                    )
-                                ):
-                                    violations.append(data_rule_35.strip())
-                if payload.wqx.organization.monitoringLocation is not None:
-                    for (
-                        monitoring_location
-                    ) in payload.wqx.organization.monitoringLocation:
-                        if (
-                            (
-                                (
-                                    monitoring_location.monitoringLocationGeospatial
-                                    is not None
-                                )
-                                and (
-                                    (
-                                        (
-                                            monitoring_location.monitoringLocationGeospatial.horizontalAccuracyMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationGeospatial.horizontalAccuracyMeasure.measureValue  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationGeospatial.horizontalAccuracyMeasure.measureUnitCode  # noqa: B950
-                                            is None
-                                        )
-                                    )
-                                    or (
-                                        (
-                                            monitoring_location.monitoringLocationGeospatial.verticalAccuracyMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationGeospatial.verticalAccuracyMeasure.measureValue  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationGeospatial.verticalAccuracyMeasure.measureUnitCode  # noqa: B950
-                                            is None
-                                        )
-                                    )
-                                    or (
-                                        (
-                                            monitoring_location.monitoringLocationGeospatial.verticalMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationGeospatial.verticalMeasure.measureValue  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationGeospatial.verticalMeasure.measureUnitCode  # noqa: B950
-                                            is None
-                                        )
-                                    )
-                                )
-                            )
-                            or (
-                                (
-                                    monitoring_location.monitoringLocationIdentity
-                                    is not None
-                                )
-                                and (
-                                    (
-                                        (
-                                            monitoring_location.monitoringLocationIdentity.drainageAreaMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationIdentity.drainageAreaMeasure.measureValue  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationIdentity.drainageAreaMeasure.measureUnitCode  # noqa: B950
-                                            is None
-                                        )
-                                    )
-                                    or (
-                                        (
-                                            monitoring_location.monitoringLocationIdentity.contributingDrainageAreaMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationIdentity.contributingDrainageAreaMeasure.measureValue  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationIdentity.contributingDrainageAreaMeasure.measureUnitCode  # noqa: B950
-                                            is None
-                                        )
-                                    )
-                                )
-                            )
-                            or (
-                                (monitoring_location.wellInformation is not None)
-                                and (
-                                    (
-                                        (
-                                            monitoring_location.wellInformation.wellHoleDepthMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.wellInformation.wellHoleDepthMeasure.measureValue  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.wellInformation.wellHoleDepthMeasure.measureUnitCode  # noqa: B950
-                                            is None
-                                        )
-                                    )
-                                    or (
-                                        (
-                                            monitoring_location.wellInformation.wellDepthMeasure
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.wellInformation.wellDepthMeasure.measureValue  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.wellInformation.wellDepthMeasure.measureUnitCode  # noqa: B950
-                                            is None
-                                        )
-                                    )
-                                )
-                            )
-                        ):
-                            violations.append(data_rule_35.strip())
-                if payload.wqx.organization.project is not None:
-                    for project in payload.wqx.organization.project:
-                        for (
-                            project_monitoring_location_weighting
-                        ) in project.projectMonitoringLocationWeighting:
-                            if (
-                                (
-                                    project_monitoring_location_weighting.locationWeightingFactorMeasure  # noqa: B950
-                                    is not None
-                                )
-                                and (
-                                    project_monitoring_location_weighting.locationWeightingFactorMeasure.measureValue  # noqa: B950
-                                    is not None
-                                )
-                                and (
-                                    project_monitoring_location_weighting.locationWeightingFactorMeasure.measureUnitCode  # noqa: B950
-                                    is None
-                                )
-                            ):
-                                violations.append(data_rule_35.strip())
-
-            data_rule_36 = """
-            Measure Value is required when Measurement Unit is supplied.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if activity.results is not None:
-                        for result in activity.results:
-                            if (
-                                (result.resultDescription is not None)
-                                and (result.resultDescription.resultMeasure is not None)
-                                and (
-                                    result.resultDescription.resultMeasure.resultMeasureValue
-                                    is None
-                                )
-                                and (
-                                    result.resultDescription.resultMeasure.measureUnitCode
-                                    is not None
-                                )
-                            ) or (
-                                (result.resultDescription is not None)
-                                and (
-                                    result.resultDescription.resultDepthHeightMeasure
-                                    is not None
-                                )
-                                and (
-                                    result.resultDescription.resultDepthHeightMeasure.measureValue
-                                    is None
-                                )
-                                and (
-                                    result.resultDescription.resultDepthHeightMeasure.measureUnitCode  # noqa: B950
-                                    is not None
-                                )
-                            ):
-                                violations.append(data_rule_36.strip())
-                    if (
-                        (
-                            (activity.activityDescription is not None)
-                            and (
-                                (
-                                    (
-                                        activity.activityDescription.activityDepthHeightMeasure
-                                        is not None
-                                    )
-                                    and (
-                                        activity.activityDescription.activityDepthHeightMeasure.measureValue  # noqa: B950
-                                        is None
-                                    )
-                                    and (
-                                        activity.activityDescription.activityDepthHeightMeasure.measureUnitCode  # noqa: B950
-                                        is not None
-                                    )
-                                )
-                                or (
-                                    (
-                                        activity.activityDescription.activityTopDepthHeightMeasure
-                                        is not None
-                                    )
-                                    and (
-                                        activity.activityDescription.activityTopDepthHeightMeasure.measureValue  # noqa: B950
-                                        is None
-                                    )
-                                    and (
-                                        activity.activityDescription.activityTopDepthHeightMeasure.measureUnitCode  # noqa: B950
-                                        is not None
-                                    )
-                                )
-                                or (
-                                    (
-                                        activity.activityDescription.activityBottomDepthHeightMeasure  # noqa: B950
-                                        is not None
-                                    )
-                                    and (
-                                        activity.activityDescription.activityBottomDepthHeightMeasure.measureValue  # noqa: B950
-                                        is None
-                                    )
-                                    and (
-                                        activity.activityDescription.activityBottomDepthHeightMeasure.measureUnitCode  # noqa: B950
-                                        is not None
-                                    )
-                                )
-                            )
-                        )
-                        or (
-                            (activity.activityLocation is not None)
-                            and (
-                                activity.activityLocation.horizontalAccuracyMeasure
-                                is not None
-                            )
-                            and (
-                                activity.activityLocation.horizontalAccuracyMeasure.measureValue
-                                is None
-                            )
-                            and (
-                                activity.activityLocation.horizontalAccuracyMeasure.measureUnitCode
-                                is not None
-                            )
-                        )
-                        or (
-                            (activity.biologicalActivityDescription is not None)
-                            and (
-                                activity.biologicalActivityDescription.biologicalHabitatCollectionInformation  # noqa: B950
-                                is not None
-                            )
-                            and (
-                                (
-                                    (
-                                        activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.collectionDuration  # noqa: B950
-                                        is not None
-                                    )
-                                    and (
-                                        activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.collectionDuration.measureValue  # noqa: B950
-                                        is None
-                                    )
-                                    and (
-                                        activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.collectionDuration.measureUnitCode  # noqa: B950
-                                        is not None
-                                    )
-                                )
-                                or (
-                                    (
-                                        activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.collectionArea  # noqa: B950
-                                        is not None
-                                    )
-                                    and (
-                                        activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.collectionArea.measureValue  # noqa: B950
-                                        is None
-                                    )
-                                    and (
-                                        activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.collectionArea.measureUnitCode  # noqa: B950
-                                        is not None
-                                    )
-                                )
-                                or (
-                                    (
-                                        activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.reachLengthMeasure  # noqa: B950
-                                        is not None
-                                    )
-                                    and (
-                                        activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.reachLengthMeasure.measureValue  # noqa: B950
-                                        is None
-                                    )
-                                    and (
-                                        activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.reachLengthMeasure.measureUnitCode  # noqa: B950
-                                        is not None
-                                    )
-                                )
-                                or (
-                                    (
-                                        activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.reachWidthMeasure  # noqa: B950
-                                        is not None
-                                    )
-                                    and (
-                                        activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.reachWidthMeasure.measureValue  # noqa: B950
-                                        is None
-                                    )
-                                    and (
-                                        activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.reachWidthMeasure.measureUnitCode  # noqa: B950
-                                        is not None
-                                    )
-                                )
-                                or (
-                                    (
-                                        activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation  # noqa: B950
-                                        is not None
-                                    )
-                                    and (
-                                        (
-                                            (
-                                                activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.netSurfaceAreaMeasure  # noqa: B950
-                                                is not None
-                                            )
-                                            and (
-                                                activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.netSurfaceAreaMeasure.measureValue  # noqa: B950
-                                                is None
-                                            )
-                                            and (
-                                                activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.netSurfaceAreaMeasure.measureUnitCode  # noqa: B950
-                                                is not None
-                                            )
-                                        )
-                                        or (
-                                            (
-                                                activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.netMeshSizeMeasure  # noqa: B950
-                                                is not None
-                                            )
-                                            and (
-                                                activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.netMeshSizeMeasure.measureValue  # noqa: B950
-                                                is None
-                                            )
-                                            and (
-                                                activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.netMeshSizeMeasure.measureUnitCode  # noqa: B950
-                                                is not None
-                                            )
-                                        )
-                                        or (
-                                            (
-                                                activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.boatSpeedMeasure  # noqa: B950
-                                                is not None
-                                            )
-                                            and (
-                                                activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.boatSpeedMeasure.measureValue  # noqa: B950
-                                                is None
-                                            )
-                                            and (
-                                                activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.boatSpeedMeasure.measureUnitCode  # noqa: B950
-                                                is not None
-                                            )
-                                        )
-                                        or (
-                                            (
-                                                activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.currentSpeedMeasure  # noqa: B950
-                                                is not None
-                                            )
-                                            and (
-                                                activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.currentSpeedMeasure.measureValue  # noqa: B950
-                                                is None
-                                            )
-                                            and (
-                                                activity.biologicalActivityDescription.biologicalHabitatCollectionInformation.netInformation.currentSpeedMeasure.measureUnitCode  # noqa: B950
-                                                is not None
-                                            )
-                                        )
-                                    )
-                                )
-                            )
-                        )
-                    ):
-                        violations.append(data_rule_36.strip())
-                    if activity.activityMetric is not None:
-                        for activity_metric in activity.activityMetric:
-                            if (
-                                (activity_metric.metricValueMeasure is not None)
-                                and (
-                                    activity_metric.metricValueMeasure.measureValue
-                                    is None
-                                )
-                                and (
-                                    activity_metric.metricValueMeasure.measureUnitCode
-                                    is not None
-                                )
-                            ):
-                                violations.append(data_rule_36.strip())
-                    if activity.results is not None:
-                        for result in activity.results:
-                            if (result.resultLabInformation is not None) and (
-                                result.resultLabInformation.resultDetectionQuantitationLimit
-                                is not None
-                            ):
-                                for (
-                                    detection_quantitation_limit
-                                ) in (
-                                    result.resultLabInformation.resultDetectionQuantitationLimit
-                                ):
-                                    if (
-                                        (
-                                            detection_quantitation_limit.detectionQuantitationLimitMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            detection_quantitation_limit.detectionQuantitationLimitMeasure.measureValue  # noqa: B950
-                                            is None
-                                        )
-                                        and (
-                                            detection_quantitation_limit.detectionQuantitationLimitMeasure.measureUnitCode  # noqa: B950
-                                            is not None
-                                        )
-                                    ):
-                                        violations.append(data_rule_36.strip())
-                            if (
-                                (result.biologicalResultDescription is not None)
-                                and (
-                                    result.biologicalResultDescription.groupSummaryWeightMeasure
-                                    is not None
-                                )
-                                and (
-                                    result.biologicalResultDescription.groupSummaryWeightMeasure.measureValue  # noqa: B950
-                                    is None
-                                )
-                                and (
-                                    result.biologicalResultDescription.groupSummaryWeightMeasure.measureUnitCode  # noqa: B950
-                                    is not None
-                                )
-                            ):
-                                violations.append(data_rule_36.strip())
-                if payload.wqx.organization.monitoringLocation is not None:
-                    for (
-                        monitoring_location
-                    ) in payload.wqx.organization.monitoringLocation:
-                        if (
-                            (
-                                (
-                                    monitoring_location.monitoringLocationGeospatial
-                                    is not None
-                                )
-                                and (
-                                    (
-                                        (
-                                            monitoring_location.monitoringLocationGeospatial.horizontalAccuracyMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationGeospatial.horizontalAccuracyMeasure.measureValue  # noqa: B950
-                                            is None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationGeospatial.horizontalAccuracyMeasure.measureUnitCode  # noqa: B950
-                                            is not None
-                                        )
-                                    )
-                                    or (
-                                        (
-                                            monitoring_location.monitoringLocationGeospatial.verticalAccuracyMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationGeospatial.verticalAccuracyMeasure.measureValue  # noqa: B950
-                                            is None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationGeospatial.verticalAccuracyMeasure.measureUnitCode  # noqa: B950
-                                            is not None
-                                        )
-                                    )
-                                    or (
-                                        (
-                                            monitoring_location.monitoringLocationGeospatial.verticalMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationGeospatial.verticalMeasure.measureValue  # noqa: B950
-                                            is None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationGeospatial.verticalMeasure.measureUnitCode  # noqa: B950
-                                            is not None
-                                        )
-                                    )
-                                )
-                            )
-                            or (
-                                (
-                                    monitoring_location.monitoringLocationIdentity
-                                    is not None
-                                )
-                                and (
-                                    (
-                                        (
-                                            monitoring_location.monitoringLocationIdentity.drainageAreaMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationIdentity.drainageAreaMeasure.measureValue  # noqa: B950
-                                            is None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationIdentity.drainageAreaMeasure.measureUnitCode  # noqa: B950
-                                            is not None
-                                        )
-                                    )
-                                    or (
-                                        (
-                                            monitoring_location.monitoringLocationIdentity.contributingDrainageAreaMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationIdentity.contributingDrainageAreaMeasure.measureValue  # noqa: B950
-                                            is None
-                                        )
-                                        and (
-                                            monitoring_location.monitoringLocationIdentity.contributingDrainageAreaMeasure.measureUnitCode  # noqa: B950
-                                            is not None
-                                        )
-                                    )
-                                )
-                            )
-                            or (
-                                (monitoring_location.wellInformation is not None)
-                                and (
-                                    (
-                                        (
-                                            monitoring_location.wellInformation.wellHoleDepthMeasure  # noqa: B950
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.wellInformation.wellHoleDepthMeasure.measureValue  # noqa: B950
-                                            is None
-                                        )
-                                        and (
-                                            monitoring_location.wellInformation.wellHoleDepthMeasure.measureUnitCode  # noqa: B950
-                                            is not None
-                                        )
-                                    )
-                                    or (
-                                        (
-                                            monitoring_location.wellInformation.wellDepthMeasure
-                                            is not None
-                                        )
-                                        and (
-                                            monitoring_location.wellInformation.wellDepthMeasure.measureValue  # noqa: B950
-                                            is None
-                                        )
-                                        and (
-                                            monitoring_location.wellInformation.wellDepthMeasure.measureUnitCode  # noqa: B950
-                                            is not None
-                                        )
-                                    )
-                                )
-                            )
-                        ):
-                            violations.append(data_rule_35.strip())
-                if payload.wqx.organization.project is not None:
-                    for project in payload.wqx.organization.project:
-                        if project.projectMonitoringLocationWeighting is not None:
-                            for (
-                                project_monitoring_location_weighting
-                            ) in project.projectMonitoringLocationWeighting:
-                                if (
-                                    (
-                                        project_monitoring_location_weighting.locationWeightingFactorMeasure  # noqa: B950
-                                        is not None
-                                    )
-                                    and (
-                                        project_monitoring_location_weighting.locationWeightingFactorMeasure.measureValue  # noqa: B950
-                                        is None
-                                    )
-                                    and (
-                                        project_monitoring_location_weighting.locationWeightingFactorMeasure.measureUnitCode  # noqa: B950
-                                        is not None
-                                    )
-                                ):
-                                    violations.append(data_rule_36.strip())
-
-            data_rule_37 = """
-            Target Count is required when the Activity Assemblage is
-            "Benthic Macroinvertebrates"
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if (
-                        (activity.biologicalActivityDescription is not None)
-                        and (
-                            "Benthic Macroinvertebrates"
-                            == activity.biologicalActivityDescription.assemblageSampledName
-                        )
-                        and (activity.results is not None)
-                    ):
-                        for result in activity.results:
-                            if (result.resultDescription is None) or (
-                                result.resultDescription.targetCount is None
-                            ):
-                                violations.append(data_rule_37.strip())
-
-            data_rule_38 = """
-            Percent Sample Processed Numeric is required when the Activity Assemblage is
-            "Benthic Macroinvertebrates"
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if (
-                        (activity.biologicalActivityDescription is not None)
-                        and (
-                            "Benthic Macroinvertebrates"
-                            == activity.biologicalActivityDescription.assemblageSampledName
-                        )
-                        and (activity.results is not None)
-                    ):
-                        for result in activity.results:
-                            if (result.resultDescription is None) or (
-                                result.resultDescription.proportionSampleProcessedNumeric
-                                is None
-                            ):
-                                violations.append(data_rule_38.strip())
-
-            data_rule_39 = """
-            Percent Sample Processed Numeric must be a positive number between 0 and 1"
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if activity.results is not None:
-                        for result in activity.results:
-                            if (
-                                (result.resultDescription is not None)
-                                and (
-                                    result.resultDescription.proportionSampleProcessedNumeric
-                                    is not None
-                                )
-                                and (
-                                    (
-                                        result.resultDescription.proportionSampleProcessedNumeric
-                                        < 0
-                                    )
-                                    or (
-                                        result.resultDescription.proportionSampleProcessedNumeric
-                                        > 1
-                                    )
-                                )
-                            ):
-                                violations.append(data_rule_39.strip())
+        return (RuleSet() if rules is None else rules).listViolations(self.__payload)
 
-            # pylint: disable=unused-variable
-            data_rule_40 = """
-            Removed (v3.0) Sample Collection Method is required when Activity Type Code
-            contains the word "Sample"
-            """  # noqa: F841
-            # Not enforced because rule indicates it was removed.
-
-            data_rule_41 = """
-            Statistical N-Value Numeric must be a positive whole number.
-            """
-            if (
-                (payload.wqx is not None)
-                and (payload.wqx.organization is not None)
-                and (payload.wqx.organization.activity is not None)
-            ):
-                for activity in payload.wqx.organization.activity:
-                    if activity.results is not None:
-                        for result in activity.results:
-                            if (
-                                (result.resultDescription is not None)
-                                and (
-                                    result.resultDescription.statisticalNValueNumeric
-                                    is not None
-                                )
-                                and (
-                                    result.resultDescription.statisticalNValueNumeric < 0
-                                )
-                            ):
-                                violations.append(data_rule_41.strip())
+    def profileDataRules(self, rules: RuleSet = None) -> List[RuleStatistics]:
+        """
+        Check the data rules like list_data_rule_violations, and give how many times
+        the checks of each rule were called, the time they took and the violations
+        they found.
 
-        return violations
+        :param rules: Rules to check, every rule by default
+        """
+        return (RuleSet() if rules is None else rules).profile(self.__payload)
 
     def list_rule_violations(self) -> List[str]:
         violations: List[str] = []
@@ -2178,8 +136,50 @@ class Document:
 
         return violations
 
-    def generateXML(self, name: str = "Document") -> str:
-        doc = Doc()
+    def generateXML(
+        self,
+        name: str = "Document",
+        writer: XMLWriter = None,
+        *,
+        compact: bool = False,
+        workers: int = None,
+        cache: bool = False,
+        backend: str = "python",
+    ) -> str:
+        """
+        Generate the XML document. It is indented with two spaces per level unless
+        compact is set, which leaves out all whitespace between elements.
+
+        When workers is given, the activities are generated by a pool of that many
+        processes and then written in their original order. This only pays off for
+        large documents.
+
+        When cache is set, activities, results and monitoring locations keep their XML
+        and only the ones which changed since the last call are generated again. This
+        costs memory, and workers are not used then.
+
+        backend selects the writer which serializes the document (see getWriter) unless
+        one is given.
+        """
+        if writer is None:
+            doc = getWriter(backend)(
+                indentation=None if compact else " " * 2, cache=cache
+            )
+        else:
+            doc = writer
+            doc.cache = doc.cache or cache
+        if workers is not None:
+            # Only imported when needed, as it takes a while
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                doc.executor = executor
+                try:
+                    # Subclasses such as WQXSubmission redefine generateXML
+                    Document.generateXML(self, name, doc)
+                finally:
+                    doc.executor = None
+            return doc.getvalue() if writer is None else ""
         asis = doc.asis
         tag = doc.tag
 
@@ -2194,27 +194,203 @@ class Document:
 
         if self.__id is None:
             raise WQXException("Attribute 'id' is required.")
-        asis('<?xml version="1.0" encoding="UTF-8"?>')
-        with tag(
-            name,
-            ("Id", self.__id),
-            (
-                "xmlns",
-                "http://www.exchangenetwork.net/schema/v1.0/ExchangeNetworkDocument.xsd",
-            ),
-            ("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance"),
+        with doc:
+            asis('<?xml version="1.0" encoding="UTF-8"?>')
+            with tag(
+                name,
+                (
+                    "xmlns",
+                    "http://www.exchangenetwork.net/schema/v1.0/"
+                    "ExchangeNetworkDocument.xsd",
+                ),
+                ("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance"),
+                ("Id", self.__id),
+            ):
+                if self.__header is None:
+                    raise WQXException("Attribute 'header' is required.")
+                self.__header.generateXML("Header", doc)
+                if len(self.__payload) < 1:
+                    raise WQXException(
+                        "Attribute 'payload' must be a list of 1 or more Payload "
+                        "objects."
+                    )
+                for x in self.__payload:
+                    x.generateXML("Payload", doc)
+
+        return doc.getvalue() if writer is None else ""
+
+    def generateZIP(
+        self,
+        file: Union[str, BinaryIO],
+        name: str = "submission.xml",
+        *,
+        compression: int = ZIP_DEFLATED,
+        compresslevel: int = None,
+        compact: bool = False,
+        xml: str = None,
+        workers: int = None,
+        cache: bool = False,
+        backend: str = "python",
+    ) -> None:
+        """
+        Write the XML document into a new ZIP archive. The document is streamed into
+        the archive as it is generated unless it was already generated and is passed
+        in as xml.
+
+        :param file: Filename or binary file object of the archive to create
+        :param name: Name of the XML file inside the archive
+        :param compression: ZIP compression method, such as ZIP_STORED, ZIP_DEFLATED,
+            ZIP_BZIP2 or ZIP_LZMA
+        :param compresslevel: Compression level, as accepted by ZipFile
+        :param compact: Leave out the indentation
+        :param xml: Previously generated XML document to store
+        :param workers: Number of processes generating the activities
+        :param cache: Reuse the XML of elements which did not change since the last
+            export
+        :param backend: XML writer backend, "python" or "lxml"
+        """
+        with ZipFile(
+            file, mode="w", compression=compression, compresslevel=compresslevel
+        ) as zip:
+            if xml is not None:
+                zip.writestr(name, xml)
+                return
+            with zip.open(name, mode="w") as member:
+                with TextIOWrapper(member, encoding="utf-8") as out:
+                    indentation = None if compact else " " * 2
+                    # Subclasses such as WQXSubmission redefine generateXML
+                    Document.generateXML(
+                        self,
+                        writer=getWriter(backend)(out, indentation, cache=cache),
+                        workers=workers,
+                    )
+
+    def split(  # noqa: C901
+        self,
+        *,
+        maxResults: int = None,
+        maxBytes: int = None,
+        byMonitoringLocation: bool = False,
+    ) -> List["Document"]:
+        """
+        Split the document into several complete documents, each with its own copy of
+        the header and the organization description. Activities are never split and
+        keep their order. Each activity group goes into the part with its activities,
+        or the first part if it has none of them. The rest of the organization
+        (addresses, projects, monitoring locations, etc.) only goes into the first part,
+        so the parts should be submitted in order.
+
+        :param maxResults: Largest number of results in one part
+        :param maxBytes: Largest size of the activities in one part, measured as
+            compact XML
+        :param byMonitoringLocation: Keep activities of different monitoring locations
+            in separate parts
+        :return: List of documents, numbered by appending "-1", "-2", etc. to the id
+        :raises WQXLibException: If the activities of an activity group would end up in
+            different parts
+        """
+        if (
+            len(self.__payload) != 1
+            or self.__payload[0].wqx is None
+            or self.__payload[0].wqx.organization is None
         ):
-            if self.__header is None:
-                raise WQXException("Attribute 'header' is required.")
-            asis(self.__header.generateXML("Header"))
-            if len(self.__payload) < 1:
-                raise WQXException(
-                    "Attribute 'payload' must be a list of 1 or more Payload objects."
+            raise WQXLibException(
+                "Only a document with a single WQX payload can be split."
+            )
+        payload = self.__payload[0]
+        organization = payload.wqx.organization
+
+        if byMonitoringLocation:
+            locations = {}
+            for activity in organization.activity:
+                description = activity.activityDescription
+                locations.setdefault(
+                    None
+                    if description is None
+                    else description.monitoringLocationIdentifier,
+                    [],
+                ).append(activity)
+            groups = list(locations.values())
+        else:
+            groups = [organization.activity]
+
+        parts: List[List[Activity]] = []
+        for group in groups:
+            part: List[Activity] = []
+            results = 0
+            size = 0
+            for activity in group:
+                activityResults = len(activity.results)
+                activitySize = 0
+                if maxBytes is not None:
+                    activitySize = len(activity.generateXML("Activity").encode("utf-8"))
+                if part and (
+                    (maxResults is not None and results + activityResults > maxResults)
+                    or (maxBytes is not None and size + activitySize > maxBytes)
+                ):
+                    parts.append(part)
+                    part = []
+                    results = 0
+                    size = 0
+                part.append(activity)
+                results += activityResults
+                size += activitySize
+            if part:
+                parts.append(part)
+        if len(parts) < 1:
+            parts.append([])
+
+        owners: Dict[str, int] = {}
+        for i, activities in enumerate(parts):
+            for activity in activities:
+                if activity.activityDescription is not None:
+                    owners[activity.activityDescription.activityIdentifier] = i
+        activityGroups: List[List[ActivityGroup]] = [[] for _ in parts]
+        for activityGroup in organization.activityGroup:
+            indexes = {owners[x] for x in activityGroup.activityIdentifier if x in owners}
+            if len(indexes) > 1:
+                raise WQXLibException(
+                    f"Activity group {activityGroup.activityGroupIdentifier!r} would be "
+                    "split across several parts."
                 )
-            for x in self.__payload:
-                asis(x.generateXML("Payload"))
-
-        return indent(doc.getvalue(), indentation=" " * 2)
+            activityGroups[indexes.pop() if indexes else 0].append(activityGroup)
+
+        documents: List[Document] = []
+        for i, activities in enumerate(parts):
+            first = i == 0
+            documents.append(
+                Document(
+                    id=f"{self.__id}-{i + 1}",
+                    header=Header(self.__header),
+                    payload=Payload(
+                        operation=payload.operation,
+                        wqx=WQX.adopt(
+                            organization=Organization.adopt(
+                                organizationDescription=(
+                                    organization.organizationDescription
+                                ),
+                                electronicAddress=(
+                                    organization.electronicAddress if first else None
+                                ),
+                                telephonic=organization.telephonic if first else None,
+                                organizationAddress=(
+                                    organization.organizationAddress if first else None
+                                ),
+                                project=organization.project if first else None,
+                                monitoringLocation=(
+                                    organization.monitoringLocation if first else None
+                                ),
+                                biologicalHabitatIndex=(
+                                    organization.biologicalHabitatIndex if first else None
+                                ),
+                                activity=activities,
+                                activityGroup=activityGroups[i],
+                            )
+                        ),
+                    ),
+                )
+            )
+        return documents
 
 
 #        return doc.getvalue()
@@ -1,9 +1,8 @@
 from datetime import datetime
 from typing import List, Union
 
-from yattag import Doc
-
 from .exceptions import WQXException
+from .XMLWriter import XMLWriter
 
 
 class Header:
@@ -204,8 +203,10 @@ class Header:
             )
         self.__property = {} if val is None else val
 
-    def generateXML(self, name: str = "Header") -> str:  # noqa: C901
-        doc = Doc()
+    def generateXML(  # noqa: C901
+        self, name: str = "Header", writer: XMLWriter = None
+    ) -> str:
+        doc = XMLWriter() if writer is None else writer
         tag = doc.tag
         line = doc.line
 
@@ -240,4 +241,4 @@ class Header:
                     line("name", key)
                     line("value", self.__property[key])
 
-        return doc.getvalue()
+        return doc.getvalue() if writer is None else ""
@@ -0,0 +1,19 @@
+from types import ModuleType
+from typing import Any
+
+
+class LazyPackage(ModuleType):
+    """
+    Class of a package whose classes are imported from their modules the first time
+    they are used, by the __getattr__ function of the package (see PEP 562). The
+    MODULES dictionary of the package gives the module of each class.
+
+    Importing a module binds it to its package under its name, which is also the name
+    of its class for most modules of wqxlib, so the class would be hidden by the
+    module. Such modules are not bound.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if isinstance(value, ModuleType) and name in self.MODULES:
+            return
+        super().__setattr__(name, value)
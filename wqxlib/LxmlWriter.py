@@ -0,0 +1,155 @@
+from codecs import getincrementaldecoder
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, TextIO, Tuple, Union
+
+from lxml.etree import xmlfile
+
+from .XMLWriter import Attribute, XMLWriter
+
+
+class TextSink:
+    """
+    Binary file object for lxml to write into, which decodes the output and passes
+    it on as text.
+    """
+
+    def __init__(self, write: Callable[[str], Any]):
+        self.__decode = getincrementaldecoder("utf-8")().decode
+        self.__write = write
+
+    def write(self, data: bytes) -> None:
+        text = self.__decode(data)
+        if text:
+            self.__write(text)
+
+
+class LxmlWriter(XMLWriter):
+    """
+    Serialization backend which escapes and writes the elements with the incremental
+    writer of lxml (``lxml.etree.xmlfile``), written in C. Its output is the same as
+    that of XMLWriter, which it can replace anywhere.
+
+    Namespace declarations are always written ahead of the other attributes of an
+    element, so they should be listed first to get the same output from XMLWriter.
+    Markup written with ``asis`` and ``fragment`` is passed through as is.
+    """
+
+    raw = False
+
+    def __init__(
+        self,
+        stream: TextIO = None,
+        indentation: str = None,
+        *,
+        level: int = 0,
+        executor: Executor = None,
+        cache: bool = False,
+    ):
+        super().__init__(stream, indentation, level=level, executor=executor, cache=cache)
+        self.__output = self._write
+        self.__file = xmlfile(TextSink(self.__output), encoding="utf-8")
+        self.__xf = self.__file.__enter__()
+        self.__indentation = indentation
+        self.__level = level
+        # Element context of lxml and whether it has child elements yet, per open
+        # element
+        self.__elements: List[Any] = []
+        self.__children: List[bool] = []
+        self.__started = False
+        self.__namespaces: Dict[str, str] = {}
+        self._write = self.__raw
+
+    def __exit__(self, *exc: Any) -> None:
+        # lxml checks that every element was closed, unless an error stopped the
+        # document halfway
+        if self.__file is not None:
+            file, self.__file = self.__file, None
+            file.__exit__(*exc)
+
+    @property
+    def depth(self) -> int:
+        return self.__level + len(self.__children)
+
+    def __raw(self, markup: str) -> None:
+        # Anything lxml still holds has to come out first
+        self.__xf.flush()
+        self.__output(markup)
+
+    def __space(self, whitespace: str) -> None:
+        # lxml only writes text inside an element
+        if self.__elements:
+            self.__xf.write(whitespace)
+        else:
+            self.__raw(whitespace)
+
+    def __newline(self) -> None:
+        if self.__children:
+            self.__children[-1] = True
+        if self.__started:
+            self.__space("\n" + self.__indentation * self.depth)
+        self.__started = True
+
+    def __start(self, name: str, attrs: Tuple[Attribute, ...]) -> Any:
+        if not attrs:
+            return self.__xf.element(name)
+        attrib: Dict[str, str] = {}
+        nsmap: Dict[Union[str, None], str] = {}
+        for key, val in attrs:
+            prefix, _, local = key.rpartition(":")
+            if key == "xmlns":
+                nsmap[None] = val
+            elif prefix == "xmlns":
+                nsmap[local] = self.__namespaces[local] = val
+            elif prefix:
+                attrib[f"{{{self.__namespaces[prefix]}}}{local}"] = str(val)
+            else:
+                attrib[key] = str(val)
+        return self.__xf.element(name, attrib, nsmap=nsmap or None)
+
+    def open(self, name: str, *attrs: Attribute) -> None:
+        if self.__indentation is not None:
+            self.__newline()
+        element = self.__start(name, attrs)
+        element.__enter__()
+        self.__elements.append(element)
+        self.__children.append(False)
+
+    def close(self, name: str) -> None:
+        if self.__children.pop() and self.__indentation is not None:
+            self.__xf.write("\n" + self.__indentation * self.depth)
+        self.__elements.pop().__exit__(None, None, None)
+        if not self.__elements:
+            self.__xf.flush()
+
+    def line(self, name: str, content: Union[str, int, float], *attrs: Attribute) -> None:
+        if self.__indentation is not None:
+            self.__newline()
+        if not isinstance(content, str):
+            if not isinstance(content, (int, float)):
+                raise TypeError(
+                    "Only a string, an int or a float can be written inside an XML "
+                    f"text node. Got {content!r} (type {type(content)!r}) instead."
+                )
+            content = str(content)
+        with self.__start(name, attrs):
+            self.__xf.write(content)
+
+    def fragment(self, markup: str) -> None:
+        if self.__indentation is not None:
+            self.__newline()
+        self.__raw(markup)
+
+    def text(self, *content: Union[str, int, float]) -> None:
+        for x in content:
+            self.__xf.write(x if isinstance(x, str) else str(x))
+        self.__started = True
+
+    def asis(self, *content: str) -> None:
+        for x in content:
+            self.__raw(x)
+        self.__started = True
+
+    def getvalue(self) -> str:
+        if self.__file is not None:
+            self.__xf.flush()
+        return super().getvalue()
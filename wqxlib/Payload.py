@@ -1,11 +1,10 @@
 from enum import Enum
 
-from yattag import Doc
-
 from .exceptions import WQXException
 from .wqx_v3_0.WQX import WQX
 from .wqx_v3_0.WQX_Delete import WQXDelete
 from .wqx_v3_0.WQX_Update_Identifiers import WQXUpdateIdentifiers
+from .XMLWriter import XMLWriter
 
 
 class OperationType(Enum):
@@ -97,9 +96,10 @@ class Payload:
             )
         self.__wqxDelete = None if val is None else WQXDelete(val)
 
-    def generateXML(self, name: str = "Payload") -> str:  # noqa: C901
-        doc = Doc()
-        asis = doc.asis
+    def generateXML(  # noqa: C901
+        self, name: str = "Payload", writer: XMLWriter = None
+    ) -> str:
+        doc = XMLWriter() if writer is None else writer
 
         if self.__operation is None:
             raise WQXException("Attribute 'operation' is required.")
@@ -126,9 +126,9 @@ class Payload:
                         "for 'Update-Insert' operation."
                     )
                 elif self.__wqx is not None and self.__wqxUpdateIdentifiers is None:
-                    asis(self.__wqx.generateXML("WQX"))
+                    self.__wqx.generateXML("WQX", doc)
                 elif self.__wqxUpdateIdentifiers is not None and self.__wqx is None:
-                    asis(self.__wqxUpdateIdentifiers.generateXML("WQXUpdateIdentifiers"))
+                    self.__wqxUpdateIdentifiers.generateXML("WQXUpdateIdentifiers", doc)
             elif self.__operation == OperationType.DELETE:
                 if self.__wqx is not None:
                     raise WQXException(
@@ -143,10 +143,10 @@ class Payload:
                     raise WQXException(
                         "Attribute 'wqxDelete' is required for 'Delete' operation."
                     )
-                asis(self.__wqxDelete.generateXML("WQXDelete"))
+                self.__wqxDelete.generateXML("WQXDelete", doc)
             else:
                 raise WQXException(
                     "Attribute 'operation' must be either 'Update-Insert' or 'Delete'."
                 )
 
-        return doc.getvalue()
+        return doc.getvalue() if writer is None else ""
@@ -0,0 +1,344 @@
+from abc import ABC, abstractmethod
+from array import array
+from datetime import datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Iterable, List, Sequence, Tuple, Union
+
+from .ResultTemplate import ResultTemplate, Slot, TemplateResult
+from .wqx_v3_0 import WQXTime
+from .XMLWriter import XMLWriter
+
+EPOCH = datetime(1970, 1, 1)
+ORDINAL = EPOCH.toordinal()
+# Microseconds in a day
+DAY = 86400000000
+
+
+def codes(values: Iterable[int], count: int) -> array:
+    """
+    Store codes below count in the smallest array which holds them.
+    """
+    typecode = "B" if count <= 0x100 else "H" if count <= 0x10000 else "L"
+    return array(typecode, values)
+
+
+def missing(value: Any) -> bool:
+    """
+    Tell whether a value stands for a missing one: None, or NaN, NaT or pandas.NA as
+    pandas and NumPy give for missing values of any type.
+    """
+    if value is None:
+        return True
+    try:
+        return bool(value != value)
+    except TypeError:
+        # pandas.NA compares as missing too, which cannot be made a bool
+        return True
+
+
+class Column(ABC):
+    """
+    Values of one slot of a ResultTable, held compactly. Indexing a column gives the
+    value of the slot in that row, as the property of the slot would hold it, or None
+    if it is missing.
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def __getitem__(self, i: int) -> Any:
+        pass
+
+    @abstractmethod
+    def slice(self, start: int, stop: int) -> "Column":
+        """
+        Copy the values of a range of rows into a new column.
+        """
+
+
+class TextColumn(Column):
+    """
+    Text stored once per distinct value, with a code per row. This suits values which
+    repeat, like characteristic names, units and statuses.
+    """
+
+    def __init__(self, slot: Slot, values: Iterable[Any]):
+        index = {}
+        self.values: List[Any] = []
+        rows = []
+        for x in values:
+            if missing(x):
+                x = None
+            i = index.get(x)
+            if i is None:
+                i = index[x] = len(self.values)
+                self.values.append(slot.convert(x))
+            rows.append(i)
+        self.codes = codes(rows, len(self.values))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, i: int) -> Any:
+        return self.values[self.codes[i]]
+
+    def slice(self, start: int, stop: int) -> "TextColumn":
+        column = TextColumn.__new__(TextColumn)
+        column.values = self.values
+        column.codes = self.codes[start:stop]
+        return column
+
+
+class NumberColumn(Column):
+    """
+    Numbers held in an array, for a slot holding text such as a ResultMeasureValue.
+    They are written the shortest way which reads back as the same number, without
+    an exponent. NaN, or None in a list, stands for a missing value.
+
+    Arrays of the array module and NumPy arrays of numbers are used as they are.
+    """
+
+    def __init__(self, slot: Slot, values: Any):
+        self.slot = slot
+        if isinstance(values, array) or hasattr(values, "dtype"):
+            self.numbers = values
+        else:
+            values = list(values)
+            if all(isinstance(x, int) for x in values):
+                self.numbers = array("q", values)
+            else:
+                self.numbers = array(
+                    "d", (float("nan") if x is None else x for x in values)
+                )
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def __getitem__(self, i: int) -> Any:
+        # NumPy arrays give their items as Python numbers this way
+        x = self.numbers.item(i) if hasattr(self.numbers, "dtype") else self.numbers[i]
+        if x != x:
+            return None
+        text = repr(x)
+        if "e" in text:
+            text = format(Decimal(text), "f")
+        # The property of a text slot only converts the text to its type
+        return self.slot.fields[-1].type(text)
+
+    def slice(self, start: int, stop: int) -> "NumberColumn":
+        column = NumberColumn.__new__(NumberColumn)
+        column.slot = self.slot
+        column.numbers = self.numbers[start:stop]
+        return column
+
+
+class TimeColumn(Column):
+    """
+    Dates and times held as microseconds in an array, with their time zones stored
+    once per distinct zone. NumPy arrays of datetime64, which have no zone, are read
+    as UTC times.
+    """
+
+    def __init__(self, slot: Slot, values: Any):
+        self.slot = slot
+        zones = {}
+        self.zones: List[Any] = []
+        rows = []
+        microseconds = []
+        if hasattr(values, "dtype"):
+            values = values.astype("datetime64[us]").astype("int64").tolist()
+            self.times = array("q", values)
+            self.codes = codes([0] * len(values), 1)
+            self.zones.append(timezone.utc)
+            return
+        for x in values:
+            tz = x.tzinfo
+            i = zones.get(tz)
+            if i is None:
+                i = zones[tz] = len(self.zones)
+                self.zones.append(tz)
+            rows.append(i)
+            # Counted from the fields, which is faster than subtracting datetimes
+            microseconds.append(
+                (((x.toordinal() - ORDINAL) * 24 + x.hour) * 60 + x.minute) * 60000000
+                + x.second * 1000000
+                + x.microsecond
+            )
+        self.times = array("q", microseconds)
+        self.codes = codes(rows, len(self.zones))
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __getitem__(self, i: int) -> Any:
+        zone = self.zones[self.codes[i]]
+        if self.slot.fields[-1].type is WQXTime and (
+            zone is None or isinstance(zone, timezone)
+        ):
+            # A WQXTime only holds the time of day and the name of the zone, which
+            # does not depend on the date for a fixed zone
+            seconds, microseconds = divmod(self.times[i] % DAY, 1000000)
+            minutes, seconds = divmod(seconds, 60)
+            hours, minutes = divmod(minutes, 60)
+            return WQXTime.adopt(
+                time=time(hours, minutes, seconds, microseconds),
+                timeZoneCode="" if zone is None else zone.tzname(None),
+            )
+        value = EPOCH + timedelta(microseconds=self.times[i])
+        return self.slot.convert(value.replace(tzinfo=zone))
+
+    def slice(self, start: int, stop: int) -> "TimeColumn":
+        column = TimeColumn.__new__(TimeColumn)
+        column.slot = self.slot
+        column.zones = self.zones
+        column.times = self.times[start:stop]
+        column.codes = self.codes[start:stop]
+        return column
+
+
+class ObjectColumn(Column):
+    """
+    Values of any other kind, kept as they were converted by the slot.
+    """
+
+    def __init__(self, slot: Slot, values: Iterable[Any]):
+        self.values = [None if missing(x) else slot.convert(x) for x in values]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, i: int) -> Any:
+        return self.values[i]
+
+    def slice(self, start: int, stop: int) -> "ObjectColumn":
+        column = ObjectColumn.__new__(ObjectColumn)
+        column.values = self.values[start:stop]
+        return column
+
+
+def isColumn(values: Any) -> bool:
+    """
+    Tell whether the values given for a property are a column, with a value per row,
+    rather than a single value for every row: a list, tuple, array or anything else
+    with a dtype and dimensions, such as a NumPy array or a pandas Series.
+    """
+    if isinstance(values, (list, tuple, array, Column)):
+        return True
+    return hasattr(values, "dtype") and getattr(values, "ndim", 0) > 0
+
+
+def column(slot: Slot, values: Any) -> Column:
+    """
+    Store the values of a slot in the kind of column which suits them.
+    """
+    if isinstance(values, Column):
+        return values
+    text = not slot.fields[-1].element
+    dtype = getattr(values, "dtype", None)
+    if dtype is not None:
+        if dtype.kind == "M":
+            return TimeColumn(slot, values)
+        if dtype.kind in "iuf" and text:
+            return NumberColumn(slot, values)
+        values = values.tolist()
+    elif isinstance(values, array) and text:
+        return NumberColumn(slot, values)
+    values = [None if missing(x) else x for x in values]
+    sample = next((x for x in values if x is not None), None)
+    if isinstance(sample, datetime):
+        if None not in values:
+            return TimeColumn(slot, values)
+    elif isinstance(sample, (int, float)) and not isinstance(sample, bool) and text:
+        return NumberColumn(slot, values)
+    elif isinstance(sample, str) or sample is None:
+        return TextColumn(slot, values)
+    return ObjectColumn(slot, values)
+
+
+class ResultTable(Sequence[TemplateResult]):
+    """
+    Results made from a ResultTemplate whose slot values are held in columns, one per
+    slot, instead of objects per result. Repeated text is stored once, and numbers
+    and times are kept in arrays, so a table of a million results takes tens of
+    megabytes. Its XML is generated straight from the columns.
+
+    A table is the list of results of an activity (see WQXActivity.resultTable).
+    Indexing it gives a result made from the template, which turns into a complete
+    Result when any of its properties is read. Slicing it gives a table of some of
+    the rows which shares the columns, so one table can hold the results of a group
+    of activities and each gets a slice. Tables are not changed once made.
+
+    :param template: Template of the results
+    :param columns: Values of each slot of the template, in the order of the slots.
+        Each is a list, an array of the array module, a NumPy array or a Column.
+    """
+
+    def __init__(self, template: ResultTemplate, columns: Sequence[Any]):
+        if len(columns) != len(template.slots):
+            raise ValueError(
+                f"The template has {len(template.slots)} slots, got {len(columns)} "
+                "columns."
+            )
+        self.__template = template
+        self.__columns = [
+            column(Slot(path), x)
+            for path, x in zip(template.slots, columns)  # noqa: B905
+        ]
+        lengths = {len(x) for x in self.__columns}
+        if len(lengths) > 1:
+            raise ValueError("The columns must be of the same length.")
+        self.__start = 0
+        self.__stop = lengths.pop() if lengths else 0
+
+    def __reduce__(self) -> tuple:
+        # Only the rows of a slice are kept
+        return ResultTable, (
+            self.__template,
+            [x.slice(self.__start, self.__stop) for x in self.__columns],
+        )
+
+    @property
+    def template(self) -> ResultTemplate:
+        return self.__template
+
+    def __len__(self) -> int:
+        return self.__stop - self.__start
+
+    def row(self, i: int) -> Tuple[Any, ...]:
+        """
+        Values of the slots in a row.
+        """
+        i += self.__start
+        return tuple(x[i] for x in self.__columns)
+
+    def __getitem__(self, i: Union[int, slice]) -> Any:
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step != 1:
+                raise ValueError("A table can only be sliced in steps of 1.")
+            table = ResultTable.__new__(ResultTable)
+            table.__template = self.__template
+            table.__columns = self.__columns
+            table.__start = self.__start + start
+            table.__stop = self.__start + max(start, stop)
+            return table
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("Result table index out of range.")
+        return TemplateResult(self.__template, self.row(i))
+
+    def generateXML(self, name: str = "Result", writer: XMLWriter = None) -> str:
+        """
+        Generate the XML of every result in the table, one after another.
+        """
+        doc = XMLWriter() if writer is None else writer
+        columns = self.__columns
+        self.__template.generateRows(
+            (tuple(x[i] for x in columns) for i in range(self.__start, self.__stop)),
+            name,
+            doc,
+        )
+        return doc.getvalue() if writer is None else ""
@@ -0,0 +1,274 @@
+import re
+from copy import deepcopy
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+from .Schema import Field, encode
+from .wqx_v3_0 import Result
+from .XMLWriter import XMLWriter, escapeText, render
+
+
+class Marker(str):
+    """
+    Stands in for the value of a slot while the XML of a template is generated.
+    """
+
+    def generateXML(self, name: str, writer: XMLWriter) -> str:
+        self.depth = writer.depth
+        writer.fragment(self)
+        return ""
+
+
+class Slot:
+    """
+    A value of a template which differs per result, found by following ``fields``
+    from the Result. The last one belongs to ``owner``, whose property setter checks
+    and converts the values on a scratch instance of its own.
+    """
+
+    __slots__ = ("path", "fields", "owner", "setter", "scratch")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.fields: List[Field] = []
+        owner = Result
+        for i, attribute in enumerate(path.split(".")):
+            if i > 0:
+                owner = self.fields[-1].type
+                if not self.fields[-1].element:
+                    raise ValueError(f"Slot {path!r} goes through a text element.")
+            field = next((x for x in owner.schema if x.attribute == attribute), None)
+            if field is None:
+                raise ValueError(f"{owner.__name__} has no element {attribute!r}.")
+            if field.maxOccurs != 1:
+                raise ValueError(f"Slot {path!r} holds a list of elements.")
+            self.fields.append(field)
+        if not field.element and field.format not in (None, str):
+            raise ValueError(f"Slot {path!r} needs the element holding it instead.")
+        self.owner = owner
+        self.setter = getattr(owner, field.attribute).fset
+        self.scratch = owner.__new__(owner)
+
+    def __reduce__(self) -> tuple:
+        # Property setters cannot be pickled
+        return Slot, (self.path,)
+
+    def convert(self, value: Any) -> Any:
+        """
+        Check and convert a value the way the property of the slot does.
+        """
+        if value is None:
+            return None
+        self.setter(self.scratch, value)
+        return self.fields[-1].get(self.scratch)
+
+
+class ResultTemplate:
+    """
+    Result whose XML is generated once and reused by every result made from it, with
+    only the values of its slots filled in per result. This suits results which are
+    all the same apart from a few values, such as the readings of a sensor.
+
+    Each slot is the path to one value or element from the Result, made of the
+    property names leading to it, such as "resultDescription.characteristicName" or
+    "resultLabInformation.analysisStartTime". The values given for the slots are
+    checked by the same properties. Results made from a template only hold those
+    values, and turn into complete Result objects when any of their properties is
+    read, so they can still be inspected and changed.
+
+    :param result: Result holding everything the results have in common
+    :param slots: Paths of the values which differ per result
+    """
+
+    def __init__(self, result: Result, slots: Sequence[str]):
+        self.__result = deepcopy(result)
+        self.__slots = [Slot(x) for x in slots]
+        # Function generating the XML from the values of the slots, per name,
+        # indentation and nesting level
+        self.__fill: Dict[Tuple[str, str, int], Callable[..., str]] = {}
+
+    def __reduce__(self) -> tuple:
+        # The slots hold property setters, which cannot be pickled
+        return ResultTemplate, (self.__result, [x.path for x in self.__slots])
+
+    @property
+    def slots(self) -> List[str]:
+        return [x.path for x in self.__slots]
+
+    def result(self, *values: Any) -> "TemplateResult":
+        """
+        Make a result with the given values of the slots, in the order of the slots.
+        """
+        if len(values) != len(self.__slots):
+            raise ValueError(
+                f"The template has {len(self.__slots)} slots, got {len(values)} values."
+            )
+        return TemplateResult(
+            self,
+            tuple(slot.convert(x) for slot, x in zip(self.__slots, values)),  # noqa: B905
+        )
+
+    def materialize(self, values: Tuple[Any, ...]) -> Result:
+        """
+        Make a complete Result with the given values of the slots, which have already
+        been converted.
+        """
+        result = deepcopy(self.__result)
+        for slot, value in zip(self.__slots, values):  # noqa: B905
+            obj = result
+            for field in slot.fields[:-1]:
+                child = field.get(obj)
+                if child is None:
+                    if value is None:
+                        break
+                    child = field.type()
+                    setattr(obj, field.key, child)
+                obj = child
+            else:
+                setattr(obj, slot.fields[-1].key, value)
+        return result
+
+    def __compile(self, name: str, indentation: str, depth: int) -> Callable[..., str]:
+        """
+        Generate the XML of the template with a marker in each slot and cut it apart
+        around the markers, taking the whitespace in front of each slot along. The
+        pieces are then compiled into a function which joins them with the values of
+        the slots, like a Schema is.
+
+        An element in a slot which only holds single text elements, like a WQXTime,
+        is laid out ahead of time as well, so only its text is filled in. It is
+        generated as usual when some of them are missing.
+        """
+        markers = [Marker(f"\0{i}\0") for i in range(len(self.__slots))]
+        doc = XMLWriter(indentation=indentation, level=depth)
+        encode(self.materialize(markers), Result.schema, name, doc)
+        markup = doc.getvalue()
+        pattern = "|".join(
+            r"(\n[^<\n]*)?"
+            + re.escape(
+                marker
+                if slot.fields[-1].element
+                else f"<{slot.fields[-1].tag}>{marker}</{slot.fields[-1].tag}>"
+            )
+            for slot, marker in zip(self.__slots, markers)  # noqa: B905
+        )
+        namespace = {"escapeText": escapeText, "render": render}
+        body = []
+        pieces = []
+        start = 0
+        for match in re.finditer(pattern, markup):
+            pieces.append(repr(markup[start : match.start()]))
+            start = match.end()
+            i = int(re.search("\0([0-9]+)\0", match.group()).group(1))
+            field = self.__slots[i].fields[-1]
+            space = match.group(i + 1) or ""
+            if not field.element:
+                text = f"v{i}" if field.format is None else f"format{i}(v{i})"
+                namespace[f"format{i}"] = field.format
+                pieces.append(f"{space + f'<{field.tag}>'!r} + escapeText({text})")
+                pieces.append(repr(f"</{field.tag}>"))
+                continue
+            body.append(
+                f"x{i} = {space!r} + render(v{i}, {field.tag!r}, "
+                f"{indentation!r}, {markers[i].depth!r})"
+            )
+            schema = field.type.schema
+            if any(x.element or x.maxOccurs != 1 for x in schema):
+                pieces.append(f"x{i}")
+                continue
+            inner = XMLWriter(indentation=indentation, level=markers[i].depth)
+            inner.open(field.tag)
+            for k, x in enumerate(schema):
+                inner.line(x.tag, f"\0{k}\0")
+            inner.close(field.tag)
+            parts = re.split("\0[0-9]+\0", space + inner.getvalue())
+            namespace[f"values{i}"] = schema.values
+            items = [f"v{i}_{k}" for k in range(len(schema))]
+            body[-1] = "\n".join(
+                [
+                    f"{''.join(x + ', ' for x in items)}= values{i}(v{i})",
+                    f"if {' is None or '.join(items)} is None:",
+                    f"    {body[-1]}",
+                    "else:",
+                    f"    x{i} = {parts[0]!r}",
+                ]
+            )
+            for k, (x, part) in enumerate(zip(schema, parts[1:])):  # noqa: B905
+                namespace[f"format{i}_{k}"] = x.format
+                text = items[k] if x.format is None else f"format{i}_{k}({items[k]})"
+                body[-1] += f"\n    x{i} += escapeText({text}) + {part!r}"
+            pieces.append(f"x{i}")
+        pieces.append(repr(markup[start:]))
+        source = "\n".join(
+            [
+                "def fill(values):",
+                f"    {''.join(f'v{i}, ' for i in range(len(self.__slots)))}= values",
+            ]
+            + [f"    {y}" for x in body for y in x.split("\n")]
+            + [f"    return {' + '.join(pieces)}"]
+        )
+        exec(compile(source, "<ResultTemplate>", "exec"), namespace)
+        return namespace["fill"]
+
+    def generateXML(
+        self,
+        values: Tuple[Any, ...],
+        name: str = "Result",
+        writer: XMLWriter = None,
+    ) -> str:
+        """
+        Generate the XML of a result made from the template with the given values of
+        the slots, which have already been converted.
+        """
+        doc = XMLWriter() if writer is None else writer
+        self.generateRows((values,), name, doc)
+        return doc.getvalue() if writer is None else ""
+
+    def generateRows(
+        self, rows: Iterable[Tuple[Any, ...]], name: str, writer: XMLWriter
+    ) -> None:
+        """
+        Write the XML of several results made from the template into a writer, given
+        the values of their slots, which have already been converted.
+        """
+        key = (name, writer.indentation, writer.depth)
+        fill = self.__fill.get(key)
+        if fill is None:
+            fill = self.__fill[key] = self.__compile(*key)
+        fragment = writer.fragment
+        for values in rows:
+            if None in values:
+                # The element of an empty slot is left out, which can change the
+                # layout
+                encode(self.materialize(values), Result.schema, name, writer)
+            else:
+                fragment(fill(values))
+
+
+class TemplateResult(Result):
+    """
+    Result made from a ResultTemplate, holding only the values of its slots until any
+    property is read. It then turns into a complete Result, generated like any other.
+    """
+
+    def __init__(self, template: ResultTemplate, values: Tuple[Any, ...]):
+        self.__template = template
+        self.__values = values
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes which are not there, like those of a Result
+        # which has not been made yet
+        d = self.__dict__
+        if not name.startswith("_Result__") or "_TemplateResult__template" not in d:
+            raise AttributeError(name)
+        result = d.pop("_TemplateResult__template").materialize(
+            d.pop("_TemplateResult__values")
+        )
+        for field in Result.schema:
+            d[field.key] = field.get(result)
+        return d[name]
+
+    def generateXML(self, name: str = "Result", writer: XMLWriter = None) -> str:
+        template = self.__dict__.get("_TemplateResult__template")
+        if template is None:
+            return encode(self, Result.schema, name, writer)
+        return template.generateXML(self.__values, name, writer)
@@ -0,0 +1,373 @@
+from datetime import date, time
+from decimal import Decimal
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from xml.etree.ElementTree import Element
+
+from .exceptions import WQXException
+from .XMLWriter import Attribute, XMLWriter, escapeText
+
+
+class Field:
+    """
+    Describes one child element of a WQX element: the property holding it, its XML
+    tag, the type of its value and how many times it occurs, as in the schema.
+
+    The fields of a class are listed in document order in its ``schema`` attribute,
+    which drives ``encode``, ``decode`` and ``validate`` instead of code written out
+    per class.
+    XMLFragment turns that tuple into a Schema when the class is created.
+    A ``maxOccurs`` of 1 means the property holds a single value (or None), anything
+    else means it holds a list. ``maxOccurs=None`` means unbounded.
+    """
+
+    __slots__ = (
+        "attribute",
+        "tag",
+        "type",
+        "minOccurs",
+        "maxOccurs",
+        "format",
+        "parse",
+        "element",
+        "key",
+        "get",
+    )
+
+    def __init__(
+        self,
+        attribute: str,
+        tag: str,
+        type: type,
+        *,
+        minOccurs: int = 0,
+        maxOccurs: Optional[int] = 1,
+        format: Callable[[Any], str] = None,
+    ):
+        self.attribute = attribute
+        self.tag = tag
+        self.type = type
+        self.minOccurs = minOccurs
+        self.maxOccurs = maxOccurs
+        # Other element classes generate their own XML, while simple values are
+        # written as text, converting those the writer cannot escape directly.
+        self.element = hasattr(type, "generateXML")
+        if format is None and not issubclass(type, (str, int, float)):
+            format = str
+        self.format = format
+        # Turns the text of the element back into a value, without the checks made
+        # when the value is set, so that invalid documents can still be read. Text
+        # and numbers are kept as plain values of their base type rather than of the
+        # type of the field, so validate(values=True) and the setters still check
+        # them, as they do the values given to XMLFragment.adopt.
+        self.parse: Callable[[str], Any] = type
+        if issubclass(type, (date, time)):
+            self.parse = type.fromisoformat
+        elif not self.element:
+            for base in (str, int, float, Decimal):
+                if issubclass(type, base):
+                    self.parse = base
+                    break
+            else:
+                self.parse = lambda text: type(text.strip() in ("True", "true", "1"))
+        # Name of the private attribute behind the property, and a function reading it
+        self.key: str = None
+        self.get: Callable[[Any], Any] = None
+
+    def check(self, value: Any) -> Optional[str]:
+        """
+        Return what is wrong with the number of values, if anything.
+        """
+        if self.maxOccurs == 1:
+            if value is None and self.minOccurs > 0:
+                return f"Attribute {self.attribute!r} is required."
+            return None
+        count = len(value)
+        if count >= self.minOccurs and (
+            self.maxOccurs is None or count <= self.maxOccurs
+        ):
+            return None
+        return self.message()
+
+    def typed(self, value: Any) -> bool:
+        """
+        Tell whether the value, or every value in the list, is of the type of the field.
+        """
+        if self.maxOccurs == 1:
+            return type(value) is self.type
+        return all(type(x) is self.type for x in value)
+
+    def message(self) -> str:
+        """
+        Describe how many values a list should hold.
+        """
+        if self.maxOccurs is None:
+            occurs = f"{self.minOccurs} or more"
+        else:
+            occurs = f"{self.minOccurs} to {self.maxOccurs}"
+        return (
+            f"Attribute {self.attribute!r} must be a list of {occurs} "
+            f"{self.type.__name__} objects."
+        )
+
+
+class Schema(tuple):
+    """
+    The fields of a class, bound to the private attributes behind its properties.
+
+    The schema is compiled into a function which reads all those attributes at once
+    and writes the elements with their tags, checks and conversions filled in, so
+    generating XML from it is as fast as the code it replaces.
+    """
+
+    def __new__(cls, owner: type, fields: Iterable[Field]) -> "Schema":
+        self = super().__new__(cls, fields)
+        self.owner = owner
+        keys = [f"_{owner.__name__.lstrip('_')}__{x.attribute}" for x in self]
+        for field, key in zip(self, keys):  # noqa: B905
+            field.key = key
+            field.get = attrgetter(key)
+        self.tags: Dict[str, Field] = {x.tag: x for x in self}
+        if len(keys) == 1:
+            get = self[0].get
+            self.values = lambda obj: (get(obj),)
+        else:
+            self.values = attrgetter(*keys)
+        self.encodeCompact = self.__compile(owner, True)
+        self.encodeIndented = self.__compile(owner, False)
+        # Compiled when first used, as most classes are never read from dictionaries
+        self.__load: Callable[[Dict[str, Any]], Any] = None
+        self.__dump: Callable[[Any], Dict[str, Any]] = None
+        return self
+
+    def __compile(self, owner: type, compact: bool) -> Callable[..., None]:
+        """
+        Without indentation, text elements are written straight to the output with
+        their tags joined in ahead of time. Otherwise the writer has to lay them out.
+        """
+        namespace = {
+            "WQXException": WQXException,
+            "escapeText": escapeText,
+            "values": self.values,
+        }
+        body = []
+        for i, field in enumerate(self):
+            v = f"v{i}"
+            if field.element:
+                write = f"{{}}.generateXML({field.tag!r}, doc)"
+            else:
+                text = "{}" if field.format is None else f"format{i}({{}})"
+                namespace[f"format{i}"] = field.format
+                if compact:
+                    write = (
+                        f"write({f'<{field.tag}>'!r} + escapeText({text}) + "
+                        f"{f'</{field.tag}>'!r})"
+                    )
+                else:
+                    write = f"line({field.tag!r}, {text})"
+            if field.maxOccurs == 1:
+                if field.minOccurs > 0:
+                    namespace[f"message{i}"] = field.check(None)
+                    body.append(f"if {v} is None: raise WQXException(message{i})")
+                    body.append(write.format(v))
+                else:
+                    body.append(f"if {v} is not None: " + write.format(v))
+                continue
+            conditions = []
+            if field.minOccurs > 0:
+                conditions.append(f"len({v}) < {field.minOccurs}")
+            if field.maxOccurs is not None:
+                conditions.append(f"len({v}) > {field.maxOccurs}")
+            if conditions:
+                namespace[f"message{i}"] = field.message()
+                body.append(
+                    f"if {' or '.join(conditions)}: raise WQXException(message{i})"
+                )
+            if field.element:
+                body.append(f"doc.elements({v}, {field.tag!r})")
+            else:
+                body.append(f"for x in {v}: " + write.format("x"))
+        source = "\n".join(
+            [
+                "def encode(obj, name, doc, attributes):",
+                f"    {''.join(f'v{i}, ' for i in range(len(self)))}= values(obj)",
+                "    line = doc.line",
+                "    write = doc._write",
+                "    doc.open(name, *attributes)",
+            ]
+            + [f"    {x}" for x in body]
+            + ["    doc.close(name)"]
+        )
+        exec(compile(source, f"<{owner.__name__} schema>", "exec"), namespace)
+        return namespace["encode"]
+
+    def load(self, d: Dict[str, Any]) -> Any:
+        """
+        Make an element of the class from a dictionary, as XMLFragment.fromDict.
+        """
+        if self.__load is None:
+            self.__load = self.__compileLoad()
+        return self.__load(d)
+
+    def dump(self, obj: Any) -> Dict[str, Any]:
+        """
+        Turn an element of the class into a dictionary, as XMLFragment.toDict.
+        """
+        if self.__dump is None:
+            self.__dump = self.__compileDump()
+        return self.__dump(obj)
+
+    def __compileLoad(self) -> Callable[[Dict[str, Any]], Any]:
+        """
+        Compile a function which reads every field from a dictionary in turn. Text
+        is turned into values by the parse function of each field, without checks,
+        and nested dictionaries by the function compiled for their class.
+        """
+        namespace = {"new": object.__new__, "Compact": self.owner.Compact}
+        body = ["obj = new(Compact)", "get = d.get"]
+        for i, field in enumerate(self):
+            if field.element:
+                namespace[f"load{i}"] = field.type.schema.load
+                value = "load{0}({1}) if type({1}) is dict else {1}"
+            else:
+                namespace[f"parse{i}"] = field.parse
+                value = "parse{0}({1} if type({1}) is str else str({1}))"
+            body.append(f"v = get({field.attribute!r})")
+            if field.maxOccurs == 1:
+                value = value.format(i, "v")
+                body.append(f"obj.{field.key} = None if v is None else {value}")
+            else:
+                value = value.format(i, "x")
+                body.append(
+                    f"obj.{field.key} = [] if v is None else [{value} for x in v]"
+                )
+        source = "\n".join(
+            ["def load(d):"] + [f"    {x}" for x in body] + ["    return obj"]
+        )
+        exec(compile(source, f"<{self.owner.__name__} load>", "exec"), namespace)
+        return namespace["load"]
+
+    def __compileDump(self) -> Callable[[Any], Dict[str, Any]]:
+        """
+        Compile a function which puts every field which is set into a dictionary.
+        Numbers stay numbers and other simple values become their text, so the
+        dictionary can be written as JSON.
+        """
+        namespace = {"values": self.values}
+        body = [f"{''.join(f'v{i}, ' for i in range(len(self)))}= values(obj)", "d = {}"]
+        for i, field in enumerate(self):
+            if field.element:
+                value = "{}.toDict()"
+            else:
+                for base in (str, int, float):
+                    if issubclass(field.type, base):
+                        namespace[f"plain{i}"] = base
+                        break
+                else:
+                    namespace[f"plain{i}"] = field.format
+                value = f"plain{i}({{}})"
+            if field.maxOccurs == 1:
+                body.append(
+                    f"if v{i} is not None: d[{field.attribute!r}] = "
+                    + value.format(f"v{i}")
+                )
+            else:
+                body.append(
+                    f"if v{i}: d[{field.attribute!r}] = [{value.format('x')} for x in v{i}]"
+                )
+        source = "\n".join(
+            ["def dump(obj):"] + [f"    {x}" for x in body] + ["    return d"]
+        )
+        exec(compile(source, f"<{self.owner.__name__} dump>", "exec"), namespace)
+        return namespace["dump"]
+
+
+def encode(
+    obj: Any,
+    schema: Schema,
+    name: str,
+    writer: XMLWriter = None,
+    attributes: Tuple[Attribute, ...] = (),
+) -> str:
+    """
+    Generate the XML of an element from its schema. Like every generateXML method, it
+    writes into the writer if one is given and returns the XML otherwise.
+    """
+    doc = XMLWriter() if writer is None else writer
+    if doc.indentation is None and doc.raw:
+        schema.encodeCompact(obj, name, doc, attributes)
+    else:
+        schema.encodeIndented(obj, name, doc, attributes)
+    return doc.getvalue() if writer is None else ""
+
+
+def decode(
+    element: Element, cls: type, hook: Callable[[Element, Any], None] = None
+) -> Any:
+    """
+    Make an element of the given class, and everything inside it, from its XML as
+    parsed by ElementTree. The namespaces of the tags are ignored.
+
+    :param hook: Called with each element and the object made from it
+    :return: The object, holding the values as they are in the XML
+    """
+    schema = cls.schema
+    obj = cls.__new__(cls)
+    for field in schema:
+        setattr(obj, field.key, None if field.maxOccurs == 1 else [])
+    for child in element:
+        tag = child.tag.rpartition("}")[2]
+        field = schema.tags.get(tag)
+        if field is None:
+            raise WQXException(f"{cls.__name__} has no element {tag!r}.")
+        if field.element:
+            value = decode(child, field.type, hook)
+        else:
+            value = field.parse(child.text or "")
+        if field.maxOccurs == 1:
+            setattr(obj, field.key, value)
+        else:
+            field.get(obj).append(value)
+    if hook is not None:
+        hook(element, obj)
+    return obj
+
+
+def validate(obj: Any, schema: Schema = None, values: bool = False) -> List[str]:
+    """
+    Check an element and everything inside it against their schemas without
+    generating any XML.
+
+    :param values: Also check the simple values with the property setters, which
+        turns them into the types of their fields. Elements made with
+        XMLFragment.adopt, fromDict or decode hold their values unchecked until this
+        is done.
+    :return: List of every missing element, wrong number of elements and, if values
+        are checked, invalid value found
+    """
+    violations = []
+    schema = type(obj).schema if schema is None else schema
+    for field, value in zip(schema, schema.values(obj)):  # noqa: B905
+        problem = field.check(value)
+        if problem is not None:
+            violations.append(f"{type(obj).__name__}: {problem}")
+        if field.element:
+            if value is not None:
+                for x in [value] if field.maxOccurs == 1 else value:
+                    if isinstance(x, field.type):
+                        violations.extend(validate(x, values=values))
+                    else:
+                        violations.append(
+                            f"{type(obj).__name__}: Attribute {field.attribute!r} is "
+                            f"invalid: Expected {field.type.__name__}, not "
+                            f"{type(x).__name__}."
+                        )
+        elif values and value is not None and not field.typed(value):
+            try:
+                setattr(obj, field.attribute, value)
+            except (TypeError, ValueError) as e:
+                violations.append(
+                    f"{type(obj).__name__}: Attribute {field.attribute!r} is invalid: "
+                    f"{e}"
+                )
+    return violations
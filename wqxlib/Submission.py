@@ -1,5 +1,4 @@
-from io import BytesIO
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED
 
 from .Document import Document
 from .ImportConfiguration import ImportConfiguration
@@ -59,21 +58,24 @@ class Submission:
     #  def importResult(self, result: dict):
     #      pass
 
-    def generateZIP(self, fileName: str = None):
+    def generateZIP(
+        self,
+        fileName: str = None,
+        *,
+        compression: int = ZIP_DEFLATED,
+        compresslevel: int = None,
+        compact: bool = False,
+    ):
         if not isinstance(fileName, str):
             raise TypeError("Parameter 'fileName' must be a string.")
 
-        mem = BytesIO()
-        zip = ZipFile(mem, mode="w", compression=ZIP_DEFLATED)
-
-        results = self.__document.generateXML()
-        zip.writestr("results.xml", results)
+        self.__document.generateZIP(
+            fileName,
+            "results.xml",
+            compression=compression,
+            compresslevel=compresslevel,
+            compact=compact,
+        )
 
         # TODO: Add attachment files, if necessary. Example:
         #   zip.writestr('rawdata.csv', self.data)
-
-        zip.close()
-        mem.seek(0)
-
-        with open(fileName, "wb") as out:
-            out.write(mem.read())
@@ -1,6 +1,8 @@
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 from .exceptions import WQXLibException
+from .ResultTable import ResultTable, isColumn
+from .ResultTemplate import ResultTemplate, TemplateResult
 from .wqx_v3_0 import (
     Activity,
     ActivityDescription,
@@ -10,9 +12,46 @@ from .wqx_v3_0 import (
     ResultLabInformation,
     SampleDescription,
 )
-from .WQXResult import WQXResult
+from .WQXResult import PATHS, WQXResult
 from .WQXSample import WQXSample
 
+# Templates made by addResults, by their slots and the values shared by their results,
+# so that activities given the same kind of results share one
+TEMPLATES: Dict[Tuple[Any, ...], ResultTemplate] = {}
+
+
+def complete(result: WQXResult) -> Result:
+    """
+    Make the Result described by a facade, which takes over its values.
+    """
+    result._Result__resultDescription = ResultDescription.adopt(result)
+    result._Result__resultLabInformation = ResultLabInformation.adopt(result)
+    return Result.adopt(result)
+
+
+def template(paths: List[str], shared: Dict[str, Any]) -> ResultTemplate:
+    """
+    Get a template with the given slots for results which have the given values of
+    the properties of WQXResult in common.
+    """
+    key = (tuple(paths), tuple(shared.items()))
+    try:
+        found = TEMPLATES.get(key)
+    except TypeError:
+        # Some shared value cannot be hashed
+        key = found = None
+    if found is not None:
+        return found
+    result = WQXResult()
+    for name, x in shared.items():
+        setattr(result, name, x)
+    found = ResultTemplate(complete(result), paths)
+    if key is not None:
+        if len(TEMPLATES) >= 256:
+            TEMPLATES.clear()
+        TEMPLATES[key] = found
+    return found
+
 
 class WQXActivity(Activity, ActivityDescription):
     __samples: List[WQXSample] = []
@@ -21,6 +60,8 @@ class WQXActivity(Activity, ActivityDescription):
     def __init__(self,):
         Activity.__init__(self)
         ActivityDescription.__init__(self)
+        self.__samples = []
+        self.__results = []
         self.samples = []
         self.results = []
 
@@ -33,21 +74,29 @@ class WQXActivity(Activity, ActivityDescription):
             if self.activityIdentifier is None:
                 # Give the activity a default activityIdentifier
                 self.activityIdentifier = id
-            self.activityDescription = ActivityDescription(self)
+            self._Activity__activityDescription = ActivityDescription.adopt(self)
             if len(self.__samples) != 1:
                 assert WQXLibException(
                     "Each Activity requires a single sampleDescription."
                 )
             else:
                 sample = self.__samples[0]
-                sample.sampleCollectionMethod = ReferenceMethod(sample)
-                self.sampleDescription = SampleDescription(sample)
+                sample._SampleDescription__sampleCollectionMethod = ReferenceMethod.adopt(
+                    sample
+                )
+                self._Activity__sampleDescription = SampleDescription.adopt(sample)
+            if isinstance(self.__results, ResultTable):
+                self._Activity__results = self.__results
+                return
             tmp = []
             for result in self.__results:
-                result.resultDescription = ResultDescription(result)
-                result.resultLabInformation = ResultLabInformation(result)
-                tmp.append(Result(result))
-            self.results = tmp
+                if isinstance(result, TemplateResult):
+                    tmp.append(result)
+                    continue
+                tmp.append(complete(result))
+            # The setter would copy every result again, and turn those made from a
+            # template into complete results
+            self._Activity__results = tmp
 
     def sample(self) -> WQXSample:
         tmp = WQXSample()
@@ -56,5 +105,61 @@ class WQXActivity(Activity, ActivityDescription):
 
     def result(self) -> WQXResult:
         tmp = WQXResult()
-        self.__results.append(tmp)
+        self.__addResult(tmp)
         return tmp
+
+    def templateResult(self, template: ResultTemplate, *values: Any) -> TemplateResult:
+        """
+        Add a result made from a template, with the given values of its slots.
+        """
+        tmp = template.result(*values)
+        self.__addResult(tmp)
+        return tmp
+
+    def resultTable(self, table: ResultTable) -> ResultTable:
+        """
+        Give the activity a table of results made from a template, or a slice of one,
+        as all of its results.
+        """
+        if self.__results:
+            raise WQXLibException("The activity already has results.")
+        self.__results = table
+        return table
+
+    def addResults(self, **columns: Any) -> ResultTable:
+        """
+        Give the activity many results at once, from the values of the properties of
+        WQXResult given by name. Each is either a column with a value per result,
+        such as a list or a NumPy array (see isColumn), or a single value which every
+        result has. The results are held in a ResultTable, whose columns check each
+        distinct value once, so the activity must not have other results.
+
+            activity.addResults(
+                characteristicName="Temperature, water",
+                resultMeasureValue=values,
+                resultMeasureUnitCode="deg C",
+                analysisStartTime=times,
+            )
+        """
+        shared = {}
+        paths = []
+        values = []
+        for name, x in columns.items():
+            if name not in PATHS:
+                raise TypeError(f"WQXResult has no property {name!r}.")
+            if isColumn(x):
+                paths.append(PATHS[name])
+                values.append(x)
+            else:
+                shared[name] = x
+        if not paths:
+            raise ValueError("At least one column of values is needed.")
+        table = self.resultTable(ResultTable(template(paths, shared), values))
+        # The results are complete without leaving a with block
+        self._Activity__results = table
+        return table
+
+    def __addResult(self, result: Result) -> None:
+        if isinstance(self.__results, ResultTable):
+            raise WQXLibException("The results of the activity are in a table.")
+        self.__results.append(result)
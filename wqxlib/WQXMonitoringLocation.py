@@ -1,6 +1,7 @@
 from typing import List
 
 from .wqx_v3_0 import (
+    AttachedBinaryObject,
     MonitoringLocation,
     MonitoringLocationGeospatial,
     MonitoringLocationIdentity,
@@ -36,8 +37,14 @@ class WQXMonitoringLocation(
         return tmp
 
     def normalize(self) -> None:
-        self.monitoringLocationGeospatial = MonitoringLocationGeospatial(self)
-        self.monitoringLocationIdentity = MonitoringLocationIdentity(self)
+        self._MonitoringLocation__monitoringLocationGeospatial = (
+            MonitoringLocationGeospatial.adopt(self)
+        )
+        self._MonitoringLocation__monitoringLocationIdentity = (
+            MonitoringLocationIdentity.adopt(self)
+        )
         if self.wellTypeText is not None:
-            self.wellInformation = WellInformation(self)
-        self.attachedBinaryObject = self.__attachedBinaryObjects
+            self._MonitoringLocation__wellInformation = WellInformation.adopt(self)
+        self._MonitoringLocation__attachedBinaryObject = [
+            AttachedBinaryObject.adopt(x) for x in self.__attachedBinaryObjects
+        ]
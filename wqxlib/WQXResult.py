@@ -12,6 +12,22 @@ from .wqx_v3_0 import (
     ResultMeasureValue,
 )
 
+# Paths from a Result to the values behind the properties of the facade, as used for
+# the slots of a ResultTemplate. Those of the first base class take precedence.
+PATHS = {
+    **{
+        x.attribute: f"resultLabInformation.{x.attribute}"
+        for x in ResultLabInformation.schema
+    },
+    **{x.attribute: f"resultDescription.{x.attribute}" for x in ResultDescription.schema},
+    **{x.attribute: x.attribute for x in Result.schema},
+    "resultMeasureValue": "resultDescription.resultMeasure.resultMeasureValue",
+    "resultMeasureUnitCode": "resultDescription.resultMeasure.measureUnitCode",
+    "resultMeasureQualifierCode": "resultDescription.resultMeasure.measureQualifierCode",
+    "resultDepthHeightMeasureValue": "resultDescription.resultDepthHeightMeasure.measureValue",  # noqa: B950
+    "resultDepthHeightMeasureUnitCode": "resultDescription.resultDepthHeightMeasure.measureUnitCode",  # noqa: B950
+}
+
 
 class WQXResult(Result, ResultDescription, ResultLabInformation):
     def __init__(self,):
@@ -25,14 +41,34 @@ class WQXResult(Result, ResultDescription, ResultLabInformation):
     def __exit__(self, exception_type, exception_value, exception_traceback):
         pass  # TODO: add rule test
 
+    def __resultMeasure(self) -> Measure:
+        """
+        The measure of the result, which the properties below change in place. It is
+        made when one of them is first set.
+        """
+        measure = self.resultMeasure
+        if measure is None:
+            measure = self._ResultDescription__resultMeasure = Measure()
+        return measure
+
+    def __resultDepthHeightMeasure(self) -> MeasureCompact:
+        """
+        The depth or height measure of the result, which the properties below change
+        in place. It is made when one of them is first set.
+        """
+        measure = self.resultDepthHeightMeasure
+        if measure is None:
+            measure = self._ResultDescription__resultDepthHeightMeasure = MeasureCompact()
+        return measure
+
     @property
     def resultMeasureValue(self) -> ResultMeasureValue:
         """
         The reportable measure of the result for the chemical, microbiological or other
         characteristic being analyzed.
         """
-        val = Measure(self.resultMeasure)
-        return val.resultMeasureValue
+        measure = self.resultMeasure
+        return None if measure is None else measure.resultMeasureValue
 
     @resultMeasureValue.setter
     def resultMeasureValue(self, val: str) -> None:
@@ -40,15 +76,7 @@ class WQXResult(Result, ResultDescription, ResultLabInformation):
         The reportable measure of the result for the chemical, microbiological or other
         characteristic being analyzed.
         """
-        tmp = Measure(self.resultMeasure)
-        if tmp is None:
-            self.resultMeasure = Measure(resultMeasureValue=val)
-        else:
-            if val is None:
-                tmp.resultMeasureValue = None
-            else:
-                tmp.resultMeasureValue = val
-            self.resultMeasure = tmp
+        self.__resultMeasure().resultMeasureValue = val
 
     @property
     def resultMeasureUnitCode(self) -> MeasureUnitCode:
@@ -56,8 +84,8 @@ class WQXResult(Result, ResultDescription, ResultLabInformation):
         The reportable measure of the result for the chemical, microbiological or other
         characteristic being analyzed.
         """
-        val = Measure(self.resultMeasure)
-        return val.measureUnitCode
+        measure = self.resultMeasure
+        return None if measure is None else measure.measureUnitCode
 
     @resultMeasureUnitCode.setter
     def resultMeasureUnitCode(self, val: MeasureUnitCode) -> None:
@@ -65,15 +93,7 @@ class WQXResult(Result, ResultDescription, ResultLabInformation):
         The reportable measure of the result for the chemical, microbiological or other
         characteristic being analyzed.
         """
-        tmp = Measure(self.resultMeasure)
-        if tmp is None:
-            self.resultMeasure = Measure(measureUnitCode=val)
-        else:
-            if val is None:
-                tmp.measureUnitCode = None
-            else:
-                tmp.measureUnitCode = val
-            self.resultMeasure = tmp
+        self.__resultMeasure().measureUnitCode = val
 
     @property
     def resultMeasureQualifierCode(self) -> MeasureQualifierCode:
@@ -81,8 +101,8 @@ class WQXResult(Result, ResultDescription, ResultLabInformation):
         The reportable measure of the result for the chemical, microbiological or other
         characteristic being analyzed.
         """
-        val = Measure(self.resultMeasure)
-        return val.measureQualifierCode
+        measure = self.resultMeasure
+        return None if measure is None else measure.measureQualifierCode
 
     @resultMeasureQualifierCode.setter
     def resultMeasureQualifierCode(self, val: List[MeasureQualifierCode]) -> None:
@@ -90,15 +110,7 @@ class WQXResult(Result, ResultDescription, ResultLabInformation):
         The reportable measure of the result for the chemical, microbiological or other
         characteristic being analyzed.
         """
-        tmp = Measure(self.resultMeasure)
-        if tmp is None:
-            self.resultMeasure = Measure(measureQualifierCode=val)
-        else:
-            if val is None:
-                tmp.measureQualifierCode = None
-            else:
-                tmp.measureQualifierCode = val
-            self.resultMeasure = tmp
+        self.__resultMeasure().measureQualifierCode = val
 
     @property
     def resultDepthHeightMeasureValue(self) -> MeasureValue:
@@ -106,8 +118,8 @@ class WQXResult(Result, ResultDescription, ResultLabInformation):
         The reportable measure of the result for the chemical, microbiological or other
         characteristic being analyzed.
         """
-        val = MeasureCompact(self.resultDepthHeightMeasure)
-        return val.measureValue
+        measure = self.resultDepthHeightMeasure
+        return None if measure is None else measure.measureValue
 
     @resultDepthHeightMeasureValue.setter
     def resultDepthHeightMeasureValue(self, val: str) -> None:
@@ -115,12 +127,7 @@ class WQXResult(Result, ResultDescription, ResultLabInformation):
         The reportable measure of the result for the chemical, microbiological or other
         characteristic being analyzed.
         """
-        tmp = MeasureCompact(self.resultDepthHeightMeasure)
-        if val is None:
-            tmp.measureValue = None
-        else:
-            tmp.measureValue = val
-        self.resultDepthHeightMeasure = tmp
+        self.__resultDepthHeightMeasure().measureValue = val
 
     @property
     def resultDepthHeightMeasureUnitCode(self) -> MeasureUnitCode:
@@ -128,8 +135,8 @@ class WQXResult(Result, ResultDescription, ResultLabInformation):
         The reportable measure of the result for the chemical, microbiological or other
         characteristic being analyzed.
         """
-        val = MeasureCompact(self.resultDepthHeightMeasure)
-        return val.measureUnitCode
+        measure = self.resultDepthHeightMeasure
+        return None if measure is None else measure.measureUnitCode
 
     @resultDepthHeightMeasureUnitCode.setter
     def resultDepthHeightMeasureUnitCode(self, val: MeasureUnitCode) -> None:
@@ -137,9 +144,4 @@ class WQXResult(Result, ResultDescription, ResultLabInformation):
         The reportable measure of the result for the chemical, microbiological or other
         characteristic being analyzed.
         """
-        tmp = MeasureCompact(self.resultDepthHeightMeasure)
-        if val is None:
-            tmp.measureUnitCode = None
-        else:
-            tmp.measureUnitCode = val
-        self.resultDepthHeightMeasure = tmp
+        self.__resultDepthHeightMeasure().measureUnitCode = val
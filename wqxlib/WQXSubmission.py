@@ -1,16 +1,33 @@
-from io import BytesIO
-from typing import List, NewType
-from zipfile import ZipFile
+from copy import deepcopy
+from datetime import timezone
+from io import TextIOWrapper
+from os.path import join, splitext
+from tempfile import TemporaryDirectory
+from typing import Any, BinaryIO, Dict, Iterable, List, NewType, Optional, Sequence, Tuple
+from zipfile import ZIP_DEFLATED, ZipFile
 
 from .Document import Document
 from .Header import Header
 from .Payload import Payload
-from .wqx_v3_0 import WQX, Organization, OrganizationDescription
+from .ResultTable import isColumn
+from .Schema import Field
+from .wqx_v3_0 import (
+    WQX,
+    Activity,
+    ActivityDescription,
+    ElectronicAddress,
+    MonitoringLocation,
+    Organization,
+    OrganizationAddress,
+    OrganizationDescription,
+    Telephonic,
+)
 from .WQXActivity import WQXActivity
 from .WQXElectronicAddress import WQXElectronicAddress
 from .WQXMonitoringLocation import WQXMonitoringLocation
 from .WQXOrganizationAddress import WQXOrganizationAddress
 from .WQXTelephonic import WQXTelephonic
+from .XMLWriter import getWriter
 
 WQXActivityType = NewType("WQXActivity", WQXActivity)
 # WQXActivityGroupType = NewType("WQXActivityGroup", WQXActivityGroup)
@@ -22,6 +39,134 @@ WQXOrganizationAddressType = NewType("WQXOrganizationAddress", WQXOrganizationAd
 WQXTelephonicType = NewType("WQXTelephonic", WQXTelephonic)
 
 
+# Properties which addActivities sets, by name, with the class they belong to
+PROPERTIES: Dict[str, Tuple[type, Field]] = {
+    **{
+        x.attribute: (Activity, x)
+        for x in Activity.schema
+        if x.attribute not in ("activityDescription", "results")
+    },
+    **{x.attribute: (ActivityDescription, x) for x in ActivityDescription.schema},
+}
+
+
+def mutable(field: Field) -> bool:
+    """
+    Tell whether the values of a field can be changed in place, as lists and elements
+    can, so that each activity needs its own.
+    """
+    return field.element or field.maxOccurs != 1
+
+
+def convert(owner: type, field: Field, values: Iterable[Any]) -> List[Any]:
+    """
+    Check and convert values with the property setter of a field, once per distinct
+    value. Rows with the same value share it if it is simple content, and get a copy
+    of it otherwise.
+    """
+    setter = getattr(owner, field.attribute).fset
+    scratch = owner.__new__(owner)
+    converted: Dict[Any, Any] = {}
+    copy = mutable(field)
+    column = []
+    for x in values:
+        try:
+            value = converted[x]
+        except KeyError:
+            setter(scratch, x)
+            column.append(field.get(scratch))
+            converted[x] = column[-1]
+            continue
+        except TypeError:
+            # Lists cannot be looked up
+            setter(scratch, x)
+            column.append(field.get(scratch))
+            continue
+        column.append(deepcopy(value) if copy else value)
+    return column
+
+
+def rows(column: Any, positions: Sequence[int]) -> Any:
+    """
+    Take the values of a column in the rows at the given positions.
+    """
+    if hasattr(column, "dtype"):
+        return column[positions]
+    return [column[i] for i in positions]
+
+
+def writePart(part: Document, file: BinaryIO, indentation: str, backend: str) -> None:
+    """
+    Stream the XML of a part of a submission into a binary file object.
+    """
+    with TextIOWrapper(file, encoding="utf-8") as out:
+        part.generateXML(writer=getWriter(backend)(out, indentation))
+
+
+def writePartFile(part: Document, filename: str, indentation: str, backend: str) -> None:
+    """
+    Stream the XML of a part of a submission into a file, in a process of the pool of
+    writeParts.
+    """
+    with open(filename, "wb") as f:
+        writePart(part, f, indentation, backend)
+
+
+def writeParts(
+    parts: List[Document],
+    filenames: List[str],
+    indentation: str,
+    backend: str,
+    workers: int = None,
+) -> None:
+    """
+    Write each part of a submission into its file, several at once in a pool of
+    processes if workers is given.
+    """
+    if workers is None:
+        for part, filename in zip(parts, filenames):  # noqa: B905
+            writePartFile(part, filename, indentation, backend)
+        return
+    # Only imported when needed, as it takes a while
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(writePartFile, part, filename, indentation, backend)
+            for part, filename in zip(parts, filenames)  # noqa: B905
+        ]
+        for future in futures:
+            # Raises the exception of a part which failed
+            future.result()
+
+
+def tableColumn(column: Any) -> Any:
+    """
+    Read a column of a table, such as a pandas DataFrame or a PyArrow Table, as a
+    list or an array. PyArrow gives times with a zone as NumPy datetime64 in UTC,
+    which loses the zone, so those are read as datetime objects in the zone of the
+    column instead. pandas already gives them as Timestamps with their zone.
+    """
+    if getattr(getattr(column, "type", None), "tz", None) is not None:
+        return column.to_pylist()
+    return column.to_numpy() if hasattr(column, "to_numpy") else column
+
+
+def groups(frame: Any, names: List[Any], columns: List[Any]) -> List[Sequence[int]]:
+    """
+    Positions of the rows of a table holding each distinct combination of values of
+    the named columns, in the order in which they first occur.
+    """
+    if hasattr(frame, "groupby"):
+        # pandas groups the rows without going through them in Python
+        indices = frame.groupby(names, sort=False, dropna=False).indices
+        return sorted(indices.values(), key=lambda x: x[0])
+    found: Dict[Tuple[Any, ...], List[int]] = {}
+    for i, key in enumerate(zip(*columns)):  # noqa: B905
+        found.setdefault(key, []).append(i)
+    return list(found.values())
+
+
 class WQXSubmission(Document, Header, OrganizationDescription):
     __filename: str = None
     __activities: List[WQXActivityType] = []
@@ -66,6 +211,95 @@ class WQXSubmission(Document, Header, OrganizationDescription):
         self.__activities.append(tmp)
         return tmp
 
+    def addActivities(self, **columns: Any) -> List[WQXActivity]:
+        """
+        Add many activities at once, from the values of the properties of
+        ActivityDescription given by name. Each is either a column with a value per
+        activity, such as a list or a NumPy array (see isColumn), or a single value
+        which every activity has. Each distinct value is checked once. The elements
+        of an Activity, like its sampleDescription, can be given as well. The
+        activities are complete without a with block, and can be given results with
+        addResults.
+
+        :return: The activities, in the order of the values
+        """
+        shared: Dict[str, Any] = {}
+        # Shared values which each activity gets a copy of
+        copied: Dict[str, Any] = {}
+        values: Dict[str, List[Any]] = {}
+        for name, x in columns.items():
+            if name not in PROPERTIES:
+                raise TypeError(f"WQXActivity has no property {name!r}.")
+            owner, field = PROPERTIES[name]
+            if not isColumn(x):
+                value = convert(owner, field, [x])[0]
+                (copied if mutable(field) else shared)[field.key] = value
+                continue
+            if hasattr(x, "dtype") and x.dtype.kind == "M":
+                # Only times in microseconds turn into datetime objects, and they
+                # are in UTC like in a ResultTable
+                x = [
+                    None if y is None else y.replace(tzinfo=timezone.utc)
+                    for y in x.astype("datetime64[us]").tolist()
+                ]
+            values[field.key] = convert(
+                owner, field, x.tolist() if hasattr(x, "tolist") else x
+            )
+        counts = {len(x) for x in values.values()}
+        if len(counts) != 1:
+            raise ValueError("Columns of values of the same length are needed.")
+        activities = []
+        for i in range(counts.pop()):
+            activity = self.activity()
+            with activity:
+                for key, x in shared.items():
+                    setattr(activity, key, x)
+                for key, x in copied.items():
+                    setattr(activity, key, deepcopy(x))
+                for key, x in values.items():
+                    setattr(activity, key, x[i])
+            activities.append(activity)
+        return activities
+
+    def addDataFrame(
+        self, frame: Any, mapping: Dict[str, Any], **values: Any
+    ) -> List[WQXActivity]:
+        """
+        Add the activities and results in a table with a row per result, such as a
+        pandas DataFrame, a PyArrow Table or a dictionary of lists or arrays. The rows
+        are grouped into activities by the values of the properties of the activities,
+        and the results of each are added at once with addResults.
+
+        :param frame: Table whose columns can be read by name as lists or arrays, or
+            as anything with a to_numpy method
+        :param mapping: Name of the column holding the values of each property, by
+            the name of the property of WQXActivity (see addActivities) or WQXResult
+        :param values: Values which every activity or result has, by the name of the
+            property
+        :return: The activities, in the order in which they first occur
+        """
+        columns = {}
+        for name, label in mapping.items():
+            columns[name] = tableColumn(frame[label])
+        activityNames = [x for x in columns if x in PROPERTIES]
+        resultNames = [x for x in columns if x not in PROPERTIES]
+        if not activityNames:
+            raise ValueError("A column of a property of the activities is needed.")
+        positions = groups(
+            frame,
+            [mapping[x] for x in activityNames],
+            [columns[x] for x in activityNames],
+        )
+        first = [x[0] for x in positions]
+        activities = self.addActivities(
+            **{x: values[x] for x in values if x in PROPERTIES},
+            **{x: rows(columns[x], first) for x in activityNames},
+        )
+        shared = {x: values[x] for x in values if x not in PROPERTIES}
+        for activity, x in zip(activities, positions):  # noqa: B905
+            activity.addResults(**shared, **{y: rows(columns[y], x) for y in resultNames})
+        return activities
+
     # def activityGroup(self) -> WQXActivityGroup:
     #    tmp = WQXActivityGroup()
     #    self.__activityGroups.append(tmp)
@@ -101,21 +335,44 @@ class WQXSubmission(Document, Header, OrganizationDescription):
         self.__telephonics.append(tmp)
         return tmp
 
+    @staticmethod
+    def __adopt(cls: type, facade: Any) -> Any:
+        """
+        Make the element of an export which takes over the values of a facade. It
+        keeps the snapshot of the element made from the facade for the previous
+        export, so the XML cached for that one is written again if nothing changed.
+        """
+        element = cls.adopt(facade)
+        previous = facade.__dict__.get("_WQXSubmission__adopted")
+        snapshot = getattr(previous, "_XMLFragment__snapshot", None)
+        if snapshot is not None:
+            element._XMLFragment__snapshot = snapshot
+        facade.__adopted = element
+        return element
+
     def normalize(self) -> None:
         self.header = Header(self)
         self.payload = [
             Payload(
                 operation="Update-Insert",
-                wqx=WQX(
-                    organization=Organization(
-                        organizationDescription=OrganizationDescription(self),
-                        electronicAddress=self.__electronicAddresses,
-                        telephonic=self.__telephonics,
-                        organizationAddress=self.__organizationAddresses,
+                wqx=WQX.adopt(
+                    organization=Organization.adopt(
+                        organizationDescription=OrganizationDescription.adopt(self),
+                        electronicAddress=[
+                            ElectronicAddress.adopt(x) for x in self.__electronicAddresses
+                        ],
+                        telephonic=[Telephonic.adopt(x) for x in self.__telephonics],
+                        organizationAddress=[
+                            OrganizationAddress.adopt(x)
+                            for x in self.__organizationAddresses
+                        ],
                         # project=self.__projects,
-                        monitoringLocation=self.__monitoringLocations,
+                        monitoringLocation=[
+                            self.__adopt(MonitoringLocation, x)
+                            for x in self.__monitoringLocations
+                        ],
                         # biologicalHabitatIndex=self.__biologicalHabitatIndex,
-                        activity=self.__activities,
+                        activity=[self.__adopt(Activity, x) for x in self.__activities],
                         # activityGroup=self.__activityGroups,
                     )
                 ),
@@ -124,7 +381,7 @@ class WQXSubmission(Document, Header, OrganizationDescription):
 
     def list_rule_violations(self) -> List[str]:
         self.normalize()
-        return self.list_rule_violations()
+        return Document.list_rule_violations(self)
 
     def generateXML(self, fileName: str = None) -> None:
         """
@@ -150,44 +407,141 @@ class WQXSubmission(Document, Header, OrganizationDescription):
         """
         self.export(fileName)
 
-    def export(self, filename: str = None) -> str:
-        self.header = Header(self)
-        self.payload = [
-            Payload(
-                operation="Update-Insert",
-                wqx=WQX(
-                    organization=Organization(
-                        organizationDescription=OrganizationDescription(self),
-                        electronicAddress=self.__electronicAddresses,
-                        telephonic=self.__telephonics,
-                        organizationAddress=self.__organizationAddresses,
-                        # project=self.__projects,
-                        monitoringLocation=self.__monitoringLocations,
-                        # biologicalHabitatIndex=self.__biologicalHabitatIndex,
-                        activity=self.__activities,
-                        # activityGroup=self.__activityGroups,
-                    )
-                ),
+    def export(
+        self,
+        filename: str = None,
+        *,
+        stream: bool = False,
+        compact: bool = False,
+        compression: int = ZIP_DEFLATED,
+        compresslevel: int = None,
+        workers: int = None,
+        cache: bool = False,
+        backend: str = "python",
+    ) -> Optional[str]:
+        """
+        Export the WQXSubmission object as an XML document
+
+        :param filename: Filename of the .xml or .zip file to create, if any
+        :param stream: Write the XML straight into the file (or zip member) while it is
+            generated instead of building the whole document in memory first
+        :param compact: Leave out the indentation, which WQX Web does not need
+        :param compression: ZIP compression method used for .zip files, such as
+            ZIP_STORED, ZIP_DEFLATED, ZIP_BZIP2 or ZIP_LZMA
+        :param compresslevel: Compression level for .zip files, as accepted by ZipFile
+        :param workers: Generate the activities in a pool of this many processes,
+            which speeds up large submissions
+        :param cache: Keep the XML of the activities, results and monitoring locations
+            and only generate it again for the ones that changed, which speeds up
+            exporting the same submission repeatedly
+        :param backend: Serialize the XML with the pure-Python writer ("python") or
+            with lxml ("lxml"), which must be installed. Both give the same output.
+        :return: The XML document, or None if it was streamed into the file
+        :raises ValueError: If the XML is streamed into a file whose name does not end
+            with .xml or .zip
+        """
+        if stream and filename is not None:
+            if filename[-4:].upper() not in (".XML", ".ZIP"):
+                raise ValueError("The filename must end with .xml or .zip.")
+        self.normalize()
+        xml = None
+        if not stream or filename is None:
+            xml = super().generateXML(
+                compact=compact, workers=workers, cache=cache, backend=backend
             )
-        ]
-        xml = super().generateXML()
         if filename is not None:
             filetype = filename[-4:].upper()
             if filetype == ".XML":
-                with open(filename, "w") as out:
-                    out.write(xml)
+                with open(filename, "w", encoding="utf-8") as out:
+                    if xml is None:
+                        indentation = None if compact else " " * 2
+                        super().generateXML(
+                            writer=getWriter(backend)(out, indentation, cache=cache),
+                            workers=workers,
+                        )
+                    else:
+                        out.write(xml)
             elif filetype == ".ZIP":
-                mem = BytesIO()
-                zip = ZipFile(mem, mode="w")
-
-                zip.writestr("submission.xml", xml)
+                # TODO: Add attachment files, if necessary.
+                super().generateZIP(
+                    filename,
+                    compression=compression,
+                    compresslevel=compresslevel,
+                    compact=compact,
+                    xml=xml,
+                    workers=workers,
+                    cache=cache,
+                    backend=backend,
+                )
+        return xml
 
-                # TODO: Add attachment files, if necessary. Example:
-                #   zip.writestr('rawdata.csv', self.data)
+    def exportParts(
+        self,
+        filename: str,
+        *,
+        maxResults: int = None,
+        maxBytes: int = None,
+        byMonitoringLocation: bool = False,
+        compact: bool = False,
+        compression: int = ZIP_DEFLATED,
+        compresslevel: int = None,
+        workers: int = None,
+        backend: str = "python",
+    ) -> List[str]:
+        """
+        Export the WQXSubmission object as several XML documents which each stay
+        within the given limits. See Document.split for how the parts are made.
 
-                zip.close()
-                mem.seek(0)
+        A .xml filename produces one numbered file per part (name_1.xml, name_2.xml,
+        etc.), while a .zip filename produces a single archive holding one numbered
+        XML file per part (submission_1.xml, submission_2.xml, etc.). The parts should
+        be submitted in order. Each part is streamed into its file or archive member
+        while it is generated, so no part is held in memory as a whole.
 
-                with open(filename, "wb") as out:
-                    out.write(mem.read())
-        return xml
+        :param filename: Filename of the .xml or .zip file to create
+        :param maxResults: Largest number of results in one part
+        :param maxBytes: Largest size of the activities in one part, measured as
+            compact XML
+        :param byMonitoringLocation: Keep activities of different monitoring locations
+            in separate parts
+        :param compact: Leave out the indentation, which WQX Web does not need
+        :param compression: ZIP compression method used for .zip files, such as
+            ZIP_STORED, ZIP_DEFLATED, ZIP_BZIP2 or ZIP_LZMA
+        :param compresslevel: Compression level for .zip files, as accepted by ZipFile
+        :param workers: Write this many parts at once, each in a process of a pool.
+            For a .zip filename they are written into temporary files, which are
+            then copied into the archive in order.
+        :param backend: XML writer backend, "python" or "lxml"
+        :return: Names of the files written, or of the members of the archive
+        """
+        self.normalize()
+        parts = self.split(
+            maxResults=maxResults,
+            maxBytes=maxBytes,
+            byMonitoringLocation=byMonitoringLocation,
+        )
+        indentation = None if compact else " " * 2
+        root, ext = splitext(filename)
+        if ext.upper() == ".XML":
+            names = [f"{root}_{i + 1}{ext}" for i in range(len(parts))]
+            writeParts(parts, names, indentation, backend, workers)
+        elif ext.upper() == ".ZIP":
+            names = [f"submission_{i + 1}.xml" for i in range(len(parts))]
+            with ZipFile(
+                filename, mode="w", compression=compression, compresslevel=compresslevel
+            ) as archive:
+                if workers is None:
+                    for part, name in zip(parts, names):  # noqa: B905
+                        with archive.open(name, mode="w") as member:
+                            writePart(part, member, indentation, backend)
+                    return names
+                # Members of an archive can only be written one at a time, so the
+                # parts are written into files first and then copied in
+                with TemporaryDirectory() as tmp:
+                    paths = [join(tmp, x) for x in names]
+                    writeParts(parts, paths, indentation, backend, workers)
+                    for path, name in zip(paths, names):  # noqa: B905
+                        archive.write(path, name)
+        else:
+            raise ValueError("The filename must end with .xml or .zip.")
+        return names
@@ -0,0 +1,245 @@
+from functools import wraps
+from inspect import signature
+from typing import Any, Callable, Dict, List, Tuple
+
+from .Schema import Schema
+from .XMLWriter import XMLWriter
+
+
+def attributes(obj: "XMLFragment") -> List[Any]:
+    """
+    Values of the private attributes of an element, which are held in slots if it is
+    compact and in its dictionary otherwise.
+    """
+    slots = type(obj).__dict__.get("__slots__")
+    if slots is None:
+        return list(obj.__dict__.values())
+    return [getattr(obj, x, None) for x in slots]
+
+
+class Snapshot:
+    """
+    State of an element when it was last generated with a cache. Setters always store
+    new objects, so comparing the attributes tells whether the element was changed.
+    Lists can be changed in place, so their contents are kept as well.
+    """
+
+    __slots__ = ("attributes", "lists", "children", "fragment")
+
+    def __init__(self, obj: "XMLFragment"):
+        self.attributes = attributes(obj)
+        self.lists: List[Tuple[list, list]] = []
+        self.children: List[XMLFragment] = []
+        for v in self.attributes:
+            if isinstance(v, list):
+                self.lists.append((v, list(v)))
+                self.children.extend(x for x in v if isinstance(x, XMLFragment))
+            elif isinstance(v, XMLFragment):
+                self.children.append(v)
+        self.fragment: Tuple[Any, str] = None
+        obj._XMLFragment__snapshot = self
+
+
+def unchanged(obj: "XMLFragment") -> bool:
+    """
+    Tell whether an element and everything inside it is still the same as when it
+    was last generated with a cache.
+    """
+    snapshot = getattr(obj, "_XMLFragment__snapshot", None)
+    if snapshot is None or snapshot.attributes != attributes(obj):
+        return False
+    for v, old in snapshot.lists:
+        if v != old:
+            return False
+    for x in snapshot.children:
+        if not unchanged(x):
+            return False
+    return True
+
+
+def cached(generateXML: Callable[..., str]) -> Callable[..., str]:
+    """
+    Wrap the generateXML method of an element so it takes part in fragment caching
+    when it is called with a writer that has ``cache`` set.
+    """
+    default = signature(generateXML).parameters["name"].default
+
+    @wraps(generateXML)
+    def wrapper(self, name: str = default, writer: XMLWriter = None) -> str:
+        if writer is None or not writer.cache:
+            return generateXML(self, name, writer)
+        if not self.cacheXML:
+            Snapshot(self)
+            return generateXML(self, name, writer)
+        key = (name, writer.indentation, writer.depth)
+        snapshot = getattr(self, "_XMLFragment__snapshot", None)
+        if (
+            snapshot is None
+            or snapshot.fragment is None
+            or snapshot.fragment[0] != key
+            or not unchanged(self)
+        ):
+            snapshot = Snapshot(self)
+            doc = XMLWriter(
+                indentation=writer.indentation, level=writer.depth, cache=True
+            )
+            generateXML(self, name, doc)
+            snapshot.fragment = (key, doc.getvalue())
+        writer.fragment(snapshot.fragment[1])
+        return ""
+
+    return wrapper
+
+
+def takeAttributes(
+    name: str, layout: Tuple[Tuple[str, str, bool], ...]
+) -> Callable[[Any, Any], None]:
+    """
+    Compile a function which sets the private attributes of an element to those of
+    another element, for XMLFragment.adopt.
+    """
+    body = []
+    for key, _, isList in layout:
+        if isList:
+            body.append(f"v = o.{key}")
+            body.append(f"obj.{key} = [] if v is None else v")
+        else:
+            body.append(f"obj.{key} = o.{key}")
+    source = "\n".join(["def take(obj, o):"] + [f"    {x}" for x in body or ["pass"]])
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<{name} adopt>", "exec"), namespace)
+    return namespace["take"]
+
+
+def setAttributes(
+    name: str, layout: Tuple[Tuple[str, str, bool], ...]
+) -> Callable[..., None]:
+    """
+    Compile a function which sets the private attributes of an element to the values
+    given by name, for XMLFragment.adopt.
+    """
+    body = []
+    for key, attribute, isList in layout:
+        if isList:
+            body.append(f"obj.{key} = [] if {attribute} is None else {attribute}")
+        else:
+            body.append(f"obj.{key} = {attribute}")
+    parameters = "".join(f", {x}=None" for _, x, _ in layout)
+    source = "\n".join(
+        [f"def set(obj, *{parameters}):" if parameters else "def set(obj):"]
+        + [f"    {x}" for x in body or ["pass"]]
+    )
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<{name} adopt>", "exec"), namespace)
+    return namespace["set"]
+
+
+class XMLFragment:
+    """
+    Base class of the WQX elements, which lets them keep their generated XML between
+    exports.
+
+    Elements of classes with ``cacheXML`` set remember the XML they generated for a
+    writer with ``cache`` set and write it again as long as nothing inside them has
+    changed, so only the changed parts of a document are generated again.
+
+    ``schema`` lists the child elements of the class in document order (see Field).
+
+    Every class with a schema also gets a compact subclass, ``Compact``, which holds
+    the private attributes annotated in the class in slots instead of a dictionary,
+    and elements are made as instances of it. The classes themselves have empty
+    ``__slots__`` so that subclasses combining several of them, like the facades,
+    are still possible. Those keep their attributes in a dictionary.
+    """
+
+    __slots__ = ("__snapshot",)
+
+    cacheXML = False
+    schema: Schema = ()
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "XMLFragment":
+        return object.__new__(cls.__dict__.get("Compact", cls))
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "schema" in cls.__dict__:
+            cls.schema = Schema(cls, cls.schema)
+            prefix = f"_{cls.__name__}__"
+            slots = [
+                x for x in cls.__dict__.get("__annotations__", {}) if x.startswith(prefix)
+            ]
+            cls.Compact = type(
+                cls.__name__,
+                (cls,),
+                {
+                    "__slots__": tuple(slots),
+                    "__module__": cls.__module__,
+                    "__qualname__": f"{cls.__qualname__}.Compact",
+                },
+            )
+            # Private attribute, property name and whether it holds a list, per slot
+            lists = {x.key for x in cls.schema if x.maxOccurs != 1}
+            cls.__layout = tuple(
+                (x, x[len(prefix) :], x in lists) for x in cls.Compact.__slots__
+            )
+            cls.__take = takeAttributes(cls.__name__, cls.__layout)
+            cls.__set = setAttributes(cls.__name__, cls.__layout)
+        generateXML = cls.__dict__.get("generateXML")
+        if generateXML is not None and "writer" in signature(generateXML).parameters:
+            cls.generateXML = cached(generateXML)
+
+    @classmethod
+    def fromDict(cls, d: Dict[str, Any]) -> "XMLFragment":
+        """
+        Make an element, and everything inside it, from a dictionary such as toDict
+        makes or json.load reads, in a single pass compiled for the class. Elements
+        are dictionaries, lists are lists and simple values are text as in the XML,
+        or numbers. Like decode, the values are taken without the checks of the
+        property setters, which Schema.validate makes when asked to.
+        """
+        return cls.schema.load(d)
+
+    def toDict(self) -> Dict[str, Any]:
+        """
+        Turn the element, and everything inside it, into dictionaries, lists, text and
+        numbers which can be written as JSON and read back with fromDict. Attributes
+        which are not set are left out.
+        """
+        return type(self).schema.dump(self)
+
+    @classmethod
+    def adopt(cls, o: "XMLFragment" = None, **values: Any) -> "XMLFragment":
+        """
+        Make an element which takes over the given values, or those of another
+        element of the class such as a facade, as they are. Unlike the constructor and
+        the property setters, nothing is copied or checked and lists are shared, so
+        this is for values which are not changed separately afterwards, like the
+        elements put together for an export, and for building many elements from
+        values known to be valid. Schema.validate checks such values when asked to.
+
+        Values given by name take precedence over those of ``o``. Attributes given
+        neither way, or as None, are empty.
+        """
+        obj = object.__new__(cls.Compact)
+        try:
+            if o is None:
+                cls.__set(obj, **values)
+                return obj
+            if not values:
+                cls.__take(obj, o)
+                return obj
+        except (TypeError, AttributeError):
+            # A name which is not an attribute, reported below, or an attribute of o
+            # which was never set
+            pass
+        for key, name, isList in cls.__layout:
+            if name in values:
+                value = values.pop(name)
+            else:
+                value = None if o is None else getattr(o, key, None)
+            if value is None and isList:
+                value = []
+            setattr(obj, key, value)
+        if values:
+            raise TypeError(f"{cls.__name__} has no attribute {next(iter(values))!r}.")
+        return obj
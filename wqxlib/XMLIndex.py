@@ -0,0 +1,152 @@
+import json
+import os
+import re
+from html import unescape
+from mmap import ACCESS_READ, mmap
+from typing import Dict, List, Tuple
+from xml.etree.ElementTree import fromstring
+
+from .exceptions import WQXException
+from .Schema import decode
+from .wqx_v3_0 import Activity
+from .XMLReader import readAttributes
+
+START = re.compile(rb"<Activity[\s>]")
+END = b"</Activity>"
+IDENTIFIERS = {
+    key: re.compile(rb"<%s>([^<]*)</%s>" % (tag, tag))
+    for key, tag in (
+        ("activity", b"ActivityIdentifier"),
+        ("monitoringLocation", b"MonitoringLocationIdentifier"),
+        ("project", b"ProjectIdentifier"),
+    )
+}
+
+
+def text(value: bytes) -> str:
+    return unescape(value.decode("utf-8"))
+
+
+class ActivityIndex:
+    """
+    Index of the activities in a WQX XML file by their activity, monitoring location
+    and project identifiers, which lets single activities be read from large files
+    without parsing anything else.
+
+    The file is memory-mapped and scanned once for the byte range of every Activity
+    element, so it must be a plain XML file rather than a ZIP archive. The index can
+    be saved next to the file and loaded again as long as the file does not change.
+
+    :param filename: XML file to index
+    """
+
+    def __init__(self, filename: str):
+        self.__filename = filename
+        stat = os.stat(filename)
+        self.__stamp = [stat.st_size, stat.st_mtime_ns]
+        self.__ranges: List[Tuple[int, int]] = []
+        self.__identifiers: Dict[str, Dict[str, List[int]]] = {
+            key: {} for key in IDENTIFIERS
+        }
+        if stat.st_size == 0:
+            return
+        with open(filename, "rb") as f, mmap(f.fileno(), 0, access=ACCESS_READ) as mm:
+            for match in START.finditer(mm):
+                start = match.start()
+                end = mm.find(END, start)
+                if end < 0:
+                    raise WQXException(f"Activity at byte {start} is not closed.")
+                end += len(END)
+                fragment = mm[start:end]
+                i = len(self.__ranges)
+                self.__ranges.append((start, end))
+                for key, pattern in IDENTIFIERS.items():
+                    for value in pattern.findall(fragment):
+                        self.__identifiers[key].setdefault(text(value), []).append(i)
+
+    @property
+    def filename(self) -> str:
+        return self.__filename
+
+    def __len__(self) -> int:
+        return len(self.__ranges)
+
+    @staticmethod
+    def indexFilename(filename: str) -> str:
+        return filename + ".index.json"
+
+    def save(self, indexFilename: str = None) -> None:
+        """
+        Save the index, by default as the name of the XML file followed by
+        ".index.json".
+        """
+        with open(indexFilename or self.indexFilename(self.__filename), "w") as f:
+            json.dump(
+                {
+                    "stamp": self.__stamp,
+                    "ranges": self.__ranges,
+                    "identifiers": self.__identifiers,
+                },
+                f,
+            )
+
+    @classmethod
+    def load(cls, filename: str, indexFilename: str = None) -> "ActivityIndex":
+        """
+        Load the saved index of an XML file. The file is indexed again and the index
+        saved if there is none yet or the file changed since.
+        """
+        indexFilename = indexFilename or cls.indexFilename(filename)
+        stat = os.stat(filename)
+        try:
+            with open(indexFilename) as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            saved = None
+        if saved is None or saved["stamp"] != [stat.st_size, stat.st_mtime_ns]:
+            index = cls(filename)
+            index.save(indexFilename)
+            return index
+        index = cls.__new__(cls)
+        index.__filename = filename
+        index.__stamp = saved["stamp"]
+        index.__ranges = [tuple(x) for x in saved["ranges"]]
+        index.__identifiers = saved["identifiers"]
+        return index
+
+    def identifiers(self, key: str = "activity") -> List[str]:
+        """
+        List the identifiers found for "activity", "monitoringLocation" or "project".
+        """
+        return list(self.__identifiers[key])
+
+    def __read(self, positions: List[int]) -> List[Activity]:
+        activities = []
+        with open(self.__filename, "rb") as f:
+            for i in positions:
+                start, end = self.__ranges[i]
+                f.seek(start)
+                element = fromstring(f.read(end - start))
+                activities.append(decode(element, Activity, readAttributes))
+        return activities
+
+    def activity(self, identifier: str) -> Activity:
+        """
+        Read the activity with the given ActivityIdentifier, or the first of them if
+        several have it.
+
+        :raises KeyError: If there is no such activity
+        """
+        return self.__read(self.__identifiers["activity"][identifier][:1])[0]
+
+    def byMonitoringLocation(self, identifier: str) -> List[Activity]:
+        """
+        Read the activities at the monitoring location with the given identifier.
+        """
+        return self.__read(self.__identifiers["monitoringLocation"].get(identifier, []))
+
+    def byProject(self, identifier: str) -> List[Activity]:
+        """
+        Read the activities of the project with the given identifier.
+        """
+        return self.__read(self.__identifiers["project"].get(identifier, []))
@@ -0,0 +1,187 @@
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple, Union
+from xml.etree.ElementTree import Element, iterparse
+from zipfile import ZipFile, is_zipfile
+
+from .Document import ID, Document
+from .exceptions import WQXException
+from .Header import Header
+from .Payload import Payload
+from .Schema import decode
+from .wqx_v3_0 import (
+    WQX,
+    Activity,
+    ActivityGroup,
+    Organization,
+    WQXDelete,
+    WQXUpdateIdentifiers,
+)
+
+Source = Union[str, BinaryIO]
+
+
+def localName(element: Element) -> str:
+    return element.tag.rpartition("}")[2]
+
+
+@contextmanager
+def openXML(source: Source) -> Iterator[BinaryIO]:
+    """
+    Open a WQX document for reading, or the first XML file inside a ZIP archive.
+
+    :param source: Filename or seekable binary file object
+    """
+    if is_zipfile(source):
+        with ZipFile(source) as zip:
+            name = next((x for x in zip.namelist() if x.lower().endswith(".xml")), None)
+            if name is None:
+                raise WQXException("The ZIP archive does not contain an XML file.")
+            with zip.open(name) as stream:
+                yield stream
+    elif isinstance(source, str):
+        with open(source, "rb") as stream:
+            yield stream
+    else:
+        # is_zipfile moved the file position
+        source.seek(0)
+        yield source
+
+
+def readAttributes(element: Element, obj: Any) -> None:
+    """
+    Read what the schema of an element does not describe.
+    """
+    if isinstance(obj, ActivityGroup):
+        obj.replaceActivities = element.get("ReplaceActivities") == "True"
+
+
+def parse(
+    stream: BinaryIO, document: List[Element] = None
+) -> Iterator[Tuple[Element, Activity]]:
+    """
+    Parse a WQX document incrementally, yielding every activity along with the XML
+    element of its organization as soon as the activity is complete. The XML of the
+    activities is dropped, so memory use does not grow with their number.
+
+    :param document: List to append the XML of the rest of the document to
+    """
+    parents: List[Element] = []
+    for event, element in iterparse(stream, events=("start", "end")):
+        if event == "start":
+            parents.append(element)
+            continue
+        parents.pop()
+        if (
+            parents
+            and localName(element) == "Activity"
+            and localName(parents[-1]) == "Organization"
+        ):
+            yield parents[-1], decode(element, Activity, readAttributes)
+            parents[-1].remove(element)
+        elif not parents and document is not None:
+            document.append(element)
+
+
+def readActivities(source: Source) -> Iterator[Activity]:
+    """
+    Read the activities of a WQX document one at a time, without keeping the rest of
+    the document in memory. This suits documents of any size.
+
+    :param source: Filename or seekable binary file object of an XML document or a
+        ZIP archive holding one
+    """
+    with openXML(source) as stream:
+        for _, activity in parse(stream):
+            yield activity
+
+
+# Text elements of the header, each held by the property of the same name
+HEADER = (
+    "Author",
+    "Organization",
+    "Title",
+    "Comment",
+    "DataService",
+    "ContactInfo",
+    "Sensitivity",
+)
+
+
+def readHeader(element: Element) -> Header:
+    header = Header()
+    notification = []
+    properties = {}
+    for child in element:
+        tag = localName(child)
+        text = child.text or ""
+        if tag == "CreationTime":
+            header.creationTime = datetime.fromisoformat(text)
+        elif tag == "Notification":
+            notification.append(text)
+        elif tag == "Property":
+            values = {localName(x): x.text or "" for x in child}
+            properties[values.get("name")] = values.get("value")
+        elif tag in HEADER:
+            setattr(header, tag[0].lower() + tag[1:], text)
+        else:
+            raise WQXException(f"Header has no element {tag!r}.")
+    header.notification = notification
+    header.property = properties
+    return header
+
+
+def readPayload(element: Element, activities: Dict[Element, List[Activity]]) -> Payload:
+    def organization(element: Element, obj: Any) -> None:
+        readAttributes(element, obj)
+        if isinstance(obj, Organization):
+            key = Organization.schema.tags["Activity"].key
+            setattr(obj, key, activities.get(element, []))
+
+    payload = Payload(operation=element.get("Operation"))
+    for child in element:
+        tag = localName(child)
+        if tag == "WQX":
+            payload.wqx = decode(child, WQX, organization)
+        elif tag == "WQXUpdateIdentifiers":
+            payload.wqxUpdateIdentifiers = decode(
+                child, WQXUpdateIdentifiers, readAttributes
+            )
+        elif tag == "WQXDelete":
+            payload.wqxDelete = decode(child, WQXDelete, readAttributes)
+        else:
+            raise WQXException(f"Payload has no element {tag!r}.")
+    return payload
+
+
+def readDocument(source: Source) -> Document:
+    """
+    Read a WQX document back into a Document. Values are taken as they are in the
+    document, without the checks made when they are set, so that documents which
+    would not be accepted can be read as well.
+
+    :param source: Filename or seekable binary file object of an XML document or a
+        ZIP archive holding one
+    """
+    activities: Dict[Element, List[Activity]] = {}
+    root: List[Element] = []
+    with openXML(source) as stream:
+        for organization, activity in parse(stream, root):
+            activities.setdefault(organization, []).append(activity)
+    element = root[0]
+    if localName(element) != "Document":
+        raise WQXException(f"Expected a Document element, found {localName(element)!r}.")
+    document = Document()
+    # Taken as it is, like the other values
+    document._Document__id = ID.__new__(ID, element.get("Id", ""))
+    payload = []
+    for child in element:
+        tag = localName(child)
+        if tag == "Header":
+            document.header = readHeader(child)
+        elif tag == "Payload":
+            payload.append(readPayload(child, activities))
+        else:
+            raise WQXException(f"Document has no element {tag!r}.")
+    document.payload = payload
+    return document
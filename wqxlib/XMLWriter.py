@@ -0,0 +1,263 @@
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Iterator, List, Sequence, TextIO, Tuple, Type, Union
+
+Attribute = Tuple[str, Union[str, int, float]]
+
+
+def escapeText(s: Union[str, int, float]) -> str:
+    """
+    Escape a value for use as the text content of an element. Carriage returns are
+    escaped as well, since parsers would otherwise turn them into line feeds.
+    """
+    if isinstance(s, (int, float)):
+        return str(s)
+    try:
+        return (
+            s.replace("&", "&amp;")
+            .replace("<", "&lt;")
+            .replace(">", "&gt;")
+            .replace("\r", "&#13;")
+        )
+    except AttributeError:
+        raise TypeError(
+            "Only a string, an int or a float can be written inside an XML text node. "
+            f"Got {s!r} (type {type(s)!r}) instead."
+        ) from None
+
+
+def escapeAttribute(s: Union[str, int, float]) -> str:
+    """
+    Escape a value for use inside a double-quoted attribute. Whitespace other than
+    spaces is escaped as well, since parsers would otherwise turn it into spaces.
+    """
+    if isinstance(s, (int, float)):
+        return str(s)
+    try:
+        return (
+            s.replace("&", "&amp;")
+            .replace("<", "&lt;")
+            .replace(">", "&gt;")
+            .replace('"', "&quot;")
+            .replace("\t", "&#9;")
+            .replace("\n", "&#10;")
+            .replace("\r", "&#13;")
+        )
+    except AttributeError:
+        raise TypeError(
+            "XML attributes must be strings, ints or floats. "
+            f"Got {s!r} (type {type(s)!r}) instead."
+        ) from None
+
+
+def render(obj: Any, name: str, indentation: str = None, level: int = 0) -> str:
+    """
+    Generate the XML of a single element in a writer of its own. This is what the
+    worker processes of ``XMLWriter.elements`` run.
+    """
+    doc = XMLWriter(indentation=indentation, level=level)
+    obj.generateXML(name, doc)
+    return doc.getvalue()
+
+
+class XMLWriter:
+    """
+    Incremental XML writer shared by every element of a document.
+
+    Each ``generateXML`` method accepts an optional writer and emits its element into
+    it instead of building and returning its own string (it then returns an empty
+    string), so the whole document is produced in a single pass. When ``stream`` is
+    given (any object with a ``write`` method, such as an open text file), output goes
+    straight to it; otherwise it is buffered and returned by ``getvalue``.
+
+    Output is compact unless ``indentation`` is given, in which case every element
+    starts on its own line, indented once per level of nesting. Elements containing
+    only text stay on a single line. ``level`` is the nesting level of the first
+    element, for output that will be inserted into another document.
+
+    When an ``executor`` is given, lists of elements written with ``elements`` are
+    generated by it in parallel and written in their original order. When ``cache`` is
+    set, elements reuse the XML they generated before if they have not changed since
+    (see XMLFragment); the executor is not used then.
+
+    This is the pure-Python serialization backend. Other backends subclass it (see
+    ``getWriter``) and set ``raw`` to False when markup cannot be written straight to
+    their output through ``_write``, so the elements are written with ``line``. A
+    writer is used as a context manager around a whole document, which lets backends
+    finish their output when it ends.
+    """
+
+    raw = True
+
+    def __init__(
+        self,
+        stream: TextIO = None,
+        indentation: str = None,
+        *,
+        level: int = 0,
+        executor: Executor = None,
+        cache: bool = False,
+    ):
+        self.__stream = stream
+        self.__buffer = []
+        self.__indentation = indentation
+        self.__level = level
+        self.executor = executor
+        self.cache = cache
+        # One entry per open element, telling whether it has child elements yet
+        self.__children: List[bool] = []
+        self.__started = False
+        self._write = self.__buffer.append if stream is None else stream.write
+
+    def __enter__(self) -> "XMLWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """
+        Finish the output once the document has been written. XMLWriter has nothing
+        left to do.
+        """
+
+    @property
+    def stream(self) -> TextIO:
+        return self.__stream
+
+    @property
+    def indentation(self) -> str:
+        return self.__indentation
+
+    @property
+    def depth(self) -> int:
+        """
+        Nesting level of the next element.
+        """
+        return self.__level + len(self.__children)
+
+    def __attributes(self, attrs: Tuple[Attribute, ...]) -> str:
+        return " ".join('%s="%s"' % (key, escapeAttribute(val)) for key, val in attrs)
+
+    def __newline(self) -> None:
+        if self.__children:
+            self.__children[-1] = True
+        if self.__started:
+            self._write("\n" + self.__indentation * (self.__level + len(self.__children)))
+        self.__started = True
+
+    @contextmanager
+    def tag(self, name: str, *attrs: Attribute) -> Iterator[None]:
+        """
+        Open an element, yield for its content and close it again.
+        """
+        self.open(name, *attrs)
+        yield
+        self.close(name)
+
+    def open(self, name: str, *attrs: Attribute) -> None:
+        """
+        Write the start tag of an element. Every call must be matched by a call to
+        close, which is what tag does.
+        """
+        if self.__indentation is not None:
+            self.__newline()
+        if attrs:
+            self._write(f"<{name} {self.__attributes(attrs)}>")
+        else:
+            self._write(f"<{name}>")
+        self.__children.append(False)
+
+    def close(self, name: str) -> None:
+        """
+        Write the end tag of the innermost open element.
+        """
+        if self.__children.pop() and self.__indentation is not None:
+            self._write("\n" + self.__indentation * (self.__level + len(self.__children)))
+        self._write(f"</{name}>")
+
+    def line(self, name: str, content: Union[str, int, float], *attrs: Attribute) -> None:
+        """
+        Write an element which contains only text.
+        """
+        if self.__indentation is not None:
+            self.__newline()
+        if attrs:
+            self._write(f"<{name} {self.__attributes(attrs)}>")
+        else:
+            self._write(f"<{name}>")
+        self._write(escapeText(content))
+        self._write(f"</{name}>")
+
+    def elements(self, objs: Sequence[Any], name: str) -> None:
+        """
+        Write a list of elements, in parallel if the writer has an executor. Tables of
+        elements, like a ResultTable, generate their own XML.
+        """
+        generateXML = getattr(objs, "generateXML", None)
+        if generateXML is not None:
+            generateXML(name, self)
+            return
+        if self.executor is None or self.cache or len(objs) < 2:
+            for x in objs:
+                x.generateXML(name, self)
+            return
+        fragments = self.executor.map(
+            partial(
+                render,
+                name=name,
+                indentation=self.__indentation,
+                level=self.depth,
+            ),
+            objs,
+            # Hand out work in batches to keep the inter-process overhead down
+            chunksize=max(1, len(objs) // 64),
+        )
+        for fragment in fragments:
+            self.fragment(fragment)
+
+    def fragment(self, markup: str) -> None:
+        """
+        Write an element which was generated separately at the current nesting level.
+        """
+        if self.__indentation is not None:
+            self.__newline()
+        self._write(markup)
+
+    def text(self, *content: Union[str, int, float]) -> None:
+        """
+        Write escaped text into the current element.
+        """
+        for x in content:
+            self._write(escapeText(x))
+        self.__started = True
+
+    def asis(self, *content: str) -> None:
+        """
+        Write preformatted markup without escaping it.
+        """
+        for x in content:
+            self._write(x)
+        self.__started = True
+
+    def getvalue(self) -> str:
+        """
+        Return everything written so far. Writers bound to a stream do not buffer
+        anything and always return an empty string.
+        """
+        return "".join(self.__buffer)
+
+
+def getWriter(backend: str = "python") -> Type[XMLWriter]:
+    """
+    Return the writer class of a serialization backend. They all produce the same
+    output.
+
+    :param backend: "python" for XMLWriter, or "lxml" for LxmlWriter, which needs lxml
+        to be installed and refuses text that cannot be written in XML
+    """
+    if backend == "python":
+        return XMLWriter
+    if backend == "lxml":
+        from .LxmlWriter import LxmlWriter
+
+        return LxmlWriter
+    raise ValueError(f"Unknown XML writer backend {backend!r}.")
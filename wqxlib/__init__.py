@@ -1,14 +1,52 @@
-from .Document import Document  # noqa F401
-from .Header import Header  # noqa F401
-from .Payload import Payload  # noqa F401
-from .Submission import Submission  # noqa F401
-
-# from .WQXActivity import WQXActivity  # noqa F401
-# from .WQXElectronicAddress import WQXElectronicAddress  # noqa F401
-# from .WQXOrganizationAddress import WQXOrganizationAddress  # noqa F401
-# from .WQXOrganizationDescription import WQXOrganizationDescription  # noqa F401
-# from .WQXResult import WQXResult  # noqa F401
-# from .WQXSample import WQXSample  # noqa F401
-from .WQXSubmission import WQXSubmission  # noqa F401
-
-# from .WQXTelephonic import WQXTelephonic  # noqa F401
+"""
+The classes of the package are imported from their modules the first time they are
+used (see PEP 562), so importing wqxlib alone loads none of the WQX elements.
+"""
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+from .LazyPackage import LazyPackage
+
+if TYPE_CHECKING:
+    from .DataRules import RuleSet  # noqa F401
+    from .Document import Document  # noqa F401
+    from .Header import Header  # noqa F401
+    from .Payload import Payload  # noqa F401
+    from .Submission import Submission  # noqa F401
+    from .WQXSubmission import WQXSubmission  # noqa F401
+    from .XMLWriter import XMLWriter  # noqa F401
+
+# Module of every class of the package
+MODULES = {
+    "Document": "Document",
+    "Header": "Header",
+    "Payload": "Payload",
+    "RuleSet": "DataRules",
+    "Submission": "Submission",
+    # "WQXActivity": "WQXActivity",
+    # "WQXElectronicAddress": "WQXElectronicAddress",
+    # "WQXOrganizationAddress": "WQXOrganizationAddress",
+    # "WQXOrganizationDescription": "WQXOrganizationDescription",
+    # "WQXResult": "WQXResult",
+    # "WQXSample": "WQXSample",
+    "WQXSubmission": "WQXSubmission",
+    "XMLWriter": "XMLWriter",
+    # "WQXTelephonic": "WQXTelephonic",
+}
+
+sys.modules[__name__].__class__ = LazyPackage
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__all__":
+        return __dir__()
+    if name not in MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{MODULES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(MODULES)
@@ -1,8 +1,8 @@
 from typing import List, Union
 
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .ActivityDescription import ActivityDescription
 from .ActivityLocation import ActivityLocation
 from .ActivityMetric import ActivityMetric
@@ -12,11 +12,36 @@ from .Result import Result
 from .SampleDescription import SampleDescription
 
 
-class Activity:
+class Activity(XMLFragment):
     """
     Allows for the reporting of monitoring activities conducted at a Monitoring Location.
     """
 
+    __slots__ = ()
+
+    cacheXML = True
+
+    schema = (
+        Field(
+            "activityDescription", "ActivityDescription", ActivityDescription, minOccurs=1
+        ),
+        Field("activityLocation", "ActivityLocation", ActivityLocation),
+        Field(
+            "biologicalActivityDescription",
+            "BiologicalActivityDescription",
+            BiologicalActivityDescription,
+        ),
+        Field("sampleDescription", "SampleDescription", SampleDescription),
+        Field("activityMetric", "ActivityMetric", ActivityMetric, maxOccurs=None),
+        Field(
+            "attachedBinaryObject",
+            "AttachedBinaryObject",
+            AttachedBinaryObject,
+            maxOccurs=None,
+        ),
+        Field("results", "Result", Result, maxOccurs=None),
+    )
+
     __activityDescription: ActivityDescription = None
     __activityLocation: ActivityLocation = None
     __biologicalActivityDescription: BiologicalActivityDescription = None
@@ -149,30 +174,5 @@ class Activity:
         else:
             self.__results = [Result(val)]
 
-    def generateXML(self, name: str = "Activity") -> str:
-        doc = Doc()
-        asis = doc.asis
-        tag = doc.tag
-
-        with tag(name):
-            if self.__activityDescription is None:
-                raise WQXException("Attribute 'activityDescription' is required.")
-            asis(self.__activityDescription.generateXML("ActivityDescription"))
-            if self.__activityLocation is not None:
-                asis(self.__activityLocation.generateXML("ActivityLocation"))
-            if self.__biologicalActivityDescription is not None:
-                asis(
-                    self.__biologicalActivityDescription.generateXML(
-                        "BiologicalActivityDescription"
-                    )
-                )
-            if self.__sampleDescription is not None:
-                asis(self.__sampleDescription.generateXML("SampleDescription"))
-            for x in self.__activityMetric:
-                asis(x.generateXML("ActivityMetric"))
-            for x in self.__attachedBinaryObject:
-                asis(x.generateXML("AttachedBinaryObject"))
-            for x in self.__results:
-                asis(x.generateXML("Result"))
-
-        return doc.getvalue()
+    def generateXML(self, name: str = "Activity", writer: XMLWriter = None) -> str:
+        return encode(self, Activity.schema, name, writer)
@@ -1,8 +1,8 @@
 from typing import List, Union
 
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .MeasureCompact import MeasureCompact
 from .SimpleContent import (
     ActivityConductingOrganizationText,
@@ -23,11 +23,70 @@ from .SimpleContent import (
 from .WQXTime import WQXTime
 
 
-class ActivityDescription:
+class ActivityDescription(XMLFragment):
     """
     Basic identification information for an activity conducted within a project.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "activityIdentifier", "ActivityIdentifier", ActivityIdentifier, minOccurs=1
+        ),
+        Field(
+            "activityIdentifierUserSupplied",
+            "ActivityIdentifierUserSupplied",
+            ActivityIdentifierUserSupplied,
+        ),
+        Field("activityTypeCode", "ActivityTypeCode", ActivityTypeCode, minOccurs=1),
+        Field("activityMediaName", "ActivityMediaName", ActivityMediaName, minOccurs=1),
+        Field(
+            "activityMediaSubdivisionName",
+            "ActivityMediaSubdivisionName",
+            ActivityMediaSubdivisionName,
+        ),
+        Field("activityStartDate", "ActivityStartDate", ActivityStartDate, minOccurs=1),
+        Field("activityStartTime", "ActivityStartTime", WQXTime),
+        Field("activityEndDate", "ActivityEndDate", ActivityEndDate),
+        Field("activityEndTime", "ActivityEndTime", WQXTime),
+        Field(
+            "activityRelativeDepthName",
+            "ActivityRelativeDepthName",
+            ActivityRelativeDepthName,
+        ),
+        Field("activityDepthHeightMeasure", "ActivityDepthHeightMeasure", MeasureCompact),
+        Field(
+            "activityTopDepthHeightMeasure",
+            "ActivityTopDepthHeightMeasure",
+            MeasureCompact,
+        ),
+        Field(
+            "activityBottomDepthHeightMeasure",
+            "ActivityBottomDepthHeightMeasure",
+            MeasureCompact,
+        ),
+        Field(
+            "activityDepthAltitudeReferencePointText",
+            "ActivityDepthAltitudeReferencePointText",
+            DepthAltitudeReferencePointText,
+        ),
+        Field("projectIdentifier", "ProjectIdentifier", ProjectIdentifier, minOccurs=1),
+        Field(
+            "activityConductingOrganizationText",
+            "ActivityConductingOrganizationText",
+            ActivityConductingOrganizationText,
+            maxOccurs=None,
+        ),
+        Field(
+            "monitoringLocationIdentifier",
+            "MonitoringLocationIdentifier",
+            MonitoringLocationIdentifier,
+        ),
+        Field("samplingComponentName", "SamplingComponentName", SamplingComponentName),
+        Field("activityCommentText", "ActivityCommentText", CommentText),
+    )
+
     __activityIdentifier: ActivityIdentifier
     __activityIdentifierUserSupplied: ActivityIdentifierUserSupplied
     __activityTypeCode: ActivityTypeCode
@@ -156,7 +215,11 @@ class ActivityDescription:
 
     @activityIdentifier.setter
     def activityIdentifier(self, val: ActivityIdentifier) -> None:
-        self.__activityIdentifier = None if val is None else ActivityIdentifier(val)
+        self.__activityIdentifier = (
+            val
+            if val is None or type(val) is ActivityIdentifier
+            else ActivityIdentifier(val)
+        )
 
     @property
     def activityIdentifierUserSupplied(self) -> ActivityIdentifierUserSupplied:
@@ -165,7 +228,9 @@ class ActivityDescription:
     @activityIdentifierUserSupplied.setter
     def activityIdentifierUserSupplied(self, val: ActivityIdentifierUserSupplied) -> None:
         self.__activityIdentifierUserSupplied = (
-            None if val is None else ActivityIdentifierUserSupplied(val)
+            val
+            if val is None or type(val) is ActivityIdentifierUserSupplied
+            else ActivityIdentifierUserSupplied(val)
         )
 
     @property
@@ -174,7 +239,9 @@ class ActivityDescription:
 
     @activityTypeCode.setter
     def activityTypeCode(self, val: ActivityTypeCode) -> None:
-        self.__activityTypeCode = None if val is None else ActivityTypeCode(val)
+        self.__activityTypeCode = (
+            val if val is None or type(val) is ActivityTypeCode else ActivityTypeCode(val)
+        )
 
     @property
     def activityMediaName(self) -> ActivityMediaName:
@@ -182,7 +249,11 @@ class ActivityDescription:
 
     @activityMediaName.setter
     def activityMediaName(self, val: ActivityMediaName) -> None:
-        self.__activityMediaName = None if val is None else ActivityMediaName(val)
+        self.__activityMediaName = (
+            val
+            if val is None or type(val) is ActivityMediaName
+            else ActivityMediaName(val)
+        )
 
     @property
     def activityMediaSubdivisionName(self) -> ActivityMediaSubdivisionName:
@@ -191,7 +262,9 @@ class ActivityDescription:
     @activityMediaSubdivisionName.setter
     def activityMediaSubdivisionName(self, val: ActivityMediaSubdivisionName) -> None:
         self.__activityMediaSubdivisionName = (
-            None if val is None else ActivityMediaSubdivisionName(val)
+            val
+            if val is None or type(val) is ActivityMediaSubdivisionName
+            else ActivityMediaSubdivisionName(val)
         )
 
     @property
@@ -201,8 +274,8 @@ class ActivityDescription:
     @activityStartDate.setter
     def activityStartDate(self, val: ActivityStartDate) -> None:
         self.__activityStartDate = (
-            None
-            if val is None
+            val
+            if val is None or type(val) is ActivityStartDate
             else ActivityStartDate(year=val.year, month=val.month, day=val.day)
         )
 
@@ -227,8 +300,8 @@ class ActivityDescription:
     @activityEndDate.setter
     def activityEndDate(self, val: ActivityEndDate) -> None:
         self.__activityEndDate = (
-            None
-            if val is None
+            val
+            if val is None or type(val) is ActivityEndDate
             else ActivityEndDate(year=val.year, month=val.month, day=val.day)
         )
 
@@ -253,7 +326,9 @@ class ActivityDescription:
     @activityRelativeDepthName.setter
     def activityRelativeDepthName(self, val: ActivityRelativeDepthName) -> None:
         self.__activityRelativeDepthName = (
-            None if val is None else ActivityRelativeDepthName(val)
+            val
+            if val is None or type(val) is ActivityRelativeDepthName
+            else ActivityRelativeDepthName(val)
         )
 
     @property
@@ -309,7 +384,9 @@ class ActivityDescription:
         )
 
     @property
-    def activityDepthAltitudeReferencePointText(self,) -> DepthAltitudeReferencePointText:
+    def activityDepthAltitudeReferencePointText(
+        self,
+    ) -> DepthAltitudeReferencePointText:
         """
         The reference used to indicate the datum or reference used to establish the
         depth/altitude of an activity.
@@ -325,7 +402,9 @@ class ActivityDescription:
         depth/altitude of an activity.
         """
         self.__activityDepthAltitudeReferencePointText = (
-            None if val is None else DepthAltitudeReferencePointText(val)
+            val
+            if val is None or type(val) is DepthAltitudeReferencePointText
+            else DepthAltitudeReferencePointText(val)
         )
 
     @property
@@ -334,7 +413,11 @@ class ActivityDescription:
 
     @projectIdentifier.setter
     def projectIdentifier(self, val: ProjectIdentifier) -> None:
-        self.__projectIdentifier = None if val is None else ProjectIdentifier(val)
+        self.__projectIdentifier = (
+            val
+            if val is None or type(val) is ProjectIdentifier
+            else ProjectIdentifier(val)
+        )
 
     @property
     def activityConductingOrganizationText(
@@ -368,7 +451,9 @@ class ActivityDescription:
     @monitoringLocationIdentifier.setter
     def monitoringLocationIdentifier(self, val: MonitoringLocationIdentifier) -> None:
         self.__monitoringLocationIdentifier = (
-            None if val is None else MonitoringLocationIdentifier(val)
+            val
+            if val is None or type(val) is MonitoringLocationIdentifier
+            else MonitoringLocationIdentifier(val)
         )
 
     @property
@@ -377,7 +462,11 @@ class ActivityDescription:
 
     @samplingComponentName.setter
     def samplingComponentName(self, val: SamplingComponentName) -> None:
-        self.__samplingComponentName = None if val is None else SamplingComponentName(val)
+        self.__samplingComponentName = (
+            val
+            if val is None or type(val) is SamplingComponentName
+            else SamplingComponentName(val)
+        )
 
     @property
     def activityCommentText(self) -> CommentText:
@@ -391,78 +480,11 @@ class ActivityDescription:
         """
         General comments concerning the activity.
         """
-        self.__activityCommentText = None if val is None else CommentText(val)
-
-    def generateXML(self, name: str = "ActivityDescription") -> str:  # noqa: C901
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__activityIdentifier is None:
-                raise WQXException("Attribute 'activityIdentifier' is required.")
-            line("ActivityIdentifier", self.__activityIdentifier)
-            if self.__activityIdentifierUserSupplied is not None:
-                line(
-                    "ActivityIdentifierUserSupplied",
-                    self.__activityIdentifierUserSupplied,
-                )
-            if self.__activityTypeCode is None:
-                raise WQXException("Attribute 'activityTypeCode' is required.")
-            line("ActivityTypeCode", self.__activityTypeCode)
-            if self.__activityMediaName is None:
-                raise WQXException("Attribute 'activityMediaName' is required.")
-            line("ActivityMediaName", self.__activityMediaName)
-            if self.__activityMediaSubdivisionName is not None:
-                line("ActivityMediaSubdivisionName", self.__activityMediaSubdivisionName)
-            if self.__activityStartDate is None:
-                raise WQXException("Attribute 'activityStartDate' is required.")
-            line("ActivityStartDate", str(self.__activityStartDate))
-            if self.__activityStartTime is not None:
-                asis(self.__activityStartTime.generateXML("ActivityStartTime"))
-            if self.__activityEndDate is not None:
-                line("ActivityEndDate", str(self.__activityEndDate))
-            if self.__activityEndTime is not None:
-                asis(self.__activityEndTime.generateXML("ActivityEndTime"))
-            if self.__activityRelativeDepthName is not None:
-                line("ActivityRelativeDepthName", self.__activityRelativeDepthName)
-            if self.__activityDepthHeightMeasure is not None:
-                asis(
-                    self.__activityDepthHeightMeasure.generateXML(
-                        "ActivityDepthHeightMeasure"
-                    )
-                )
-            if self.__activityTopDepthHeightMeasure is not None:
-                asis(
-                    self.__activityTopDepthHeightMeasure.generateXML(
-                        "ActivityTopDepthHeightMeasure"
-                    )
-                )
-            if self.__activityBottomDepthHeightMeasure is not None:
-                asis(
-                    self.__activityBottomDepthHeightMeasure.generateXML(
-                        "ActivityBottomDepthHeightMeasure"
-                    )
-                )
-            if self.__activityDepthAltitudeReferencePointText is not None:
-                line(
-                    "ActivityDepthAltitudeReferencePointText",
-                    self.__activityDepthAltitudeReferencePointText,
-                )
-            if self.__projectIdentifier is None or len(self.__projectIdentifier) < 1:
-                raise WQXException(
-                    "Attribute 'projectIdentifier' must be a list of 1 or more "
-                    "ProjectIdentifier objects."
-                )
-            line("ProjectIdentifier", self.__projectIdentifier)
-            for x in self.__activityConductingOrganizationText:
-                line("ActivityConductingOrganizationText", x)
-            if self.__monitoringLocationIdentifier is not None:
-                line("MonitoringLocationIdentifier", self.__monitoringLocationIdentifier)
-            if self.__samplingComponentName is not None:
-                line("SamplingComponentName", self.__samplingComponentName)
-            if self.__activityCommentText is not None:
-                line("ActivityCommentText", self.__activityCommentText)
-
-        return doc.getvalue()
+        self.__activityCommentText = (
+            val if val is None or type(val) is CommentText else CommentText(val)
+        )
+
+    def generateXML(
+        self, name: str = "ActivityDescription", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, ActivityDescription.schema, name, writer)
@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import (
     ActivityGroupIdentifier,
     ActivityGroupName,
@@ -9,11 +9,36 @@ from .SimpleContent import (
 )
 
 
-class ActivityGroup:
+class ActivityGroup(XMLFragment):
     """
     Allows for the grouping of activities.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "activityGroupIdentifier",
+            "ActivityGroupIdentifier",
+            ActivityGroupIdentifier,
+            minOccurs=1,
+        ),
+        Field("activityGroupName", "ActivityGroupName", ActivityGroupName),
+        Field(
+            "activityGroupTypeCode",
+            "ActivityGroupTypeCode",
+            ActivityGroupTypeCode,
+            minOccurs=1,
+        ),
+        Field(
+            "activityIdentifier",
+            "ActivityIdentifier",
+            ActivityIdentifier,
+            minOccurs=2,
+            maxOccurs=None,
+        ),
+    )
+
     __activityGroupIdentifier: ActivityGroupIdentifier
     __activityGroupName: ActivityGroupName
     __activityGroupTypeCode: ActivityGroupTypeCode
@@ -59,7 +84,9 @@ class ActivityGroup:
     @activityGroupIdentifier.setter
     def activityGroupIdentifier(self, val: ActivityGroupIdentifier) -> None:
         self.__activityGroupIdentifier = (
-            None if val is None else ActivityGroupIdentifier(val)
+            val
+            if val is None or type(val) is ActivityGroupIdentifier
+            else ActivityGroupIdentifier(val)
         )
 
     @property
@@ -68,7 +95,11 @@ class ActivityGroup:
 
     @activityGroupName.setter
     def activityGroupName(self, val: ActivityGroupName) -> None:
-        self.__activityGroupName = None if val is None else ActivityGroupName(val)
+        self.__activityGroupName = (
+            val
+            if val is None or type(val) is ActivityGroupName
+            else ActivityGroupName(val)
+        )
 
     @property
     def activityGroupTypeCode(self) -> ActivityGroupTypeCode:
@@ -76,7 +107,11 @@ class ActivityGroup:
 
     @activityGroupTypeCode.setter
     def activityGroupTypeCode(self, val: ActivityGroupTypeCode) -> None:
-        self.__activityGroupTypeCode = None if val is None else ActivityGroupTypeCode(val)
+        self.__activityGroupTypeCode = (
+            val
+            if val is None or type(val) is ActivityGroupTypeCode
+            else ActivityGroupTypeCode(val)
+        )
 
     @property
     def activityIdentifier(self) -> ActivityIdentifier:
@@ -84,7 +119,11 @@ class ActivityGroup:
 
     @activityIdentifier.setter
     def activityIdentifier(self, val: ActivityIdentifier) -> None:
-        self.__activityIdentifier = None if val is None else ActivityIdentifier(val)
+        self.__activityIdentifier = (
+            val
+            if val is None or type(val) is ActivityIdentifier
+            else ActivityIdentifier(val)
+        )
 
     @property
     def replaceActivities(self) -> bool:
@@ -94,26 +133,11 @@ class ActivityGroup:
     def replaceActivities(self, val: bool) -> None:
         self.__replaceActivities = bool(val)
 
-    def generateXML(self, name: str = "ActivityGroup") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name, ("ReplaceActivities", str(self.__replaceActivities))):
-            if self.__activityGroupIdentifier is None:
-                raise WQXException("Attribute 'activityGroupIdentifier' is required.")
-            line("ActivityGroupIdentifier", self.__activityGroupIdentifier)
-            if self.__activityGroupName is not None:
-                line("ActivityGroupName", self.__activityGroupName)
-            if self.__activityGroupTypeCode is None:
-                raise WQXException("Attribute 'activityGroupTypeCode' is required.")
-            line("ActivityGroupTypeCode", self.__activityGroupTypeCode)
-            if len(self.__activityIdentifier) < 2:
-                raise WQXException(
-                    "Attribute 'activityIdentifier' must be a list of 2 or more "
-                    "ActivityIdentifier objects."
-                )
-            for x in self.__activityIdentifier:
-                line("ActivityIdentifier", x)
-
-        return doc.getvalue()
+    def generateXML(self, name: str = "ActivityGroup", writer: XMLWriter = None) -> str:
+        return encode(
+            self,
+            ActivityGroup.schema,
+            name,
+            writer,
+            (("ReplaceActivities", str(self.__replaceActivities)),),
+        )
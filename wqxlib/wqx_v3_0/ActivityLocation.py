@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .MeasureCompact import MeasureCompact
 from .SimpleContent import (
     ActivityLocationDescriptionText,
@@ -12,12 +12,38 @@ from .SimpleContent import (
 )
 
 
-class ActivityLocation:
+class ActivityLocation(XMLFragment):
     """
     Geospatial description of monitoring site, if it is different from that described in
     the station description.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("latitudeMeasure", "LatitudeMeasure", LatitudeMeasure, minOccurs=1),
+        Field("longitudeMeasure", "LongitudeMeasure", LongitudeMeasure, minOccurs=1),
+        Field("sourceMapScale", "SourceMapScale", SourceMapScale),
+        Field("horizontalAccuracyMeasure", "HorizontalAccuracyMeasure", MeasureCompact),
+        Field(
+            "horizontalCollectionMethodName",
+            "HorizontalCollectionMethodName",
+            HorizontalCollectionMethodName,
+            minOccurs=1,
+        ),
+        Field(
+            "horizontalCoordinateReferenceSystemDatumName",
+            "HorizontalCoordinateReferenceSystemDatumName",
+            HorizontalCoordinateReferenceSystemDatumName,
+            minOccurs=1,
+        ),
+        Field(
+            "activityLocationDescriptionText",
+            "ActivityLocationDescriptionText",
+            ActivityLocationDescriptionText,
+        ),
+    )
+
     __latitudeMeasure: LatitudeMeasure
     __longitudeMeasure: LongitudeMeasure
     __sourceMapScale: SourceMapScale
@@ -80,7 +106,9 @@ class ActivityLocation:
 
     @latitudeMeasure.setter
     def latitudeMeasure(self, val: LatitudeMeasure) -> None:
-        self.__latitudeMeasure = LatitudeMeasure(val)
+        self.__latitudeMeasure = (
+            val if type(val) is LatitudeMeasure else LatitudeMeasure(val)
+        )
 
     @property
     def longitudeMeasure(self) -> LongitudeMeasure:
@@ -88,7 +116,9 @@ class ActivityLocation:
 
     @longitudeMeasure.setter
     def longitudeMeasure(self, val: LongitudeMeasure) -> None:
-        self.__longitudeMeasure = LongitudeMeasure(val)
+        self.__longitudeMeasure = (
+            val if type(val) is LongitudeMeasure else LongitudeMeasure(val)
+        )
 
     @property
     def sourceMapScale(self) -> SourceMapScale:
@@ -96,7 +126,9 @@ class ActivityLocation:
 
     @sourceMapScale.setter
     def sourceMapScale(self, val: SourceMapScale) -> None:
-        self.__sourceMapScale = None if val is None else SourceMapScale(val)
+        self.__sourceMapScale = (
+            val if val is None or type(val) is SourceMapScale else SourceMapScale(val)
+        )
 
     @property
     def horizontalAccuracyMeasure(self) -> MeasureCompact:
@@ -112,7 +144,11 @@ class ActivityLocation:
 
     @horizontalCollectionMethodName.setter
     def horizontalCollectionMethodName(self, val: HorizontalCollectionMethodName) -> None:
-        self.__horizontalCollectionMethodName = HorizontalCollectionMethodName(val)
+        self.__horizontalCollectionMethodName = (
+            val
+            if type(val) is HorizontalCollectionMethodName
+            else HorizontalCollectionMethodName(val)
+        )
 
     @property
     def horizontalCoordinateReferenceSystemDatumName(
@@ -124,8 +160,10 @@ class ActivityLocation:
     def horizontalCoordinateReferenceSystemDatumName(
         self, val: HorizontalCoordinateReferenceSystemDatumName
     ) -> None:
-        self.__horizontalCoordinateReferenceSystemDatumName = HorizontalCoordinateReferenceSystemDatumName(  # noqa: B950
+        self.__horizontalCoordinateReferenceSystemDatumName = (
             val
+            if type(val) is HorizontalCoordinateReferenceSystemDatumName
+            else HorizontalCoordinateReferenceSystemDatumName(val)
         )
 
     @property
@@ -137,47 +175,12 @@ class ActivityLocation:
         self, val: ActivityLocationDescriptionText
     ) -> None:
         self.__activityLocationDescriptionText = (
-            None if val is None else ActivityLocationDescriptionText(val)
+            val
+            if val is None or type(val) is ActivityLocationDescriptionText
+            else ActivityLocationDescriptionText(val)
         )
 
-    def generateXML(self, name: str = "ActivityLocation") -> str:
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__latitudeMeasure is None:
-                raise WQXException("Attribute 'latitudeMeasure' is required.")
-            line("LatitudeMeasure", self.__latitudeMeasure)
-            if self.__longitudeMeasure is None:
-                raise WQXException("Attribute 'longitudeMeasure' is required.")
-            line("LongitudeMeasure", self.__longitudeMeasure)
-            if self.__sourceMapScale is not None:
-                line("SourceMapScale", self.__sourceMapScale)
-            if self.__horizontalAccuracyMeasure is not None:
-                asis(
-                    self.__horizontalAccuracyMeasure.generateXML(
-                        "HorizontalAccuracyMeasure"
-                    )
-                )
-            if self.__horizontalCollectionMethodName is None:
-                raise WQXException(
-                    "Attribute 'horizontalCollectionMethodName' is required."
-                )
-            line("HorizontalCollectionMethodName", self.__horizontalCollectionMethodName)
-            if self.__horizontalCoordinateReferenceSystemDatumName is None:
-                raise WQXException(
-                    "Attribute 'horizontalCoordinateReferenceSystemDatumName' is required."
-                )
-            line(
-                "HorizontalCoordinateReferenceSystemDatumName",
-                self.__horizontalCoordinateReferenceSystemDatumName,
-            )
-            if self.__activityLocationDescriptionText is not None:
-                line(
-                    "ActivityLocationDescriptionText",
-                    self.__activityLocationDescriptionText,
-                )
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "ActivityLocation", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, ActivityLocation.schema, name, writer)
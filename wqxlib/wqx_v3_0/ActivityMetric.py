@@ -1,8 +1,8 @@
 from typing import List, Union
 
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .ActivityMetricType import ActivityMetricType
 from .MeasureCompact import MeasureCompact
 from .SimpleContent import (
@@ -13,12 +13,29 @@ from .SimpleContent import (
 )
 
 
-class ActivityMetric:
+class ActivityMetric(XMLFragment):
     """
     This section allows for the reporting of metrics to support habitat or biotic
     integrity indices.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "activityMetricType", "ActivityMetricType", ActivityMetricType, minOccurs=1
+        ),
+        Field("metricValueMeasure", "MetricValueMeasure", MeasureCompact),
+        Field("metricScore", "MetricScore", MetricScore, minOccurs=1),
+        Field(
+            "metricSamplingPointPlaceInSeries",
+            "MetricSamplingPointPlaceInSeries",
+            MetricSamplingPointPlaceInSeries,
+        ),
+        Field("metricCommentText", "MetricCommentText", CommentText),
+        Field("indexIdentifier", "IndexIdentifier", IndexIdentifier, maxOccurs=None),
+    )
+
     __activityMetricType: ActivityMetricType
     __metricValueMeasure: MeasureCompact
     __metricScore: MetricScore
@@ -94,7 +111,9 @@ class ActivityMetric:
 
     @metricScore.setter
     def metricScore(self, val: MetricScore) -> None:
-        self.__metricScore = None if val is None else MetricScore(val)
+        self.__metricScore = (
+            val if val is None or type(val) is MetricScore else MetricScore(val)
+        )
 
     @property
     def metricSamplingPointPlaceInSeries(self) -> MetricSamplingPointPlaceInSeries:
@@ -103,7 +122,9 @@ class ActivityMetric:
     @metricSamplingPointPlaceInSeries.setter
     def metricSamplingPointPlaceInSeries(self, val: MetricSamplingPointPlaceInSeries):
         self.__metricSamplingPointPlaceInSeries = (
-            None if val is None else MetricSamplingPointPlaceInSeries(val)
+            val
+            if val is None or type(val) is MetricSamplingPointPlaceInSeries
+            else MetricSamplingPointPlaceInSeries(val)
         )
 
     @property
@@ -118,7 +139,9 @@ class ActivityMetric:
         """
         Free text with general comments concerning the metric.
         """
-        self.__metricCommentText = None if val is None else CommentText(val)
+        self.__metricCommentText = (
+            val if val is None or type(val) is CommentText else CommentText(val)
+        )
 
     @property
     def indexIdentifier(self) -> IndexIdentifier:
@@ -136,29 +159,5 @@ class ActivityMetric:
         else:
             self.__indexIdentifier = [IndexIdentifier(val)]
 
-    def generateXML(self, name: str = "ActivityMetric") -> str:
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__activityMetricType is None:
-                raise WQXException("Attribute 'activityMetricType' is required.")
-            asis(self.__activityMetricType.generateXML("ActivityMetricType"))
-            if self.__metricValueMeasure is not None:
-                asis(self.__metricValueMeasure.generateXML("MetricValueMeasure"))
-            if self.__metricScore is None:
-                raise WQXException("Attribute 'metricScore' is required.")
-            line("MetricScore", self.__metricScore)
-            if self.__metricSamplingPointPlaceInSeries is not None:
-                line(
-                    "MetricSamplingPointPlaceInSeries",
-                    self.__metricSamplingPointPlaceInSeries,
-                )
-            if self.__metricCommentText is not None:
-                line("MetricCommentText", self.__metricCommentText)
-            for x in self.__indexIdentifier:
-                line("IndexIdentifier", x)
-
-        return doc.getvalue()
+    def generateXML(self, name: str = "ActivityMetric", writer: XMLWriter = None) -> str:
+        return encode(self, ActivityMetric.schema, name, writer)
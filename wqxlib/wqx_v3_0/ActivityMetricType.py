@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .BibliographicReference import BibliographicReference
 from .SimpleContent import (
     FormulaDescriptionText,
@@ -11,11 +11,32 @@ from .SimpleContent import (
 )
 
 
-class ActivityMetricType:
+class ActivityMetricType(XMLFragment):
     """
     This section identifies the metric type reported as part of an activity metric.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "metricTypeIdentifier",
+            "MetricTypeIdentifier",
+            MetricTypeIdentifier,
+            minOccurs=1,
+        ),
+        Field(
+            "metricTypeIdentifierContext",
+            "MetricTypeIdentifierContext",
+            MetricTypeIdentifierContext,
+            minOccurs=1,
+        ),
+        Field("metricTypeName", "MetricTypeName", MetricTypeName),
+        Field("metricTypeCitation", "MetricTypeCitation", BibliographicReference),
+        Field("metricTypeScaleText", "MetricTypeScaleText", MetricTypeScaleText),
+        Field("formulaDescriptionText", "FormulaDescriptionText", FormulaDescriptionText),
+    )
+
     __metricTypeIdentifier: MetricTypeIdentifier
     __metricTypeIdentifierContext: MetricTypeIdentifierContext
     __metricTypeName: MetricTypeName
@@ -65,7 +86,9 @@ class ActivityMetricType:
 
     @metricTypeIdentifier.setter
     def metricTypeIdentifier(self, val: MetricTypeIdentifier) -> None:
-        self.__metricTypeIdentifier = MetricTypeIdentifier(val)
+        self.__metricTypeIdentifier = (
+            val if type(val) is MetricTypeIdentifier else MetricTypeIdentifier(val)
+        )
 
     @property
     def metricTypeIdentifierContext(self) -> MetricTypeIdentifierContext:
@@ -73,7 +96,11 @@ class ActivityMetricType:
 
     @metricTypeIdentifierContext.setter
     def metricTypeIdentifierContext(self, val: MetricTypeIdentifierContext) -> None:
-        self.__metricTypeIdentifierContext = MetricTypeIdentifierContext(val)
+        self.__metricTypeIdentifierContext = (
+            val
+            if type(val) is MetricTypeIdentifierContext
+            else MetricTypeIdentifierContext(val)
+        )
 
     @property
     def metricTypeName(self) -> MetricTypeName:
@@ -81,7 +108,9 @@ class ActivityMetricType:
 
     @metricTypeName.setter
     def metricTypeName(self, val: MetricTypeName) -> None:
-        self.__metricTypeName = None if val is None else MetricTypeName(val)
+        self.__metricTypeName = (
+            val if val is None or type(val) is MetricTypeName else MetricTypeName(val)
+        )
 
     @property
     def metricTypeCitation(self) -> BibliographicReference:
@@ -105,7 +134,11 @@ class ActivityMetricType:
 
     @metricTypeScaleText.setter
     def metricTypeScaleText(self, val: MetricTypeScaleText) -> None:
-        self.__metricTypeScaleText = None if val is None else MetricTypeScaleText(val)
+        self.__metricTypeScaleText = (
+            val
+            if val is None or type(val) is MetricTypeScaleText
+            else MetricTypeScaleText(val)
+        )
 
     @property
     def formulaDescriptionText(self) -> FormulaDescriptionText:
@@ -114,29 +147,12 @@ class ActivityMetricType:
     @formulaDescriptionText.setter
     def formulaDescriptionText(self, val: FormulaDescriptionText) -> None:
         self.__formulaDescriptionText = (
-            None if val is None else FormulaDescriptionText(val)
+            val
+            if val is None or type(val) is FormulaDescriptionText
+            else FormulaDescriptionText(val)
         )
 
-    def generateXML(self, name: str = "ActivityMetricType") -> str:
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__metricTypeIdentifier is None:
-                raise WQXException("Attribute 'metricTypeIdentifier' is required.")
-            line("MetricTypeIdentifier", self.__metricTypeIdentifier)
-            if self.__metricTypeIdentifierContext is None:
-                raise WQXException("Attribute 'metricTypeIdentifierContext' is required.")
-            line("MetricTypeIdentifierContext", self.__metricTypeIdentifierContext)
-            if self.__metricTypeName is not None:
-                line("MetricTypeName", self.__metricTypeName)
-            if self.__metricTypeCitation is not None:
-                asis(self.__metricTypeCitation.generateXML("MetricTypeCitation"))
-            if self.__metricTypeScaleText is not None:
-                line("MetricTypeScaleText", self.__metricTypeScaleText)
-            if self.__formulaDescriptionText is not None:
-                line("FormulaDescriptionText", self.__formulaDescriptionText)
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "ActivityMetricType", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, ActivityMetricType.schema, name, writer)
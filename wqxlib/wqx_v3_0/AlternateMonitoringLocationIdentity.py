@@ -1,17 +1,34 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import (
     MonitoringLocationIdentifier,
     MonitoringLocationIdentifierContext,
 )
 
 
-class AlternateMonitoringLocationIdentity:
+class AlternateMonitoringLocationIdentity(XMLFragment):
     """
     Alternate identifications of a monitoring location.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "monitoringLocationIdentifier",
+            "MonitoringLocationIdentifier",
+            MonitoringLocationIdentifier,
+            minOccurs=1,
+        ),
+        Field(
+            "monitoringLocationIdentifierContext",
+            "MonitoringLocationIdentifierContext",
+            MonitoringLocationIdentifierContext,
+            minOccurs=1,
+        ),
+    )
+
     __monitoringLocationIdentifier: MonitoringLocationIdentifier
     __monitoringLocationIdentifierContext: MonitoringLocationIdentifierContext
 
@@ -45,38 +62,29 @@ class AlternateMonitoringLocationIdentity:
 
     @monitoringLocationIdentifier.setter
     def monitoringLocationIdentifier(self, val: MonitoringLocationIdentifier) -> None:
-        self.__monitoringLocationIdentifier = MonitoringLocationIdentifier(val)
+        self.__monitoringLocationIdentifier = (
+            val
+            if type(val) is MonitoringLocationIdentifier
+            else MonitoringLocationIdentifier(val)
+        )
 
     @property
-    def monitoringLocationIdentifierContext(self,) -> MonitoringLocationIdentifierContext:
+    def monitoringLocationIdentifierContext(
+        self,
+    ) -> MonitoringLocationIdentifierContext:
         return self.__monitoringLocationIdentifierContext
 
     @monitoringLocationIdentifierContext.setter
     def monitoringLocationIdentifierContext(
         self, val: MonitoringLocationIdentifierContext
     ) -> None:
-        self.__monitoringLocationIdentifierContext = MonitoringLocationIdentifierContext(
+        self.__monitoringLocationIdentifierContext = (
             val
+            if type(val) is MonitoringLocationIdentifierContext
+            else MonitoringLocationIdentifierContext(val)
         )
 
-    def generateXML(self, name: str = "AlternateMonitoringLocationIdentity") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__monitoringLocationIdentifier is None:
-                raise WQXException(
-                    "Attribute 'MonitoringLocationIdentifier' is required."
-                )
-            line("MonitoringLocationIdentifier", self.__monitoringLocationIdentifier)
-            if self.__monitoringLocationIdentifierContext is None:
-                raise WQXException(
-                    "Attribute 'MonitoringLocationIdentifierContext' is required."
-                )
-            line(
-                "MonitoringLocationIdentifierContext",
-                self.__monitoringLocationIdentifierContext,
-            )
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "AlternateMonitoringLocationIdentity", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, AlternateMonitoringLocationIdentity.schema, name, writer)
@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import (
     LocalAquiferCode,
     LocalAquiferCodeContext,
@@ -9,12 +9,30 @@ from .SimpleContent import (
 )
 
 
-class AquiferInformation:
+class AquiferInformation(XMLFragment):
     """
     Identifies the procedures, processes, and references required to determine the
     methods used to obtain a result.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("localAquiferCode", "LocalAquiferCode", LocalAquiferCode, minOccurs=1),
+        Field(
+            "localAquiferCodeContext",
+            "LocalAquiferCodeContext",
+            LocalAquiferCodeContext,
+            minOccurs=1,
+        ),
+        Field("localAquiferName", "LocalAquiferName", LocalAquiferName, minOccurs=1),
+        Field(
+            "localAquiferDescriptionText",
+            "LocalAquiferDescriptionText",
+            LocalAquiferDescriptionText,
+        ),
+    )
+
     __localAquiferCode: LocalAquiferCode
     __localAquiferCodeContext: LocalAquiferCodeContext
     __localAquiferName: LocalAquiferName
@@ -54,7 +72,9 @@ class AquiferInformation:
 
     @localAquiferCode.setter
     def localAquiferCode(self, val: LocalAquiferCode) -> None:
-        self.__localAquiferCode = LocalAquiferCode(val)
+        self.__localAquiferCode = (
+            val if type(val) is LocalAquiferCode else LocalAquiferCode(val)
+        )
 
     @property
     def localAquiferCodeContext(self) -> LocalAquiferCodeContext:
@@ -62,7 +82,9 @@ class AquiferInformation:
 
     @localAquiferCodeContext.setter
     def localAquiferCodeContext(self, val: LocalAquiferCodeContext) -> None:
-        self.__localAquiferCodeContext = LocalAquiferCodeContext(val)
+        self.__localAquiferCodeContext = (
+            val if type(val) is LocalAquiferCodeContext else LocalAquiferCodeContext(val)
+        )
 
     @property
     def localAquiferName(self) -> LocalAquiferName:
@@ -70,7 +92,9 @@ class AquiferInformation:
 
     @localAquiferName.setter
     def localAquiferName(self, val: LocalAquiferName) -> None:
-        self.__localAquiferName = LocalAquiferName(val)
+        self.__localAquiferName = (
+            val if type(val) is LocalAquiferName else LocalAquiferName(val)
+        )
 
     @property
     def localAquiferDescriptionText(self) -> LocalAquiferDescriptionText:
@@ -79,25 +103,12 @@ class AquiferInformation:
     @localAquiferDescriptionText.setter
     def localAquiferDescriptionText(self, val: LocalAquiferDescriptionText) -> None:
         self.__localAquiferDescriptionText = (
-            None if val is None else LocalAquiferDescriptionText(val)
+            val
+            if val is None or type(val) is LocalAquiferDescriptionText
+            else LocalAquiferDescriptionText(val)
         )
 
-    def generateXML(self, name: str = "AquiferInformation") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__localAquiferCode is None:
-                raise WQXException("Attribute 'localAquiferCode' is required.")
-            line("LocalAquiferCode", self.__localAquiferCode)
-            if self.__localAquiferCodeContext is None:
-                raise WQXException("Attribute 'localAquiferCodeContext' is required.")
-            line("LocalAquiferCodeContext", self.__localAquiferCodeContext)
-            if self.__localAquiferName is None:
-                raise WQXException("Attribute 'localAquiferName' is required.")
-            line("LocalAquiferName", self.__localAquiferName)
-            if self.__localAquiferDescriptionText is not None:
-                line("LocalAquiferDescriptionText", self.__localAquiferDescriptionText)
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "AquiferInformation", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, AquiferInformation.schema, name, writer)
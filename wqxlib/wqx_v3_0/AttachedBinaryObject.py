@@ -1,16 +1,33 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import BinaryObjectFileName, BinaryObjectFileTypeCode
 
 
-class AttachedBinaryObject:
+class AttachedBinaryObject(XMLFragment):
     """
     Reference document, image, photo, GIS data layer, laboratory material or other
     electronic object attached within a data exchange, as well as information used to
     describe the object.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "binaryObjectFileName",
+            "BinaryObjectFileName",
+            BinaryObjectFileName,
+            minOccurs=1,
+        ),
+        Field(
+            "binaryObjectFileTypeCode",
+            "BinaryObjectFileTypeCode",
+            BinaryObjectFileTypeCode,
+            minOccurs=1,
+        ),
+    )
+
     __binaryObjectFileName: BinaryObjectFileName
     __binaryObjectFileTypeCode: BinaryObjectFileTypeCode
 
@@ -40,7 +57,9 @@ class AttachedBinaryObject:
 
     @binaryObjectFileName.setter
     def binaryObjectFileName(self, val: BinaryObjectFileName) -> None:
-        self.__binaryObjectFileName = BinaryObjectFileName(val)
+        self.__binaryObjectFileName = (
+            val if type(val) is BinaryObjectFileName else BinaryObjectFileName(val)
+        )
 
     @property
     def binaryObjectFileTypeCode(self) -> BinaryObjectFileTypeCode:
@@ -48,19 +67,13 @@ class AttachedBinaryObject:
 
     @binaryObjectFileTypeCode.setter
     def binaryObjectFileTypeCode(self, val: BinaryObjectFileTypeCode) -> None:
-        self.__binaryObjectFileTypeCode = BinaryObjectFileTypeCode(val)
-
-    def generateXML(self, name: str = "AttachedBinaryObject") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__binaryObjectFileName is None:
-                raise WQXException("Attribute 'binaryObjectFileName' is required.")
-            line("BinaryObjectFileName", self.__binaryObjectFileName)
-            if self.__binaryObjectFileTypeCode is None:
-                raise WQXException("Attribute 'binaryObjectFileTypeCode' is required.")
-            line("BinaryObjectFileTypeCode", self.__binaryObjectFileTypeCode)
+        self.__binaryObjectFileTypeCode = (
+            val
+            if type(val) is BinaryObjectFileTypeCode
+            else BinaryObjectFileTypeCode(val)
+        )
 
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "AttachedBinaryObject", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, AttachedBinaryObject.schema, name, writer)
@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import (
     ResourceCreatorName,
     ResourceDate,
@@ -11,11 +11,24 @@ from .SimpleContent import (
 )
 
 
-class BibliographicReference:
+class BibliographicReference(XMLFragment):
     """
     The descriptors used to identify and catalog an object.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("resourceTitleName", "ResourceTitleName", ResourceTitleName, minOccurs=1),
+        Field("resourceCreatorName", "ResourceCreatorName", ResourceCreatorName),
+        Field("resourceSubjectText", "ResourceSubjectText", ResourceSubjectText),
+        Field("resourcePublisherName", "ResourcePublisherName", ResourcePublisherName),
+        Field("resourceDate", "ResourceDate", ResourceDate, minOccurs=1),
+        Field(
+            "resourceIdentifier", "ResourceIdentifier", ResourceIdentifier, minOccurs=1
+        ),
+    )
+
     __resourceTitleName: ResourceTitleName
     __resourceCreatorName: ResourceCreatorName
     __resourceSubjectText: ResourceSubjectText
@@ -36,12 +49,12 @@ class BibliographicReference:
     ):
         if isinstance(o, BibliographicReference):
             # Assign attributes from object without typechecking
-            self.__resourceTitleName = resourceTitleName
-            self.__resourceCreatorName = resourceCreatorName
-            self.__resourceSubjectText = resourceSubjectText
-            self.__resourcePublisherName = resourcePublisherName
-            self.__resourceDate = resourceDate
-            self.__resourceIdentifier = resourceIdentifier
+            self.__resourceTitleName = o.resourceTitleName
+            self.__resourceCreatorName = o.resourceCreatorName
+            self.__resourceSubjectText = o.resourceSubjectText
+            self.__resourcePublisherName = o.resourcePublisherName
+            self.__resourceDate = o.resourceDate
+            self.__resourceIdentifier = o.resourceIdentifier
         elif isinstance(o, dict):
             # Assign attributes from dictionary with typechecking
             self.resourceTitleName = o.get("resourceTitleName")
@@ -60,73 +73,74 @@ class BibliographicReference:
             self.resourceIdentifier = resourceIdentifier
 
     @property
-    def ResourceTitleName(self) -> ResourceTitleName:
-        return self.__ResourceTitleName
+    def resourceTitleName(self) -> ResourceTitleName:
+        return self.__resourceTitleName
 
-    @ResourceTitleName.setter
-    def ResourceTitleName(self, val: ResourceTitleName) -> None:
-        self.__ResourceTitleName = ResourceTitleName(val)
+    @resourceTitleName.setter
+    def resourceTitleName(self, val: ResourceTitleName) -> None:
+        self.__resourceTitleName = (
+            val if type(val) is ResourceTitleName else ResourceTitleName(val)
+        )
 
     @property
-    def ResourceCreatorName(self) -> ResourceCreatorName:
-        return self.__ResourceCreatorName
+    def resourceCreatorName(self) -> ResourceCreatorName:
+        return self.__resourceCreatorName
 
-    @ResourceCreatorName.setter
-    def ResourceCreatorName(self, val: ResourceCreatorName) -> None:
-        self.__ResourceCreatorName = None if val is None else ResourceCreatorName(val)
+    @resourceCreatorName.setter
+    def resourceCreatorName(self, val: ResourceCreatorName) -> None:
+        self.__resourceCreatorName = (
+            val
+            if val is None or type(val) is ResourceCreatorName
+            else ResourceCreatorName(val)
+        )
 
     @property
-    def ResourceSubjectText(self) -> ResourceSubjectText:
-        return self.__ResourceSubjectText
+    def resourceSubjectText(self) -> ResourceSubjectText:
+        return self.__resourceSubjectText
 
-    @ResourceSubjectText.setter
-    def ResourceSubjectText(self, val: ResourceSubjectText) -> None:
-        self.__ResourceSubjectText = None if val is None else ResourceSubjectText(val)
+    @resourceSubjectText.setter
+    def resourceSubjectText(self, val: ResourceSubjectText) -> None:
+        self.__resourceSubjectText = (
+            val
+            if val is None or type(val) is ResourceSubjectText
+            else ResourceSubjectText(val)
+        )
 
     @property
-    def ResourcePublisherName(self) -> ResourcePublisherName:
-        return self.__ResourcePublisherName
+    def resourcePublisherName(self) -> ResourcePublisherName:
+        return self.__resourcePublisherName
 
-    @ResourcePublisherName.setter
-    def ResourcePublisherName(self, val: ResourcePublisherName) -> None:
-        self.__ResourcePublisherName = None if val is None else ResourcePublisherName(val)
+    @resourcePublisherName.setter
+    def resourcePublisherName(self, val: ResourcePublisherName) -> None:
+        self.__resourcePublisherName = (
+            val
+            if val is None or type(val) is ResourcePublisherName
+            else ResourcePublisherName(val)
+        )
 
     @property
-    def ResourceDate(self) -> ResourceDate:
-        return self.__ResourceDate
+    def resourceDate(self) -> ResourceDate:
+        return self.__resourceDate
 
-    @ResourceDate.setter
-    def ResourceDate(self, val: ResourceDate) -> None:
-        self.__ResourceDate = ResourceDate(val)
+    @resourceDate.setter
+    def resourceDate(self, val: ResourceDate) -> None:
+        self.__resourceDate = (
+            val
+            if type(val) is ResourceDate
+            else ResourceDate(year=val.year, month=val.month, day=val.day)
+        )
 
     @property
-    def ResourceIdentifier(self) -> ResourceIdentifier:
-        return self.__ResourceIdentifier
-
-    @ResourceIdentifier.setter
-    def ResourceIdentifier(self, val: ResourceIdentifier) -> None:
-        self.__ResourceIdentifier = ResourceIdentifier(val)
-
-    def generateXML(self, name: str = "BibliographicReference") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__resourceTitleName is None:
-                raise WQXException("Attribute 'ResourceTitleName' is required.")
-            line("ResourceTitleName", self.__resourceTitleName)
-            if self.__resourceCreatorName is not None:
-                line("ResourceCreatorName", self.__resourceCreatorName)
-            if self.__resourceSubjectText is not None:
-                line("ResourceSubjectText", self.__resourceSubjectText)
-            if self.__resourcePublisherName is not None:
-                line("ResourcePublisherName", self.__resourcePublisherName)
-            if self.__resourceDate is None:
-                raise WQXException("Attribute 'ResourceDate' is required.")
-            line("ResourceDate", self.__resourceDate)
-            if self.__resourceIdentifier is None:
-                raise WQXException("Attribute 'ResourceIdentifier' is required.")
-            line("ResourceIdentifier", self.__resourceIdentifier)
-
-        return doc.getvalue()
+    def resourceIdentifier(self) -> ResourceIdentifier:
+        return self.__resourceIdentifier
+
+    @resourceIdentifier.setter
+    def resourceIdentifier(self, val: ResourceIdentifier) -> None:
+        self.__resourceIdentifier = (
+            val if type(val) is ResourceIdentifier else ResourceIdentifier(val)
+        )
+
+    def generateXML(
+        self, name: str = "BibliographicReference", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, BibliographicReference.schema, name, writer)
@@ -1,15 +1,29 @@
-from yattag import Doc
-
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .BiologicalHabitatCollectionInformation import BiologicalHabitatCollectionInformation
 from .SimpleContent import AssemblageSampledName, HabitatSelectionMethod, ToxicityTestType
 
 
-class BiologicalActivityDescription:
+class BiologicalActivityDescription(XMLFragment):
     """
     Allows for the reporting of biological monitoring activities conducted at a
     Monitoring Location.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("assemblageSampledName", "AssemblageSampledName", AssemblageSampledName),
+        Field(
+            "biologicalHabitatCollectionInformation",
+            "BiologicalHabitatCollectionInformation",
+            BiologicalHabitatCollectionInformation,
+        ),
+        Field("toxicityTestType", "ToxicityTestType", ToxicityTestType),
+        Field("habitatSelectionMethod", "HabitatSelectionMethod", HabitatSelectionMethod),
+    )
+
     __assemblageSampledName: AssemblageSampledName
     __biologicalHabitatCollectionInformation: BiologicalHabitatCollectionInformation
     __toxicityTestType: ToxicityTestType
@@ -55,7 +69,11 @@ class BiologicalActivityDescription:
 
     @assemblageSampledName.setter
     def assemblageSampledName(self, val: AssemblageSampledName) -> None:
-        self.__assemblageSampledName = None if val is None else AssemblageSampledName(val)
+        self.__assemblageSampledName = (
+            val
+            if val is None or type(val) is AssemblageSampledName
+            else AssemblageSampledName(val)
+        )
 
     @property
     def biologicalHabitatCollectionInformation(
@@ -77,7 +95,9 @@ class BiologicalActivityDescription:
 
     @toxicityTestType.setter
     def toxicityTestType(self, val: ToxicityTestType) -> None:
-        self.__toxicityTestType = None if val is None else ToxicityTestType(val)
+        self.__toxicityTestType = (
+            val if val is None or type(val) is ToxicityTestType else ToxicityTestType(val)
+        )
 
     @property
     def habitatSelectionMethod(self) -> HabitatSelectionMethod:
@@ -86,27 +106,12 @@ class BiologicalActivityDescription:
     @habitatSelectionMethod.setter
     def habitatSelectionMethod(self, val: HabitatSelectionMethod) -> None:
         self.__habitatSelectionMethod = (
-            None if val is None else HabitatSelectionMethod(val)
+            val
+            if val is None or type(val) is HabitatSelectionMethod
+            else HabitatSelectionMethod(val)
         )
 
-    def generateXML(self, name: str = "BiologicalActivityDescription") -> str:
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__assemblageSampledName is not None:
-                line("AssemblageSampledName", self.__assemblageSampledName)
-            if self.__biologicalHabitatCollectionInformation is not None:
-                asis(
-                    self.__biologicalHabitatCollectionInformation.generateXML(
-                        "BiologicalHabitatCollectionInformation"
-                    )
-                )
-            if self.__toxicityTestType is not None:
-                line("ToxicityTestType", self.__toxicityTestType)
-            if self.__habitatSelectionMethod is not None:
-                line("HabitatSelectionMethod", self.__habitatSelectionMethod)
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "BiologicalActivityDescription", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, BiologicalActivityDescription.schema, name, writer)
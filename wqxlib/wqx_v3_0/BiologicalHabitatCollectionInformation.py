@@ -1,16 +1,34 @@
-from yattag import Doc
-
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .CollectionEffort import CollectionEffort
 from .MeasureCompact import MeasureCompact
 from .NetInformation import NetInformation
 from .SimpleContent import CollectionDescriptionText, PassCount
 
 
-class BiologicalHabitatCollectionInformation:
+class BiologicalHabitatCollectionInformation(XMLFragment):
     """
     Allows for the reporting of biological habitat sample collection information.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("collectionDuration", "CollectionDuration", MeasureCompact),
+        Field("collectionArea", "CollectionArea", MeasureCompact),
+        Field("collectionEffort", "CollectionEffort", CollectionEffort),
+        Field("reachLengthMeasure", "ReachLengthMeasure", MeasureCompact),
+        Field("reachWidthMeasure", "ReachWidthMeasure", MeasureCompact),
+        Field(
+            "collectionDescriptionText",
+            "CollectionDescriptionText",
+            CollectionDescriptionText,
+        ),
+        Field("passCount", "PassCount", PassCount),
+        Field("netInformation", "NetInformation", NetInformation),
+    )
+
     __collectionDuration: MeasureCompact
     __collectionArea: MeasureCompact
     __collectionEffort: CollectionEffort
@@ -141,7 +159,9 @@ class BiologicalHabitatCollectionInformation:
     @collectionDescriptionText.setter
     def collectionDescriptionText(self, val: CollectionDescriptionText) -> None:
         self.__collectionDescriptionText = (
-            None if val is None else CollectionDescriptionText(val)
+            val
+            if val is None or type(val) is CollectionDescriptionText
+            else CollectionDescriptionText(val)
         )
 
     @property
@@ -150,7 +170,9 @@ class BiologicalHabitatCollectionInformation:
 
     @passCount.setter
     def passCount(self, val: PassCount) -> None:
-        self.__passCount = None if val is None else PassCount(val)
+        self.__passCount = (
+            val if val is None or type(val) is PassCount else PassCount(val)
+        )
 
     @property
     def netInformation(self) -> NetInformation:
@@ -160,28 +182,9 @@ class BiologicalHabitatCollectionInformation:
     def netInformation(self, val: NetInformation) -> None:
         self.__netInformation = None if val is None else NetInformation(val)
 
-    def generateXML(self, name: str = "BiologicalHabitatCollectionInformation") -> str:
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__collectionDuration is not None:
-                asis(self.__collectionDuration.generateXML("CollectionDuration"))
-            if self.__collectionArea is not None:
-                asis(self.__collectionArea.generateXML("CollectionArea"))
-            if self.__collectionEffort is not None:
-                asis(self.__collectionEffort.generateXML("CollectionEffort"))
-            if self.__reachLengthMeasure is not None:
-                asis(self.__reachLengthMeasure.generateXML("ReachLengthMeasure"))
-            if self.__reachWidthMeasure is not None:
-                asis(self.__reachWidthMeasure.generateXML("ReachWidthMeasure"))
-            if self.__collectionDescriptionText is not None:
-                line("CollectionDescriptionText", self.__collectionDescriptionText)
-            if self.__passCount is not None:
-                line("PassCount", self.__passCount)
-            if self.__netInformation is not None:
-                asis(self.__netInformation.generateXML("NetInformation"))
-
-        return doc.getvalue()
+    def generateXML(
+        self,
+        name: str = "BiologicalHabitatCollectionInformation",
+        writer: XMLWriter = None,
+    ) -> str:
+        return encode(self, BiologicalHabitatCollectionInformation.schema, name, writer)
@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .IndexType import IndexType
 from .SimpleContent import (
     CommentText,
@@ -12,12 +12,29 @@ from .SimpleContent import (
 )
 
 
-class BiologicalHabitatIndex:
+class BiologicalHabitatIndex(XMLFragment):
     """
     This section allows for the reporting of habitat and biotic integrity indices as a
     representation of water quality conditions.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("indexIdentifier", "IndexIdentifier", IndexIdentifier, minOccurs=1),
+        Field("indexType", "IndexType", IndexType, minOccurs=1),
+        Field("indexScore", "IndexScore", IndexScore, minOccurs=1),
+        Field("indexQualifierCode", "IndexQualifierCode", IndexQualifierCode),
+        Field("indexCommentText", "IndexCommentText", CommentText),
+        Field("indexCalculatedDate", "IndexCalculatedDate", IndexCalculatedDate),
+        Field(
+            "monitoringLocationIdentifier",
+            "MonitoringLocationIdentifier",
+            MonitoringLocationIdentifier,
+            minOccurs=1,
+        ),
+    )
+
     __indexIdentifier: IndexIdentifier
     __indexType: IndexType
     __indexScore: IndexScore
@@ -72,7 +89,9 @@ class BiologicalHabitatIndex:
 
     @indexIdentifier.setter
     def indexIdentifier(self, val: IndexIdentifier) -> None:
-        self.__indexIdentifier = IndexIdentifier(val)
+        self.__indexIdentifier = (
+            val if type(val) is IndexIdentifier else IndexIdentifier(val)
+        )
 
     @property
     def indexType(self) -> IndexType:
@@ -88,7 +107,7 @@ class BiologicalHabitatIndex:
 
     @indexScore.setter
     def indexScore(self, val: IndexScore) -> None:
-        self.__indexScore = IndexScore(val)
+        self.__indexScore = val if type(val) is IndexScore else IndexScore(val)
 
     @property
     def indexQualifierCode(self) -> IndexQualifierCode:
@@ -96,7 +115,11 @@ class BiologicalHabitatIndex:
 
     @indexQualifierCode.setter
     def indexQualifierCode(self, val: IndexQualifierCode) -> None:
-        self.__indexQualifierCode = None if val is None else IndexQualifierCode(val)
+        self.__indexQualifierCode = (
+            val
+            if val is None or type(val) is IndexQualifierCode
+            else IndexQualifierCode(val)
+        )
 
     @property
     def indexCommentText(self) -> CommentText:
@@ -110,7 +133,9 @@ class BiologicalHabitatIndex:
         """
         Free text with general comments concerning the index.
         """
-        self.__indexCommentText = None if val is None else CommentText(val)
+        self.__indexCommentText = (
+            val if val is None or type(val) is CommentText else CommentText(val)
+        )
 
     @property
     def indexCalculatedDate(self) -> IndexCalculatedDate:
@@ -118,7 +143,11 @@ class BiologicalHabitatIndex:
 
     @indexCalculatedDate.setter
     def indexCalculatedDate(self, val: IndexCalculatedDate) -> None:
-        self.__indexCalculatedDate = None if val is None else IndexCalculatedDate(val)
+        self.__indexCalculatedDate = (
+            val
+            if val is None or type(val) is IndexCalculatedDate
+            else IndexCalculatedDate(val)
+        )
 
     @property
     def monitoringLocationIdentifier(self) -> MonitoringLocationIdentifier:
@@ -126,34 +155,13 @@ class BiologicalHabitatIndex:
 
     @monitoringLocationIdentifier.setter
     def monitoringLocationIdentifier(self, val: MonitoringLocationIdentifier) -> None:
-        self.__monitoringLocationIdentifier = MonitoringLocationIdentifier(val)
-
-    def generateXML(self, name: str = "BiologicalHabitatIndex") -> str:
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__indexIdentifier is None:
-                raise WQXException("Attribute 'indexIdentifier' is required.")
-            line("IndexIdentifier", self.__indexIdentifier)
-            if self.__indexType is None:
-                raise WQXException("Attribute 'indexType' is required.")
-            asis(self.__indexType.generateXML("IndexType"))
-            if self.__indexScore is None:
-                raise WQXException("Attribute 'indexScore' is required.")
-            line("IndexScore", self.__indexScore)
-            if self.__indexQualifierCode is not None:
-                line("IndexQualifierCode", self.__indexQualifierCode)
-            if self.__indexCommentText is not None:
-                line("IndexCommentText", self.__indexCommentText)
-            if self.__indexCalculatedDate is not None:
-                line("IndexCalculatedDate", self.__indexCalculatedDate)
-            if self.__monitoringLocationIdentifier is None:
-                raise WQXException(
-                    "Attribute 'monitoringLocationIdentifier' is required."
-                )
-            line("MonitoringLocationIdentifier", self.__monitoringLocationIdentifier)
-
-        return doc.getvalue()
+        self.__monitoringLocationIdentifier = (
+            val
+            if type(val) is MonitoringLocationIdentifier
+            else MonitoringLocationIdentifier(val)
+        )
+
+    def generateXML(
+        self, name: str = "BiologicalHabitatIndex", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, BiologicalHabitatIndex.schema, name, writer)
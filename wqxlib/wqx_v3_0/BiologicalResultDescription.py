@@ -1,8 +1,8 @@
 from typing import List, Union
 
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .FrequencyClassInformation import FrequencyClassInformation
 from .MeasureCompact import MeasureCompact
 from .SimpleContent import (
@@ -18,11 +18,60 @@ from .SimpleContent import (
 from .TaxonomicDetails import TaxonomicDetails
 
 
-class BiologicalResultDescription:
+class BiologicalResultDescription(XMLFragment):
     """
     Allows for the reporting of biological result information.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "biologicalIntentName",
+            "BiologicalIntentName",
+            BiologicalIntentName,
+            minOccurs=1,
+        ),
+        Field(
+            "biologicalIndividualIdentifier",
+            "BiologicalIndividualIdentifier",
+            BiologicalIndividualIdentifier,
+        ),
+        Field(
+            "subjectTaxonomicName",
+            "SubjectTaxonomicName",
+            SubjectTaxonomicName,
+            minOccurs=1,
+        ),
+        Field(
+            "subjectTaxonomicNameUserSupplied",
+            "SubjectTaxonomicNameUserSupplied",
+            SubjectTaxonomicNameUserSupplied,
+        ),
+        Field(
+            "subjectTaxonomicNameUserSuppliedReferenceText",
+            "SubjectTaxonomicNameUserSuppliedReferenceText",
+            SubjectTaxonomicNameUserSuppliedReferenceText,
+        ),
+        Field(
+            "unidentifiedSpeciesIdentifier",
+            "UnidentifiedSpeciesIdentifier",
+            UnidentifiedSpeciesIdentifier,
+        ),
+        Field(
+            "sampleTissueAnatomyName", "SampleTissueAnatomyName", SampleTissueAnatomyName
+        ),
+        Field("groupSummaryCount", "GroupSummaryCount", GroupSummaryCount),
+        Field("groupSummaryWeightMeasure", "GroupSummaryWeightMeasure", MeasureCompact),
+        Field("taxonomicDetails", "TaxonomicDetails", TaxonomicDetails),
+        Field(
+            "frequencyClassInformation",
+            "FrequencyClassInformation",
+            FrequencyClassInformation,
+            maxOccurs=3,
+        ),
+    )
+
     __biologicalIntentName: BiologicalIntentName
     __biologicalIndividualIdentifier: BiologicalIndividualIdentifier
     __subjectTaxonomicName: SubjectTaxonomicName
@@ -105,7 +154,11 @@ class BiologicalResultDescription:
 
     @biologicalIntentName.setter
     def biologicalIntentName(self, val: BiologicalIntentName) -> None:
-        self.__biologicalIntentName = None if val is None else BiologicalIntentName(val)
+        self.__biologicalIntentName = (
+            val
+            if val is None or type(val) is BiologicalIntentName
+            else BiologicalIntentName(val)
+        )
 
     @property
     def biologicalIndividualIdentifier(self) -> BiologicalIndividualIdentifier:
@@ -114,7 +167,9 @@ class BiologicalResultDescription:
     @biologicalIndividualIdentifier.setter
     def biologicalIndividualIdentifier(self, val: BiologicalIndividualIdentifier) -> None:
         self.__biologicalIndividualIdentifier = (
-            None if val is None else BiologicalIndividualIdentifier(val)
+            val
+            if val is None or type(val) is BiologicalIndividualIdentifier
+            else BiologicalIndividualIdentifier(val)
         )
 
     @property
@@ -123,7 +178,11 @@ class BiologicalResultDescription:
 
     @subjectTaxonomicName.setter
     def subjectTaxonomicName(self, val: SubjectTaxonomicName) -> None:
-        self.__subjectTaxonomicName = None if val is None else SubjectTaxonomicName(val)
+        self.__subjectTaxonomicName = (
+            val
+            if val is None or type(val) is SubjectTaxonomicName
+            else SubjectTaxonomicName(val)
+        )
 
     @property
     def subjectTaxonomicNameUserSupplied(self) -> SubjectTaxonomicNameUserSupplied:
@@ -134,7 +193,9 @@ class BiologicalResultDescription:
         self, val: SubjectTaxonomicNameUserSupplied
     ) -> None:
         self.__subjectTaxonomicNameUserSupplied = (
-            None if val is None else SubjectTaxonomicNameUserSupplied(val)
+            val
+            if val is None or type(val) is SubjectTaxonomicNameUserSupplied
+            else SubjectTaxonomicNameUserSupplied(val)
         )
 
     @property
@@ -148,7 +209,9 @@ class BiologicalResultDescription:
         self, val: SubjectTaxonomicNameUserSuppliedReferenceText
     ) -> None:
         self.__subjectTaxonomicNameUserSuppliedReferenceText = (
-            None if val is None else SubjectTaxonomicNameUserSuppliedReferenceText(val)
+            val
+            if val is None or type(val) is SubjectTaxonomicNameUserSuppliedReferenceText
+            else SubjectTaxonomicNameUserSuppliedReferenceText(val)
         )
 
     @property
@@ -158,7 +221,9 @@ class BiologicalResultDescription:
     @unidentifiedSpeciesIdentifier.setter
     def unidentifiedSpeciesIdentifier(self, val: UnidentifiedSpeciesIdentifier) -> None:
         self.__unidentifiedSpeciesIdentifier = (
-            None if val is None else UnidentifiedSpeciesIdentifier(val)
+            val
+            if val is None or type(val) is UnidentifiedSpeciesIdentifier
+            else UnidentifiedSpeciesIdentifier(val)
         )
 
     @property
@@ -168,7 +233,9 @@ class BiologicalResultDescription:
     @sampleTissueAnatomyName.setter
     def sampleTissueAnatomyName(self, val: SampleTissueAnatomyName) -> None:
         self.__sampleTissueAnatomyName = (
-            None if val is None else SampleTissueAnatomyName(val)
+            val
+            if val is None or type(val) is SampleTissueAnatomyName
+            else SampleTissueAnatomyName(val)
         )
 
     @property
@@ -183,7 +250,11 @@ class BiologicalResultDescription:
         """
         Captures the total count or total sample weight for a Group Summary.
         """
-        self.__groupSummaryCount = None if val is None else GroupSummaryCount(val)
+        self.__groupSummaryCount = (
+            val
+            if val is None or type(val) is GroupSummaryCount
+            else GroupSummaryCount(val)
+        )
 
     @property
     def groupSummaryWeightMeasure(self) -> MeasureCompact:
@@ -219,56 +290,7 @@ class BiologicalResultDescription:
         else:
             self.__frequencyClassInformation = [FrequencyClassInformation(val)]
 
-    def generateXML(self, name: str = "BiologicalResultDescription") -> str:  # noqa: C901
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__biologicalIntentName is None:
-                raise WQXException("Attribute 'biologicalIntentName' is required.")
-            line("BiologicalIntentName", self.__biologicalIntentName)
-            if self.__biologicalIndividualIdentifier is not None:
-                line(
-                    "BiologicalIndividualIdentifier",
-                    self.__biologicalIndividualIdentifier,
-                )
-            if self.__subjectTaxonomicName is None:
-                raise WQXException("Attribute 'subjectTaxonomicName' is required.")
-            line("SubjectTaxonomicName", self.__subjectTaxonomicName)
-            if self.__subjectTaxonomicNameUserSupplied is not None:
-                line(
-                    "SubjectTaxonomicNameUserSupplied",
-                    self.__subjectTaxonomicNameUserSupplied,
-                )
-            if self.__subjectTaxonomicNameUserSuppliedReferenceText is not None:
-                line(
-                    "SubjectTaxonomicNameUserSuppliedReferenceText",
-                    self.__subjectTaxonomicNameUserSuppliedReferenceText,
-                )
-            if self.__unidentifiedSpeciesIdentifier is not None:
-                line(
-                    "UnidentifiedSpeciesIdentifier", self.__unidentifiedSpeciesIdentifier,
-                )
-            if self.__sampleTissueAnatomyName is not None:
-                line("SampleTissueAnatomyName", self.__sampleTissueAnatomyName)
-            if self.__groupSummaryCount is not None:
-                line("GroupSummaryCount", self.__groupSummaryCount)
-            if self.__groupSummaryWeightMeasure is not None:
-                asis(
-                    self.__groupSummaryWeightMeasure.generateXML(
-                        "GroupSummaryWeightMeasure"
-                    )
-                )
-            if self.__taxonomicDetails is not None:
-                asis(self.__taxonomicDetails.generateXML("TaxonomicDetails"))
-            if len(self.__frequencyClassInformation) > 3:
-                raise WQXException(
-                    "Attribute frequencyClassInformation must be a list of 0 to 3 "
-                    "FrequencyClassInformation objects."
-                )
-            for x in self.__frequencyClassInformation:
-                asis(x.generateXML("FrequencyClassInformation"))
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "BiologicalResultDescription", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, BiologicalResultDescription.schema, name, writer)
@@ -1,14 +1,26 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import GearProcedureUnitCode, MeasureValue
 
 
-class CollectionEffort:
+class CollectionEffort(XMLFragment):
     """
     The fields to describe the effort used a collection.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("measureValue", "MeasureValue", MeasureValue, minOccurs=1),
+        Field(
+            "gearProcedureUnitCode",
+            "GearProcedureUnitCode",
+            GearProcedureUnitCode,
+            minOccurs=1,
+        ),
+    )
+
     __measureValue: MeasureValue
     __gearProcedureUnitCode: GearProcedureUnitCode
 
@@ -38,7 +50,7 @@ class CollectionEffort:
 
     @measureValue.setter
     def measureValue(self, val: MeasureValue) -> None:
-        self.__measureValue = MeasureValue(val)
+        self.__measureValue = val if type(val) is MeasureValue else MeasureValue(val)
 
     @property
     def gearProcedureUnitCode(self) -> GearProcedureUnitCode:
@@ -46,19 +58,11 @@ class CollectionEffort:
 
     @gearProcedureUnitCode.setter
     def gearProcedureUnitCode(self, val: GearProcedureUnitCode) -> None:
-        self.__gearProcedureUnitCode = GearProcedureUnitCode(val)
-
-    def generateXML(self, name: str = "CollectionEffort") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__measureValue is None:
-                raise WQXException("Attribute 'measureValue' is required.")
-            line("MeasureValue", self.__measureValue)
-            if self.__gearProcedureUnitCode is None:
-                raise WQXException("Attribute 'gearProcedureUnitCode' is required.")
-            line("GearProcedureUnitCode", self.__gearProcedureUnitCode)
+        self.__gearProcedureUnitCode = (
+            val if type(val) is GearProcedureUnitCode else GearProcedureUnitCode(val)
+        )
 
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "CollectionEffort", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, CollectionEffort.schema, name, writer)
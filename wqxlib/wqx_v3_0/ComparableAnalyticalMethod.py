@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import (
     MethodIdentifier,
     MethodIdentifierContext,
@@ -8,12 +8,25 @@ from .SimpleContent import (
 )
 
 
-class ComparableAnalyticalMethod:
+class ComparableAnalyticalMethod(XMLFragment):
     """
     Identifies the procedures, processes, and references required to determine the
     analytical methods used to obtain a result.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("methodIdentifier", "MethodIdentifier", MethodIdentifier, minOccurs=1),
+        Field(
+            "methodIdentifierContext",
+            "MethodIdentifierContext",
+            MethodIdentifierContext,
+            minOccurs=1,
+        ),
+        Field("methodModificationText", "MethodModificationText", MethodModificationText),
+    )
+
     __methodIdentifier: MethodIdentifier
     __methodIdentifierContext: MethodIdentifierContext
     __methodModificationText: MethodModificationText
@@ -48,7 +61,9 @@ class ComparableAnalyticalMethod:
 
     @methodIdentifier.setter
     def methodIdentifier(self, val: MethodIdentifier) -> None:
-        self.__methodIdentifier = MethodIdentifier(val)
+        self.__methodIdentifier = (
+            val if type(val) is MethodIdentifier else MethodIdentifier(val)
+        )
 
     @property
     def methodIdentifierContext(self) -> MethodIdentifierContext:
@@ -56,7 +71,9 @@ class ComparableAnalyticalMethod:
 
     @methodIdentifierContext.setter
     def methodIdentifierContext(self, val: MethodIdentifierContext) -> None:
-        self.__methodIdentifierContext = MethodIdentifierContext(val)
+        self.__methodIdentifierContext = (
+            val if type(val) is MethodIdentifierContext else MethodIdentifierContext(val)
+        )
 
     @property
     def methodModificationText(self) -> MethodModificationText:
@@ -65,22 +82,12 @@ class ComparableAnalyticalMethod:
     @methodModificationText.setter
     def methodModificationText(self, val: MethodModificationText) -> None:
         self.__methodModificationText = (
-            None if val is None else MethodModificationText(val)
+            val
+            if val is None or type(val) is MethodModificationText
+            else MethodModificationText(val)
         )
 
-    def generateXML(self, name: str = "ComparableAnalyticalMethod") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__methodIdentifier is None:
-                raise WQXException("Attribute 'methodIdentifier' is required.")
-            line("MethodIdentifier", self.__methodIdentifier)
-            if self.__methodIdentifierContext is None:
-                raise WQXException("Attribute 'methodIdentifierContext' is required.")
-            line("MethodIdentifierContext", self.__methodIdentifierContext)
-            if self.__methodModificationText is not None:
-                line("MethodModificationText", self.__methodModificationText)
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "ComparableAnalyticalMethod", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, ComparableAnalyticalMethod.schema, name, writer)
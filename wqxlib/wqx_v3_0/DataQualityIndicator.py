@@ -1,5 +1,6 @@
-from yattag import Doc
-
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import (
     BiasValue,
     ConfidenceIntervalValue,
@@ -9,12 +10,32 @@ from .SimpleContent import (
 )
 
 
-class DataQuality:
+class DataQuality(XMLFragment):
     """
     The quantitative statistics and qualitative descriptors that are used to interpret
     the degree of acceptability or utility of data to the user.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("precisionValue", "PrecisionValue", PrecisionValue),
+        Field("biasValue", "BiasValue", BiasValue),
+        Field(
+            "confidenceIntervalValue", "ConfidenceIntervalValue", ConfidenceIntervalValue
+        ),
+        Field(
+            "upperConfidenceLimitValue",
+            "UpperConfidenceLimitValue",
+            UpperConfidenceLimitValue,
+        ),
+        Field(
+            "lowerConfidenceLimitValue",
+            "LowerConfidenceLimitValue",
+            LowerConfidenceLimitValue,
+        ),
+    )
+
     __precisionValue: PrecisionValue  # optional
     __biasValue: BiasValue  # optional
     __confidenceIntervalValue: ConfidenceIntervalValue  # optional
@@ -59,7 +80,9 @@ class DataQuality:
 
     @precisionValue.setter
     def precisionValue(self, val: PrecisionValue) -> None:
-        self.__precisionValue = None if val is None else PrecisionValue(val)
+        self.__precisionValue = (
+            val if val is None or type(val) is PrecisionValue else PrecisionValue(val)
+        )
 
     @property
     def biasValue(self) -> BiasValue:
@@ -67,7 +90,9 @@ class DataQuality:
 
     @biasValue.setter
     def biasValue(self, val: BiasValue) -> None:
-        self.__biasValue = None if val is None else BiasValue(val)
+        self.__biasValue = (
+            val if val is None or type(val) is BiasValue else BiasValue(val)
+        )
 
     @property
     def confidenceIntervalValue(self) -> ConfidenceIntervalValue:
@@ -76,7 +101,9 @@ class DataQuality:
     @confidenceIntervalValue.setter
     def confidenceIntervalValue(self, val: ConfidenceIntervalValue) -> None:
         self.__confidenceIntervalValue = (
-            None if val is None else ConfidenceIntervalValue(val)
+            val
+            if val is None or type(val) is ConfidenceIntervalValue
+            else ConfidenceIntervalValue(val)
         )
 
     @property
@@ -86,7 +113,9 @@ class DataQuality:
     @upperConfidenceLimitValue.setter
     def upperConfidenceLimitValue(self, val: UpperConfidenceLimitValue) -> None:
         self.__upperConfidenceLimitValue = (
-            None if val is None else UpperConfidenceLimitValue(val)
+            val
+            if val is None or type(val) is UpperConfidenceLimitValue
+            else UpperConfidenceLimitValue(val)
         )
 
     @property
@@ -96,24 +125,10 @@ class DataQuality:
     @lowerConfidenceLimitValue.setter
     def lowerConfidenceLimitValue(self, val: LowerConfidenceLimitValue) -> None:
         self.__lowerConfidenceLimitValue = (
-            None if val is None else LowerConfidenceLimitValue(val)
+            val
+            if val is None or type(val) is LowerConfidenceLimitValue
+            else LowerConfidenceLimitValue(val)
         )
 
-    def generateXML(self, name: str = "DataQuality") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__precisionValue is not None:
-                line("PrecisionValue", self.__precisionValue)
-            if self.__biasValue is not None:
-                line("BiasValue", self.__biasValue)
-            if self.__confidenceIntervalValue is not None:
-                line("ConfidenceIntervalValue", self.__confidenceIntervalValue)
-            if self.__upperConfidenceLimitValue is not None:
-                line("UpperConfidenceLimitValue", self.__upperConfidenceLimitValue)
-            if self.__lowerConfidenceLimitValue is not None:
-                line("LowerConfidenceLimitValue", self.__lowerConfidenceLimitValue)
-
-        return doc.getvalue()
+    def generateXML(self, name: str = "DataQuality", writer: XMLWriter = None) -> str:
+        return encode(self, DataQuality.schema, name, writer)
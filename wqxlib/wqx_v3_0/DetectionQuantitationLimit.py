@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .MeasureCompact import MeasureCompact
 from .SimpleContent import (
     DetectionQuantitationLimitCommentText,
@@ -8,12 +8,34 @@ from .SimpleContent import (
 )
 
 
-class DetectionQuantitationLimit:
+class DetectionQuantitationLimit(XMLFragment):
     """
     Information that describes one of a variety of detection or quantitation limits
     determined in a laboratory.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "detectionQuantitationLimitTypeName",
+            "DetectionQuantitationLimitTypeName",
+            DetectionQuantitationLimitTypeName,
+            minOccurs=1,
+        ),
+        Field(
+            "detectionQuantitationLimitMeasure",
+            "DetectionQuantitationLimitMeasure",
+            MeasureCompact,
+            minOccurs=1,
+        ),
+        Field(
+            "detectionQuantitationLimitCommentText",
+            "DetectionQuantitationLimitCommentText",
+            DetectionQuantitationLimitCommentText,
+        ),
+    )
+
     __detectionQuantitationLimitTypeName: DetectionQuantitationLimitTypeName
     __detectionQuantitationLimitMeasure: MeasureCompact
     __detectionQuantitationLimitCommentText: DetectionQuantitationLimitCommentText
@@ -62,8 +84,10 @@ class DetectionQuantitationLimit:
     def detectionQuantitationLimitTypeName(
         self, val: DetectionQuantitationLimitTypeName
     ) -> None:
-        self.__detectionQuantitationLimitTypeName = DetectionQuantitationLimitTypeName(
+        self.__detectionQuantitationLimitTypeName = (
             val
+            if type(val) is DetectionQuantitationLimitTypeName
+            else DetectionQuantitationLimitTypeName(val)
         )
 
     @property
@@ -85,37 +109,12 @@ class DetectionQuantitationLimit:
         self, val: DetectionQuantitationLimitCommentText
     ) -> None:
         self.__detectionQuantitationLimitCommentText = (
-            None if val is None else DetectionQuantitationLimitCommentText(val)
+            val
+            if val is None or type(val) is DetectionQuantitationLimitCommentText
+            else DetectionQuantitationLimitCommentText(val)
         )
 
-    def generateXML(self, name: str = "DetectionQuantitationLimit") -> str:
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__detectionQuantitationLimitTypeName is None:
-                raise WQXException(
-                    "Attribute 'detectionQuantitationLimitTypeName' is required."
-                )
-            line(
-                "DetectionQuantitationLimitTypeName",
-                self.__detectionQuantitationLimitTypeName,
-            )
-            if self.__detectionQuantitationLimitMeasure is None:
-                raise WQXException(
-                    "Attribute 'detectionQuantitationLimitMeasure' is required."
-                )
-            asis(
-                self.__detectionQuantitationLimitMeasure.generateXML(
-                    "DetectionQuantitationLimitMeasure"
-                )
-            )
-            if self.__detectionQuantitationLimitCommentText is not None:
-                line(
-                    "DetectionQuantitationLimitCommentText",
-                    self.__detectionQuantitationLimitCommentText,
-                )
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "DetectionQuantitationLimit", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, DetectionQuantitationLimit.schema, name, writer)
@@ -1,14 +1,26 @@
-from yattag import Doc
-
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import ElectronicAddressText, ElectronicAddressTypeName
 
 
-class ElectronicAddress:
+class ElectronicAddress(XMLFragment):
     """
     A location within a system of worldwide electronic communication where a computer
     user can access information or receive electronic mail.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("electronicAddressText", "ElectronicAddressText", ElectronicAddressText),
+        Field(
+            "electronicAddressTypeName",
+            "ElectronicAddressTypeName",
+            ElectronicAddressTypeName,
+        ),
+    )
+
     __electronicAddressText: ElectronicAddressText
     __electronicAddressTypeName: ElectronicAddressTypeName
 
@@ -38,7 +50,11 @@ class ElectronicAddress:
 
     @electronicAddressText.setter
     def electronicAddressText(self, val: ElectronicAddressText) -> None:
-        self.__electronicAddressText = None if val is None else ElectronicAddressText(val)
+        self.__electronicAddressText = (
+            val
+            if val is None or type(val) is ElectronicAddressText
+            else ElectronicAddressText(val)
+        )
 
     @property
     def electronicAddressTypeName(self) -> ElectronicAddressTypeName:
@@ -47,18 +63,12 @@ class ElectronicAddress:
     @electronicAddressTypeName.setter
     def electronicAddressTypeName(self, val: ElectronicAddressTypeName) -> None:
         self.__electronicAddressTypeName = (
-            None if val is None else ElectronicAddressTypeName(val)
+            val
+            if val is None or type(val) is ElectronicAddressTypeName
+            else ElectronicAddressTypeName(val)
         )
 
-    def generateXML(self, name: str = "ElectronicAddress") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__electronicAddressText is not None:
-                line("ElectronicAddressText", self.__electronicAddressText)
-            if self.__electronicAddressTypeName is not None:
-                line("ElectronicAddressTypeName", self.__electronicAddressTypeName)
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "ElectronicAddress", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, ElectronicAddress.schema, name, writer)
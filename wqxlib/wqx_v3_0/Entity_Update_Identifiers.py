@@ -1,16 +1,23 @@
 from typing import List, Union
 
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import NewIdentifier, OldIdentifier, OrganizationIdentifier
 
 
-class IdentifierUpdate:
+class IdentifierUpdate(XMLFragment):
     """
     Allows a Project Identifier to be changed.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("oldIdentifier", "OldIdentifier", OldIdentifier, minOccurs=1),
+        Field("newIdentifier", "NewIdentifier", NewIdentifier, minOccurs=1),
+    )
+
     __oldIdentifier: OldIdentifier
     __newIdentifier: NewIdentifier
 
@@ -40,7 +47,9 @@ class IdentifierUpdate:
 
     @oldIdentifier.setter
     def oldIdentifier(self, val: OldIdentifier) -> None:
-        self.__oldIdentifier = None if val is None else OldIdentifier(val)
+        self.__oldIdentifier = (
+            val if val is None or type(val) is OldIdentifier else OldIdentifier(val)
+        )
 
     @property
     def newIdentifier(self) -> NewIdentifier:
@@ -48,29 +57,62 @@ class IdentifierUpdate:
 
     @newIdentifier.setter
     def newIdentifier(self, val: NewIdentifier) -> None:
-        self.__newIdentifier = None if val is None else NewIdentifier(val)
-
-    def generateXML(self, name="IdentifierUpdate"):
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
+        self.__newIdentifier = (
+            val if val is None or type(val) is NewIdentifier else NewIdentifier(val)
+        )
 
-        with tag(name):
-            if self.__oldIdentifier is None:
-                raise WQXException("Attribute 'oldIdentifier' is required.")
-            line("OldIdentifier", self.__oldIdentifier)
-            if self.__newIdentifier is None:
-                raise WQXException("Attribute 'newIdentifier' is required.")
-            line("NewIdentifier", self.__newIdentifier)
+    def generateXML(
+        self, name: str = "IdentifierUpdate", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, IdentifierUpdate.schema, name, writer)
 
-        return doc.getvalue()
 
-
-class UpdateIdentifiers:
+class UpdateIdentifiers(XMLFragment):
     """
     Allows a set of identifiers to be changed.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "organizationIdentifier",
+            "OrganizationIdentifier",
+            OrganizationIdentifier,
+            minOccurs=1,
+        ),
+        Field(
+            "projectIdentifierUpdate",
+            "ProjectIdentifierUpdate",
+            IdentifierUpdate,
+            maxOccurs=None,
+        ),
+        Field(
+            "monitoringLocationIdentifierUpdate",
+            "MonitoringLocationIdentifierUpdate",
+            IdentifierUpdate,
+            maxOccurs=None,
+        ),
+        Field(
+            "indexIdentifierUpdate",
+            "IndexIdentifierUpdate",
+            IdentifierUpdate,
+            maxOccurs=None,
+        ),
+        Field(
+            "activityIdentifierUpdate",
+            "ActivityIdentifierUpdate",
+            IdentifierUpdate,
+            maxOccurs=None,
+        ),
+        Field(
+            "activityGroupIdentifierUpdate",
+            "ActivityGroupIdentifierUpdate",
+            IdentifierUpdate,
+            maxOccurs=None,
+        ),
+    )
+
     __organizationIdentifier: OrganizationIdentifier
     __projectIdentifierUpdate: List[IdentifierUpdate]
     __monitoringLocationIdentifierUpdate: List[IdentifierUpdate]
@@ -140,7 +182,9 @@ class UpdateIdentifiers:
 
     @organizationIdentifier.setter
     def organizationIdentifier(self, val: OrganizationIdentifier) -> None:
-        self.__organizationIdentifier = OrganizationIdentifier(val)
+        self.__organizationIdentifier = (
+            val if type(val) is OrganizationIdentifier else OrganizationIdentifier(val)
+        )
 
     @property
     def projectIdentifierUpdate(self) -> List[IdentifierUpdate]:
@@ -232,25 +276,7 @@ class UpdateIdentifiers:
         else:
             self.__activityGroupIdentifierUpdate = [IdentifierUpdate(val)]
 
-    def generateXML(self, name="UpdateIdentifiers"):
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__organizationIdentifier is None:
-                raise WQXException("Attribute 'organizationIdentifier' is required.")
-            line("OrganizationIdentifier", self.__organizationIdentifier)
-            for x in self.__projectIdentifierUpdate:
-                asis(x.generateXML("ProjectIdentifierUpdate"))
-            for x in self.__monitoringLocationIdentifierUpdate:
-                asis(x.generateXML("MonitoringLocationIdentifierUpdate"))
-            for x in self.__indexIdentifierUpdate:
-                asis(x.generateXML("IndexIdentifierUpdate"))
-            for x in self.__activityIdentifierUpdate:
-                asis(x.generateXML("ActivityIdentifierUpdate"))
-            for x in self.__activityGroupIdentifierUpdate:
-                asis(x.generateXML("ActivityGroupIdentifierUpdate"))
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "UpdateIdentifiers", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, UpdateIdentifiers.schema, name, writer)
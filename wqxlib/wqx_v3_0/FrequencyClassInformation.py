@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import (
     FrequencyClassDescriptorCode,
     FrequencyClassDescriptorUnitCode,
@@ -9,12 +9,30 @@ from .SimpleContent import (
 )
 
 
-class FrequencyClassInformation:
+class FrequencyClassInformation(XMLFragment):
     """
     This section allows for the definition of a subgroup of biological communities by
     life stage, physical attribute, or abnormality to support frequency class studies.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "frequencyClassDescriptorCode",
+            "FrequencyClassDescriptorCode",
+            FrequencyClassDescriptorCode,
+            minOccurs=1,
+        ),
+        Field(
+            "frequencyClassDescriptorUnitCode",
+            "FrequencyClassDescriptorUnitCode",
+            FrequencyClassDescriptorUnitCode,
+        ),
+        Field("lowerClassBoundValue", "LowerClassBoundValue", LowerClassBoundValue),
+        Field("upperClassBoundValue", "UpperClassBoundValue", UpperClassBoundValue),
+    )
+
     __frequencyClassDescriptorCode: FrequencyClassDescriptorCode
     __frequencyClassDescriptorUnitCode: FrequencyClassDescriptorUnitCode
     __lowerClassBoundValue: LowerClassBoundValue
@@ -56,7 +74,11 @@ class FrequencyClassInformation:
 
     @frequencyClassDescriptorCode.setter
     def frequencyClassDescriptorCode(self, val: FrequencyClassDescriptorCode) -> None:
-        self.__frequencyClassDescriptorCode = FrequencyClassDescriptorCode(val)
+        self.__frequencyClassDescriptorCode = (
+            val
+            if type(val) is FrequencyClassDescriptorCode
+            else FrequencyClassDescriptorCode(val)
+        )
 
     @property
     def frequencyClassDescriptorUnitCode(self) -> FrequencyClassDescriptorUnitCode:
@@ -67,7 +89,9 @@ class FrequencyClassInformation:
         self, val: FrequencyClassDescriptorUnitCode
     ) -> None:
         self.__frequencyClassDescriptorUnitCode = (
-            None if val is None else FrequencyClassDescriptorUnitCode(val)
+            val
+            if val is None or type(val) is FrequencyClassDescriptorUnitCode
+            else FrequencyClassDescriptorUnitCode(val)
         )
 
     @property
@@ -76,7 +100,11 @@ class FrequencyClassInformation:
 
     @lowerClassBoundValue.setter
     def lowerClassBoundValue(self, val: LowerClassBoundValue) -> None:
-        self.__lowerClassBoundValue = None if val is None else LowerClassBoundValue(val)
+        self.__lowerClassBoundValue = (
+            val
+            if val is None or type(val) is LowerClassBoundValue
+            else LowerClassBoundValue(val)
+        )
 
     @property
     def upperClassBoundValue(self) -> UpperClassBoundValue:
@@ -84,27 +112,13 @@ class FrequencyClassInformation:
 
     @upperClassBoundValue.setter
     def upperClassBoundValue(self, val: UpperClassBoundValue) -> None:
-        self.__upperClassBoundValue = None if val is None else UpperClassBoundValue(val)
-
-    def generateXML(self, name: str = "FrequencyClassInformation") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__frequencyClassDescriptorCode is None:
-                raise WQXException(
-                    "Attribute 'frequencyClassDescriptorCode' is required."
-                )
-            line("FrequencyClassDescriptorCode", self.__frequencyClassDescriptorCode)
-            if self.__frequencyClassDescriptorUnitCode is not None:
-                line(
-                    "FrequencyClassDescriptorUnitCode",
-                    self.__frequencyClassDescriptorUnitCode,
-                )
-            if self.__lowerClassBoundValue is not None:
-                line("LowerClassBoundValue", self.__lowerClassBoundValue)
-            if self.__upperClassBoundValue is not None:
-                line("UpperClassBoundValue", self.__upperClassBoundValue)
+        self.__upperClassBoundValue = (
+            val
+            if val is None or type(val) is UpperClassBoundValue
+            else UpperClassBoundValue(val)
+        )
 
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "FrequencyClassInformation", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, FrequencyClassInformation.schema, name, writer)
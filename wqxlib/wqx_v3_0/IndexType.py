@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .BibliographicReference import BibliographicReference
 from .SimpleContent import (
     IndexTypeIdentifier,
@@ -10,12 +10,29 @@ from .SimpleContent import (
 )
 
 
-class IndexType:
+class IndexType(XMLFragment):
     """
     This section identifies the index type reported as part of a biological or habitat
     index.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "indexTypeIdentifier", "IndexTypeIdentifier", IndexTypeIdentifier, minOccurs=1
+        ),
+        Field(
+            "indexTypeIdentifierContext",
+            "IndexTypeIdentifierContext",
+            IndexTypeIdentifierContext,
+            minOccurs=1,
+        ),
+        Field("indexTypeName", "IndexTypeName", IndexTypeName, minOccurs=1),
+        Field("indexTypeCitation", "IndexTypeCitation", BibliographicReference),
+        Field("indexTypeScaleText", "IndexTypeScaleText", IndexTypeScaleText),
+    )
+
     __indexTypeIdentifier: IndexTypeIdentifier
     __indexTypeIdentifierContext: IndexTypeIdentifierContext
     __indexTypeName: IndexTypeName
@@ -60,7 +77,9 @@ class IndexType:
 
     @indexTypeIdentifier.setter
     def indexTypeIdentifier(self, val: IndexTypeIdentifier) -> None:
-        self.__indexTypeIdentifier = IndexTypeIdentifier(val)
+        self.__indexTypeIdentifier = (
+            val if type(val) is IndexTypeIdentifier else IndexTypeIdentifier(val)
+        )
 
     @property
     def indexTypeIdentifierContext(self) -> IndexTypeIdentifierContext:
@@ -68,7 +87,11 @@ class IndexType:
 
     @indexTypeIdentifierContext.setter
     def indexTypeIdentifierContext(self, val: IndexTypeIdentifierContext) -> None:
-        self.__indexTypeIdentifierContext = IndexTypeIdentifierContext(val)
+        self.__indexTypeIdentifierContext = (
+            val
+            if type(val) is IndexTypeIdentifierContext
+            else IndexTypeIdentifierContext(val)
+        )
 
     @property
     def indexTypeName(self) -> IndexTypeName:
@@ -76,7 +99,7 @@ class IndexType:
 
     @indexTypeName.setter
     def indexTypeName(self, val: IndexTypeName) -> None:
-        self.__indexTypeName = IndexTypeName(val)
+        self.__indexTypeName = val if type(val) is IndexTypeName else IndexTypeName(val)
 
     @property
     def indexTypeCitation(self) -> BibliographicReference:
@@ -98,27 +121,11 @@ class IndexType:
 
     @indexTypeScaleText.setter
     def indexTypeScaleText(self, val: IndexTypeScaleText) -> None:
-        self.__indexTypeScaleText = None if val is None else IndexTypeScaleText(val)
-
-    def generateXML(self, name: str = "IndexType") -> str:
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__indexTypeIdentifier is None:
-                raise WQXException("Attribute 'indexTypeIdentifier' is required.")
-            line("IndexTypeIdentifier", self.__indexTypeIdentifier)
-            if self.__indexTypeIdentifierContext is None:
-                raise WQXException("Attribute 'indexTypeIdentifierContext' is required.")
-            line("IndexTypeIdentifierContext", self.__indexTypeIdentifierContext)
-            if self.__indexTypeName is None:
-                raise WQXException("Attribute 'indexTypeName' is required.")
-            line("IndexTypeName", self.__indexTypeName)
-            if self.__indexTypeCitation is not None:
-                asis(self.__indexTypeCitation.generateXML("IndexTypeCitation"))
-            if self.__indexTypeScaleText is not None:
-                line("IndexTypeScaleText", self.__indexTypeScaleText)
-
-        return doc.getvalue()
+        self.__indexTypeScaleText = (
+            val
+            if val is None or type(val) is IndexTypeScaleText
+            else IndexTypeScaleText(val)
+        )
+
+    def generateXML(self, name: str = "IndexType", writer: XMLWriter = None) -> str:
+        return encode(self, IndexType.schema, name, writer)
@@ -1,5 +1,6 @@
-from yattag import Doc
-
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .ReferenceMethod import ReferenceMethod
 from .SimpleContent import (
     PreparationEndDate,
@@ -9,13 +10,28 @@ from .SimpleContent import (
 from .WQXTime import WQXTime
 
 
-class LabSamplePreparation:
+class LabSamplePreparation(XMLFragment):
     """
     Describes Lab Sample Preparation procedures which may alter the original state of
     the Sample and produce Lab subsamples.  These Lab Subsamples are analyized and
     reported by the Lab as Sample results.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "labSamplePreparationMethod", "LabSamplePreparationMethod", ReferenceMethod
+        ),
+        Field("preparationStartDate", "PreparationStartDate", PreparationStartDate),
+        Field("preparationStartTime", "PreparationStartTime", WQXTime),
+        Field("preparationEndDate", "PreparationEndDate", PreparationEndDate),
+        Field("preparationEndTime", "PreparationEndTime", WQXTime),
+        Field(
+            "substanceDilutionFactor", "SubstanceDilutionFactor", SubstanceDilutionFactor
+        ),
+    )
+
     __labSamplePreparationMethod: ReferenceMethod
     __preparationStartDate: PreparationStartDate
     __preparationStartTime: WQXTime
@@ -81,7 +97,11 @@ class LabSamplePreparation:
 
     @preparationStartDate.setter
     def preparationStartDate(self, val: PreparationStartDate) -> None:
-        self.__preparationStartDate = None if val is None else PreparationStartDate(val)
+        self.__preparationStartDate = (
+            val
+            if val is None or type(val) is PreparationStartDate
+            else PreparationStartDate(val)
+        )
 
     @property
     def preparationStartTime(self) -> WQXTime:
@@ -103,7 +123,11 @@ class LabSamplePreparation:
 
     @preparationEndDate.setter
     def preparationEndDate(self, val: PreparationEndDate) -> None:
-        self.__preparationEndDate = None if val is None else PreparationEndDate(val)
+        self.__preparationEndDate = (
+            val
+            if val is None or type(val) is PreparationEndDate
+            else PreparationEndDate(val)
+        )
 
     @property
     def preparationEndTime(self) -> WQXTime:
@@ -128,31 +152,12 @@ class LabSamplePreparation:
     @substanceDilutionFactor.setter
     def substanceDilutionFactor(self, val: SubstanceDilutionFactor) -> None:
         self.__substanceDilutionFactor = (
-            None if val is None else SubstanceDilutionFactor(val)
+            val
+            if val is None or type(val) is SubstanceDilutionFactor
+            else SubstanceDilutionFactor(val)
         )
 
-    def generateXML(self, name: str = "LabSamplePreparation") -> str:
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__labSamplePreparationMethod is not None:
-                asis(
-                    self.__labSamplePreparationMethod.generateXML(
-                        "LabSamplePreparationMethod"
-                    )
-                )
-            if self.__preparationStartDate is not None:
-                line("PreparationStartDate", self.__preparationStartDate)
-            if self.__preparationStartTime is not None:
-                asis(self.__preparationStartTime.generateXML("PreparationStartTime"))
-            if self.__preparationEndDate is not None:
-                line("PreparationEndDate", self.__preparationEndDate)
-            if self.__preparationEndTime is not None:
-                asis(self.__preparationEndTime.generateXML("PreparationEndTime"))
-            if self.__substanceDilutionFactor is not None:
-                line("SubstanceDilutionFactor", self.__substanceDilutionFactor)
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "LabSamplePreparation", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, LabSamplePreparation.schema, name, writer)
@@ -1,17 +1,30 @@
 from typing import List, Union
 
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import MeasureQualifierCode, MeasureUnitCode, ResultMeasureValue
 
 
-class Measure:
+class Measure(XMLFragment):
     """
     Identifies the value, associated units of measure, and qualifier for measuring the
     observation or analytical result value.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("resultMeasureValue", "ResultMeasureValue", ResultMeasureValue),
+        Field("measureUnitCode", "MeasureUnitCode", MeasureUnitCode),
+        Field(
+            "measureQualifierCode",
+            "MeasureQualifierCode",
+            MeasureQualifierCode,
+            maxOccurs=6,
+        ),
+    )
+
     __resultMeasureValue: ResultMeasureValue
     __measureUnitCode: MeasureUnitCode
     __measureQualifierCode: List[MeasureQualifierCode]
@@ -48,7 +61,11 @@ class Measure:
 
     @resultMeasureValue.setter
     def resultMeasureValue(self, val: ResultMeasureValue) -> None:
-        self.__resultMeasureValue = None if val is None else ResultMeasureValue(val)
+        self.__resultMeasureValue = (
+            val
+            if val is None or type(val) is ResultMeasureValue
+            else ResultMeasureValue(val)
+        )
 
     @property
     def measureUnitCode(self) -> MeasureUnitCode:
@@ -56,7 +73,9 @@ class Measure:
 
     @measureUnitCode.setter
     def measureUnitCode(self, val: MeasureUnitCode) -> None:
-        self.__measureUnitCode = None if val is None else MeasureUnitCode(val)
+        self.__measureUnitCode = (
+            val if val is None or type(val) is MeasureUnitCode else MeasureUnitCode(val)
+        )
 
     @property
     def measureQualifierCode(self) -> List[MeasureQualifierCode]:
@@ -76,22 +95,5 @@ class Measure:
         else:
             self.__measureQualifierCode = [MeasureQualifierCode(val)]
 
-    def generateXML(self, name: str = "Measure") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__resultMeasureValue is not None:
-                line("ResultMeasureValue", self.__resultMeasureValue)
-            if self.__measureUnitCode is not None:
-                line("MeasureUnitCode", self.__measureUnitCode)
-            if len(self.__measureQualifierCode) > 6:
-                raise WQXException(
-                    "Attribute 'measureQualifierCode' must be a list of 0 to 6 "
-                    "MeasureQualifierCode objects."
-                )
-            for x in self.__measureQualifierCode:
-                line("MeasureQualifierCode", x)
-
-        return doc.getvalue()
+    def generateXML(self, name: str = "Measure", writer: XMLWriter = None) -> str:
+        return encode(self, Measure.schema, name, writer)
@@ -1,15 +1,22 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import MeasureUnitCode, MeasureValue
 
 
-class MeasureCompact:
+class MeasureCompact(XMLFragment):
     """
     Identifies only the value and the associated units of measure for measuring the
     observation or analytical result value.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("measureValue", "MeasureValue", MeasureValue, minOccurs=1),
+        Field("measureUnitCode", "MeasureUnitCode", MeasureUnitCode, minOccurs=1),
+    )
+
     __measureValue: MeasureValue
     __measureUnitCode: MeasureUnitCode
 
@@ -39,7 +46,9 @@ class MeasureCompact:
 
     @measureValue.setter
     def measureValue(self, val: MeasureValue) -> None:
-        self.__measureValue = None if val is None else MeasureValue(val)
+        self.__measureValue = (
+            val if val is None or type(val) is MeasureValue else MeasureValue(val)
+        )
 
     @property
     def measureUnitCode(self) -> MeasureUnitCode:
@@ -47,19 +56,9 @@ class MeasureCompact:
 
     @measureUnitCode.setter
     def measureUnitCode(self, val: MeasureUnitCode) -> None:
-        self.__measureUnitCode = None if val is None else MeasureUnitCode(val)
-
-    def generateXML(self, name: str = "MeasureCompact") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__measureValue is None:
-                raise WQXException("Attribute 'measureValue' is required.")
-            line("MeasureValue", self.__measureValue)
-            if self.__measureUnitCode is None:
-                raise WQXException("Attribute 'measureUnitCode' is required.")
-            line("MeasureUnitCode", self.__measureUnitCode)
+        self.__measureUnitCode = (
+            val if val is None or type(val) is MeasureUnitCode else MeasureUnitCode(val)
+        )
 
-        return doc.getvalue()
+    def generateXML(self, name: str = "MeasureCompact", writer: XMLWriter = None) -> str:
+        return encode(self, MeasureCompact.schema, name, writer)
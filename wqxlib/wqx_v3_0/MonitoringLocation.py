@@ -1,20 +1,46 @@
 from typing import List, Union
 
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .AttachedBinaryObject import AttachedBinaryObject
 from .MonitoringLocationGeospatial import MonitoringLocationGeospatial
 from .MonitoringLocationIdentity import MonitoringLocationIdentity
 from .WellInformation import WellInformation
 
 
-class MonitoringLocation:
+class MonitoringLocation(XMLFragment):
     """
     An identifiable location where an environmental sample, onsite measurement, and/or
     observation is determined.
     """
 
+    __slots__ = ()
+
+    cacheXML = True
+
+    schema = (
+        Field(
+            "monitoringLocationIdentity",
+            "MonitoringLocationIdentity",
+            MonitoringLocationIdentity,
+            minOccurs=1,
+        ),
+        Field(
+            "monitoringLocationGeospatial",
+            "MonitoringLocationGeospatial",
+            MonitoringLocationGeospatial,
+            minOccurs=1,
+        ),
+        Field("wellInformation", "WellInformation", WellInformation),
+        Field(
+            "attachedBinaryObject",
+            "AttachedBinaryObject",
+            AttachedBinaryObject,
+            maxOccurs=None,
+        ),
+    )
+
     __monitoringLocationIdentity: MonitoringLocationIdentity
     __monitoringLocationGeospatial: MonitoringLocationGeospatial
     __wellInformation: WellInformation
@@ -94,31 +120,7 @@ class MonitoringLocation:
         else:
             self.__attachedBinaryObject = [AttachedBinaryObject(val)]
 
-    def generateXML(self, name: str = "MonitoringLocation") -> str:
-        doc = Doc()
-        asis = doc.asis
-        tag = doc.tag
-
-        with tag(name):
-            if self.__monitoringLocationIdentity is None:
-                raise WQXException("Attribute 'MonitoringLocationIdentity' is required.")
-            asis(
-                self.__monitoringLocationIdentity.generateXML(
-                    "MonitoringLocationIdentity"
-                )
-            )
-            if self.__monitoringLocationGeospatial is None:
-                raise WQXException(
-                    "Attribute 'MonitoringLocationGeospatial' is required."
-                )
-            asis(
-                self.__monitoringLocationGeospatial.generateXML(
-                    "MonitoringLocationGeospatial"
-                )
-            )
-            if self.__wellInformation is not None:
-                asis(self.__wellInformation.generateXML("WellInformation"))
-            for x in self.__attachedBinaryObject:
-                asis(x.generateXML("AttachedBinaryObject"))
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "MonitoringLocation", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, MonitoringLocation.schema, name, writer)
@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .MeasureCompact import MeasureCompact
 from .SimpleContent import (
     CountryCode,
@@ -16,11 +16,47 @@ from .SimpleContent import (
 )
 
 
-class MonitoringLocationGeospatial:
+class MonitoringLocationGeospatial(XMLFragment):
     """
     Monitoring location geographic location.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("latitudeMeasure", "LatitudeMeasure", LatitudeMeasure, minOccurs=1),
+        Field("longitudeMeasure", "LongitudeMeasure", LongitudeMeasure, minOccurs=1),
+        Field("sourceMapScale", "SourceMapScale", SourceMapScale),
+        Field("horizontalAccuracyMeasure", "HorizontalAccuracyMeasure", MeasureCompact),
+        Field("verticalAccuracyMeasure", "VerticalAccuracyMeasure", MeasureCompact),
+        Field(
+            "horizontalCollectionMethodName",
+            "HorizontalCollectionMethodName",
+            HorizontalCollectionMethodName,
+            minOccurs=1,
+        ),
+        Field(
+            "horizontalCoordinateReferenceSystemDatumName",
+            "HorizontalCoordinateReferenceSystemDatumName",
+            HorizontalCoordinateReferenceSystemDatumName,
+            minOccurs=1,
+        ),
+        Field("verticalMeasure", "VerticalMeasure", MeasureCompact),
+        Field(
+            "verticalCollectionMethodName",
+            "VerticalCollectionMethodName",
+            VerticalCollectionMethodName,
+        ),
+        Field(
+            "verticalCoordinateReferenceSystemDatumName",
+            "VerticalCoordinateReferenceSystemDatumName",
+            VerticalCoordinateReferenceSystemDatumName,
+        ),
+        Field("countryCode", "CountryCode", CountryCode),
+        Field("stateCode", "StateCode", StateCode),
+        Field("countyCode", "CountyCode", CountyCode),
+    )
+
     __latitudeMeasure: LatitudeMeasure
     __longitudeMeasure: LongitudeMeasure
     __sourceMapScale: SourceMapScale
@@ -117,7 +153,9 @@ class MonitoringLocationGeospatial:
 
     @latitudeMeasure.setter
     def latitudeMeasure(self, val: LatitudeMeasure) -> None:
-        self.__latitudeMeasure = None if val is None else LatitudeMeasure(val)
+        self.__latitudeMeasure = (
+            val if val is None or type(val) is LatitudeMeasure else LatitudeMeasure(val)
+        )
 
     @property
     def longitudeMeasure(self) -> LongitudeMeasure:
@@ -125,7 +163,9 @@ class MonitoringLocationGeospatial:
 
     @longitudeMeasure.setter
     def longitudeMeasure(self, val: LongitudeMeasure) -> None:
-        self.__longitudeMeasure = None if val is None else LongitudeMeasure(val)
+        self.__longitudeMeasure = (
+            val if val is None or type(val) is LongitudeMeasure else LongitudeMeasure(val)
+        )
 
     @property
     def sourceMapScale(self) -> SourceMapScale:
@@ -133,7 +173,9 @@ class MonitoringLocationGeospatial:
 
     @sourceMapScale.setter
     def sourceMapScale(self, val: SourceMapScale) -> None:
-        self.__sourceMapScale = None if val is None else SourceMapScale(val)
+        self.__sourceMapScale = (
+            val if val is None or type(val) is SourceMapScale else SourceMapScale(val)
+        )
 
     @property
     def horizontalAccuracyMeasure(self) -> MeasureCompact:
@@ -174,7 +216,9 @@ class MonitoringLocationGeospatial:
     @horizontalCollectionMethodName.setter
     def horizontalCollectionMethodName(self, val: HorizontalCollectionMethodName) -> None:
         self.__horizontalCollectionMethodName = (
-            None if val is None else HorizontalCollectionMethodName(val)
+            val
+            if val is None or type(val) is HorizontalCollectionMethodName
+            else HorizontalCollectionMethodName(val)
         )
 
     @property
@@ -188,7 +232,9 @@ class MonitoringLocationGeospatial:
         self, val: HorizontalCoordinateReferenceSystemDatumName
     ) -> None:
         self.__horizontalCoordinateReferenceSystemDatumName = (
-            None if val is None else HorizontalCoordinateReferenceSystemDatumName(val)
+            val
+            if val is None or type(val) is HorizontalCoordinateReferenceSystemDatumName
+            else HorizontalCoordinateReferenceSystemDatumName(val)
         )
 
     @property
@@ -212,7 +258,9 @@ class MonitoringLocationGeospatial:
     @verticalCollectionMethodName.setter
     def verticalCollectionMethodName(self, val: VerticalCollectionMethodName) -> None:
         self.__verticalCollectionMethodName = (
-            None if val is None else VerticalCollectionMethodName(val)
+            val
+            if val is None or type(val) is VerticalCollectionMethodName
+            else VerticalCollectionMethodName(val)
         )
 
     @property
@@ -226,7 +274,9 @@ class MonitoringLocationGeospatial:
         self, val: VerticalCoordinateReferenceSystemDatumName
     ) -> None:
         self.__verticalCoordinateReferenceSystemDatumName = (
-            None if val is None else VerticalCoordinateReferenceSystemDatumName(val)
+            val
+            if val is None or type(val) is VerticalCoordinateReferenceSystemDatumName
+            else VerticalCoordinateReferenceSystemDatumName(val)
         )
 
     @property
@@ -235,7 +285,9 @@ class MonitoringLocationGeospatial:
 
     @countryCode.setter
     def countryCode(self, val: CountryCode) -> None:
-        self.__countryCode = None if val is None else CountryCode(val)
+        self.__countryCode = (
+            val if val is None or type(val) is CountryCode else CountryCode(val)
+        )
 
     @property
     def stateCode(self) -> StateCode:
@@ -243,7 +295,9 @@ class MonitoringLocationGeospatial:
 
     @stateCode.setter
     def stateCode(self, val: StateCode) -> None:
-        self.__stateCode = None if val is None else StateCode(val)
+        self.__stateCode = (
+            val if val is None or type(val) is StateCode else StateCode(val)
+        )
 
     @property
     def countyCode(self) -> CountyCode:
@@ -251,62 +305,11 @@ class MonitoringLocationGeospatial:
 
     @countyCode.setter
     def countyCode(self, val: CountyCode) -> None:
-        self.__countyCode = None if val is None else CountyCode(val)
+        self.__countyCode = (
+            val if val is None or type(val) is CountyCode else CountyCode(val)
+        )
 
-    def generateXML(  # noqa: C901
-        self, name: str = "MonitoringLocationGeospatial"
+    def generateXML(
+        self, name: str = "MonitoringLocationGeospatial", writer: XMLWriter = None
     ) -> str:
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__latitudeMeasure is None:
-                raise WQXException("Attribute 'LatitudeMeasure' is required.")
-            line("LatitudeMeasure", str(self.__latitudeMeasure))
-            if self.__longitudeMeasure is None:
-                raise WQXException("Attribute 'LongitudeMeasure' is required.")
-            line("LongitudeMeasure", str(self.__longitudeMeasure))
-            if self.__sourceMapScale is not None:
-                line("SourceMapScale", self.__sourceMapScale)
-            if self.__horizontalAccuracyMeasure is not None:
-                asis(
-                    self.__horizontalAccuracyMeasure.generateXML(
-                        "HorizontalAccuracyMeasure"
-                    )
-                )
-            if self.__verticalAccuracyMeasure is not None:
-                asis(
-                    self.__verticalAccuracyMeasure.generateXML("VerticalAccuracyMeasure")
-                )
-            if self.__horizontalCollectionMethodName is None:
-                raise WQXException(
-                    "Attribute 'HorizontalCollectionMethodName' is required."
-                )
-            line("HorizontalCollectionMethodName", self.__horizontalCollectionMethodName)
-            if self.__horizontalCoordinateReferenceSystemDatumName is None:
-                raise WQXException(
-                    "Attribute 'HorizontalCoordinateReferenceSystemDatumName' is required."
-                )
-            line(
-                "HorizontalCoordinateReferenceSystemDatumName",
-                self.__horizontalCoordinateReferenceSystemDatumName,
-            )
-            if self.__verticalMeasure is not None:
-                asis(self.__verticalMeasure.generateXML("VerticalMeasure"))
-            if self.__verticalCollectionMethodName is not None:
-                line("VerticalCollectionMethodName", self.__verticalCollectionMethodName)
-            if self.__verticalCoordinateReferenceSystemDatumName is not None:
-                line(
-                    "VerticalCoordinateReferenceSystemDatumName",
-                    self.__verticalCoordinateReferenceSystemDatumName,
-                )
-            if self.__countryCode is not None:
-                line("CountryCode", self.__countryCode)
-            if self.__stateCode is not None:
-                line("StateCode", self.__stateCode)
-            if self.__countyCode is not None:
-                line("CountyCode", self.__countyCode)
-
-        return doc.getvalue()
+        return encode(self, MonitoringLocationGeospatial.schema, name, writer)
@@ -1,8 +1,8 @@
 from typing import List, Union
 
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .AlternateMonitoringLocationIdentity import AlternateMonitoringLocationIdentity
 from .MeasureCompact import MeasureCompact
 from .SimpleContent import (
@@ -17,12 +17,58 @@ from .SimpleContent import (
 )
 
 
-class MonitoringLocationIdentity:
+class MonitoringLocationIdentity(XMLFragment):
     """
     Basic identification information for the location/site that is monitored or used
     for sampling.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "monitoringLocationIdentifier",
+            "MonitoringLocationIdentifier",
+            MonitoringLocationIdentifier,
+            minOccurs=1,
+        ),
+        Field(
+            "monitoringLocationName",
+            "MonitoringLocationName",
+            MonitoringLocationName,
+            minOccurs=1,
+        ),
+        Field(
+            "monitoringLocationTypeName",
+            "MonitoringLocationTypeName",
+            MonitoringLocationTypeName,
+            minOccurs=1,
+        ),
+        Field(
+            "monitoringLocationDescriptionText",
+            "MonitoringLocationDescriptionText",
+            MonitoringLocationDescriptionText,
+        ),
+        Field("hucEightDigitCode", "HUCEightDigitCode", HUCEightDigitCode),
+        Field("hucTwelveDigitCode", "HUCTwelveDigitCode", HUCTwelveDigitCode),
+        Field(
+            "tribalLandIndicator", "TribalLandIndicator", TribalLandIndicator, minOccurs=1
+        ),
+        Field("tribalLandName", "TribalLandName", TribalLandName),
+        Field(
+            "alternateMonitoringLocationIdentity",
+            "AlternateMonitoringLocationIdentity",
+            AlternateMonitoringLocationIdentity,
+            maxOccurs=None,
+        ),
+        Field("drainageAreaMeasure", "DrainageAreaMeasure", MeasureCompact),
+        Field(
+            "contributingDrainageAreaMeasure",
+            "ContributingDrainageAreaMeasure",
+            MeasureCompact,
+        ),
+    )
+
     __monitoringLocationIdentifier: MonitoringLocationIdentifier
     __monitoringLocationName: MonitoringLocationName
     __monitoringLocationTypeName: MonitoringLocationTypeName
@@ -108,7 +154,9 @@ class MonitoringLocationIdentity:
     @monitoringLocationIdentifier.setter
     def monitoringLocationIdentifier(self, val: MonitoringLocationIdentifier) -> None:
         self.__monitoringLocationIdentifier = (
-            None if val is None else MonitoringLocationIdentifier(val)
+            val
+            if val is None or type(val) is MonitoringLocationIdentifier
+            else MonitoringLocationIdentifier(val)
         )
 
     @property
@@ -118,7 +166,9 @@ class MonitoringLocationIdentity:
     @monitoringLocationName.setter
     def monitoringLocationName(self, val: MonitoringLocationName) -> None:
         self.__monitoringLocationName = (
-            None if val is None else MonitoringLocationName(val)
+            val
+            if val is None or type(val) is MonitoringLocationName
+            else MonitoringLocationName(val)
         )
 
     @property
@@ -128,7 +178,9 @@ class MonitoringLocationIdentity:
     @monitoringLocationTypeName.setter
     def monitoringLocationTypeName(self, val: MonitoringLocationTypeName) -> None:
         self.__monitoringLocationTypeName = (
-            None if val is None else MonitoringLocationTypeName(val)
+            val
+            if val is None or type(val) is MonitoringLocationTypeName
+            else MonitoringLocationTypeName(val)
         )
 
     @property
@@ -140,7 +192,9 @@ class MonitoringLocationIdentity:
         self, val: MonitoringLocationDescriptionText
     ) -> None:
         self.__monitoringLocationDescriptionText = (
-            None if val is None else MonitoringLocationDescriptionText(val)
+            val
+            if val is None or type(val) is MonitoringLocationDescriptionText
+            else MonitoringLocationDescriptionText(val)
         )
 
     @property
@@ -149,7 +203,11 @@ class MonitoringLocationIdentity:
 
     @hucEightDigitCode.setter
     def hucEightDigitCode(self, val: HUCEightDigitCode) -> None:
-        self.__hucEightDigitCode = None if val is None else HUCEightDigitCode(val)
+        self.__hucEightDigitCode = (
+            val
+            if val is None or type(val) is HUCEightDigitCode
+            else HUCEightDigitCode(val)
+        )
 
     @property
     def hucTwelveDigitCode(self) -> HUCTwelveDigitCode:
@@ -157,7 +215,11 @@ class MonitoringLocationIdentity:
 
     @hucTwelveDigitCode.setter
     def hucTwelveDigitCode(self, val: HUCTwelveDigitCode) -> None:
-        self.__hucTwelveDigitCode = None if val is None else HUCTwelveDigitCode(val)
+        self.__hucTwelveDigitCode = (
+            val
+            if val is None or type(val) is HUCTwelveDigitCode
+            else HUCTwelveDigitCode(val)
+        )
 
     @property
     def tribalLandIndicator(self) -> TribalLandIndicator:
@@ -165,7 +227,9 @@ class MonitoringLocationIdentity:
 
     @tribalLandIndicator.setter
     def tribalLandIndicator(self, val: TribalLandIndicator) -> None:
-        self.__tribalLandIndicator = TribalLandIndicator(val)
+        self.__tribalLandIndicator = (
+            val if type(val) is TribalLandIndicator else TribalLandIndicator(val)
+        )
 
     @property
     def tribalLandName(self) -> TribalLandName:
@@ -173,7 +237,9 @@ class MonitoringLocationIdentity:
 
     @tribalLandName.setter
     def tribalLandName(self, val: TribalLandName) -> None:
-        self.__tribalLandName = None if val is None else TribalLandName(val)
+        self.__tribalLandName = (
+            val if val is None or type(val) is TribalLandName else TribalLandName(val)
+        )
 
     @property
     def alternateMonitoringLocationIdentity(
@@ -231,45 +297,7 @@ class MonitoringLocationIdentity:
             None if val is None else MeasureCompact(val)
         )
 
-    def generateXML(self, name: str = "MonitoringLocationIdentity") -> str:  # noqa: C901
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__monitoringLocationIdentifier is None:
-                raise WQXException(
-                    "Attribute 'MonitoringLocationIdentifier' is required."
-                )
-            line("MonitoringLocationIdentifier", self.__monitoringLocationIdentifier)
-            if self.__monitoringLocationName is None:
-                raise WQXException("Attribute 'MonitoringLocationName' is required.")
-            line("MonitoringLocationName", self.__monitoringLocationName)
-            if self.__monitoringLocationTypeName is None:
-                raise WQXException("Attribute 'MonitoringLocationTypeName' is required.")
-            line("MonitoringLocationTypeName", self.__monitoringLocationTypeName)
-            if self.__monitoringLocationDescriptionText is not None:
-                line(
-                    "MonitoringLocationDescriptionText",
-                    self.__monitoringLocationDescriptionText,
-                )
-            if self.__hucEightDigitCode is not None:
-                line("HUCEightDigitCode", self.__hucEightDigitCode)
-            if self.__hucTwelveDigitCode is not None:
-                line("HUCTwelveDigitCode", self.__hucTwelveDigitCode)
-            line("TribalLandIndicator", str(self.__tribalLandIndicator))
-            if self.__tribalLandName is not None:
-                line("TribalLandName", self.__tribalLandName)
-            for x in self.__alternateMonitoringLocationIdentity:
-                asis(x.generateXML("AlternateMonitoringLocationIdentity"))
-            if self.__drainageAreaMeasure is not None:
-                asis(self.__drainageAreaMeasure.generateXML("DrainageAreaMeasure"))
-            if self.__contributingDrainageAreaMeasure is not None:
-                asis(
-                    self.__contributingDrainageAreaMeasure.generateXML(
-                        "ContributingDrainageAreaMeasure"
-                    )
-                )
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "MonitoringLocationIdentity", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, MonitoringLocationIdentity.schema, name, writer)
@@ -1,15 +1,25 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .MeasureCompact import MeasureCompact
 from .SimpleContent import NetTypeName
 
 
-class NetInformation:
+class NetInformation(XMLFragment):
     """
     Allows for the reporting of net sample collection information.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("netTypeName", "NetTypeName", NetTypeName, minOccurs=1),
+        Field("netSurfaceAreaMeasure", "NetSurfaceAreaMeasure", MeasureCompact),
+        Field("netMeshSizeMeasure", "NetMeshSizeMeasure", MeasureCompact),
+        Field("boatSpeedMeasure", "BoatSpeedMeasure", MeasureCompact),
+        Field("currentSpeedMeasure", "CurrentSpeedMeasure", MeasureCompact),
+    )
+
     __netTypeName: NetTypeName
     __netSurfaceAreaMeasure: MeasureCompact
     __netMeshSizeMeasure: MeasureCompact
@@ -54,7 +64,7 @@ class NetInformation:
 
     @netTypeName.setter
     def netTypeName(self, val: NetTypeName) -> None:
-        self.__netTypeName = NetTypeName(val)
+        self.__netTypeName = val if type(val) is NetTypeName else NetTypeName(val)
 
     @property
     def netSurfaceAreaMeasure(self) -> MeasureCompact:
@@ -62,7 +72,7 @@ class NetInformation:
         A measurement of the effective surface area of the net used during biological
         monitoring sample collection.
         """
-        return self.netSurfaceAreaMeasure
+        return self.__netSurfaceAreaMeasure
 
     @netSurfaceAreaMeasure.setter
     def netSurfaceAreaMeasure(self, val: MeasureCompact) -> None:
@@ -78,7 +88,7 @@ class NetInformation:
         A measurement of the mesh size of the net used during biological monitoring
         sample collection.
         """
-        return self.netMeshSizeMeasure
+        return self.__netMeshSizeMeasure
 
     @netMeshSizeMeasure.setter
     def netMeshSizeMeasure(self, val: MeasureCompact) -> None:
@@ -93,7 +103,7 @@ class NetInformation:
         """
         A measurement of the boat speed during biological monitoring sample collection.
         """
-        return self.boatSpeedMeasure
+        return self.__boatSpeedMeasure
 
     @boatSpeedMeasure.setter
     def boatSpeedMeasure(self, val: MeasureCompact) -> None:
@@ -107,7 +117,7 @@ class NetInformation:
         """
         A measurement of the current during biological monitoring sample collection.
         """
-        return self.currentSpeedMeasure
+        return self.__currentSpeedMeasure
 
     @currentSpeedMeasure.setter
     def currentSpeedMeasure(self, val: MeasureCompact) -> None:
@@ -116,23 +126,5 @@ class NetInformation:
         """
         self.__currentSpeedMeasure = None if val is None else MeasureCompact(val)
 
-    def generateXML(self, name: str = "NetInformation") -> str:
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__netTypeName is None:
-                raise WQXException("Attribute 'netTypeName' is required.")
-            line("NetTypeName", self.__netTypeName)
-            if self.__netSurfaceAreaMeasure is not None:
-                asis(self.__netSurfaceAreaMeasure.generateXML("NetSurfaceAreaMeasure"))
-            if self.__netMeshSizeMeasure is not None:
-                asis(self.__netMeshSizeMeasure.generateXML("NetMeshSizeMeasure"))
-            if self.__boatSpeedMeasure is not None:
-                asis(self.__boatSpeedMeasure.generateXML("BoatSpeedMeasure"))
-            if self.__currentSpeedMeasure is not None:
-                asis(self.__currentSpeedMeasure.generateXML("CurrentSpeedMeasure"))
-
-        return doc.getvalue()
+    def generateXML(self, name: str = "NetInformation", writer: XMLWriter = None) -> str:
+        return encode(self, NetInformation.schema, name, writer)
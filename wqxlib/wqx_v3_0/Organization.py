@@ -1,8 +1,9 @@
 from typing import List, Union
 
-from yattag import Doc
-
 from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .Activity import Activity
 from .ActivityGroup import ActivityGroup
 from .BiologicalHabitatIndex import BiologicalHabitatIndex
@@ -14,11 +15,41 @@ from .Project import Project
 from .Telephonic import Telephonic
 
 
-class Organization:
+class Organization(XMLFragment):
     """
     Schema used to transfer organization information.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "organizationDescription",
+            "OrganizationDescription",
+            OrganizationDescription,
+            minOccurs=1,
+        ),
+        Field(
+            "electronicAddress", "ElectronicAddress", ElectronicAddress, maxOccurs=None
+        ),
+        Field("telephonic", "Telephonic", Telephonic, maxOccurs=None),
+        Field(
+            "organizationAddress", "OrganizationAddress", OrganizationAddress, maxOccurs=3
+        ),
+        Field("project", "Project", Project, maxOccurs=None),
+        Field(
+            "monitoringLocation", "MonitoringLocation", MonitoringLocation, maxOccurs=None
+        ),
+        Field(
+            "biologicalHabitatIndex",
+            "BiologicalHabitatIndex",
+            BiologicalHabitatIndex,
+            maxOccurs=None,
+        ),
+        Field("activity", "Activity", Activity, maxOccurs=None),
+        Field("activityGroup", "ActivityGroup", ActivityGroup, maxOccurs=None),
+    )
+
     __organizationDescription: OrganizationDescription
     __electronicAddress: List[ElectronicAddress]
     __telephonic: List[Telephonic]
@@ -228,35 +259,5 @@ class Organization:
         else:
             self.__activityGroup = [ActivityGroup(val)]
 
-    def generateXML(self, name: str = "Organization") -> str:  # noqa: C901
-        doc = Doc()
-        asis = doc.asis
-        tag = doc.tag
-
-        with tag(name):
-            if self.__organizationDescription is None:
-                raise WQXException("Attribute 'organizationDescription' is required.")
-            asis(self.__organizationDescription.generateXML("OrganizationDescription"))
-            for x in self.__electronicAddress:
-                asis(x.generateXML("ElectronicAddress"))
-            for x in self.__telephonic:
-                asis(x.generateXML("Telephonic"))
-            if len(self.__organizationAddress) > 3:
-                raise WQXException(
-                    "Attribute 'organizationAddress' must contain 0 to 3 "
-                    "OrganizationAddress objects."
-                )
-            for x in self.__organizationAddress:
-                asis(x.generateXML("OrganizationAddress"))
-            for x in self.__project:
-                asis(x.generateXML("Project"))
-            for x in self.__monitoringLocation:
-                asis(x.generateXML("MonitoringLocation"))
-            for x in self.__biologicalHabitatIndex:
-                asis(x.generateXML("BiologicalHabitatIndex"))
-            for x in self.__activity:
-                asis(x.generateXML("Activity"))
-            for x in self.__activityGroup:
-                asis(x.generateXML("ActivityGroup"))
-
-        return doc.getvalue()
+    def generateXML(self, name: str = "Organization", writer: XMLWriter = None) -> str:
+        return encode(self, Organization.schema, name, writer)
@@ -1,5 +1,6 @@
-from yattag import Doc
-
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import (
     AddressText,
     AddressTypeName,
@@ -12,11 +13,26 @@ from .SimpleContent import (
 )
 
 
-class OrganizationAddress:
+class OrganizationAddress(XMLFragment):
     """
     The physical address of an organization.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("addressTypeName", "AddressTypeName", AddressTypeName),
+        Field("addressText", "AddressText", AddressText),
+        Field(
+            "supplementalAddressText", "SupplementalAddressText", SupplementalAddressText
+        ),
+        Field("localityName", "LocalityName", LocalityName),
+        Field("stateCode", "StateCode", StateCode),
+        Field("postalCode", "PostalCode", PostalCode),
+        Field("countryCode", "CountryCode", CountryCode),
+        Field("countyCode", "CountyCode", CountyCode),
+    )
+
     __addressTypeName: AddressTypeName
     __addressText: AddressText
     __supplementalAddressText: SupplementalAddressText
@@ -76,7 +92,9 @@ class OrganizationAddress:
 
     @addressTypeName.setter
     def addressTypeName(self, val: AddressTypeName) -> None:
-        self.__addressTypeName = None if val is None else AddressTypeName(val)
+        self.__addressTypeName = (
+            val if val is None or type(val) is AddressTypeName else AddressTypeName(val)
+        )
 
     @property
     def addressText(self) -> AddressText:
@@ -84,7 +102,9 @@ class OrganizationAddress:
 
     @addressText.setter
     def addressText(self, val: AddressText) -> None:
-        self.__addressText = None if val is None else AddressText(val)
+        self.__addressText = (
+            val if val is None or type(val) is AddressText else AddressText(val)
+        )
 
     @property
     def supplementalAddressText(self) -> SupplementalAddressText:
@@ -93,7 +113,9 @@ class OrganizationAddress:
     @supplementalAddressText.setter
     def supplementalAddressText(self, val: SupplementalAddressText) -> None:
         self.__supplementalAddressText = (
-            None if val is None else SupplementalAddressText(val)
+            val
+            if val is None or type(val) is SupplementalAddressText
+            else SupplementalAddressText(val)
         )
 
     @property
@@ -102,7 +124,9 @@ class OrganizationAddress:
 
     @localityName.setter
     def localityName(self, val: LocalityName) -> None:
-        self.__localityName = None if val is None else LocalityName(val)
+        self.__localityName = (
+            val if val is None or type(val) is LocalityName else LocalityName(val)
+        )
 
     @property
     def stateCode(self) -> StateCode:
@@ -110,7 +134,9 @@ class OrganizationAddress:
 
     @stateCode.setter
     def stateCode(self, val: StateCode) -> None:
-        self.__stateCode = None if val is None else StateCode(val)
+        self.__stateCode = (
+            val if val is None or type(val) is StateCode else StateCode(val)
+        )
 
     @property
     def postalCode(self) -> PostalCode:
@@ -118,7 +144,9 @@ class OrganizationAddress:
 
     @postalCode.setter
     def postalCode(self, val: PostalCode) -> None:
-        self.__postalCode = None if val is None else PostalCode(val)
+        self.__postalCode = (
+            val if val is None or type(val) is PostalCode else PostalCode(val)
+        )
 
     @property
     def countryCode(self) -> CountryCode:
@@ -126,7 +154,9 @@ class OrganizationAddress:
 
     @countryCode.setter
     def countryCode(self, val: CountryCode) -> None:
-        self.__countryCode = None if val is None else CountryCode(val)
+        self.__countryCode = (
+            val if val is None or type(val) is CountryCode else CountryCode(val)
+        )
 
     @property
     def countyCode(self) -> CountyCode:
@@ -134,29 +164,11 @@ class OrganizationAddress:
 
     @countyCode.setter
     def countyCode(self, val: CountyCode) -> None:
-        self.__countyCode = None if val is None else CountyCode(val)
-
-    def generateXML(self, name: str = "OrganizationAddress") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__addressTypeName is not None:
-                line("AddressTypeName", self.__addressTypeName)
-            if self.__addressText is not None:
-                line("AddressText", self.__addressText)
-            if self.__supplementalAddressText is not None:
-                line("SupplementalAddressText", self.__supplementalAddressText)
-            if self.__localityName is not None:
-                line("LocalityName", self.__localityName)
-            if self.__stateCode is not None:
-                line("StateCode", self.__stateCode)
-            if self.__postalCode is not None:
-                line("PostalCode", self.__postalCode)
-            if self.__countryCode is not None:
-                line("CountryCode", self.__countryCode)
-            if self.__countyCode is not None:
-                line("CountyCode", self.__countyCode)
-
-        return doc.getvalue()
+        self.__countyCode = (
+            val if val is None or type(val) is CountyCode else CountyCode(val)
+        )
+
+    def generateXML(
+        self, name: str = "OrganizationAddress", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, OrganizationAddress.schema, name, writer)
@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import (
     OrganizationDescriptionText,
     OrganizationFormalName,
@@ -9,12 +9,35 @@ from .SimpleContent import (
 )
 
 
-class OrganizationDescription:
+class OrganizationDescription(XMLFragment):
     """
     The particular word(s) regularly connected with a unique framework of authority
     within which a person or persons act, or are designated to act, towards some purpose.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "organizationIdentifier",
+            "OrganizationIdentifier",
+            OrganizationIdentifier,
+            minOccurs=1,
+        ),
+        Field(
+            "organizationFormalName",
+            "OrganizationFormalName",
+            OrganizationFormalName,
+            minOccurs=1,
+        ),
+        Field(
+            "organizationDescriptionText",
+            "OrganizationDescriptionText",
+            OrganizationDescriptionText,
+        ),
+        Field("tribalCode", "TribalCode", TribalCode),
+    )
+
     __organizationIdentifier: OrganizationIdentifier = None
     __organizationFormalName: OrganizationFormalName = None
     __organizationDescriptionText: OrganizationDescriptionText = None
@@ -55,7 +78,9 @@ class OrganizationDescription:
     @organizationIdentifier.setter
     def organizationIdentifier(self, val: OrganizationIdentifier) -> None:
         self.__organizationIdentifier = (
-            None if val is None else OrganizationIdentifier(val)
+            val
+            if val is None or type(val) is OrganizationIdentifier
+            else OrganizationIdentifier(val)
         )
 
     @property
@@ -65,7 +90,9 @@ class OrganizationDescription:
     @organizationFormalName.setter
     def organizationFormalName(self, val: OrganizationFormalName) -> None:
         self.__organizationFormalName = (
-            None if val is None else OrganizationFormalName(val)
+            val
+            if val is None or type(val) is OrganizationFormalName
+            else OrganizationFormalName(val)
         )
 
     @property
@@ -75,7 +102,9 @@ class OrganizationDescription:
     @organizationDescriptionText.setter
     def organizationDescriptionText(self, val: OrganizationDescriptionText) -> None:
         self.__organizationDescriptionText = (
-            None if val is None else OrganizationDescriptionText(val)
+            val
+            if val is None or type(val) is OrganizationDescriptionText
+            else OrganizationDescriptionText(val)
         )
 
     @property
@@ -84,23 +113,11 @@ class OrganizationDescription:
 
     @tribalCode.setter
     def tribalCode(self, val: TribalCode) -> None:
-        self.__tribalCode = None if val is None else TribalCode(val)
-
-    def generateXML(self, name: str = "OrganizationDescription") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.organizationIdentifier is None:
-                raise WQXException("Attribute 'organizationIdentifier' is required.")
-            line("OrganizationIdentifier", self.__organizationIdentifier)
-            if self.organizationFormalName is None:
-                raise WQXException("Attribute 'organizationFormalName' is required.")
-            line("OrganizationFormalName", self.__organizationFormalName)
-            if self.__organizationDescriptionText is not None:
-                line("OrganizationDescriptionText", self.__organizationDescriptionText)
-            if self.__tribalCode is not None:
-                line("TribalCode", self.__tribalCode)
+        self.__tribalCode = (
+            val if val is None or type(val) is TribalCode else TribalCode(val)
+        )
 
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "OrganizationDescription", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, OrganizationDescription.schema, name, writer)
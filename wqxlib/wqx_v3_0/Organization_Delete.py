@@ -1,8 +1,8 @@
 from typing import List, Union
 
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import (
     ActivityGroupIdentifier,
     ActivityIdentifier,
@@ -13,11 +13,41 @@ from .SimpleContent import (
 )
 
 
-class OrganizationDelete:
+class OrganizationDelete(XMLFragment):
     """
     Schema used to delete organization information
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "organizationIdentifier",
+            "OrganizationIdentifier",
+            OrganizationIdentifier,
+            minOccurs=1,
+        ),
+        Field(
+            "projectIdentifier", "ProjectIdentifier", ProjectIdentifier, maxOccurs=None
+        ),
+        Field(
+            "monitoringLocationIdentifier",
+            "MonitoringLocationIdentifier",
+            MonitoringLocationIdentifier,
+            maxOccurs=None,
+        ),
+        Field(
+            "activityIdentifier", "ActivityIdentifier", ActivityIdentifier, maxOccurs=None
+        ),
+        Field(
+            "activityGroupIdentifier",
+            "ActivityGroupIdentifier",
+            ActivityGroupIdentifier,
+            maxOccurs=None,
+        ),
+        Field("indexIdentifier", "IndexIdentifier", IndexIdentifier, maxOccurs=None),
+    )
+
     __organizationIdentifier: OrganizationIdentifier
     __projectIdentifier: List[ProjectIdentifier]
     __monitoringLocationIdentifier: List[MonitoringLocationIdentifier]
@@ -68,7 +98,9 @@ class OrganizationDelete:
     @organizationIdentifier.setter
     def organizationIdentifier(self, val: OrganizationIdentifier) -> None:
         self.__organizationIdentifier = (
-            None if val is None else OrganizationIdentifier(val)
+            val
+            if val is None or type(val) is OrganizationIdentifier
+            else OrganizationIdentifier(val)
         )
 
     @property
@@ -160,24 +192,7 @@ class OrganizationDelete:
         else:
             self.__indexIdentifier = [IndexIdentifier(val)]
 
-    def generateXML(self, name="OrganizationDelete"):
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__organizationIdentifier is None:
-                raise WQXException("Attribute 'organizationIdentifier' is required.")
-            line("OrganizationIdentifier", self.__organizationIdentifier)
-            for x in self.__projectIdentifier:
-                line("ProjectIdentifier", x)
-            for x in self.__monitoringLocationIdentifier:
-                line("MonitoringLocationIdentifier", x)
-            for x in self.__activityIdentifier:
-                line("ActivityIdentifier", x)
-            for x in self.__activityGroupIdentifier:
-                line("ActivityGroupIdentifier", x)
-            for x in self.__indexIdentifier:
-                line("IndexIdentifier", x)
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "OrganizationDelete", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, OrganizationDelete.schema, name, writer)
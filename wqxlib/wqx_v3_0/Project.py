@@ -1,8 +1,8 @@
 from typing import List, Union
 
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .AttachedBinaryObject import AttachedBinaryObject
 from .ProjectMonitoringLocationWeighting import ProjectMonitoringLocationWeighting
 from .SimpleContent import (
@@ -15,12 +15,35 @@ from .SimpleContent import (
 )
 
 
-class Project:
+class Project(XMLFragment):
     """
     An environmental data collection effort that has a stated purpose and puts a series
     of samples and results into a meaningful context.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("projectIdentifier", "ProjectIdentifier", ProjectIdentifier, minOccurs=1),
+        Field("projectName", "ProjectName", ProjectName, minOccurs=1),
+        Field("projectDescriptionText", "ProjectDescriptionText", ProjectDescriptionText),
+        Field("samplingDesignTypeCode", "SamplingDesignTypeCode", SamplingDesignTypeCode),
+        Field("qAPPApprovedIndicator", "QAPPApprovedIndicator", QAPPApprovedIndicator),
+        Field("qAPPApprovalAgencyName", "QAPPApprovalAgencyName", QAPPApprovalAgencyName),
+        Field(
+            "attachedBinaryObject",
+            "AttachedBinaryObject",
+            AttachedBinaryObject,
+            maxOccurs=None,
+        ),
+        Field(
+            "projectMonitoringLocationWeighting",
+            "ProjectMonitoringLocationWeighting",
+            ProjectMonitoringLocationWeighting,
+            maxOccurs=None,
+        ),
+    )
+
     __projectIdentifier: ProjectIdentifier
     __projectName: ProjectName
     __projectDescriptionText: ProjectDescriptionText
@@ -86,7 +109,9 @@ class Project:
 
     @projectIdentifier.setter
     def projectIdentifier(self, val: ProjectIdentifier) -> None:
-        self.__projectIdentifier = ProjectIdentifier(val)
+        self.__projectIdentifier = (
+            val if type(val) is ProjectIdentifier else ProjectIdentifier(val)
+        )
 
     @property
     def projectName(self) -> ProjectName:
@@ -94,7 +119,7 @@ class Project:
 
     @projectName.setter
     def projectName(self, val: ProjectName) -> None:
-        self.__projectName = ProjectName(val)
+        self.__projectName = val if type(val) is ProjectName else ProjectName(val)
 
     @property
     def projectDescriptionText(self) -> ProjectDescriptionText:
@@ -103,7 +128,9 @@ class Project:
     @projectDescriptionText.setter
     def projectDescriptionText(self, val: ProjectDescriptionText) -> None:
         self.__projectDescriptionText = (
-            None if val is None else ProjectDescriptionText(val)
+            val
+            if val is None or type(val) is ProjectDescriptionText
+            else ProjectDescriptionText(val)
         )
 
     @property
@@ -113,7 +140,9 @@ class Project:
     @samplingDesignTypeCode.setter
     def samplingDesignTypeCode(self, val: SamplingDesignTypeCode) -> None:
         self.__samplingDesignTypeCode = (
-            None if val is None else SamplingDesignTypeCode(val)
+            val
+            if val is None or type(val) is SamplingDesignTypeCode
+            else SamplingDesignTypeCode(val)
         )
 
     @property
@@ -122,7 +151,11 @@ class Project:
 
     @qAPPApprovedIndicator.setter
     def qAPPApprovedIndicator(self, val: QAPPApprovedIndicator) -> None:
-        self.__qAPPApprovedIndicator = None if val is None else QAPPApprovedIndicator(val)
+        self.__qAPPApprovedIndicator = (
+            val
+            if val is None or type(val) is QAPPApprovedIndicator
+            else QAPPApprovedIndicator(val)
+        )
 
     @property
     def qAPPApprovalAgencyName(self) -> QAPPApprovalAgencyName:
@@ -131,7 +164,9 @@ class Project:
     @qAPPApprovalAgencyName.setter
     def qAPPApprovalAgencyName(self, val: QAPPApprovalAgencyName) -> None:
         self.__qAPPApprovalAgencyName = (
-            None if val is None else QAPPApprovalAgencyName(val)
+            val
+            if val is None or type(val) is QAPPApprovalAgencyName
+            else QAPPApprovalAgencyName(val)
         )
 
     @property
@@ -177,30 +212,5 @@ class Project:
                 ProjectMonitoringLocationWeighting(val)
             ]
 
-    def generateXML(self, name: str = "Project") -> str:
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__projectIdentifier is None:
-                raise WQXException("Attribute 'projectIdentifier' is required.")
-            line("ProjectIdentifier", self.__projectIdentifier)
-            if self.__projectName is None:
-                raise WQXException("Attribute 'projectName' is required.")
-            line("ProjectName", self.__projectName)
-            if self.__projectDescriptionText is not None:
-                line("ProjectDescriptionText", self.__projectDescriptionText)
-            if self.__samplingDesignTypeCode is not None:
-                line("SamplingDesignTypeCode", self.__samplingDesignTypeCode)
-            if self.__qAPPApprovedIndicator is not None:
-                line("QAPPApprovedIndicator", self.__qAPPApprovedIndicator)
-            if self.__qAPPApprovalAgencyName is not None:
-                line("QAPPApprovalAgencyName", self.__qAPPApprovalAgencyName)
-            for x in self.__attachedBinaryObject:
-                asis(x.generateXML("AttachedBinaryObject"))
-            for x in self.__projectMonitoringLocationWeighting:
-                asis(x.generateXML("ProjectMonitoringLocationWeighting"))
-
-        return doc.getvalue()
+    def generateXML(self, name: str = "Project", writer: XMLWriter = None) -> str:
+        return encode(self, Project.schema, name, writer)
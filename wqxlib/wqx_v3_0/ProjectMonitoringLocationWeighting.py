@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .BibliographicReference import BibliographicReference
 from .MeasureCompact import MeasureCompact
 from .SimpleContent import (
@@ -15,12 +15,53 @@ from .SimpleContent import (
 )
 
 
-class ProjectMonitoringLocationWeighting:
+class ProjectMonitoringLocationWeighting(XMLFragment):
     """
     Describes the probability weighting information for a given Project / Monitoring
     Location Assignment.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "monitoringLocationIdentifier",
+            "MonitoringLocationIdentifier",
+            MonitoringLocationIdentifier,
+            minOccurs=1,
+        ),
+        Field(
+            "locationWeightingFactorMeasure",
+            "LocationWeightingFactorMeasure",
+            MeasureCompact,
+            minOccurs=1,
+        ),
+        Field("statisticalStratumText", "StatisticalStratumText", StatisticalStratumText),
+        Field("locationCategoryName", "LocationCategoryName", LocationCategoryName),
+        Field("locationStatusName", "LocationStatusName", LocationStatusName),
+        Field(
+            "referenceLocationTypeCode",
+            "ReferenceLocationTypeCode",
+            ReferenceLocationTypeCode,
+        ),
+        Field(
+            "referenceLocationStartDate",
+            "ReferenceLocationStartDate",
+            ReferenceLocationStartDate,
+        ),
+        Field(
+            "referenceLocationEndDate",
+            "ReferenceLocationEndDate",
+            ReferenceLocationEndDate,
+        ),
+        Field(
+            "referenceLocationCitation",
+            "ReferenceLocationCitation",
+            BibliographicReference,
+        ),
+        Field("commentText", "CommentText", CommentText),
+    )
+
     __monitoringLocationIdentifier: MonitoringLocationIdentifier
     __locationWeightingFactorMeasure: MeasureCompact
     __statisticalStratumText: StatisticalStratumText
@@ -90,7 +131,11 @@ class ProjectMonitoringLocationWeighting:
 
     @monitoringLocationIdentifier.setter
     def monitoringLocationIdentifier(self, val: MonitoringLocationIdentifier) -> None:
-        self.__monitoringLocationIdentifier = MonitoringLocationIdentifier(val)
+        self.__monitoringLocationIdentifier = (
+            val
+            if type(val) is MonitoringLocationIdentifier
+            else MonitoringLocationIdentifier(val)
+        )
 
     @property
     def locationWeightingFactorMeasure(self) -> MeasureCompact:
@@ -113,7 +158,9 @@ class ProjectMonitoringLocationWeighting:
     @statisticalStratumText.setter
     def statisticalStratumText(self, val: StatisticalStratumText) -> None:
         self.__statisticalStratumText = (
-            None if val is None else StatisticalStratumText(val)
+            val
+            if val is None or type(val) is StatisticalStratumText
+            else StatisticalStratumText(val)
         )
 
     @property
@@ -122,7 +169,11 @@ class ProjectMonitoringLocationWeighting:
 
     @locationCategoryName.setter
     def locationCategoryName(self, val: LocationCategoryName) -> None:
-        self.__locationCategoryName = None if val is None else LocationCategoryName(val)
+        self.__locationCategoryName = (
+            val
+            if val is None or type(val) is LocationCategoryName
+            else LocationCategoryName(val)
+        )
 
     @property
     def locationStatusName(self) -> LocationStatusName:
@@ -130,7 +181,11 @@ class ProjectMonitoringLocationWeighting:
 
     @locationStatusName.setter
     def locationStatusName(self, val: LocationStatusName) -> None:
-        self.__locationStatusName = None if val is None else LocationStatusName(val)
+        self.__locationStatusName = (
+            val
+            if val is None or type(val) is LocationStatusName
+            else LocationStatusName(val)
+        )
 
     @property
     def referenceLocationTypeCode(self) -> ReferenceLocationTypeCode:
@@ -139,7 +194,9 @@ class ProjectMonitoringLocationWeighting:
     @referenceLocationTypeCode.setter
     def referenceLocationTypeCode(self, val: ReferenceLocationTypeCode) -> None:
         self.__referenceLocationTypeCode = (
-            None if val is None else ReferenceLocationTypeCode(val)
+            val
+            if val is None or type(val) is ReferenceLocationTypeCode
+            else ReferenceLocationTypeCode(val)
         )
 
     @property
@@ -149,7 +206,9 @@ class ProjectMonitoringLocationWeighting:
     @referenceLocationStartDate.setter
     def referenceLocationStartDate(self, val: ReferenceLocationStartDate) -> None:
         self.__referenceLocationStartDate = (
-            None if val is None else ReferenceLocationStartDate(val)
+            val
+            if val is None or type(val) is ReferenceLocationStartDate
+            else ReferenceLocationStartDate(val)
         )
 
     @property
@@ -159,7 +218,9 @@ class ProjectMonitoringLocationWeighting:
     @referenceLocationEndDate.setter
     def referenceLocationEndDate(self, val: ReferenceLocationEndDate) -> None:
         self.__referenceLocationEndDate = (
-            None if val is None else ReferenceLocationEndDate(val)
+            val
+            if val is None or type(val) is ReferenceLocationEndDate
+            else ReferenceLocationEndDate(val)
         )
 
     @property
@@ -184,48 +245,11 @@ class ProjectMonitoringLocationWeighting:
 
     @commentText.setter
     def commentText(self, val: CommentText) -> None:
-        self.__commentText = None if val is None else CommentText(val)
+        self.__commentText = (
+            val if val is None or type(val) is CommentText else CommentText(val)
+        )
 
-    def generateXML(  # noqa: C901
-        self, name: str = "ProjectMonitoringLocationWeighting"
+    def generateXML(
+        self, name: str = "ProjectMonitoringLocationWeighting", writer: XMLWriter = None
     ) -> str:
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__monitoringLocationIdentifier is None:
-                raise WQXException(
-                    "Attribute 'monitoringLocationIdentifier' is required."
-                )
-            line("MonitoringLocationIdentifier", self.__monitoringLocationIdentifier)
-            if self.__locationWeightingFactorMeasure is None:
-                raise WQXException("Attribute 'measureCompact' is required.")
-            asis(
-                self.__locationWeightingFactorMeasure.generateXML(
-                    "LocationWeightingFactorMeasure"
-                )
-            )
-            if self.__statisticalStratumText is not None:
-                line("StatisticalStratumText", self.__statisticalStratumText)
-            if self.__locationCategoryName is not None:
-                line("LocationCategoryName", self.__locationCategoryName)
-            if self.__locationStatusName is not None:
-                line("LocationStatusName", self.__locationStatusName)
-            if self.__referenceLocationTypeCode is not None:
-                line("ReferenceLocationTypeCode", self.__referenceLocationTypeCode)
-            if self.__referenceLocationStartDate is not None:
-                line("ReferenceLocationStartDate", self.__referenceLocationStartDate)
-            if self.__referenceLocationEndDate is not None:
-                line("ReferenceLocationEndDate", self.__referenceLocationEndDate)
-            if self.__referenceLocationCitation is not None:
-                asis(
-                    self.__referenceLocationCitation.generateXML(
-                        "ReferenceLocationCitation"
-                    )
-                )
-            if self.__commentText is not None:
-                line("CommentText", self.__commentText)
-
-        return doc.getvalue()
+        return encode(self, ProjectMonitoringLocationWeighting.schema, name, writer)
@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import (
     MethodDescriptionText,
     MethodIdentifier,
@@ -10,12 +10,29 @@ from .SimpleContent import (
 )
 
 
-class ReferenceMethod:
+class ReferenceMethod(XMLFragment):
     """
     Identifies the procedures, processes, and references required to determine the
     methods used to obtain a result.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("methodIdentifier", "MethodIdentifier", MethodIdentifier, minOccurs=1),
+        Field(
+            "methodIdentifierContext",
+            "MethodIdentifierContext",
+            MethodIdentifierContext,
+            minOccurs=1,
+        ),
+        Field("methodName", "MethodName", MethodName, minOccurs=1),
+        Field(
+            "methodQualifierTypeName", "MethodQualifierTypeName", MethodQualifierTypeName
+        ),
+        Field("methodDescriptionText", "MethodDescriptionText", MethodDescriptionText),
+    )
+
     __methodIdentifier: MethodIdentifier
     __methodIdentifierContext: MethodIdentifierContext
     __methodName: MethodName
@@ -60,7 +77,9 @@ class ReferenceMethod:
 
     @methodIdentifier.setter
     def methodIdentifier(self, val: MethodIdentifier) -> None:
-        self.__methodIdentifier = None if val is None else MethodIdentifier(val)
+        self.__methodIdentifier = (
+            val if val is None or type(val) is MethodIdentifier else MethodIdentifier(val)
+        )
 
     @property
     def methodIdentifierContext(self) -> MethodIdentifierContext:
@@ -69,7 +88,9 @@ class ReferenceMethod:
     @methodIdentifierContext.setter
     def methodIdentifierContext(self, val: MethodIdentifierContext) -> None:
         self.__methodIdentifierContext = (
-            None if val is None else MethodIdentifierContext(val)
+            val
+            if val is None or type(val) is MethodIdentifierContext
+            else MethodIdentifierContext(val)
         )
 
     @property
@@ -78,7 +99,9 @@ class ReferenceMethod:
 
     @methodName.setter
     def methodName(self, val: MethodName) -> None:
-        self.__methodName = None if val is None else MethodName(val)
+        self.__methodName = (
+            val if val is None or type(val) is MethodName else MethodName(val)
+        )
 
     @property
     def methodQualifierTypeName(self) -> MethodQualifierTypeName:
@@ -87,7 +110,9 @@ class ReferenceMethod:
     @methodQualifierTypeName.setter
     def methodQualifierTypeName(self, val: MethodQualifierTypeName) -> None:
         self.__methodQualifierTypeName = (
-            None if val is None else MethodQualifierTypeName(val)
+            val
+            if val is None or type(val) is MethodQualifierTypeName
+            else MethodQualifierTypeName(val)
         )
 
     @property
@@ -96,26 +121,11 @@ class ReferenceMethod:
 
     @methodDescriptionText.setter
     def methodDescriptionText(self, val: MethodDescriptionText) -> None:
-        self.__methodDescriptionText = None if val is None else MethodDescriptionText(val)
-
-    def generateXML(self, name: str = "ReferenceMethod") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__methodIdentifier is None:
-                raise WQXException("Attribute 'MethodIdentifier' is required.")
-            line("MethodIdentifier", self.__methodIdentifier)
-            if self.__methodIdentifierContext is None:
-                raise WQXException("Attribute 'MethodIdentifierContext' is required.")
-            line("MethodIdentifierContext", self.__methodIdentifierContext)
-            if self.__methodName is None:
-                raise WQXException("Attribute 'MethodName' is required.")
-            line("MethodName", self.__methodName)
-            if self.__methodQualifierTypeName is not None:
-                line("MethodQualifierTypeName", self.__methodQualifierTypeName)
-            if self.__methodDescriptionText is not None:
-                line("MethodDescriptionText", self.__methodDescriptionText)
-
-        return doc.getvalue()
+        self.__methodDescriptionText = (
+            val
+            if val is None or type(val) is MethodDescriptionText
+            else MethodDescriptionText(val)
+        )
+
+    def generateXML(self, name: str = "ReferenceMethod", writer: XMLWriter = None) -> str:
+        return encode(self, ReferenceMethod.schema, name, writer)
@@ -1,8 +1,8 @@
 from typing import List, Union
 
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .AttachedBinaryObject import AttachedBinaryObject
 from .BiologicalResultDescription import BiologicalResultDescription
 from .ComparableAnalyticalMethod import ComparableAnalyticalMethod
@@ -12,11 +12,43 @@ from .ResultDescription import ResultDescription
 from .ResultLabInformation import ResultLabInformation
 
 
-class Result:
+class Result(XMLFragment):
     """
     Describes the results of a field measurement, observation, or laboratory analysis.
     """
 
+    __slots__ = ()
+
+    cacheXML = True
+
+    schema = (
+        Field("resultDescription", "ResultDescription", ResultDescription, minOccurs=1),
+        Field(
+            "biologicalResultDescription",
+            "BiologicalResultDescription",
+            BiologicalResultDescription,
+        ),
+        Field(
+            "attachedBinaryObject",
+            "AttachedBinaryObject",
+            AttachedBinaryObject,
+            maxOccurs=None,
+        ),
+        Field("resultAnalyticalMethod", "ResultAnalyticalMethod", ResultAnalyticalMethod),
+        Field(
+            "comparableAnalyticalMethod",
+            "ComparableAnalyticalMethod",
+            ComparableAnalyticalMethod,
+        ),
+        Field("resultLabInformation", "ResultLabInformation", ResultLabInformation),
+        Field(
+            "labSamplePreparation",
+            "LabSamplePreparation",
+            LabSamplePreparation,
+            maxOccurs=None,
+        ),
+    )
+
     __resultDescription: ResultDescription
     __biologicalResultDescription: BiologicalResultDescription
     __attachedBinaryObject: List[AttachedBinaryObject]
@@ -147,34 +179,5 @@ class Result:
         else:
             self.__labSamplePreparation = [LabSamplePreparation(val)]
 
-    def generateXML(self, name: str = "Result") -> str:
-        doc = Doc()
-        asis = doc.asis
-        tag = doc.tag
-
-        with tag(name):
-            if self.__resultDescription is None:
-                raise WQXException("Attribute 'resultDescription' is required.")
-            asis(self.__resultDescription.generateXML("ResultDescription"))
-            if self.__biologicalResultDescription is not None:
-                asis(
-                    self.__biologicalResultDescription.generateXML(
-                        "BiologicalResultDescription"
-                    )
-                )
-            for x in self.__attachedBinaryObject:
-                asis(x.generateXML("AttachedBinaryObject"))
-            if self.__resultAnalyticalMethod is not None:
-                asis(self.__resultAnalyticalMethod.generateXML("ResultAnalyticalMethod"))
-            if self.__comparableAnalyticalMethod is not None:
-                asis(
-                    self.__comparableAnalyticalMethod.generateXML(
-                        "ComparableAnalyticalMethod"
-                    )
-                )
-            if self.__resultLabInformation is not None:
-                asis(self.__resultLabInformation.generateXML("ResultLabInformation"))
-            for x in self.__labSamplePreparation:
-                asis(x.generateXML("LabSamplePreparation"))
-
-        return doc.getvalue()
+    def generateXML(self, name: str = "Result", writer: XMLWriter = None) -> str:
+        return encode(self, Result.schema, name, writer)
@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import (
     MethodDescriptionText,
     MethodIdentifier,
@@ -10,12 +10,29 @@ from .SimpleContent import (
 )
 
 
-class ResultAnalyticalMethod:
+class ResultAnalyticalMethod(XMLFragment):
     """
     Identifies the procedures, processes, and references required to determine the
     analytical methods used to obtain a result.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("methodIdentifier", "MethodIdentifier", MethodIdentifier, minOccurs=1),
+        Field(
+            "methodIdentifierContext",
+            "MethodIdentifierContext",
+            MethodIdentifierContext,
+            minOccurs=1,
+        ),
+        Field("methodName", "MethodName", MethodName),
+        Field(
+            "methodQualifierTypeName", "MethodQualifierTypeName", MethodQualifierTypeName
+        ),
+        Field("methodDescriptionText", "MethodDescriptionText", MethodDescriptionText),
+    )
+
     __methodIdentifier: MethodIdentifier
     __methodIdentifierContext: MethodIdentifierContext
     __methodName: MethodName
@@ -60,7 +77,9 @@ class ResultAnalyticalMethod:
 
     @methodIdentifier.setter
     def methodIdentifier(self, val: MethodIdentifier) -> None:
-        self.__methodIdentifier = MethodIdentifier(val)
+        self.__methodIdentifier = (
+            val if type(val) is MethodIdentifier else MethodIdentifier(val)
+        )
 
     @property
     def methodIdentifierContext(self) -> MethodIdentifierContext:
@@ -68,7 +87,9 @@ class ResultAnalyticalMethod:
 
     @methodIdentifierContext.setter
     def methodIdentifierContext(self, val: MethodIdentifierContext) -> None:
-        self.__methodIdentifierContext = MethodIdentifierContext(val)
+        self.__methodIdentifierContext = (
+            val if type(val) is MethodIdentifierContext else MethodIdentifierContext(val)
+        )
 
     @property
     def methodName(self) -> MethodName:
@@ -76,7 +97,9 @@ class ResultAnalyticalMethod:
 
     @methodName.setter
     def methodName(self, val: MethodName) -> None:
-        self.__methodName = None if val is None else MethodName(val)
+        self.__methodName = (
+            val if val is None or type(val) is MethodName else MethodName(val)
+        )
 
     @property
     def methodQualifierTypeName(self) -> MethodQualifierTypeName:
@@ -85,7 +108,9 @@ class ResultAnalyticalMethod:
     @methodQualifierTypeName.setter
     def methodQualifierTypeName(self, val: MethodQualifierTypeName) -> None:
         self.__methodQualifierTypeName = (
-            None if val is None else MethodQualifierTypeName(val)
+            val
+            if val is None or type(val) is MethodQualifierTypeName
+            else MethodQualifierTypeName(val)
         )
 
     @property
@@ -94,25 +119,13 @@ class ResultAnalyticalMethod:
 
     @methodDescriptionText.setter
     def methodDescriptionText(self, val: MethodDescriptionText) -> None:
-        self.__methodDescriptionText = None if val is None else MethodDescriptionText(val)
-
-    def generateXML(self, name: str = "ResultAnalyticalMethod") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__methodIdentifier is None:
-                raise WQXException("Attribute 'methodIdentifier' is required.")
-            line("MethodIdentifier", self.__methodIdentifier)
-            if self.__methodIdentifierContext is None:
-                raise WQXException("Attribute 'methodIdentifierContext' is required.")
-            line("MethodIdentifierContext", self.__methodIdentifierContext)
-            if self.__methodName is not None:
-                line("MethodName", self.__methodName)
-            if self.__methodQualifierTypeName is not None:
-                line("MethodQualifierTypeName", self.__methodQualifierTypeName)
-            if self.__methodDescriptionText is not None:
-                line("MethodDescriptionText", self.__methodDescriptionText)
-
-        return doc.getvalue()
+        self.__methodDescriptionText = (
+            val
+            if val is None or type(val) is MethodDescriptionText
+            else MethodDescriptionText(val)
+        )
+
+    def generateXML(
+        self, name: str = "ResultAnalyticalMethod", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, ResultAnalyticalMethod.schema, name, writer)
@@ -1,5 +1,6 @@
-from yattag import Doc
-
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .DataQualityIndicator import DataQuality
 from .Measure import Measure
 from .MeasureCompact import MeasureCompact
@@ -30,11 +31,90 @@ from .SimpleContent import (
 )
 
 
-class ResultDescription:
+class ResultDescription(XMLFragment):
     """
     Describes the results of a field measurement, observation, or laboratory analysis.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("dataLoggerLineName", "DataLoggerLineName", DataLoggerLineName),
+        Field(
+            "resultDetectionConditionText",
+            "ResultDetectionConditionText",
+            ResultDetectionConditionText,
+        ),
+        Field("characteristicName", "CharacteristicName", CharacteristicName),
+        Field(
+            "characteristicNameUserSupplied",
+            "CharacteristicNameUserSupplied",
+            CharacteristicNameUserSupplied,
+        ),
+        Field("methodSpeciationName", "MethodSpeciationName", MethodSpeciationName),
+        Field(
+            "resultSampleFractionText",
+            "ResultSampleFractionText",
+            ResultSampleFractionText,
+        ),
+        Field("resultMeasure", "ResultMeasure", Measure),
+        Field("targetCount", "TargetCount", TargetCount),
+        Field(
+            "proportionSampleProcessedNumeric",
+            "ProportionSampleProcessedNumeric",
+            ProportionSampleProcessedNumeric,
+        ),
+        Field("resultStatusIdentifier", "ResultStatusIdentifier", ResultStatusIdentifier),
+        Field("statisticalBaseCode", "StatisticalBaseCode", StatisticalBaseCode),
+        Field(
+            "statisticalNValueNumeric",
+            "StatisticalNValueNumeric",
+            StatisticalNValueNumeric,
+        ),
+        Field("resultValueTypeName", "ResultValueTypeName", ResultValueTypeName),
+        Field("resultWeightBasisText", "ResultWeightBasisText", ResultWeightBasisText),
+        Field("resultTimeBasisText", "ResultTimeBasisText", ResultTimeBasisText),
+        Field(
+            "resultTemperatureBasisText",
+            "ResultTemperatureBasisText",
+            ResultTemperatureBasisText,
+        ),
+        Field(
+            "resultParticleSizeBasisText",
+            "ResultParticleSizeBasisText",
+            ResultParticleSizeBasisText,
+        ),
+        Field("dataQuality", "DataQuality", DataQuality),
+        Field("resultCommentText", "ResultCommentText", CommentText),
+        Field("resultDepthHeightMeasure", "ResultDepthHeightMeasure", MeasureCompact),
+        Field(
+            "resultDepthAltitudeReferencePointText",
+            "ResultDepthAltitudeReferencePointText",
+            DepthAltitudeReferencePointText,
+        ),
+        Field(
+            "resultSamplingPointName", "ResultSamplingPointName", ResultSamplingPointName
+        ),
+        Field(
+            "resultSamplingPointType", "ResultSamplingPointType", ResultSamplingPointType
+        ),
+        Field(
+            "resultSamplingPointPlaceInSeries",
+            "ResultSamplingPointPlaceInSeries",
+            ResultSamplingPointPlaceInSeries,
+        ),
+        Field(
+            "resultSamplingPointCommentText",
+            "ResultSamplingPointCommentText",
+            ResultSamplingPointCommentText,
+        ),
+        Field(
+            "recordIdentifierUserSupplied",
+            "RecordIdentifierUserSupplied",
+            RecordIdentifierUserSupplied,
+        ),
+    )
+
     __dataLoggerLineName: DataLoggerLineName
     __resultDetectionConditionText: ResultDetectionConditionText
     __characteristicName: CharacteristicName
@@ -194,7 +274,11 @@ class ResultDescription:
 
     @dataLoggerLineName.setter
     def dataLoggerLineName(self, val: DataLoggerLineName) -> None:
-        self.__dataLoggerLineName = None if val is None else DataLoggerLineName(val)
+        self.__dataLoggerLineName = (
+            val
+            if val is None or type(val) is DataLoggerLineName
+            else DataLoggerLineName(val)
+        )
 
     @property
     def resultDetectionConditionText(self) -> ResultDetectionConditionText:
@@ -203,7 +287,9 @@ class ResultDescription:
     @resultDetectionConditionText.setter
     def resultDetectionConditionText(self, val: ResultDetectionConditionText) -> None:
         self.__resultDetectionConditionText = (
-            None if val is None else ResultDetectionConditionText(val)
+            val
+            if val is None or type(val) is ResultDetectionConditionText
+            else ResultDetectionConditionText(val)
         )
 
     @property
@@ -212,7 +298,11 @@ class ResultDescription:
 
     @characteristicName.setter
     def characteristicName(self, val: CharacteristicName) -> None:
-        self.__characteristicName = None if val is None else CharacteristicName(val)
+        self.__characteristicName = (
+            val
+            if val is None or type(val) is CharacteristicName
+            else CharacteristicName(val)
+        )
 
     @property
     def characteristicNameUserSupplied(self) -> CharacteristicNameUserSupplied:
@@ -221,7 +311,9 @@ class ResultDescription:
     @characteristicNameUserSupplied.setter
     def characteristicNameUserSupplied(self, val: CharacteristicNameUserSupplied) -> None:
         self.__characteristicNameUserSupplied = (
-            None if val is None else CharacteristicNameUserSupplied(val)
+            val
+            if val is None or type(val) is CharacteristicNameUserSupplied
+            else CharacteristicNameUserSupplied(val)
         )
 
     @property
@@ -230,7 +322,11 @@ class ResultDescription:
 
     @methodSpeciationName.setter
     def methodSpeciationName(self, val: MethodSpeciationName) -> None:
-        self.__methodSpeciationName = None if val is None else MethodSpeciationName(val)
+        self.__methodSpeciationName = (
+            val
+            if val is None or type(val) is MethodSpeciationName
+            else MethodSpeciationName(val)
+        )
 
     @property
     def resultSampleFractionText(self) -> ResultSampleFractionText:
@@ -239,7 +335,9 @@ class ResultDescription:
     @resultSampleFractionText.setter
     def resultSampleFractionText(self, val: ResultSampleFractionText) -> None:
         self.__resultSampleFractionText = (
-            None if val is None else ResultSampleFractionText(val)
+            val
+            if val is None or type(val) is ResultSampleFractionText
+            else ResultSampleFractionText(val)
         )
 
     @property
@@ -264,7 +362,9 @@ class ResultDescription:
 
     @targetCount.setter
     def targetCount(self, val: TargetCount) -> None:
-        self.__targetCount = None if val is None else TargetCount(val)
+        self.__targetCount = (
+            val if val is None or type(val) is TargetCount else TargetCount(val)
+        )
 
     @property
     def proportionSampleProcessedNumeric(self) -> ProportionSampleProcessedNumeric:
@@ -275,7 +375,9 @@ class ResultDescription:
         self, val: ProportionSampleProcessedNumeric
     ) -> None:
         self.__proportionSampleProcessedNumeric = (
-            None if val is None else ProportionSampleProcessedNumeric(val)
+            val
+            if val is None or type(val) is ProportionSampleProcessedNumeric
+            else ProportionSampleProcessedNumeric(val)
         )
 
     @property
@@ -285,7 +387,9 @@ class ResultDescription:
     @resultStatusIdentifier.setter
     def resultStatusIdentifier(self, val: ResultStatusIdentifier) -> None:
         self.__resultStatusIdentifier = (
-            None if val is None else ResultStatusIdentifier(val)
+            val
+            if val is None or type(val) is ResultStatusIdentifier
+            else ResultStatusIdentifier(val)
         )
 
     @property
@@ -294,7 +398,11 @@ class ResultDescription:
 
     @statisticalBaseCode.setter
     def statisticalBaseCode(self, val: StatisticalBaseCode) -> None:
-        self.__statisticalBaseCode = None if val is None else StatisticalBaseCode(val)
+        self.__statisticalBaseCode = (
+            val
+            if val is None or type(val) is StatisticalBaseCode
+            else StatisticalBaseCode(val)
+        )
 
     @property
     def statisticalNValueNumeric(self) -> StatisticalNValueNumeric:
@@ -303,7 +411,9 @@ class ResultDescription:
     @statisticalNValueNumeric.setter
     def statisticalNValueNumeric(self, val: StatisticalNValueNumeric) -> None:
         self.__statisticalNValueNumeric = (
-            None if val is None else StatisticalNValueNumeric(val)
+            val
+            if val is None or type(val) is StatisticalNValueNumeric
+            else StatisticalNValueNumeric(val)
         )
 
     @property
@@ -312,7 +422,11 @@ class ResultDescription:
 
     @resultValueTypeName.setter
     def resultValueTypeName(self, val: ResultValueTypeName) -> None:
-        self.__resultValueTypeName = None if val is None else ResultValueTypeName(val)
+        self.__resultValueTypeName = (
+            val
+            if val is None or type(val) is ResultValueTypeName
+            else ResultValueTypeName(val)
+        )
 
     @property
     def resultWeightBasisText(self) -> ResultWeightBasisText:
@@ -320,7 +434,11 @@ class ResultDescription:
 
     @resultWeightBasisText.setter
     def resultWeightBasisText(self, val: ResultWeightBasisText) -> None:
-        self.__resultWeightBasisText = None if val is None else ResultWeightBasisText(val)
+        self.__resultWeightBasisText = (
+            val
+            if val is None or type(val) is ResultWeightBasisText
+            else ResultWeightBasisText(val)
+        )
 
     @property
     def resultTimeBasisText(self) -> ResultTimeBasisText:
@@ -328,7 +446,11 @@ class ResultDescription:
 
     @resultTimeBasisText.setter
     def resultTimeBasisText(self, val: ResultTimeBasisText) -> None:
-        self.__resultTimeBasisText = None if val is None else ResultTimeBasisText(val)
+        self.__resultTimeBasisText = (
+            val
+            if val is None or type(val) is ResultTimeBasisText
+            else ResultTimeBasisText(val)
+        )
 
     @property
     def resultTemperatureBasisText(self) -> ResultTemperatureBasisText:
@@ -337,7 +459,9 @@ class ResultDescription:
     @resultTemperatureBasisText.setter
     def resultTemperatureBasisText(self, val: ResultTemperatureBasisText) -> None:
         self.__resultTemperatureBasisText = (
-            None if val is None else ResultTemperatureBasisText(val)
+            val
+            if val is None or type(val) is ResultTemperatureBasisText
+            else ResultTemperatureBasisText(val)
         )
 
     @property
@@ -347,7 +471,9 @@ class ResultDescription:
     @resultParticleSizeBasisText.setter
     def resultParticleSizeBasisText(self, val: ResultParticleSizeBasisText) -> None:
         self.__resultParticleSizeBasisText = (
-            None if val is None else ResultParticleSizeBasisText(val)
+            val
+            if val is None or type(val) is ResultParticleSizeBasisText
+            else ResultParticleSizeBasisText(val)
         )
 
     @property
@@ -370,7 +496,9 @@ class ResultDescription:
         """
         Free text with general comments concerning the result.
         """
-        self.__resultCommentText = None if val is None else CommentText(val)
+        self.__resultCommentText = (
+            val if val is None or type(val) is CommentText else CommentText(val)
+        )
 
     @property
     def resultDepthHeightMeasure(self) -> MeasureCompact:
@@ -405,7 +533,9 @@ class ResultDescription:
         depth/altitude of a result.
         """
         self.__resultDepthAltitudeReferencePointText = (
-            None if val is None else DepthAltitudeReferencePointText(val)
+            val
+            if val is None or type(val) is DepthAltitudeReferencePointText
+            else DepthAltitudeReferencePointText(val)
         )
 
     @property
@@ -415,7 +545,9 @@ class ResultDescription:
     @resultSamplingPointName.setter
     def resultSamplingPointName(self, val: ResultSamplingPointName) -> None:
         self.__resultSamplingPointName = (
-            None if val is None else ResultSamplingPointName(val)
+            val
+            if val is None or type(val) is ResultSamplingPointName
+            else ResultSamplingPointName(val)
         )
 
     @property
@@ -425,7 +557,9 @@ class ResultDescription:
     @resultSamplingPointType.setter
     def resultSamplingPointType(self, val: ResultSamplingPointType) -> None:
         self.__resultSamplingPointType = (
-            None if val is None else ResultSamplingPointType(val)
+            val
+            if val is None or type(val) is ResultSamplingPointType
+            else ResultSamplingPointType(val)
         )
 
     @property
@@ -437,7 +571,9 @@ class ResultDescription:
         self, val: ResultSamplingPointPlaceInSeries
     ) -> None:
         self.__resultSamplingPointPlaceInSeries = (
-            None if val is None else ResultSamplingPointPlaceInSeries(val)
+            val
+            if val is None or type(val) is ResultSamplingPointPlaceInSeries
+            else ResultSamplingPointPlaceInSeries(val)
         )
 
     @property
@@ -447,7 +583,9 @@ class ResultDescription:
     @resultSamplingPointCommentText.setter
     def resultSamplingPointCommentText(self, val: ResultSamplingPointCommentText) -> None:
         self.__resultSamplingPointCommentText = (
-            None if val is None else ResultSamplingPointCommentText(val)
+            val
+            if val is None or type(val) is ResultSamplingPointCommentText
+            else ResultSamplingPointCommentText(val)
         )
 
     @property
@@ -457,86 +595,12 @@ class ResultDescription:
     @recordIdentifierUserSupplied.setter
     def recordIdentifierUserSupplied(self, val: RecordIdentifierUserSupplied) -> None:
         self.__recordIdentifierUserSupplied = (
-            None if val is None else RecordIdentifierUserSupplied(val)
+            val
+            if val is None or type(val) is RecordIdentifierUserSupplied
+            else RecordIdentifierUserSupplied(val)
         )
 
-    def generateXML(self, name: str = "ResultDescription") -> str:  # noqa: C901
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__dataLoggerLineName is not None:
-                line("DataLoggerLineName", self.__dataLoggerLineName)
-            if self.__resultDetectionConditionText is not None:
-                line("ResultDetectionConditionText", self.__resultDetectionConditionText)
-            if self.__characteristicName is not None:
-                line("CharacteristicName", self.__characteristicName)
-            if self.__characteristicNameUserSupplied is not None:
-                line(
-                    "CharacteristicNameUserSupplied",
-                    self.__characteristicNameUserSupplied,
-                )
-            if self.__methodSpeciationName is not None:
-                line("MethodSpeciationName", self.__methodSpeciationName)
-            if self.__resultSampleFractionText is not None:
-                line("ResultSampleFractionText", self.__resultSampleFractionText)
-            if self.__resultMeasure is not None:
-                asis(self.__resultMeasure.generateXML("ResultMeasure"))
-            if self.__targetCount is not None:
-                line("TargetCount", self.__targetCount)
-            if self.__proportionSampleProcessedNumeric is not None:
-                line(
-                    "ProportionSampleProcessedNumeric",
-                    self.__proportionSampleProcessedNumeric,
-                )
-            if self.__resultStatusIdentifier is not None:
-                line("ResultStatusIdentifier", self.__resultStatusIdentifier)
-            if self.__statisticalBaseCode is not None:
-                line("StatisticalBaseCode", self.__statisticalBaseCode)
-            if self.__statisticalNValueNumeric is not None:
-                line("StatisticalNValueNumeric", self.__statisticalNValueNumeric)
-            if self.__resultValueTypeName is not None:
-                line("ResultValueTypeName", self.__resultValueTypeName)
-            if self.__resultWeightBasisText is not None:
-                line("ResultWeightBasisText", self.__resultWeightBasisText)
-            if self.__resultTimeBasisText is not None:
-                line("ResultTimeBasisText", self.__resultTimeBasisText)
-            if self.__resultTemperatureBasisText is not None:
-                line("ResultTemperatureBasisText", self.__resultTemperatureBasisText)
-            if self.__resultParticleSizeBasisText is not None:
-                line("ResultParticleSizeBasisText", self.__resultParticleSizeBasisText)
-            if self.__dataQuality is not None:
-                asis(self.__dataQuality.generateXML("DataQuality"))
-            if self.__resultCommentText is not None:
-                line("ResultCommentText", self.__resultCommentText)
-            if self.__resultDepthHeightMeasure is not None:
-                asis(
-                    self.__resultDepthHeightMeasure.generateXML(
-                        "ResultDepthHeightMeasure"
-                    )
-                )
-            if self.__resultDepthAltitudeReferencePointText is not None:
-                line(
-                    "ResultDepthAltitudeReferencePointText",
-                    self.__resultDepthAltitudeReferencePointText,
-                )
-            if self.__resultSamplingPointName is not None:
-                line("ResultSamplingPointName", self.__resultSamplingPointName)
-            if self.__resultSamplingPointType is not None:
-                line("ResultSamplingPointType", self.__resultSamplingPointType)
-            if self.__resultSamplingPointPlaceInSeries is not None:
-                line(
-                    "ResultSamplingPointPlaceInSeries",
-                    self.__resultSamplingPointPlaceInSeries,
-                )
-            if self.__resultSamplingPointCommentText is not None:
-                line(
-                    "ResultSamplingPointCommentText",
-                    self.__resultSamplingPointCommentText,
-                )
-            if self.__recordIdentifierUserSupplied is not None:
-                line("RecordIdentifierUserSupplied", self.__recordIdentifierUserSupplied)
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "ResultDescription", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, ResultDescription.schema, name, writer)
@@ -1,7 +1,8 @@
 from typing import List, Union
 
-from yattag import Doc
-
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .DetectionQuantitationLimit import DetectionQuantitationLimit
 from .SimpleContent import (
     AnalysisEndDate,
@@ -17,11 +18,53 @@ from .SimpleContent import (
 from .WQXTime import WQXTime
 
 
-class ResultLabInformation:
+class ResultLabInformation(XMLFragment):
     """
     Describes information obtained by a laboratory related to a specific laboratory analysis.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("laboratoryName", "LaboratoryName", LaboratoryName),
+        Field("analysisStartDate", "AnalysisStartDate", AnalysisStartDate),
+        Field("analysisStartTime", "AnalysisStartTime", WQXTime),
+        Field("analysisEndDate", "AnalysisEndDate", AnalysisEndDate),
+        Field("analysisEndTime", "AnalysisEndTime", WQXTime),
+        Field("laboratoryCommentText", "LaboratoryCommentText", LaboratoryCommentText),
+        Field(
+            "resultDetectionQuantitationLimit",
+            "ResultDetectionQuantitationLimit",
+            DetectionQuantitationLimit,
+            maxOccurs=None,
+        ),
+        Field(
+            "laboratorySampleSplitRatio",
+            "LaboratorySampleSplitRatio",
+            LaboratorySampleSplitRatio,
+        ),
+        Field(
+            "laboratoryAccreditationIndicator",
+            "LaboratoryAccreditationIndicator",
+            LaboratoryAccreditationIndicator,
+        ),
+        Field(
+            "laboratoryAccreditationAuthorityName",
+            "LaboratoryAccreditationAuthorityName",
+            LaboratoryAccreditationAuthorityName,
+        ),
+        Field(
+            "taxonomistAccreditationIndicator",
+            "TaxonomistAccreditationIndicator",
+            TaxonomistAccreditationIndicator,
+        ),
+        Field(
+            "taxonomistAccreditationAuthorityName",
+            "TaxonomistAccreditationAuthorityName",
+            TaxonomistAccreditationAuthorityName,
+        ),
+    )
+
     __laboratoryName: LaboratoryName
     __analysisStartDate: AnalysisStartDate
     __analysisStartTime: WQXTime
@@ -119,7 +162,9 @@ class ResultLabInformation:
 
     @laboratoryName.setter
     def laboratoryName(self, val: LaboratoryName) -> None:
-        self.__laboratoryName = None if val is None else LaboratoryName(val)
+        self.__laboratoryName = (
+            val if val is None or type(val) is LaboratoryName else LaboratoryName(val)
+        )
 
     @property
     def analysisStartDate(self) -> AnalysisStartDate:
@@ -127,7 +172,11 @@ class ResultLabInformation:
 
     @analysisStartDate.setter
     def analysisStartDate(self, val: AnalysisStartDate) -> None:
-        self.__analysisStartDate = None if val is None else AnalysisStartDate(val)
+        self.__analysisStartDate = (
+            val
+            if val is None or type(val) is AnalysisStartDate
+            else AnalysisStartDate(val)
+        )
 
     @property
     def analysisStartTime(self) -> WQXTime:
@@ -149,7 +198,9 @@ class ResultLabInformation:
 
     @analysisEndDate.setter
     def analysisEndDate(self, val: AnalysisEndDate) -> None:
-        self.__analysisEndDate = None if val is None else AnalysisEndDate(val)
+        self.__analysisEndDate = (
+            val if val is None or type(val) is AnalysisEndDate else AnalysisEndDate(val)
+        )
 
     @property
     def analysisEndTime(self) -> WQXTime:
@@ -171,7 +222,11 @@ class ResultLabInformation:
 
     @laboratoryCommentText.setter
     def laboratoryCommentText(self, val: LaboratoryCommentText) -> None:
-        self.__laboratoryCommentText = None if val is None else LaboratoryCommentText(val)
+        self.__laboratoryCommentText = (
+            val
+            if val is None or type(val) is LaboratoryCommentText
+            else LaboratoryCommentText(val)
+        )
 
     @property
     def resultDetectionQuantitationLimit(self) -> List[DetectionQuantitationLimit]:
@@ -206,7 +261,9 @@ class ResultLabInformation:
     @laboratorySampleSplitRatio.setter
     def laboratorySampleSplitRatio(self, val: LaboratorySampleSplitRatio) -> None:
         self.__laboratorySampleSplitRatio = (
-            None if val is None else LaboratorySampleSplitRatio(val)
+            val
+            if val is None or type(val) is LaboratorySampleSplitRatio
+            else LaboratorySampleSplitRatio(val)
         )
 
     @property
@@ -218,7 +275,9 @@ class ResultLabInformation:
         self, val: LaboratoryAccreditationIndicator
     ) -> None:
         self.__laboratoryAccreditationIndicator = (
-            None if val is None else LaboratoryAccreditationIndicator(val)
+            val
+            if val is None or type(val) is LaboratoryAccreditationIndicator
+            else LaboratoryAccreditationIndicator(val)
         )
 
     @property
@@ -232,7 +291,9 @@ class ResultLabInformation:
         self, val: LaboratoryAccreditationAuthorityName
     ) -> None:
         self.__laboratoryAccreditationAuthorityName = (
-            None if val is None else LaboratoryAccreditationAuthorityName(val)
+            val
+            if val is None or type(val) is LaboratoryAccreditationAuthorityName
+            else LaboratoryAccreditationAuthorityName(val)
         )
 
     @property
@@ -244,7 +305,9 @@ class ResultLabInformation:
         self, val: TaxonomistAccreditationIndicator
     ) -> None:
         self.__taxonomistAccreditationIndicator = (
-            None if val is None else TaxonomistAccreditationIndicator(val)
+            val
+            if val is None or type(val) is TaxonomistAccreditationIndicator
+            else TaxonomistAccreditationIndicator(val)
         )
 
     @property
@@ -258,51 +321,12 @@ class ResultLabInformation:
         self, val: TaxonomistAccreditationAuthorityName
     ) -> None:
         self.__taxonomistAccreditationAuthorityName = (
-            None if val is None else TaxonomistAccreditationAuthorityName(val)
+            val
+            if val is None or type(val) is TaxonomistAccreditationAuthorityName
+            else TaxonomistAccreditationAuthorityName(val)
         )
 
-    def generateXML(self, name: str = "ResultLabInformation") -> str:  # noqa: C901
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__laboratoryName is not None:
-                line("LaboratoryName", self.__laboratoryName)
-            if self.__analysisStartDate is not None:
-                line("AnalysisStartDate", self.__analysisStartDate)
-            if self.__analysisStartTime is not None:
-                asis(self.__analysisStartTime.generateXML("AnalysisStartTime"))
-            if self.__analysisEndDate is not None:
-                line("AnalysisEndDate", self.__analysisEndDate)
-            if self.__analysisEndTime is not None:
-                asis(self.__analysisEndTime.generateXML("AnalysisEndTime"))
-            if self.__laboratoryCommentText is not None:
-                line("LaboratoryCommentText", self.__laboratoryCommentText)
-            for x in self.__resultDetectionQuantitationLimit:
-                asis(x.generateXML("ResultDetectionQuantitationLimit"))
-            if self.__laboratorySampleSplitRatio is not None:
-                line("LaboratorySampleSplitRatio", self.__laboratorySampleSplitRatio)
-            if self.__laboratoryAccreditationIndicator is not None:
-                line(
-                    "LaboratoryAccreditationIndicator",
-                    self.__laboratoryAccreditationIndicator,
-                )
-            if self.__laboratoryAccreditationAuthorityName is not None:
-                line(
-                    "LaboratoryAccreditationAuthorityName",
-                    self.__laboratoryAccreditationAuthorityName,
-                )
-            if self.__taxonomistAccreditationIndicator is not None:
-                line(
-                    "TaxonomistAccreditationIndicator",
-                    self.__taxonomistAccreditationIndicator,
-                )
-            if self.__taxonomistAccreditationAuthorityName is not None:
-                line(
-                    "TaxonomistAccreditationAuthorityName",
-                    self.__taxonomistAccreditationAuthorityName,
-                )
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "ResultLabInformation", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, ResultLabInformation.schema, name, writer)
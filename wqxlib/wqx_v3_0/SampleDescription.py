@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .ReferenceMethod import ReferenceMethod
 from .SamplePreparation import SamplePreparation
 from .SimpleContent import (
@@ -11,18 +11,38 @@ from .SimpleContent import (
 )
 
 
-class SampleDescription:
+class SampleDescription(XMLFragment):
     """
     Basic identification information for the sample collected as part of a monitoring
     activity.
     """
 
-    __sampleCollectionMethod: ReferenceMethod = None
-    __sampleCollectionEquipmentName: SampleCollectionEquipmentName = None
-    __sampleCollectionEquipmentCommentText: SampleCollectionEquipmentCommentText = None
-    __samplePreparation: SamplePreparation = None
-    __hydrologicCondition: HydrologicCondition = None
-    __hydrologicEvent: HydrologicEvent = None
+    __slots__ = ()
+
+    schema = (
+        Field("sampleCollectionMethod", "SampleCollectionMethod", ReferenceMethod),
+        Field(
+            "sampleCollectionEquipmentName",
+            "SampleCollectionEquipmentName",
+            SampleCollectionEquipmentName,
+            minOccurs=1,
+        ),
+        Field(
+            "sampleCollectionEquipmentCommentText",
+            "SampleCollectionEquipmentCommentText",
+            SampleCollectionEquipmentCommentText,
+        ),
+        Field("samplePreparation", "SamplePreparation", SamplePreparation),
+        Field("hydrologicCondition", "HydrologicCondition", HydrologicCondition),
+        Field("hydrologicEvent", "HydrologicEvent", HydrologicEvent),
+    )
+
+    __sampleCollectionMethod: ReferenceMethod
+    __sampleCollectionEquipmentName: SampleCollectionEquipmentName
+    __sampleCollectionEquipmentCommentText: SampleCollectionEquipmentCommentText
+    __samplePreparation: SamplePreparation
+    __hydrologicCondition: HydrologicCondition
+    __hydrologicEvent: HydrologicEvent
 
     def __init__(
         self,
@@ -95,7 +115,9 @@ class SampleDescription:
     @sampleCollectionEquipmentName.setter
     def sampleCollectionEquipmentName(self, val: SampleCollectionEquipmentName) -> None:
         self.__sampleCollectionEquipmentName = (
-            None if val is None else SampleCollectionEquipmentName(val)
+            val
+            if val is None or type(val) is SampleCollectionEquipmentName
+            else SampleCollectionEquipmentName(val)
         )
 
     @property
@@ -109,7 +131,9 @@ class SampleDescription:
         self, val: SampleCollectionEquipmentCommentText
     ) -> None:
         self.__sampleCollectionEquipmentCommentText = (
-            None if val is None else SampleCollectionEquipmentCommentText(val)
+            val
+            if val is None or type(val) is SampleCollectionEquipmentCommentText
+            else SampleCollectionEquipmentCommentText(val)
         )
 
     @property
@@ -126,7 +150,11 @@ class SampleDescription:
 
     @hydrologicCondition.setter
     def hydrologicCondition(self, val: HydrologicCondition) -> None:
-        self.__hydrologicCondition = None if val is None else HydrologicCondition(val)
+        self.__hydrologicCondition = (
+            val
+            if val is None or type(val) is HydrologicCondition
+            else HydrologicCondition(val)
+        )
 
     @property
     def hydrologicEvent(self) -> HydrologicEvent:
@@ -134,32 +162,11 @@ class SampleDescription:
 
     @hydrologicEvent.setter
     def hydrologicEvent(self, val: HydrologicEvent) -> None:
-        self.__hydrologicEvent = None if val is None else HydrologicEvent(val)
-
-    def generateXML(self, name: str = "SampleDescription") -> str:
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__sampleCollectionMethod is not None:
-                asis(self.__sampleCollectionMethod.generateXML("SampleCollectionMethod"))
-            if self.__sampleCollectionEquipmentName is None:
-                raise WQXException(
-                    "Attribute 'sampleCollectionEquipmentName' is required."
-                )
-            line("SampleCollectionEquipmentName", self.__sampleCollectionEquipmentName)
-            if self.__sampleCollectionEquipmentCommentText is not None:
-                line(
-                    "SampleCollectionEquipmentCommentText",
-                    self.__sampleCollectionEquipmentCommentText,
-                )
-            if self.__samplePreparation is not None:
-                asis(self.__samplePreparation.generateXML("SamplePreparation"))
-            if self.__hydrologicCondition is not None:
-                line("HydrologicCondition", self.__hydrologicCondition)
-            if self.__hydrologicEvent is not None:
-                line("HydrologicEvent", self.__hydrologicEvent)
-
-        return doc.getvalue()
+        self.__hydrologicEvent = (
+            val if val is None or type(val) is HydrologicEvent else HydrologicEvent(val)
+        )
+
+    def generateXML(
+        self, name: str = "SampleDescription", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, SampleDescription.schema, name, writer)
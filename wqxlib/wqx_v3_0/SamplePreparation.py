@@ -1,5 +1,6 @@
-from yattag import Doc
-
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .ReferenceMethod import ReferenceMethod
 from .SimpleContent import (
     ChemicalPreservativeUsedName,
@@ -11,12 +12,46 @@ from .SimpleContent import (
 )
 
 
-class SamplePreparation:
+class SamplePreparation(XMLFragment):
     """
     Describes a sample preparation procedure which may be conducted on an initial Sample
     or on subsequent subsamples.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("samplePreparationMethod", "SamplePreparationMethod", ReferenceMethod),
+        Field(
+            "sampleContainerLabelName",
+            "SampleContainerLabelName",
+            SampleContainerLabelName,
+        ),
+        Field(
+            "sampleContainerTypeName", "SampleContainerTypeName", SampleContainerTypeName
+        ),
+        Field(
+            "sampleContainerColorName",
+            "SampleContainerColorName",
+            SampleContainerColorName,
+        ),
+        Field(
+            "chemicalPreservativeUsedName",
+            "ChemicalPreservativeUsedName",
+            ChemicalPreservativeUsedName,
+        ),
+        Field(
+            "thermalPreservativeUsedName",
+            "ThermalPreservativeUsedName",
+            ThermalPreservativeUsedName,
+        ),
+        Field(
+            "sampleTransportStorageDescription",
+            "SampleTransportStorageDescription",
+            SampleTransportStorageDescription,
+        ),
+    )
+
     __samplePreparationMethod: ReferenceMethod
     __sampleContainerLabelName: SampleContainerLabelName
     __sampleContainerTypeName: SampleContainerTypeName
@@ -90,7 +125,9 @@ class SamplePreparation:
     @sampleContainerLabelName.setter
     def sampleContainerLabelName(self, val: SampleContainerLabelName) -> None:
         self.__sampleContainerLabelName = (
-            None if val is None else SampleContainerLabelName(val)
+            val
+            if val is None or type(val) is SampleContainerLabelName
+            else SampleContainerLabelName(val)
         )
 
     @property
@@ -100,7 +137,9 @@ class SamplePreparation:
     @sampleContainerTypeName.setter
     def sampleContainerTypeName(self, val: SampleContainerTypeName) -> None:
         self.__sampleContainerTypeName = (
-            None if val is None else SampleContainerTypeName(val)
+            val
+            if val is None or type(val) is SampleContainerTypeName
+            else SampleContainerTypeName(val)
         )
 
     @property
@@ -110,7 +149,9 @@ class SamplePreparation:
     @sampleContainerColorName.setter
     def sampleContainerColorName(self, val: SampleContainerColorName) -> None:
         self.__sampleContainerColorName = (
-            None if val is None else SampleContainerColorName(val)
+            val
+            if val is None or type(val) is SampleContainerColorName
+            else SampleContainerColorName(val)
         )
 
     @property
@@ -120,7 +161,9 @@ class SamplePreparation:
     @chemicalPreservativeUsedName.setter
     def chemicalPreservativeUsedName(self, val: ChemicalPreservativeUsedName) -> None:
         self.__chemicalPreservativeUsedName = (
-            None if val is None else ChemicalPreservativeUsedName(val)
+            val
+            if val is None or type(val) is ChemicalPreservativeUsedName
+            else ChemicalPreservativeUsedName(val)
         )
 
     @property
@@ -130,7 +173,9 @@ class SamplePreparation:
     @thermalPreservativeUsedName.setter
     def thermalPreservativeUsedName(self, val: ThermalPreservativeUsedName) -> None:
         self.__thermalPreservativeUsedName = (
-            None if val is None else ThermalPreservativeUsedName(val)
+            val
+            if val is None or type(val) is ThermalPreservativeUsedName
+            else ThermalPreservativeUsedName(val)
         )
 
     @property
@@ -142,34 +187,12 @@ class SamplePreparation:
         self, val: SampleTransportStorageDescription
     ) -> None:
         self.__sampleTransportStorageDescription = (
-            None if val is None else SampleTransportStorageDescription(val)
+            val
+            if val is None or type(val) is SampleTransportStorageDescription
+            else SampleTransportStorageDescription(val)
         )
 
-    def generateXML(self, name: str = "SamplePreparation") -> str:
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__samplePreparationMethod is not None:
-                asis(
-                    self.__samplePreparationMethod.generateXML("SamplePreparationMethod")
-                )
-            if self.__sampleContainerLabelName is not None:
-                line("SampleContainerLabelName", self.__sampleContainerLabelName)
-            if self.__sampleContainerTypeName is not None:
-                line("SampleContainerTypeName", self.__sampleContainerTypeName)
-            if self.__sampleContainerColorName is not None:
-                line("SampleContainerColorName", self.__sampleContainerColorName)
-            if self.__chemicalPreservativeUsedName is not None:
-                line("ChemicalPreservativeUsedName", self.__chemicalPreservativeUsedName)
-            if self.__thermalPreservativeUsedName is not None:
-                line("ThermalPreservativeUsedName", self.__thermalPreservativeUsedName)
-            if self.__sampleTransportStorageDescription is not None:
-                line(
-                    "SampleTransportStorageDescription",
-                    self.__sampleTransportStorageDescription,
-                )
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "SamplePreparation", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, SamplePreparation.schema, name, writer)
@@ -2,8 +2,47 @@ from datetime import date, time
 from decimal import Decimal
 from typing import Union
 
-
-class ActivityConductingOrganizationText(str):
+# Values kept per class of text
+INTERNED = 4096
+
+
+class Interned(type):
+    """
+    Metaclass of the text simple content, which gives the same instance for equal
+    values. Names, codes and units repeat across many results, so each distinct value
+    is then stored and validated once. An instance of the class is given back as it
+    is, since it was validated when it was made. Up to INTERNED values are kept per
+    class, after which they are forgotten and kept anew. Values which cannot be hashed
+    are not kept at all.
+    """
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        cls.__values = {}
+
+    def __call__(cls, *args, **kwargs):
+        if len(args) != 1 or kwargs:
+            # Values given by keyword are made as usual, without being kept
+            return super().__call__(*args, **kwargs)
+        o = args[0]
+        if type(o) is cls:
+            # Instances were validated when they were made
+            return o
+        values = cls.__values
+        try:
+            return values[o]
+        except KeyError:
+            pass
+        except TypeError:
+            return super().__call__(o)
+        value = super().__call__(o)
+        if len(values) >= INTERNED:
+            values.clear()
+        values[o] = value
+        return value
+
+
+class ActivityConductingOrganizationText(str, metaclass=Interned):
     """
     A name of the Organization conducting an activity.
     """
@@ -24,7 +63,7 @@ class ActivityEndDate(date):
     pass
 
 
-class ActivityGroupIdentifier(str):
+class ActivityGroupIdentifier(str, metaclass=Interned):
     """
     Designator that uniquely identifies a grouping of activities within an organization.
     """
@@ -36,7 +75,7 @@ class ActivityGroupIdentifier(str):
             )
 
 
-class ActivityGroupName(str):
+class ActivityGroupName(str, metaclass=Interned):
     """
     A name of an activity group.
     """
@@ -46,7 +85,7 @@ class ActivityGroupName(str):
             raise ValueError("ActivityGroupName must be between 0 and 120 characters.")
 
 
-class ActivityGroupTypeCode(str):
+class ActivityGroupTypeCode(str, metaclass=Interned):
     """
     Identifies the type of grouping of a set of activities.
     """
@@ -58,7 +97,7 @@ class ActivityGroupTypeCode(str):
             )
 
 
-class ActivityIdentifier(str):
+class ActivityIdentifier(str, metaclass=Interned):
     """
     Designator that uniquely identifies an activity within an organization.
     """
@@ -68,7 +107,7 @@ class ActivityIdentifier(str):
             raise ValueError("ActivityIdentifier must be between 1 and 55 characters.")
 
 
-class ActivityIdentifierUserSupplied(str):
+class ActivityIdentifierUserSupplied(str, metaclass=Interned):
     """
     User Supplied Sample ID that uniquely identifies an activity within an organization.
     """
@@ -80,7 +119,7 @@ class ActivityIdentifierUserSupplied(str):
             )
 
 
-class ActivityLocationDescriptionText(str):
+class ActivityLocationDescriptionText(str, metaclass=Interned):
     """
     Text description of the activity location.
     """
@@ -92,7 +131,7 @@ class ActivityLocationDescriptionText(str):
             )
 
 
-class ActivityMediaName(str):
+class ActivityMediaName(str, metaclass=Interned):
     """
     Name or code indicating the environmental medium where the sample was taken.
     """
@@ -102,7 +141,7 @@ class ActivityMediaName(str):
             raise ValueError("ActivityMediaName must be between 1 and 20 characters.")
 
 
-class ActivityMediaSubdivisionName(str):
+class ActivityMediaSubdivisionName(str, metaclass=Interned):
     """
     Name or code indicating the environmental matrix as a subdivision of the sample
     media.
@@ -115,7 +154,7 @@ class ActivityMediaSubdivisionName(str):
             )
 
 
-class ActivityRelativeDepthName(str):
+class ActivityRelativeDepthName(str, metaclass=Interned):
     """
     The name that indicates the approximate location within the water column at which
     the activity occurred.
@@ -136,7 +175,7 @@ class ActivityStartDate(date):
     pass
 
 
-class ActivityTypeCode(str):
+class ActivityTypeCode(str, metaclass=Interned):
     """
     The text describing the type of activity.
     """
@@ -146,7 +185,7 @@ class ActivityTypeCode(str):
             raise ValueError("ActivityTypeCode must be between 1 and 70 characters.")
 
 
-class AddressText(str):
+class AddressText(str, metaclass=Interned):
     """
     The address that describes the physical (geographic), shipping, or mailing location
     of an organization.
@@ -157,7 +196,7 @@ class AddressText(str):
             raise ValueError("AddressText must be between 0 and 50 characters.")
 
 
-class AddressTypeName(str):
+class AddressTypeName(str, metaclass=Interned):
     """
     Categorizes an address as either location, shipping, or mailing address.
     """
@@ -183,7 +222,7 @@ class AnalysisStartDate(date):
     pass
 
 
-class LocalAquiferCode(str):
+class LocalAquiferCode(str, metaclass=Interned):
     """
     The identification number or code assigned by the aquifer publisher.
     """
@@ -193,7 +232,7 @@ class LocalAquiferCode(str):
             raise ValueError("LocalAquiferCode must be between 0 and 120 characters.")
 
 
-class LocalAquiferCodeContext(str):
+class LocalAquiferCodeContext(str, metaclass=Interned):
     """
     The code that Identifies the source or data system that created or defined the
     identifier.
@@ -206,7 +245,7 @@ class LocalAquiferCodeContext(str):
             )
 
 
-class LocalAquiferDescriptionText(str):
+class LocalAquiferDescriptionText(str, metaclass=Interned):
     """
     Information that further describes an aquifer.
     """
@@ -218,7 +257,7 @@ class LocalAquiferDescriptionText(str):
             )
 
 
-class LocalAquiferName(str):
+class LocalAquiferName(str, metaclass=Interned):
     """
     The name associated with the aquifer from the aquifer publisher.
     """
@@ -228,7 +267,7 @@ class LocalAquiferName(str):
             raise ValueError("LocalAquiferName must be between 0 and 255 characters.")
 
 
-class AquiferTypeName(str):
+class AquiferTypeName(str, metaclass=Interned):
     """
     The type of aquifer, such as confined or unconfined.
     """
@@ -238,7 +277,7 @@ class AquiferTypeName(str):
             raise ValueError("AquiferTypeName must be between 0 and 255 characters.")
 
 
-class AssemblageSampledName(str):
+class AssemblageSampledName(str, metaclass=Interned):
     """
     An association of interacting populations of organisms in a given waterbody.
     """
@@ -250,7 +289,7 @@ class AssemblageSampledName(str):
             )
 
 
-class BiasValue(str):
+class BiasValue(str, metaclass=Interned):
     """
     The systematic or persistent distortion of a measurement process which causes error
     in one direction.
@@ -261,7 +300,7 @@ class BiasValue(str):
             raise ValueError("BiasValue must be between 0 and 60 characters.")
 
 
-class BiologicalIntentName(str):
+class BiologicalIntentName(str, metaclass=Interned):
     """
     The primary reason the biological monitoring has occurred.
     """
@@ -271,7 +310,7 @@ class BiologicalIntentName(str):
             raise ValueError("BiologicalIntentName must be between 0 and 35 characters.")
 
 
-class BiologicalIndividualIdentifier(str):
+class BiologicalIndividualIdentifier(str, metaclass=Interned):
     """
     A number uniquely identifying the individual in accordance with the total number of
     individuals reported by the user.
@@ -284,7 +323,7 @@ class BiologicalIndividualIdentifier(str):
             )
 
 
-class BinaryObjectFileName(str):
+class BinaryObjectFileName(str, metaclass=Interned):
     """
     The text describing the descriptive name used to represent the file, including file
     extension.
@@ -297,7 +336,7 @@ class BinaryObjectFileName(str):
             )
 
 
-class BinaryObjectFileTypeCode(str):
+class BinaryObjectFileTypeCode(str, metaclass=Interned):
     """
     The text or acronym describing the binary content type of a file.
     """
@@ -309,7 +348,7 @@ class BinaryObjectFileTypeCode(str):
             )
 
 
-class CellFormName(str):
+class CellFormName(str, metaclass=Interned):
     """
     The name of the cell form for phytoplankton organisms expressed as a result. A single
     phytoplankton species may have a result value for any or all of these cell forms.
@@ -320,7 +359,7 @@ class CellFormName(str):
             raise ValueError("CellFormName must be between 0 and 11 characters.")
 
 
-class CellShapeName(str):
+class CellShapeName(str, metaclass=Interned):
     """
     The cell shape of the phytoplankton organism.
     """
@@ -330,7 +369,7 @@ class CellShapeName(str):
             raise ValueError("CellShapeName must be between 0 and 18 characters.")
 
 
-class CharacteristicName(str):
+class CharacteristicName(str, metaclass=Interned):
     """
     The object, property, or substance which is evaluated or enumerated by either a
     direct field measurement, a direct field observation, or by laboratory analysis of
@@ -342,7 +381,7 @@ class CharacteristicName(str):
             raise ValueError("CharacteristicName must be between 0 and 255 characters.")
 
 
-class CharacteristicNameUserSupplied(str):
+class CharacteristicNameUserSupplied(str, metaclass=Interned):
     """
     The object, property, or substance which is evaluated or enumerated by either a
     direct field measurement, a direct field observation, or by laboratory analysis of
@@ -356,7 +395,7 @@ class CharacteristicNameUserSupplied(str):
             )
 
 
-class ChemicalPreservativeUsedName(str):
+class ChemicalPreservativeUsedName(str, metaclass=Interned):
     """
     Information describing the chemical means to preserve the sample.
     """
@@ -368,7 +407,7 @@ class ChemicalPreservativeUsedName(str):
             )
 
 
-class CollectionDescriptionText(str):
+class CollectionDescriptionText(str, metaclass=Interned):
     """
     Remark / Text description of the reach length.
     """
@@ -380,7 +419,7 @@ class CollectionDescriptionText(str):
             )
 
 
-class CommentText(str):
+class CommentText(str, metaclass=Interned):
     """
     Free text with general comments.
     """
@@ -390,7 +429,7 @@ class CommentText(str):
             raise ValueError("CommentText must be between 0 and 4000 characters.")
 
 
-class ConfidenceIntervalValue(str):
+class ConfidenceIntervalValue(str, metaclass=Interned):
     """
     A range of values constructed so that this range has a specified probability of
     including the true population mean.
@@ -411,7 +450,7 @@ class ConstructionDate(date):
     pass
 
 
-class CountryCode(str):
+class CountryCode(str, metaclass=Interned):
     """
     A code designator used to identify a primary geopolitical unit of the world.
     """
@@ -421,7 +460,7 @@ class CountryCode(str):
             raise ValueError("CountryCode must be between 0 and 2 characters.")
 
 
-class CountyCode(str):
+class CountyCode(str, metaclass=Interned):
     """
     A code designator used to identify a U.S. county or county equivalent.
     """
@@ -431,7 +470,7 @@ class CountyCode(str):
             raise ValueError("CountyCode must be between 0 and 3 characters.")
 
 
-class DataLoggerLineName(str):
+class DataLoggerLineName(str, metaclass=Interned):
     """
     The unique line identifier from a data logger result text file, normally a date/time
     format but could be any user defined name, e.g. "surface", "midwinter", and or
@@ -443,7 +482,7 @@ class DataLoggerLineName(str):
             raise ValueError("DataLoggerLineName must be between 0 and 60 characters.")
 
 
-class DepthAltitudeReferencePointText(str):
+class DepthAltitudeReferencePointText(str, metaclass=Interned):
     """
     The reference used to indicate the datum or reference used to establish a
     depth/altitude measurement.
@@ -456,7 +495,7 @@ class DepthAltitudeReferencePointText(str):
             )
 
 
-class DetectionQuantitationLimitTypeName(str):
+class DetectionQuantitationLimitTypeName(str, metaclass=Interned):
     """
     Text describing the type of detection or quantitation level used in the analysis of
     a characteristic.
@@ -469,7 +508,7 @@ class DetectionQuantitationLimitTypeName(str):
             )
 
 
-class DetectionQuantitationLimitCommentText(str):
+class DetectionQuantitationLimitCommentText(str, metaclass=Interned):
     """
     Text providing further description and comment on the detection and/or quantitation
     limits.
@@ -483,7 +522,7 @@ class DetectionQuantitationLimitCommentText(str):
             )
 
 
-class ElectronicAddressText(str):
+class ElectronicAddressText(str, metaclass=Interned):
     """
     A resource address, usually consisting of the access protocol, the domain name, and
     optionally, the path to a file or location.
@@ -496,7 +535,7 @@ class ElectronicAddressText(str):
             )
 
 
-class ElectronicAddressTypeName(str):
+class ElectronicAddressTypeName(str, metaclass=Interned):
     """
     The name that describes the electronic address type.
     """
@@ -508,7 +547,7 @@ class ElectronicAddressTypeName(str):
             )
 
 
-class RecordIdentifierUserSupplied(str):
+class RecordIdentifierUserSupplied(str, metaclass=Interned):
     """
     The user supplied record identifier associated with data entered.
     """
@@ -520,7 +559,7 @@ class RecordIdentifierUserSupplied(str):
             )
 
 
-class FormulaDescriptionText(str):
+class FormulaDescriptionText(str, metaclass=Interned):
     """
     Provides a description of the formula used to calculate the activity metric score.
     """
@@ -532,7 +571,7 @@ class FormulaDescriptionText(str):
             )
 
 
-class FormationTypeText(str):
+class FormationTypeText(str, metaclass=Interned):
     """
     Name of the primary formation or soils unit, in which the well is completed.
     """
@@ -542,7 +581,7 @@ class FormationTypeText(str):
             raise ValueError("FormationTypeText must be between 0 and 50 characters.")
 
 
-class FrequencyClassDescriptorCode(str):
+class FrequencyClassDescriptorCode(str, metaclass=Interned):
     """
     A code that describes the frequency class, either as a life stage, abnormality,
     gender, or measurable characteristic (i.e. length, weight) used to categorize a
@@ -556,7 +595,7 @@ class FrequencyClassDescriptorCode(str):
             )
 
 
-class FrequencyClassDescriptorUnitCode(str):
+class FrequencyClassDescriptorUnitCode(str, metaclass=Interned):
     """
     The code that represents the unit for measuring the item.
     """
@@ -568,7 +607,7 @@ class FrequencyClassDescriptorUnitCode(str):
             )
 
 
-class FunctionalFeedingGroupName(str):
+class FunctionalFeedingGroupName(str, metaclass=Interned):
     """
     For entries representing taxa, a code representing the functional feeding group with
     which the reported taxon is typically associated.
@@ -581,7 +620,7 @@ class FunctionalFeedingGroupName(str):
             )
 
 
-class GearProcedureUnitCode(str):
+class GearProcedureUnitCode(str, metaclass=Interned):
     """
     The procedural code or equipment that represents the unit for measuring the effort.
     """
@@ -593,7 +632,7 @@ class GearProcedureUnitCode(str):
             )
 
 
-class GroupSummaryCount(str):
+class GroupSummaryCount(str, metaclass=Interned):
     """
     Captures the total count for a Group Summary.
     """
@@ -603,7 +642,7 @@ class GroupSummaryCount(str):
             raise ValueError("GroupSummaryCount must be between 0 and 60 characters.")
 
 
-class HabitName(str):
+class HabitName(str, metaclass=Interned):
     """
     The position that the characteristic occupies in a food chain.
     """
@@ -613,7 +652,7 @@ class HabitName(str):
             raise ValueError("HabitName must be between 0 and 15 characters.")
 
 
-class HabitatSelectionMethod(str):
+class HabitatSelectionMethod(str, metaclass=Interned):
     """
     The monitoring approach by which each habitat was chosen to sample. (e.g. random).
     """
@@ -625,7 +664,7 @@ class HabitatSelectionMethod(str):
             )
 
 
-class HorizontalCollectionMethodName(str):
+class HorizontalCollectionMethodName(str, metaclass=Interned):
     """
     The name that identifies the method used to determine the latitude and longitude
     coordinates for a point on the earth.
@@ -638,7 +677,7 @@ class HorizontalCollectionMethodName(str):
             )
 
 
-class HorizontalCoordinateReferenceSystemDatumName(str):
+class HorizontalCoordinateReferenceSystemDatumName(str, metaclass=Interned):
     """
     The name that describes the reference datum used in determining latitude and
     longitude coordinates.
@@ -652,7 +691,7 @@ class HorizontalCoordinateReferenceSystemDatumName(str):
             )
 
 
-class HUCEightDigitCode(str):
+class HUCEightDigitCode(str, metaclass=Interned):
     """
     The 8 digit federal code used to identify the hydrologic unit of the monitoring
     location to the cataloging unit level of precision.
@@ -663,7 +702,7 @@ class HUCEightDigitCode(str):
             raise ValueError("HUCEightDigitCode must be between 0 and 8 characters.")
 
 
-class HUCTwelveDigitCode(str):
+class HUCTwelveDigitCode(str, metaclass=Interned):
     """
     The 12 digit federal code used to identify the hydrologic unit of the monitoring
     location to the subwatershed level of precision.
@@ -674,7 +713,7 @@ class HUCTwelveDigitCode(str):
             raise ValueError("HUCTwelveDigitCode must be between 0 and 12 characters.")
 
 
-class HydrologicCondition(str):
+class HydrologicCondition(str, metaclass=Interned):
     """
     Hydrologic condition is the hydrologic condition that is represented by the sample
     collected (i.e. ? normal, falling, rising, peak stage).
@@ -685,7 +724,7 @@ class HydrologicCondition(str):
             raise ValueError("HydrologicCondition must be between 0 and 60 characters.")
 
 
-class HydrologicEvent(str):
+class HydrologicEvent(str, metaclass=Interned):
     """
     A hydrologic event that is represented by the sample collected (i.e. - storm,
     drought, snowmelt).
@@ -704,7 +743,7 @@ class IndexCalculatedDate(date):
     pass
 
 
-class IndexIdentifier(str):
+class IndexIdentifier(str, metaclass=Interned):
     """
     A unique designator used to identify a unique index record that the activity metric
     is associated with.
@@ -715,7 +754,7 @@ class IndexIdentifier(str):
             raise ValueError("IndexIdentifier must be between 1 and 55 characters.")
 
 
-class IndexQualifierCode(str):
+class IndexQualifierCode(str, metaclass=Interned):
     """
     A code used to identify any qualifying issues that affect the index.
     """
@@ -725,7 +764,7 @@ class IndexQualifierCode(str):
             raise ValueError("IndexQualifierCode must be between 0 and 35 characters.")
 
 
-class IndexScore(str):
+class IndexScore(str, metaclass=Interned):
     """
     Provides the score for the index.
     """
@@ -735,7 +774,7 @@ class IndexScore(str):
             raise ValueError("IndexScore must be between 0 and 60 characters.")
 
 
-class IndexTypeIdentifier(str):
+class IndexTypeIdentifier(str, metaclass=Interned):
     """
     A designator used to describe the unique name, number, or code assigned to identify
     the index (Organization specific).
@@ -746,7 +785,7 @@ class IndexTypeIdentifier(str):
             raise ValueError("IndexTypeIdentifier must be between 1 and 50 characters.")
 
 
-class IndexTypeIdentifierContext(str):
+class IndexTypeIdentifierContext(str, metaclass=Interned):
     """
     Identifies the source or data system that created or defined the index.
     """
@@ -758,7 +797,7 @@ class IndexTypeIdentifierContext(str):
             )
 
 
-class IndexTypeName(str):
+class IndexTypeName(str, metaclass=Interned):
     """
     Name of the habitat or biotic integrity index.
     """
@@ -768,7 +807,7 @@ class IndexTypeName(str):
             raise ValueError("IndexTypeName must be between 0 and 100 characters.")
 
 
-class IndexTypeScaleText(str):
+class IndexTypeScaleText(str, metaclass=Interned):
     """
     Provides a description of the scale used for the index.
     """
@@ -795,7 +834,7 @@ class LaboratoryAccreditationIndicator(object):
         return self.__o
 
 
-class LaboratoryAccreditationAuthorityName(str):
+class LaboratoryAccreditationAuthorityName(str, metaclass=Interned):
     """
     An outside accreditation authority identifier.
     """
@@ -808,7 +847,7 @@ class LaboratoryAccreditationAuthorityName(str):
             )
 
 
-class LaboratoryName(str):
+class LaboratoryName(str, metaclass=Interned):
     """
     The name of Lab responsible for the result.
     """
@@ -818,7 +857,7 @@ class LaboratoryName(str):
             raise ValueError("LaboratoryName must be between 0 and 60 characters.")
 
 
-class LaboratorySampleSplitRatio(str):
+class LaboratorySampleSplitRatio(str, metaclass=Interned):
     """
     The proportion of all of the material collected that was sent to lab for analysis.
     """
@@ -843,7 +882,7 @@ class LatitudeMeasure(Decimal):
         return super().__new__(cls, ".".join(s))
 
 
-class LocalityName(str):
+class LocalityName(str, metaclass=Interned):
     """
     The name of a city, town, village or other locality.
     """
@@ -853,7 +892,7 @@ class LocalityName(str):
             raise ValueError("LocalityName must be between 0 and 30 characters.")
 
 
-class LocationCategoryName(str):
+class LocationCategoryName(str, metaclass=Interned):
     """
     Free text describing a category of naturally similar site types, such as
     high-gradient.
@@ -864,7 +903,7 @@ class LocationCategoryName(str):
             raise ValueError("LocationCategoryName must be between 0 and 50 characters.")
 
 
-class LocationStatusName(str):
+class LocationStatusName(str, metaclass=Interned):
     """
     Indicates whether this site is active and available for sampling.
     """
@@ -887,7 +926,7 @@ class LongitudeMeasure(float):
         return super().__new__(cls, ".".join(s))
 
 
-class LowerConfidenceLimitValue(str):
+class LowerConfidenceLimitValue(str, metaclass=Interned):
     """
     Value of the lower end of the confidence interval.
     """
@@ -899,7 +938,7 @@ class LowerConfidenceLimitValue(str):
             )
 
 
-class LowerClassBoundValue(str):
+class LowerClassBoundValue(str, metaclass=Interned):
     """
     This described the lower bound for a frequency class descriptor.
     """
@@ -909,7 +948,7 @@ class LowerClassBoundValue(str):
             raise ValueError("LowerClassBoundValue must be between 0 and 60 characters.")
 
 
-class MeasureQualifierCode(str):
+class MeasureQualifierCode(str, metaclass=Interned):
     """
     A code used to identify any qualifying issues that affect the results.
     """
@@ -919,7 +958,7 @@ class MeasureQualifierCode(str):
             raise ValueError("MeasureQualifierCode must be between 0 and 35 characters.")
 
 
-class MeasureUnitCode(str):
+class MeasureUnitCode(str, metaclass=Interned):
     """
     The code that represents the unit for measuring the item.
     """
@@ -929,7 +968,7 @@ class MeasureUnitCode(str):
             raise ValueError("MeasureUnitCode must be between 0 and 12 characters.")
 
 
-class MeasureValue(str):
+class MeasureValue(str, metaclass=Interned):
     """
     The recorded dimension, capacity, quality, or amount of something ascertained by
     measuring or observing.
@@ -940,7 +979,7 @@ class MeasureValue(str):
             raise ValueError("MeasureValue must be between 0 and 60 characters.")
 
 
-class MeasureValueTargeted(str):
+class MeasureValueTargeted(str, metaclass=Interned):
     """
     The targeted value of the recorded dimension, capacity, quality, or amount of
     something ascertained by measuring or observing.
@@ -951,7 +990,7 @@ class MeasureValueTargeted(str):
             raise ValueError("MeasureValueTargeted must be between 0 and 60 characters.")
 
 
-class MeasureUnitCodeTargeted(str):
+class MeasureUnitCodeTargeted(str, metaclass=Interned):
     """
     The code that represents the unit for measuring the item.
     """
@@ -963,7 +1002,7 @@ class MeasureUnitCodeTargeted(str):
             )
 
 
-class MethodDescriptionText(str):
+class MethodDescriptionText(str, metaclass=Interned):
     """
     A brief summary that provides general information about the method.
     """
@@ -975,7 +1014,7 @@ class MethodDescriptionText(str):
             )
 
 
-class MethodIdentifier(str):
+class MethodIdentifier(str, metaclass=Interned):
     """
     The identification number or code assigned by the method publisher.
     """
@@ -985,7 +1024,7 @@ class MethodIdentifier(str):
             raise ValueError("MethodIdentifier must be between 1 and 35 characters.")
 
 
-class MethodIdentifierContext(str):
+class MethodIdentifierContext(str, metaclass=Interned):
     """
     Identifies the source or data system that created or defined the identifier.
     """
@@ -997,7 +1036,7 @@ class MethodIdentifierContext(str):
             )
 
 
-class MethodModificationText(str):
+class MethodModificationText(str, metaclass=Interned):
     """
     A brief summary that provides general information about the modification of the
     method.
@@ -1010,7 +1049,7 @@ class MethodModificationText(str):
             )
 
 
-class MethodName(str):
+class MethodName(str, metaclass=Interned):
     """
     The title that appears on the method from the method publisher.
     """
@@ -1020,7 +1059,7 @@ class MethodName(str):
             raise ValueError("MethodName must be between 1 and 250 characters.")
 
 
-class MethodQualifierTypeName(str):
+class MethodQualifierTypeName(str, metaclass=Interned):
     """
     Identifier of type of method that identifies it as reference, equivalent, or other.
     """
@@ -1032,7 +1071,7 @@ class MethodQualifierTypeName(str):
             )
 
 
-class MethodSpeciationName(str):
+class MethodSpeciationName(str, metaclass=Interned):
     """
     Identifies the chemical speciation in which the measured result is expressed.
     """
@@ -1042,7 +1081,7 @@ class MethodSpeciationName(str):
             raise ValueError("MethodSpeciationName must be between 0 and 20 characters.")
 
 
-class MetricTypeIdentifier(str):
+class MetricTypeIdentifier(str, metaclass=Interned):
     """
     A designator used to describe the unique name, number, or code assigned to identify
     the metric (Organization specific).
@@ -1053,7 +1092,7 @@ class MetricTypeIdentifier(str):
             raise ValueError("MetricTypeIdentifier must be between 0 and 50 characters.")
 
 
-class MetricTypeIdentifierContext(str):
+class MetricTypeIdentifierContext(str, metaclass=Interned):
     """
     Identifies the source or data system that created or defined the metric.
     """
@@ -1065,7 +1104,7 @@ class MetricTypeIdentifierContext(str):
             )
 
 
-class MetricTypeName(str):
+class MetricTypeName(str, metaclass=Interned):
     """
     Name of the activity metric.
     """
@@ -1075,7 +1114,7 @@ class MetricTypeName(str):
             raise ValueError("MetricTypeName must be between 0 and 100 characters.")
 
 
-class MetricSamplingPointPlaceInSeries(str):
+class MetricSamplingPointPlaceInSeries(str, metaclass=Interned):
     """
     The order in which a single point within a sampling frame was visited in relation to
     other components.
@@ -1088,7 +1127,7 @@ class MetricSamplingPointPlaceInSeries(str):
             )
 
 
-class MetricScore(str):
+class MetricScore(str, metaclass=Interned):
     """
     Provides the scaled or calculated score for the activity metric.
     """
@@ -1098,7 +1137,7 @@ class MetricScore(str):
             raise ValueError("MetricScore must be between 0 and 60 characters.")
 
 
-class MetricTypeScaleText(str):
+class MetricTypeScaleText(str, metaclass=Interned):
     """
     Provides a description of the scale used for the activity metric.
     """
@@ -1108,7 +1147,7 @@ class MetricTypeScaleText(str):
             raise ValueError("MetricTypeScaleText must be between 0 and 50 characters.")
 
 
-class MonitoringLocationDescriptionText(str):
+class MonitoringLocationDescriptionText(str, metaclass=Interned):
     """
     Text description of the monitoring location.
     """
@@ -1120,7 +1159,7 @@ class MonitoringLocationDescriptionText(str):
             )
 
 
-class MonitoringLocationIdentifier(str):
+class MonitoringLocationIdentifier(str, metaclass=Interned):
     """
     A designator used to describe the unique name, number, or code assigned to identify
     the monitoring location.
@@ -1133,7 +1172,7 @@ class MonitoringLocationIdentifier(str):
             )
 
 
-class MonitoringLocationIdentifierContext(str):
+class MonitoringLocationIdentifierContext(str, metaclass=Interned):
     """
     Identifies the source or data system that created or defined the monitoring location
     identifier.
@@ -1147,7 +1186,7 @@ class MonitoringLocationIdentifierContext(str):
             )
 
 
-class MonitoringLocationName(str):
+class MonitoringLocationName(str, metaclass=Interned):
     """
     The designator specified by the sampling organization for the site at which sampling
     or other activities are conducted.
@@ -1160,7 +1199,7 @@ class MonitoringLocationName(str):
             )
 
 
-class MonitoringLocationTypeName(str):
+class MonitoringLocationTypeName(str, metaclass=Interned):
     """
     The descriptive name for a type of monitoring location.
     """
@@ -1172,7 +1211,7 @@ class MonitoringLocationTypeName(str):
             )
 
 
-class NationalAquiferCode(str):
+class NationalAquiferCode(str, metaclass=Interned):
     """
     Code of the aquifer in which the well is completed.
     """
@@ -1182,7 +1221,7 @@ class NationalAquiferCode(str):
             raise ValueError("NationalAquiferCode must be between 0 and 120 characters.")
 
 
-class NetTypeName(str):
+class NetTypeName(str, metaclass=Interned):
     """
     The text describing the type of net.
     """
@@ -1192,7 +1231,7 @@ class NetTypeName(str):
             raise ValueError("NetTypeName must be between 1 and 60 characters.")
 
 
-class NewIdentifier(str):
+class NewIdentifier(str, metaclass=Interned):
     """
     The new identifier which replaces an older one.
     """
@@ -1202,7 +1241,7 @@ class NewIdentifier(str):
             raise ValueError("NewIdentifier must be between 1 and 55 characters.")
 
 
-class OldIdentifier(str):
+class OldIdentifier(str, metaclass=Interned):
     """
     The old identifier which will be replaced.
     """
@@ -1212,7 +1251,7 @@ class OldIdentifier(str):
             raise ValueError("OldIdentifier must be between 1 and 55 characters.")
 
 
-class OrganizationDescriptionText(str):
+class OrganizationDescriptionText(str, metaclass=Interned):
     """
     Information that further describes an organization.
     """
@@ -1224,7 +1263,7 @@ class OrganizationDescriptionText(str):
             )
 
 
-class OrganizationFormalName(str):
+class OrganizationFormalName(str, metaclass=Interned):
     """
     The legal designator (i.e. formal name) of an organization.
     """
@@ -1236,7 +1275,7 @@ class OrganizationFormalName(str):
             )
 
 
-class OrganizationIdentifier(str):
+class OrganizationIdentifier(str, metaclass=Interned):
     """
     A designator used to uniquely identify a unique business establishment within a
     context.
@@ -1251,7 +1290,7 @@ class OrganizationIdentifier(str):
             )
 
 
-class PassCount(str):
+class PassCount(str, metaclass=Interned):
     """
     The number of passes through the water from which the sample was collected.
     """
@@ -1270,7 +1309,7 @@ class ProportionSampleProcessedNumeric(float):
     pass
 
 
-class PostalCode(str):
+class PostalCode(str, metaclass=Interned):
     """
     The combination of the 5-digit Zone Improvement Plan (ZIP) code and the four-digit
     extension code (if available) that represents the geographic segment that is a
@@ -1284,7 +1323,7 @@ class PostalCode(str):
             raise ValueError("PostalCode must be between 0 and 10 characters.")
 
 
-class PrecisionValue(str):
+class PrecisionValue(str, metaclass=Interned):
     """
     A measure of mutual agreement among individual measurements of the same property
     usually under prescribed similar conditions.
@@ -1312,7 +1351,7 @@ class PreparationStartDate(date):
     pass
 
 
-class ProjectDescriptionText(str):
+class ProjectDescriptionText(str, metaclass=Interned):
     """
     Project description, which may include a description of the project purpose, summary
     of the objectives, or brief summary of the results of the project.
@@ -1325,7 +1364,7 @@ class ProjectDescriptionText(str):
             )
 
 
-class ProjectIdentifier(str):
+class ProjectIdentifier(str, metaclass=Interned):
     """
     A designator used to uniquely identify a data collection project within a context of
     an organization.
@@ -1336,7 +1375,7 @@ class ProjectIdentifier(str):
             raise ValueError("ProjectIdentifier must be between 1 and 55 characters.")
 
 
-class ProjectName(str):
+class ProjectName(str, metaclass=Interned):
     """
     The name assigned by the Organization (project leader or principal investigator) to
     the project.
@@ -1365,7 +1404,7 @@ class QAPPApprovedIndicator(object):
         return self.__o
 
 
-class QAPPApprovalAgencyName(str):
+class QAPPApprovalAgencyName(str, metaclass=Interned):
     """
     An outside approval authority identifier for the QAPP (e.g. EPA or State
     Organization).
@@ -1396,7 +1435,7 @@ class ReferenceLocationStartDate(date):
     pass
 
 
-class ReferenceLocationTypeCode(str):
+class ReferenceLocationTypeCode(str, metaclass=Interned):
     """
     Identifies whether this site is a reference or control site by specifying the
     reference location type.
@@ -1409,7 +1448,7 @@ class ReferenceLocationTypeCode(str):
             )
 
 
-class ResourceCreatorName(str):
+class ResourceCreatorName(str, metaclass=Interned):
     """
     An entity primarily responible for making the content of the resource.
     """
@@ -1427,7 +1466,7 @@ class ResourceDate(date):
     pass
 
 
-class ResourceIdentifier(str):
+class ResourceIdentifier(str, metaclass=Interned):
     """
     An unambiguous reference to the resource within a given context.
     """
@@ -1437,7 +1476,7 @@ class ResourceIdentifier(str):
             raise ValueError("ResourceIdentifier must be between 1 and 255 characters.")
 
 
-class ResourcePublisherName(str):
+class ResourcePublisherName(str, metaclass=Interned):
     """
     An entity responsible for making the resource available.
     """
@@ -1447,7 +1486,7 @@ class ResourcePublisherName(str):
             raise ValueError("ResourcePublisherName must be between 0 and 60 characters.")
 
 
-class ResourceSubjectText(str):
+class ResourceSubjectText(str, metaclass=Interned):
     """
     A topic of the content of the resource.
     """
@@ -1457,7 +1496,7 @@ class ResourceSubjectText(str):
             raise ValueError("ResourceSubjectText must be between 0 and 4000 characters.")
 
 
-class ResourceTitleName(str):
+class ResourceTitleName(str, metaclass=Interned):
     """
     A name given to the resource.
     """
@@ -1467,7 +1506,7 @@ class ResourceTitleName(str):
             raise ValueError("ResourceTitleName must be between 1 and 120 characters.")
 
 
-class ResultDetectionConditionText(str):
+class ResultDetectionConditionText(str, metaclass=Interned):
     """
     The textual descriptor of a result.
     """
@@ -1479,7 +1518,7 @@ class ResultDetectionConditionText(str):
             )
 
 
-class LaboratoryCommentText(str):
+class LaboratoryCommentText(str, metaclass=Interned):
     """
     Remarks which further describe the laboratory procedures which produced the result.
     """
@@ -1491,7 +1530,7 @@ class LaboratoryCommentText(str):
             )
 
 
-class ResultMeasureValue(str):
+class ResultMeasureValue(str, metaclass=Interned):
     """
     The reportable measure of the result for the chemical, microbiological or other
     characteristic being analyzed.
@@ -1502,7 +1541,7 @@ class ResultMeasureValue(str):
             raise ValueError("ResultMeasureValue must be between 0 and 60 characters.")
 
 
-class ResultParticleSizeBasisText(str):
+class ResultParticleSizeBasisText(str, metaclass=Interned):
     """
     User defined free text describing the particle size class for which the associated
     result is defined.
@@ -1515,7 +1554,7 @@ class ResultParticleSizeBasisText(str):
             )
 
 
-class ResultSampleFractionText(str):
+class ResultSampleFractionText(str, metaclass=Interned):
     """
     The text name of the portion of the sample associated with results obtained from a
     physically-partitioned sample.
@@ -1528,7 +1567,7 @@ class ResultSampleFractionText(str):
             )
 
 
-class ResultSamplingPointName(str):
+class ResultSamplingPointName(str, metaclass=Interned):
     """
     Single point name within a sampling frame or protocol that is associated with the
     reported result.
@@ -1541,7 +1580,7 @@ class ResultSamplingPointName(str):
             )
 
 
-class ResultSamplingPointCommentText(str):
+class ResultSamplingPointCommentText(str, metaclass=Interned):
     """
     Text description of a single point within a sampling frame for the result.
     """
@@ -1553,7 +1592,7 @@ class ResultSamplingPointCommentText(str):
             )
 
 
-class ResultSamplingPointType(str):
+class ResultSamplingPointType(str, metaclass=Interned):
     """
     Location of a Single point within a sampling frame or position that is associated
     with the reported result.
@@ -1566,7 +1605,7 @@ class ResultSamplingPointType(str):
             )
 
 
-class ResultSamplingPointPlaceInSeries(str):
+class ResultSamplingPointPlaceInSeries(str, metaclass=Interned):
     """
     The order in which a single point within a sampling frame was visited in relation to
     other components.
@@ -1579,7 +1618,7 @@ class ResultSamplingPointPlaceInSeries(str):
             )
 
 
-class ResultStatusIdentifier(str):
+class ResultStatusIdentifier(str, metaclass=Interned):
     """
     Indicates the acceptability of the result with respect to QA/QC criteria.
     """
@@ -1591,7 +1630,7 @@ class ResultStatusIdentifier(str):
             )
 
 
-class ResultTemperatureBasisText(str):
+class ResultTemperatureBasisText(str, metaclass=Interned):
     """
     The name that represents the controlled temperature at which the sample was
     maintained during analysis, e.g. 25 deg BOD analysis.
@@ -1604,7 +1643,7 @@ class ResultTemperatureBasisText(str):
             )
 
 
-class ResultTimeBasisText(str):
+class ResultTimeBasisText(str, metaclass=Interned):
     """
     The period of time (in days) over which a measurement was made. For example, BOD can
     be measured as 5 day or 20 day BOD.
@@ -1615,7 +1654,7 @@ class ResultTimeBasisText(str):
             raise ValueError("ResultTimeBasisText must be between 0 and 12 characters.")
 
 
-class ResultValueTypeName(str):
+class ResultValueTypeName(str, metaclass=Interned):
     """
     A name that qualifies the process which was used in the determination of the result
     value (e.g., actual, estimated, calculated).
@@ -1626,7 +1665,7 @@ class ResultValueTypeName(str):
             raise ValueError("ResultValueTypeName must be between 0 and 20 characters.")
 
 
-class ResultWeightBasisText(str):
+class ResultWeightBasisText(str, metaclass=Interned):
     """
     The name that represents the form of the sample or portion of the sample which is
     associated with the result value (e.g., wet weight, dry weight, ash-free dry weight).
@@ -1637,7 +1676,7 @@ class ResultWeightBasisText(str):
             raise ValueError("ResultWeightBasisText must be between 0 and 60 characters.")
 
 
-class SampleCollectionEquipmentCommentText(str):
+class SampleCollectionEquipmentCommentText(str, metaclass=Interned):
     """
     Free text with general comments further describing the sample collection equipment.
     """
@@ -1650,7 +1689,7 @@ class SampleCollectionEquipmentCommentText(str):
             )
 
 
-class SampleCollectionEquipmentName(str):
+class SampleCollectionEquipmentName(str, metaclass=Interned):
     """
     The name for the equipment used in collecting the sample.
     """
@@ -1662,7 +1701,7 @@ class SampleCollectionEquipmentName(str):
             )
 
 
-class SampleContainerColorName(str):
+class SampleContainerColorName(str, metaclass=Interned):
     """
     The text describing the sample container color.
     """
@@ -1674,7 +1713,7 @@ class SampleContainerColorName(str):
             )
 
 
-class SampleContainerLabelName(str):
+class SampleContainerLabelName(str, metaclass=Interned):
     """
     The identification number or code assigned by the LAB or data collector. Sample
     Identification Codes and Labeling.
@@ -1687,7 +1726,7 @@ class SampleContainerLabelName(str):
             )
 
 
-class SampleContainerTypeName(str):
+class SampleContainerTypeName(str, metaclass=Interned):
     """
     The text describing the sample container type.
     """
@@ -1699,7 +1738,7 @@ class SampleContainerTypeName(str):
             )
 
 
-class SampleTissueAnatomyName(str):
+class SampleTissueAnatomyName(str, metaclass=Interned):
     """
     The name of the anatomy from which a tissue sample was taken.
     """
@@ -1711,7 +1750,7 @@ class SampleTissueAnatomyName(str):
             )
 
 
-class SampleTransportStorageDescription(str):
+class SampleTransportStorageDescription(str, metaclass=Interned):
     """
     The text describing sample handling and transport procedures used.
     """
@@ -1724,7 +1763,7 @@ class SampleTransportStorageDescription(str):
             )
 
 
-class SamplingComponentName(str):
+class SamplingComponentName(str, metaclass=Interned):
     """
     Single entity within a sampling frame at which a collection procedure or protocol
     was performed (e.g. transect, plot point).
@@ -1737,7 +1776,7 @@ class SamplingComponentName(str):
             )
 
 
-class SamplingDesignTypeCode(str):
+class SamplingDesignTypeCode(str, metaclass=Interned):
     """
     A code used to identify the type of sampling design employed for this project to
     ensure that sampling activities can support project objectives.
@@ -1750,7 +1789,7 @@ class SamplingDesignTypeCode(str):
             )
 
 
-class SourceMapScale(str):
+class SourceMapScale(str, metaclass=Interned):
     """
     The number that represents the proportional distance on the ground for one unit of
     measure on the map or photo.
@@ -1761,7 +1800,7 @@ class SourceMapScale(str):
             raise ValueError("SourceMapScale must be between 0 and 60 characters.")
 
 
-class StateCode(str):
+class StateCode(str, metaclass=Interned):
     """
     A code designator used to identify a principal administrative subdivision of the
     United States, Canada, or Mexico.
@@ -1772,7 +1811,7 @@ class StateCode(str):
             raise ValueError("StateCode must be between 0 and 2 characters.")
 
 
-class StatisticalBaseCode(str):
+class StatisticalBaseCode(str, metaclass=Interned):
     """
     The code for the method used to calculate derived results.
     """
@@ -1793,7 +1832,7 @@ class StatisticalNValueNumeric(int):
             raise ValueError("StatisticalNValueNumeric must be a positive integer.")
 
 
-class StatisticalStratumText(str):
+class StatisticalStratumText(str, metaclass=Interned):
     """
     Identifies the statistical stratum applied to this site.
     """
@@ -1805,7 +1844,7 @@ class StatisticalStratumText(str):
             )
 
 
-class SubjectTaxonomicName(str):
+class SubjectTaxonomicName(str, metaclass=Interned):
     """
     The name of the organism sampled as part of a biological sample.
     """
@@ -1815,7 +1854,7 @@ class SubjectTaxonomicName(str):
             raise ValueError("SubjectTaxonomicName must be between 0 and 255 characters.")
 
 
-class SubjectTaxonomicNameUserSupplied(str):
+class SubjectTaxonomicNameUserSupplied(str, metaclass=Interned):
     """
     The user supplied name of the organism sampled as part of a biological sample.
     """
@@ -1827,7 +1866,7 @@ class SubjectTaxonomicNameUserSupplied(str):
             )
 
 
-class SubjectTaxonomicNameUserSuppliedReferenceText(str):
+class SubjectTaxonomicNameUserSuppliedReferenceText(str, metaclass=Interned):
     """
     Identifies the source or data system that created or defined the identifier.
     """
@@ -1840,7 +1879,7 @@ class SubjectTaxonomicNameUserSuppliedReferenceText(str):
             )
 
 
-class SubstanceDilutionFactor(str):
+class SubstanceDilutionFactor(str, metaclass=Interned):
     """
     The overall dilution of the substance subjected to this analysis.
     """
@@ -1852,7 +1891,7 @@ class SubstanceDilutionFactor(str):
             )
 
 
-class SupplementalAddressText(str):
+class SupplementalAddressText(str, metaclass=Interned):
     """
     The text that provides additional information about an address, including a building
     name with its secondary unit and number, an industrial park name, an installation
@@ -1866,7 +1905,7 @@ class SupplementalAddressText(str):
             )
 
 
-class TargetCount(str):
+class TargetCount(str, metaclass=Interned):
     """
     A code used to identify the intended count that the sorter was aiming for.
     """
@@ -1876,7 +1915,7 @@ class TargetCount(str):
             raise ValueError("TargetCount must be between 0 and 35 characters.")
 
 
-class TaxonomicPollutionTolerance(str):
+class TaxonomicPollutionTolerance(str, metaclass=Interned):
     """
     For entries representing taxa, a code representing the ability of the reported taxon
     to tolerate pollution.
@@ -1906,7 +1945,7 @@ class TaxonomistAccreditationIndicator(object):
         return self.__o
 
 
-class TaxonomistAccreditationAuthorityName(str):
+class TaxonomistAccreditationAuthorityName(str, metaclass=Interned):
     """
     An outside accreditation authority identifier for the taxonomist.
     """
@@ -1919,7 +1958,7 @@ class TaxonomistAccreditationAuthorityName(str):
             )
 
 
-class TaxonomicPollutionToleranceScaleText(str):
+class TaxonomicPollutionToleranceScaleText(str, metaclass=Interned):
     """
     Provides a description of the scale used for the taxonomic pollution tolerance value.
     """
@@ -1932,7 +1971,7 @@ class TaxonomicPollutionToleranceScaleText(str):
             )
 
 
-class TelephoneExtensionNumberText(str):
+class TelephoneExtensionNumberText(str, metaclass=Interned):
     """
     The number assigned within an organization to an individual telephone that extends
     the external telephone number.
@@ -1945,7 +1984,7 @@ class TelephoneExtensionNumberText(str):
             )
 
 
-class TelephoneNumberText(str):
+class TelephoneNumberText(str, metaclass=Interned):
     """
     The number that identifies a particular telephone connection.
     """
@@ -1955,7 +1994,7 @@ class TelephoneNumberText(str):
             raise ValueError("TelephoneNumberText must be between 0 and 15 characters.")
 
 
-class TelephoneNumberTypeName(str):
+class TelephoneNumberTypeName(str, metaclass=Interned):
     """
     The name that describes a telephone number type.
     """
@@ -1967,7 +2006,7 @@ class TelephoneNumberTypeName(str):
             )
 
 
-class ThermalPreservativeUsedName(str):
+class ThermalPreservativeUsedName(str, metaclass=Interned):
     """
     Information describing the temperature means used to preserve the sample.
     """
@@ -1987,7 +2026,7 @@ class Time(time):
     pass
 
 
-class TimeZoneCode(str):
+class TimeZoneCode(str, metaclass=Interned):
     """
     The time zone for which the time of day is reported. Any of the longitudinal
     divisions of the earth's surface in which a standard time is kept.
@@ -1998,7 +2037,7 @@ class TimeZoneCode(str):
             raise ValueError("TimeZoneCode must be between 1 and 4 characters.")
 
 
-class ToxicityTestType(str):
+class ToxicityTestType(str, metaclass=Interned):
     """
     Identifies the type of toxicity as either Acute or Chronic.
     """
@@ -2008,7 +2047,7 @@ class ToxicityTestType(str):
             raise ValueError("ToxicityTestType must be between 0 and 30 characters.")
 
 
-class TribalCode(str):
+class TribalCode(str, metaclass=Interned):
     """
     The code that represents the American Indian tribe or Alaskan Native entity.
     """
@@ -2018,7 +2057,7 @@ class TribalCode(str):
             raise ValueError("TribalCode must be between 0 and 3 characters.")
 
 
-class TribalLandIndicator(str):
+class TribalLandIndicator(str, metaclass=Interned):
     """
     An indicator denoting whether the location is on a tribal land.
     """
@@ -2039,7 +2078,7 @@ class TribalLandIndicator(str):
             return False
 
 
-class TribalLandName(str):
+class TribalLandName(str, metaclass=Interned):
     """
     The name of an American Indian or Alaskan native area where the location exists.
     """
@@ -2049,7 +2088,7 @@ class TribalLandName(str):
             raise ValueError("TribalLandName must be between 0 and 512 characters.")
 
 
-class TrophicLevelName(str):
+class TrophicLevelName(str, metaclass=Interned):
     """
     For entries representing taxa, a code representing the trophic level with which the
     reported taxon is typically assigned.
@@ -2060,7 +2099,7 @@ class TrophicLevelName(str):
             raise ValueError("TrophicLevelName must be between 0 and 30 characters.")
 
 
-class UnidentifiedSpeciesIdentifier(str):
+class UnidentifiedSpeciesIdentifier(str, metaclass=Interned):
     """
     A number or name assigned as a part of a taxonomic identification. Used with a valid
     genus name to indicate a unique species has been observed but not taxonomically
@@ -2074,7 +2113,7 @@ class UnidentifiedSpeciesIdentifier(str):
             )
 
 
-class UpperConfidenceLimitValue(str):
+class UpperConfidenceLimitValue(str, metaclass=Interned):
     """
     Value of the upper end of the confidence interval.
     """
@@ -2086,7 +2125,7 @@ class UpperConfidenceLimitValue(str):
             )
 
 
-class UpperClassBoundValue(str):
+class UpperClassBoundValue(str, metaclass=Interned):
     """
     This described the upper bound for a frequency class descriptor.
     """
@@ -2096,7 +2135,7 @@ class UpperClassBoundValue(str):
             raise ValueError("UpperClassBoundValue must be between 0 and 60 characters.")
 
 
-class VerticalCollectionMethodName(str):
+class VerticalCollectionMethodName(str, metaclass=Interned):
     """
     The name that identifies the method used to collect the vertical measure (i.e. the
     altitude) of a reference point.
@@ -2109,7 +2148,7 @@ class VerticalCollectionMethodName(str):
             )
 
 
-class VerticalCoordinateReferenceSystemDatumName(str):
+class VerticalCoordinateReferenceSystemDatumName(str, metaclass=Interned):
     """
     The name of the reference datum used to determine the vertical measure (i.e., the
     altitude).
@@ -2123,7 +2162,7 @@ class VerticalCoordinateReferenceSystemDatumName(str):
             )
 
 
-class VoltinismName(str):
+class VoltinismName(str, metaclass=Interned):
     """
     The number of broods or generations of the characteristic in a year.
     """
@@ -2133,7 +2172,7 @@ class VoltinismName(str):
             raise ValueError("VoltinismName must be between 0 and 25 characters.")
 
 
-class WellTypeText(str):
+class WellTypeText(str, metaclass=Interned):
     """
     Identifies the primary well type.
     """
@@ -1,8 +1,8 @@
 from typing import List, Union
 
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .BibliographicReference import BibliographicReference
 from .SimpleContent import (
     CellFormName,
@@ -16,11 +16,40 @@ from .SimpleContent import (
 )
 
 
-class TaxonomicDetails:
+class TaxonomicDetails(XMLFragment):
     """
     This section allows for the further definition of user-defined details for taxa.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("cellFormName", "CellFormName", CellFormName),
+        Field("cellShapeName", "CellShapeName", CellShapeName),
+        Field("habitName", "HabitName", HabitName, maxOccurs=3),
+        Field("voltinismName", "VoltinismName", VoltinismName),
+        Field(
+            "taxonomicPollutionTolerance",
+            "TaxonomicPollutionTolerance",
+            TaxonomicPollutionTolerance,
+        ),
+        Field(
+            "taxonomicPollutionToleranceScaleText",
+            "TaxonomicPollutionToleranceScaleText",
+            TaxonomicPollutionToleranceScaleText,
+        ),
+        Field("trophicLevelName", "TrophicLevelName", TrophicLevelName),
+        Field(
+            "functionalFeedingGroupName",
+            "FunctionalFeedingGroupName",
+            FunctionalFeedingGroupName,
+            maxOccurs=3,
+        ),
+        Field(
+            "taxonomicDetailsCitation", "TaxonomicDetailsCitation", BibliographicReference
+        ),
+    )
+
     __cellFormName: CellFormName
     __cellShapeName: CellShapeName
     __habitName: HabitName
@@ -91,7 +120,9 @@ class TaxonomicDetails:
 
     @cellFormName.setter
     def cellFormName(self, val: CellFormName) -> None:
-        self.__cellFormName = None if val is None else CellFormName(val)
+        self.__cellFormName = (
+            val if val is None or type(val) is CellFormName else CellFormName(val)
+        )
 
     @property
     def cellShapeName(self) -> CellShapeName:
@@ -99,7 +130,9 @@ class TaxonomicDetails:
 
     @cellShapeName.setter
     def cellShapeName(self, val: CellShapeName) -> None:
-        self.__cellShapeName = None if val is None else CellShapeName(val)
+        self.__cellShapeName = (
+            val if val is None or type(val) is CellShapeName else CellShapeName(val)
+        )
 
     @property
     def habitName(self) -> HabitName:
@@ -123,7 +156,9 @@ class TaxonomicDetails:
 
     @voltinismName.setter
     def voltinismName(self, val: VoltinismName) -> None:
-        self.__voltinismName = None if val is None else VoltinismName(val)
+        self.__voltinismName = (
+            val if val is None or type(val) is VoltinismName else VoltinismName(val)
+        )
 
     @property
     def taxonomicPollutionTolerance(self) -> TaxonomicPollutionTolerance:
@@ -132,7 +167,9 @@ class TaxonomicDetails:
     @taxonomicPollutionTolerance.setter
     def taxonomicPollutionTolerance(self, val: TaxonomicPollutionTolerance) -> None:
         self.__taxonomicPollutionTolerance = (
-            None if val is None else TaxonomicPollutionTolerance(val)
+            val
+            if val is None or type(val) is TaxonomicPollutionTolerance
+            else TaxonomicPollutionTolerance(val)
         )
 
     @property
@@ -146,7 +183,9 @@ class TaxonomicDetails:
         self, val: TaxonomicPollutionToleranceScaleText
     ) -> None:
         self.__taxonomicPollutionToleranceScaleText = (
-            None if val is None else TaxonomicPollutionToleranceScaleText(val)
+            val
+            if val is None or type(val) is TaxonomicPollutionToleranceScaleText
+            else TaxonomicPollutionToleranceScaleText(val)
         )
 
     @property
@@ -155,7 +194,9 @@ class TaxonomicDetails:
 
     @trophicLevelName.setter
     def trophicLevelName(self, val: TrophicLevelName) -> None:
-        self.__trophicLevelName = None if val is None else TrophicLevelName(val)
+        self.__trophicLevelName = (
+            val if val is None or type(val) is TrophicLevelName else TrophicLevelName(val)
+        )
 
     @property
     def functionalFeedingGroupName(self) -> FunctionalFeedingGroupName:
@@ -185,46 +226,7 @@ class TaxonomicDetails:
             None if val is None else BibliographicReference(val)
         )
 
-    def generateXML(self, name: str = "TaxonomicDetails") -> str:  # noqa: C901
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__cellFormName is not None:
-                line("CellFormName", self.__cellFormName)
-            if self.__cellShapeName is not None:
-                line("CellShapeName", self.__cellShapeName)
-            if len(self.__habitName) > 3:
-                raise WQXException(
-                    "Attribute 'habitName' must be a list of 0 to 3 HabitName objects."
-                )
-            for x in self.__habitName:
-                line("HabitName", x)
-            if self.__voltinismName is not None:
-                line("VoltinismName", self.__voltinismName)
-            if self.__taxonomicPollutionTolerance is not None:
-                line("TaxonomicPollutionTolerance", self.__taxonomicPollutionTolerance)
-            if self.__taxonomicPollutionToleranceScaleText is not None:
-                line(
-                    "TaxonomicPollutionToleranceScaleText",
-                    self.__taxonomicPollutionToleranceScaleText,
-                )
-            if self.__trophicLevelName is not None:
-                line("TrophicLevelName", self.__trophicLevelName)
-            if len(self.__functionalFeedingGroupName) > 3:
-                raise WQXException(
-                    "Attribute 'functionalFeedingGroupName' must be a list of 0 to 3 "
-                    "FunctionalFeedingGroupName objects."
-                )
-            for x in self.__functionalFeedingGroupName:
-                line("FunctionalFeedingGroupName", x)
-            if self.__taxonomicDetailsCitation is not None:
-                asis(
-                    self.__taxonomicDetailsCitation.generateXML(
-                        "TaxonomicDetailsCitation"
-                    )
-                )
-
-        return doc.getvalue()
+    def generateXML(
+        self, name: str = "TaxonomicDetails", writer: XMLWriter = None
+    ) -> str:
+        return encode(self, TaxonomicDetails.schema, name, writer)
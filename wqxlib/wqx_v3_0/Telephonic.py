@@ -1,5 +1,6 @@
-from yattag import Doc
-
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import (
     TelephoneExtensionNumberText,
     TelephoneNumberText,
@@ -7,11 +8,25 @@ from .SimpleContent import (
 )
 
 
-class Telephonic:
+class Telephonic(XMLFragment):
     """
     An identification of a telephone connection.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("telephoneNumberText", "TelephoneNumberText", TelephoneNumberText),
+        Field(
+            "telephoneNumberTypeName", "TelephoneNumberTypeName", TelephoneNumberTypeName
+        ),
+        Field(
+            "telephoneExtensionNumberText",
+            "TelephoneExtensionNumberText",
+            TelephoneExtensionNumberText,
+        ),
+    )
+
     __telephoneNumberText: TelephoneNumberText
     __telephoneNumberTypeName: TelephoneNumberTypeName
     __telephoneExtensionNumberText: TelephoneExtensionNumberText
@@ -46,7 +61,11 @@ class Telephonic:
 
     @telephoneNumberText.setter
     def telephoneNumberText(self, val: TelephoneNumberText) -> None:
-        self.__telephoneNumberText = None if val is None else TelephoneNumberText(val)
+        self.__telephoneNumberText = (
+            val
+            if val is None or type(val) is TelephoneNumberText
+            else TelephoneNumberText(val)
+        )
 
     @property
     def telephoneNumberTypeName(self) -> TelephoneNumberTypeName:
@@ -55,7 +74,9 @@ class Telephonic:
     @telephoneNumberTypeName.setter
     def telephoneNumberTypeName(self, val: TelephoneNumberTypeName) -> None:
         self.__telephoneNumberTypeName = (
-            None if val is None else TelephoneNumberTypeName(val)
+            val
+            if val is None or type(val) is TelephoneNumberTypeName
+            else TelephoneNumberTypeName(val)
         )
 
     @property
@@ -65,20 +86,10 @@ class Telephonic:
     @telephoneExtensionNumberText.setter
     def telephoneExtensionNumberText(self, val: TelephoneExtensionNumberText) -> None:
         self.__telephoneExtensionNumberText = (
-            None if val is None else TelephoneExtensionNumberText(val)
+            val
+            if val is None or type(val) is TelephoneExtensionNumberText
+            else TelephoneExtensionNumberText(val)
         )
 
-    def generateXML(self, name: str = "Telephonic") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__telephoneNumberText is not None:
-                line("TelephoneNumberText", self.__telephoneNumberText)
-            if self.__telephoneNumberTypeName is not None:
-                line("TelephoneNumberTypeName", self.__telephoneNumberTypeName)
-            if self.__telephoneExtensionNumberText is not None:
-                line("TelephoneExtensionNumberText", self.__telephoneExtensionNumberText)
-
-        return doc.getvalue()
+    def generateXML(self, name: str = "Telephonic", writer: XMLWriter = None) -> str:
+        return encode(self, Telephonic.schema, name, writer)
@@ -1,14 +1,19 @@
-from yattag import Doc
-
 from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .Organization import Organization
 
 
-class WQX:
+class WQX(XMLFragment):
     """
     Main Schema used to transfer water monitoring results to EPA Office of Water.
     """
 
+    __slots__ = ()
+
+    schema = (Field("organization", "Organization", Organization, minOccurs=1),)
+
     __organization: Organization
 
     def __init__(self, o: dict = None, *, organization: Organization = None):
@@ -32,23 +37,19 @@ class WQX:
             raise WQXException("Attribute 'organization' must be an Organization object.")
         self.__organization = None if val is None else Organization(val)
 
-    def generateXML(self, name="WQX"):
-        doc = Doc()
-        asis = doc.asis
-        tag = doc.tag
-
-        with tag(
+    def generateXML(self, name: str = "WQX", writer: XMLWriter = None) -> str:
+        return encode(
+            self,
+            WQX.schema,
             name,
-            ("xmlns", "http://www.exchangenetwork.net/schema/wqx/3"),
-            ("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance"),
+            writer,
             (
-                "xsi:schemaLocation",
-                "http://www.exchangenetwork.net/schema/wqx/3 "
-                "http://www.exchangenetwork.net/schema/wqx/3/index.xsd",
+                ("xmlns", "http://www.exchangenetwork.net/schema/wqx/3"),
+                ("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance"),
+                (
+                    "xsi:schemaLocation",
+                    "http://www.exchangenetwork.net/schema/wqx/3 "
+                    "http://www.exchangenetwork.net/schema/wqx/3/index.xsd",
+                ),
             ),
-        ):
-            if self.__organization is None:
-                raise WQXException("Attribute 'organization' is required.")
-            asis(self.__organization.generateXML("Organization"))
-
-        return doc.getvalue()
+        )
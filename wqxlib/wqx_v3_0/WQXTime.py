@@ -1,19 +1,26 @@
 import datetime
 
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .SimpleContent import Time, TimeZoneCode
 
 
-class WQXTime:
+class WQXTime(XMLFragment):
     """
     Custom WQX datatype that defines a local time and corresponding time zone in which
     the time is measured.
     """
 
-    __time: Time = None
-    __timeZoneCode: TimeZoneCode = None
+    __slots__ = ()
+
+    schema = (
+        Field("time", "Time", Time, minOccurs=1, format=lambda x: x.strftime("%H:%M:%S")),
+        Field("timeZoneCode", "TimeZoneCode", TimeZoneCode, minOccurs=1),
+    )
+
+    __time: Time
+    __timeZoneCode: TimeZoneCode
 
     def __init__(
         self, o: dict = None, *, time: Time = None, timeZoneCode: TimeZoneCode = None
@@ -24,7 +31,7 @@ class WQXTime:
             self.__timeZoneCode = o.timeZoneCode
         elif isinstance(o, datetime.datetime):
             self.__time = o.time()
-            self.__timeZoneCode = o.strftime("%Z")
+            self.__timeZoneCode = o.tzname() or ""
         elif isinstance(o, dict):
             # Assign attributes from dictionary with typechecking
             self.time = o.get("time")
@@ -40,7 +47,7 @@ class WQXTime:
 
     @time.setter
     def time(self, val: Time) -> None:
-        self.__time = None if val is None else Time(val)
+        self.__time = val if val is None or type(val) is Time else Time(val)
 
     @property
     def timeZoneCode(self) -> TimeZoneCode:
@@ -48,19 +55,9 @@ class WQXTime:
 
     @timeZoneCode.setter
     def timeZoneCode(self, val: TimeZoneCode) -> None:
-        self.__timeZoneCode = None if val is None else TimeZoneCode(val)
-
-    def generateXML(self, name: str = "WQXTime") -> str:
-        doc = Doc()
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__time is None:
-                raise WQXException("Attribute 'time' is required.")
-            line("Time", self.__time.strftime("%H:%M:%S"))
-            if self.__timeZoneCode is None:
-                raise WQXException("Attribute 'timeZoneCode' is required.")
-            line("TimeZoneCode", self.__timeZoneCode)
+        self.__timeZoneCode = (
+            val if val is None or type(val) is TimeZoneCode else TimeZoneCode(val)
+        )
 
-        return doc.getvalue()
+    def generateXML(self, name: str = "WQXTime", writer: XMLWriter = None) -> str:
+        return encode(self, WQXTime.schema, name, writer)
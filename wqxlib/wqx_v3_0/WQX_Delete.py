@@ -1,17 +1,29 @@
 from typing import List, Union
 
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .Organization_Delete import OrganizationDelete
 
 
-class WQXDelete:
+class WQXDelete(XMLFragment):
     """
     Main Schema used to delete a portion of water monitoring results from EPA Office of
     Water system.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "organizationDelete",
+            "OrganizationDelete",
+            OrganizationDelete,
+            minOccurs=1,
+            maxOccurs=None,
+        ),
+    )
+
     __organizationDelete: List[OrganizationDelete]
 
     def __init__(
@@ -45,24 +57,19 @@ class WQXDelete:
         else:
             self.__organizationDelete = [OrganizationDelete(val)]
 
-    def generateXML(self, name="WQXDelete"):
-        doc = Doc()
-        asis = doc.asis
-        tag = doc.tag
-
-        with tag(
+    def generateXML(self, name: str = "WQXDelete", writer: XMLWriter = None) -> str:
+        return encode(
+            self,
+            WQXDelete.schema,
             name,
-            ("xmlns", "http://www.exchangenetwork.net/schema/wqx/3"),
-            ("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance"),
+            writer,
             (
-                "xsi:schemaLocation",
-                "http://www.exchangenetwork.net/schema/wqx/3 "
-                "http://www.exchangenetwork.net/schema/wqx/3/index.xsd",
+                ("xmlns", "http://www.exchangenetwork.net/schema/wqx/3"),
+                ("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance"),
+                (
+                    "xsi:schemaLocation",
+                    "http://www.exchangenetwork.net/schema/wqx/3 "
+                    "http://www.exchangenetwork.net/schema/wqx/3/index.xsd",
+                ),
             ),
-        ):
-            if self.__organizationDelete is None:
-                raise WQXException("Attribute 'organizationDelete' is required.")
-            for x in self.__organizationDelete:
-                asis(x.generateXML("OrganizationDelete"))
-
-        return doc.getvalue()
+        )
@@ -1,17 +1,29 @@
 from typing import List, Union
 
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .Entity_Update_Identifiers import UpdateIdentifiers
 
 
-class WQXUpdateIdentifiers:
+class WQXUpdateIdentifiers(XMLFragment):
     """
     Main Schema used to update identifiers for major entities (projects, monitoring
     locations, activity, activity groups, and indexes).
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field(
+            "updateIdentifiers",
+            "UpdateIdentifiers",
+            UpdateIdentifiers,
+            minOccurs=1,
+            maxOccurs=None,
+        ),
+    )
+
     __updateIdentifiers: List[UpdateIdentifiers]
 
     def __init__(
@@ -45,27 +57,21 @@ class WQXUpdateIdentifiers:
         else:
             self.__updateIdentifiers = [UpdateIdentifiers(val)]
 
-    def generateXML(self, name="UpdateIdentifiers") -> str:
-        doc = Doc()
-        asis = doc.asis
-        tag = doc.tag
-
-        with tag(
+    def generateXML(
+        self, name: str = "UpdateIdentifiers", writer: XMLWriter = None
+    ) -> str:
+        return encode(
+            self,
+            WQXUpdateIdentifiers.schema,
             name,
-            ("xmlns", "http://www.exchangenetwork.net/schema/wqx/3"),
-            ("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance"),
+            writer,
             (
-                "xsi:schemaLocation",
-                "http://www.exchangenetwork.net/schema/wqx/3 "
-                "http://www.exchangenetwork.net/schema/wqx/3/index.xsd",
+                ("xmlns", "http://www.exchangenetwork.net/schema/wqx/3"),
+                ("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance"),
+                (
+                    "xsi:schemaLocation",
+                    "http://www.exchangenetwork.net/schema/wqx/3 "
+                    "http://www.exchangenetwork.net/schema/wqx/3/index.xsd",
+                ),
             ),
-        ):
-            if len(self.__updateIdentifiers) < 1:
-                raise WQXException(
-                    "Attribute 'updateIdentifiers' must be a list of 1 or more "
-                    "UpdateIdentifiers objects."
-                )
-            for x in self.__updateIdentifiers:
-                asis(x.generateXML("UpdateIdentifiers"))
-
-        return doc.getvalue()
+        )
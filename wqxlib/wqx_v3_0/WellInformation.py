@@ -1,6 +1,6 @@
-from yattag import Doc
-
-from ..exceptions import WQXException
+from ..Schema import Field, encode
+from ..XMLFragment import XMLFragment
+from ..XMLWriter import XMLWriter
 from .AquiferInformation import AquiferInformation
 from .MeasureCompact import MeasureCompact
 from .SimpleContent import (
@@ -12,11 +12,24 @@ from .SimpleContent import (
 )
 
 
-class WellInformation:
+class WellInformation(XMLFragment):
     """
     Description of the attributes of a well.
     """
 
+    __slots__ = ()
+
+    schema = (
+        Field("wellTypeText", "WellTypeText", WellTypeText, minOccurs=1),
+        Field("aquiferTypeName", "AquiferTypeName", AquiferTypeName),
+        Field("nationalAquiferCode", "NationalAquiferCode", NationalAquiferCode),
+        Field("aquiferInformation", "AquiferInformation", AquiferInformation),
+        Field("formationTypeText", "FormationTypeText", FormationTypeText),
+        Field("wellHoleDepthMeasure", "WellHoleDepthMeasure", MeasureCompact),
+        Field("constructionDate", "ConstructionDate", ConstructionDate),
+        Field("wellDepthMeasure", "WellDepthMeasure", MeasureCompact),
+    )
+
     __wellTypeText: WellTypeText = None
     __aquiferTypeName: AquiferTypeName = None
     __nationalAquiferCode: NationalAquiferCode = None
@@ -76,7 +89,9 @@ class WellInformation:
 
     @wellTypeText.setter
     def wellTypeText(self, val: WellTypeText) -> None:
-        self.__wellTypeText = None if val is None else WellTypeText(val)
+        self.__wellTypeText = (
+            val if val is None or type(val) is WellTypeText else WellTypeText(val)
+        )
 
     @property
     def aquiferTypeName(self) -> AquiferTypeName:
@@ -84,7 +99,9 @@ class WellInformation:
 
     @aquiferTypeName.setter
     def aquiferTypeName(self, val: AquiferTypeName) -> None:
-        self.__aquiferTypeName = None if val is None else AquiferTypeName(val)
+        self.__aquiferTypeName = (
+            val if val is None or type(val) is AquiferTypeName else AquiferTypeName(val)
+        )
 
     @property
     def nationalAquiferCode(self) -> NationalAquiferCode:
@@ -92,7 +109,11 @@ class WellInformation:
 
     @nationalAquiferCode.setter
     def nationalAquiferCode(self, val: NationalAquiferCode) -> None:
-        self.__nationalAquiferCode = None if val is None else NationalAquiferCode(val)
+        self.__nationalAquiferCode = (
+            val
+            if val is None or type(val) is NationalAquiferCode
+            else NationalAquiferCode(val)
+        )
 
     @property
     def aquiferInformation(self) -> AquiferInformation:
@@ -108,7 +129,11 @@ class WellInformation:
 
     @formationTypeText.setter
     def formationTypeText(self, val: FormationTypeText) -> None:
-        self.__formationTypeText = None if val is None else FormationTypeText(val)
+        self.__formationTypeText = (
+            val
+            if val is None or type(val) is FormationTypeText
+            else FormationTypeText(val)
+        )
 
     @property
     def wellHoleDepthMeasure(self) -> MeasureCompact:
@@ -132,7 +157,9 @@ class WellInformation:
 
     @constructionDate.setter
     def constructionDate(self, val: ConstructionDate) -> None:
-        self.__constructionDate = None if val is None else ConstructionDate(val)
+        self.__constructionDate = (
+            val if val is None or type(val) is ConstructionDate else ConstructionDate(val)
+        )
 
     @property
     def wellDepthMeasure(self) -> MeasureCompact:
@@ -150,29 +177,5 @@ class WellInformation:
         """
         self.__wellDepthMeasure = None if val is None else MeasureCompact(val)
 
-    def generateXML(self, name: str = "WellInformation") -> str:
-        doc = Doc()
-        asis = doc.asis
-        line = doc.line
-        tag = doc.tag
-
-        with tag(name):
-            if self.__wellTypeText is None:
-                raise WQXException("Attribute 'wellTypeText' is required.")
-            line("WellTypeText", self.__wellTypeText)
-            if self.__aquiferTypeName is not None:
-                line("AquiferTypeName", self.__aquiferTypeName)
-            if self.__nationalAquiferCode is not None:
-                line("NationalAquiferCode", self.__nationalAquiferCode)
-            if self.__aquiferInformation is not None:
-                asis(self.__aquiferInformation.generateXML("AquiferInformation"))
-            if self.__formationTypeText is not None:
-                line("FormationTypeText", self.__formationTypeText)
-            if self.__wellHoleDepthMeasure is not None:
-                asis(self.__wellHoleDepthMeasure.generateXML("WellHoleDepthMeasure"))
-            if self.__constructionDate is not None:
-                line("ConstructionDate", self.__constructionDate)
-            if self.__wellDepthMeasure is not None:
-                asis(self.__wellDepthMeasure.generateXML("WellDepthMeasure"))
-
-        return doc.getvalue()
+    def generateXML(self, name: str = "WellInformation", writer: XMLWriter = None) -> str:
+        return encode(self, WellInformation.schema, name, writer)
@@ -1,50 +1,150 @@
-from .Activity import *  # noqa: F401,F403
-from .ActivityDescription import *  # noqa: F401,F403
-from .ActivityGroup import *  # noqa: F401,F403
-from .ActivityLocation import *  # noqa: F401,F403
-from .ActivityMetric import *  # noqa: F401,F403
-from .ActivityMetricType import *  # noqa: F401,F403
-from .AlternateMonitoringLocationIdentity import *  # noqa: F401,F403
-from .AquiferInformation import *  # noqa: F401,F403
-from .AttachedBinaryObject import *  # noqa: F401,F403
-from .BibliographicReference import *  # noqa: F401,F403
-from .BiologicalActivityDescription import *  # noqa: F401,F403
-from .BiologicalHabitatCollectionInformation import *  # noqa: F401,F403
-from .BiologicalHabitatIndex import *  # noqa: F401,F403
-from .CollectionEffort import *  # noqa: F401,F403
-from .ComparableAnalyticalMethod import *  # noqa: F401,F403
-from .DataQualityIndicator import *  # noqa: F401,F403
-from .DetectionQuantitationLimit import *  # noqa: F401,F403
-from .ElectronicAddress import *  # noqa: F401,F403
-from .Entity_Update_Identifiers import *  # noqa: F401,F403
-from .FrequencyClassInformation import *  # noqa: F401,F403
-from .HorizontalAccuracyMeasure import *  # noqa: F401,F403
-from .IndexType import *  # noqa: F401,F403
-from .LabSamplePreparation import *  # noqa: F401,F403
-from .Measure import *  # noqa: F401,F403
-from .MeasureCompact import *  # noqa: F401,F403
-from .MonitoringLocation import *  # noqa: F401,F403
-from .MonitoringLocationGeospatial import *  # noqa: F401,F403
-from .MonitoringLocationIdentity import *  # noqa: F401,F403
-from .NetInformation import *  # noqa: F401,F403
-from .Organization import *  # noqa: F401,F403
-from .Organization_Delete import *  # noqa: F401,F403
-from .OrganizationAddress import *  # noqa: F401,F403
-from .OrganizationDescription import *  # noqa: F401,F403
-from .Project import *  # noqa: F401,F403
-from .ProjectMonitoringLocationWeighting import *  # noqa: F401,F403
-from .ReferenceMethod import *  # noqa: F401,F403
-from .Result import *  # noqa: F401,F403
-from .ResultAnalyticalMethod import *  # noqa: F401,F403
-from .ResultDescription import *  # noqa: F401,F403
-from .ResultLabInformation import *  # noqa: F401,F403
-from .SampleDescription import *  # noqa: F401,F403
-from .SamplePreparation import *  # noqa: F401,F403
-from .SimpleContent import *  # noqa: F401,F403
-from .TaxonomicDetails import *  # noqa: F401,F403
-from .Telephonic import *  # noqa: F401,F403
-from .WellInformation import *  # noqa: F401,F403
-from .WQX import *  # noqa: F401,F403
-from .WQX_Delete import *  # noqa: F401,F403
-from .WQX_Update_Identifiers import *  # noqa: F401,F403
-from .WQXTime import *  # noqa: F401,F403
+"""
+Classes of the elements of WQX version 3.0. Each is imported from its module the
+first time it is used (see PEP 562), so importing the package costs little and
+only the elements a program uses are loaded. The simple content classes are all
+in SimpleContent.
+"""
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+from ..LazyPackage import LazyPackage
+
+if TYPE_CHECKING:
+    from .Activity import *  # noqa: F401,F403
+    from .ActivityDescription import *  # noqa: F401,F403
+    from .ActivityGroup import *  # noqa: F401,F403
+    from .ActivityLocation import *  # noqa: F401,F403
+    from .ActivityMetric import *  # noqa: F401,F403
+    from .ActivityMetricType import *  # noqa: F401,F403
+    from .AlternateMonitoringLocationIdentity import *  # noqa: F401,F403
+    from .AquiferInformation import *  # noqa: F401,F403
+    from .AttachedBinaryObject import *  # noqa: F401,F403
+    from .BibliographicReference import *  # noqa: F401,F403
+    from .BiologicalActivityDescription import *  # noqa: F401,F403
+    from .BiologicalHabitatCollectionInformation import *  # noqa: F401,F403
+    from .BiologicalHabitatIndex import *  # noqa: F401,F403
+    from .BiologicalResultDescription import *  # noqa: F401,F403
+    from .CollectionEffort import *  # noqa: F401,F403
+    from .ComparableAnalyticalMethod import *  # noqa: F401,F403
+    from .DataQualityIndicator import *  # noqa: F401,F403
+    from .DetectionQuantitationLimit import *  # noqa: F401,F403
+    from .ElectronicAddress import *  # noqa: F401,F403
+    from .Entity_Update_Identifiers import *  # noqa: F401,F403
+    from .FrequencyClassInformation import *  # noqa: F401,F403
+    from .HorizontalAccuracyMeasure import *  # noqa: F401,F403
+    from .IndexType import *  # noqa: F401,F403
+    from .LabSamplePreparation import *  # noqa: F401,F403
+    from .Measure import *  # noqa: F401,F403
+    from .MeasureCompact import *  # noqa: F401,F403
+    from .MonitoringLocation import *  # noqa: F401,F403
+    from .MonitoringLocationGeospatial import *  # noqa: F401,F403
+    from .MonitoringLocationIdentity import *  # noqa: F401,F403
+    from .NetInformation import *  # noqa: F401,F403
+    from .Organization import *  # noqa: F401,F403
+    from .Organization_Delete import *  # noqa: F401,F403
+    from .OrganizationAddress import *  # noqa: F401,F403
+    from .OrganizationDescription import *  # noqa: F401,F403
+    from .Project import *  # noqa: F401,F403
+    from .ProjectMonitoringLocationWeighting import *  # noqa: F401,F403
+    from .ReferenceMethod import *  # noqa: F401,F403
+    from .Result import *  # noqa: F401,F403
+    from .ResultAnalyticalMethod import *  # noqa: F401,F403
+    from .ResultDescription import *  # noqa: F401,F403
+    from .ResultLabInformation import *  # noqa: F401,F403
+    from .SampleDescription import *  # noqa: F401,F403
+    from .SamplePreparation import *  # noqa: F401,F403
+    from .SimpleContent import *  # noqa: F401,F403
+    from .TaxonomicDetails import *  # noqa: F401,F403
+    from .Telephonic import *  # noqa: F401,F403
+    from .WellInformation import *  # noqa: F401,F403
+    from .WQX import *  # noqa: F401,F403
+    from .WQX_Delete import *  # noqa: F401,F403
+    from .WQX_Update_Identifiers import *  # noqa: F401,F403
+    from .WQXTime import *  # noqa: F401,F403
+
+# Module of every element class
+MODULES = {
+    "Activity": "Activity",
+    "ActivityDescription": "ActivityDescription",
+    "ActivityGroup": "ActivityGroup",
+    "ActivityLocation": "ActivityLocation",
+    "ActivityMetric": "ActivityMetric",
+    "ActivityMetricType": "ActivityMetricType",
+    "AlternateMonitoringLocationIdentity": "AlternateMonitoringLocationIdentity",
+    "AquiferInformation": "AquiferInformation",
+    "AttachedBinaryObject": "AttachedBinaryObject",
+    "BibliographicReference": "BibliographicReference",
+    "BiologicalActivityDescription": "BiologicalActivityDescription",
+    "BiologicalHabitatCollectionInformation": "BiologicalHabitatCollectionInformation",
+    "BiologicalHabitatIndex": "BiologicalHabitatIndex",
+    "BiologicalResultDescription": "BiologicalResultDescription",
+    "CollectionEffort": "CollectionEffort",
+    "ComparableAnalyticalMethod": "ComparableAnalyticalMethod",
+    "DataQuality": "DataQualityIndicator",
+    "DetectionQuantitationLimit": "DetectionQuantitationLimit",
+    "ElectronicAddress": "ElectronicAddress",
+    "FrequencyClassInformation": "FrequencyClassInformation",
+    "IdentifierUpdate": "Entity_Update_Identifiers",
+    "IndexType": "IndexType",
+    "LabSamplePreparation": "LabSamplePreparation",
+    "Measure": "Measure",
+    "MeasureCompact": "MeasureCompact",
+    "MonitoringLocation": "MonitoringLocation",
+    "MonitoringLocationGeospatial": "MonitoringLocationGeospatial",
+    "MonitoringLocationIdentity": "MonitoringLocationIdentity",
+    "NetInformation": "NetInformation",
+    "Organization": "Organization",
+    "OrganizationAddress": "OrganizationAddress",
+    "OrganizationDelete": "Organization_Delete",
+    "OrganizationDescription": "OrganizationDescription",
+    "Project": "Project",
+    "ProjectMonitoringLocationWeighting": "ProjectMonitoringLocationWeighting",
+    "ReferenceMethod": "ReferenceMethod",
+    "Result": "Result",
+    "ResultAnalyticalMethod": "ResultAnalyticalMethod",
+    "ResultDescription": "ResultDescription",
+    "ResultLabInformation": "ResultLabInformation",
+    "SampleDescription": "SampleDescription",
+    "SamplePreparation": "SamplePreparation",
+    "TaxonomicDetails": "TaxonomicDetails",
+    "Telephonic": "Telephonic",
+    "UpdateIdentifiers": "Entity_Update_Identifiers",
+    "WellInformation": "WellInformation",
+    "WQX": "WQX",
+    "WQXDelete": "WQX_Delete",
+    "WQXTime": "WQXTime",
+    "WQXUpdateIdentifiers": "WQX_Update_Identifiers",
+}
+
+sys.modules[__name__].__class__ = LazyPackage
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__all__":
+        # Asked for by "from wqxlib.wqx_v3_0 import *"
+        return __dir__()
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(f".{MODULES.get(name, 'SimpleContent')}", __name__)
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    # Found without calling this function from now on
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    simpleContent = import_module(".SimpleContent", __name__)
+    return sorted(
+        [
+            *MODULES,
+            *(
+                name
+                for name, value in vars(simpleContent).items()
+                if getattr(value, "__module__", None) == simpleContent.__name__
+            ),
+        ]
+    )